@@ -0,0 +1,42 @@
+"""Add message indexes
+
+Revision ID: 7c1f4b2e9d3a
+Revises: 66f72f04a1de
+Create Date: 2026-10-18 10:12:31.418205
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "7c1f4b2e9d3a"
+down_revision: Union[str, None] = "66f72f04a1de"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEXES = {
+    "ix_message_session_id_timestamp": ["session_id", "timestamp", "id"],
+    "ix_message_flow_id_timestamp": ["flow_id", "timestamp", "id"],
+}
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)  # type: ignore
+    indexes_names = [index["name"] for index in inspector.get_indexes("message")]
+    with op.batch_alter_table("message", schema=None) as batch_op:
+        for name, columns in INDEXES.items():
+            if name not in indexes_names:
+                batch_op.create_index(name, columns, unique=False)
+
+
+def downgrade() -> None:
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)  # type: ignore
+    indexes_names = [index["name"] for index in inspector.get_indexes("message")]
+    with op.batch_alter_table("message", schema=None) as batch_op:
+        for name in INDEXES:
+            if name in indexes_names:
+                batch_op.drop_index(name)
@@ -0,0 +1,36 @@
+"""Add the input schema of flows
+
+Revision ID: a3e5c8d1f402
+Revises: 7c1f4b2e9d3a
+Create Date: 2026-10-18 11:02:47.905118
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "a3e5c8d1f402"
+down_revision: Union[str, None] = "7c1f4b2e9d3a"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)  # type: ignore
+    column_names = [column["name"] for column in inspector.get_columns("flow")]
+    # Existing flows get their input schema the next time their tools are listed
+    with op.batch_alter_table("flow", schema=None) as batch_op:
+        if "input_schema" not in column_names:
+            batch_op.add_column(sa.Column("input_schema", sa.JSON(), nullable=True))
+
+
+def downgrade() -> None:
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)  # type: ignore
+    column_names = [column["name"] for column in inspector.get_columns("flow")]
+    with op.batch_alter_table("flow", schema=None) as batch_op:
+        if "input_schema" in column_names:
+            batch_op.drop_column("input_schema")
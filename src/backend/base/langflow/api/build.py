@@ -1,4 +1,5 @@
 import asyncio
+import contextlib
 import json
 import time
 import traceback
@@ -37,6 +38,12 @@ from langflow.services.deps import get_chat_service, get_telemetry_service, sess
 from langflow.services.job_queue.service import JobQueueNotFoundError, JobQueueService
 from langflow.services.telemetry.schema import ComponentPayload, PlaygroundPayload
 
+EVENT_CURSOR_HEADER = "X-Langflow-Event-Cursor"
+"""Header with the cursor of the last event returned by a polling request, with a shared job queue."""
+
+EVENT_POLL_TIMEOUT = 30.0
+"""Seconds a request waits for the next event of a job, with a shared job queue."""
+
 
 async def start_flow_build(
     *,
@@ -51,6 +58,7 @@ async def start_flow_build(
     current_user: CurrentActiveUser,
     queue_service: JobQueueService,
     flow_name: str | None = None,
+    coalesce_tokens: bool = False,
 ) -> str:
     """Start the flow build process by setting up the queue and starting the build task.
 
@@ -59,7 +67,8 @@ async def start_flow_build(
     """
     job_id = str(uuid.uuid4())
     try:
-        _, event_manager = queue_service.create_queue(job_id)
+        _, event_manager = queue_service.create_queue(job_id, coalesce_tokens=coalesce_tokens)
+        await queue_service.register_job(job_id)
         task_coro = generate_flow_events(
             flow_id=flow_id,
             background_tasks=background_tasks,
@@ -85,8 +94,13 @@ async def get_flow_events_response(
     job_id: str,
     queue_service: JobQueueService,
     event_delivery: EventDeliveryType,
+    cursor: str | None = None,
 ):
     """Get events for a specific build job, either as a stream or single event."""
+    if queue_service.is_shared:
+        return await get_shared_flow_events_response(
+            job_id=job_id, queue_service=queue_service, event_delivery=event_delivery, cursor=cursor
+        )
     try:
         main_queue, event_manager, event_task, _ = queue_service.get_queue_data(job_id)
         if event_delivery in (EventDeliveryType.STREAMING, EventDeliveryType.DIRECT):
@@ -146,6 +160,77 @@ async def get_flow_events_response(
         raise HTTPException(status_code=500, detail=f"Unexpected error: {exc!s}") from exc
 
 
+async def get_shared_flow_events_response(
+    *,
+    job_id: str,
+    queue_service: JobQueueService,
+    event_delivery: EventDeliveryType,
+    cursor: str | None = None,
+):
+    """Get the events of a build job from the job queue backend that all workers share.
+
+    Without a cursor, reading continues after the events the previous request returned. The cursor of
+    the last returned event is sent in the EVENT_CURSOR_HEADER header of polling responses.
+    """
+    try:
+        if event_delivery in (EventDeliveryType.STREAMING, EventDeliveryType.DIRECT):
+            # Fail with a 404 before the stream starts if the job does not exist
+            events, next_cursor = await queue_service.read_events(job_id, cursor)
+            return create_shared_flow_response(
+                job_id=job_id, queue_service=queue_service, events=events, cursor=cursor and next_cursor
+            )
+
+        events, next_cursor = await queue_service.read_events(job_id, cursor, timeout=EVENT_POLL_TIMEOUT)
+        content = "\n".join(event.decode("utf-8") for event in events if event is not None)
+        return Response(content=content, media_type="application/x-ndjson", headers={EVENT_CURSOR_HEADER: next_cursor})
+    except JobQueueNotFoundError as exc:
+        logger.error(f"Job not found: {job_id}. Error: {exc!s}")
+        raise HTTPException(status_code=404, detail=f"Job not found: {exc!s}") from exc
+    except asyncio.CancelledError as exc:
+        logger.info(f"Event polling was cancelled for job {job_id}")
+        raise HTTPException(status_code=499, detail="Event polling was cancelled") from exc
+    except Exception as exc:
+        logger.exception(f"Unexpected error processing flow events for job {job_id}")
+        raise HTTPException(status_code=500, detail=f"Unexpected error: {exc!s}") from exc
+
+
+def create_shared_flow_response(
+    *,
+    job_id: str,
+    queue_service: JobQueueService,
+    events: list[bytes | None],
+    cursor: str | None,
+) -> DisconnectHandlerStreamingResponse:
+    """Stream the events of a build job from the shared job queue backend, starting with `events`."""
+
+    async def consume_and_yield() -> AsyncIterator[str]:
+        nonlocal events, cursor
+        while True:
+            for value in events:
+                if value is None:
+                    return
+                yield value.decode("utf-8")
+            try:
+                events, next_cursor = await queue_service.read_events(job_id, cursor, timeout=EVENT_POLL_TIMEOUT)
+            except JobQueueNotFoundError:
+                logger.warning(f"Job {job_id} expired while streaming its events")
+                return
+            # Without a cursor the backend keeps track of the position
+            if cursor is not None:
+                cursor = next_cursor
+
+    async def on_disconnect() -> None:
+        logger.debug("Client disconnected, cancelling the job")
+        with contextlib.suppress(JobQueueNotFoundError):
+            await queue_service.request_cancel(job_id)
+
+    return DisconnectHandlerStreamingResponse(
+        consume_and_yield(),
+        media_type="application/x-ndjson",
+        on_disconnect=on_disconnect,
+    )
+
+
 async def create_flow_response(
     queue: asyncio.Queue,
     event_manager: EventManager,
@@ -160,6 +245,7 @@ async def create_flow_response(
                 if value is None:
                     break
                 get_time = time.time()
+                get_telemetry_service().record_event_queue_depth(queue.qsize(), delivery="streaming")
                 yield value.decode("utf-8")
                 logger.debug(f"Event {event_id} consumed in {get_time - put_time:.4f}s")
             except Exception as exc:  # noqa: BLE001
@@ -226,7 +312,7 @@ async def generate_flow_events(
             components_count = len(graph.vertices)
             vertices_to_run = list(graph.vertices_to_run.union(get_top_level_vertices(graph, graph.vertices_to_run)))
 
-            await chat_service.set_cache(flow_id_str, graph)
+            await chat_service.set_graph_cache(flow_id_str, graph)
             await log_telemetry(start_time, components_count, success=True)
 
         except Exception as exc:
@@ -343,7 +429,7 @@ async def generate_flow_events(
                     artifacts=artifacts,
                 )
             else:
-                await chat_service.set_cache(flow_id_str, graph)
+                await chat_service.set_graph_cache(flow_id_str, graph)
 
             timedelta = time.perf_counter() - start_time
             duration = format_elapsed_time(timedelta)
@@ -474,6 +560,7 @@ async def generate_flow_events(
 
     event_manager.on_end(data={})
     await graph.end_all_traces()
+    await event_manager.drain(flush=True)
     await event_manager.queue.put((None, None, time.time()))
 
 
@@ -496,6 +583,11 @@ async def cancel_flow_build(
         ValueError: If the job doesn't exist
         asyncio.CancelledError: If the task cancellation failed
     """
+    if queue_service.is_shared and not queue_service.owns_job(job_id):
+        # The worker running the job cancels it and ends its events
+        await queue_service.request_cancel(job_id)
+        return True
+
     # Get the event task and event manager for the job
     _, _, event_task, _ = queue_service.get_queue_data(job_id)
 
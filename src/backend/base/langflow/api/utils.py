@@ -7,6 +7,7 @@ from enum import Enum
 from typing import TYPE_CHECKING, Annotated, Any
 
 from fastapi import Depends, HTTPException, Query
+from fastapi.responses import FileResponse, StreamingResponse
 from fastapi_pagination import Params
 from loguru import logger
 from sqlalchemy import delete
@@ -20,10 +21,18 @@ from langflow.services.database.models.message import MessageTable
 from langflow.services.database.models.transactions.model import TransactionTable
 from langflow.services.database.models.vertex_builds.model import VertexBuildTable
 from langflow.services.deps import get_session, session_scope
+from langflow.services.storage.service import DEFAULT_CHUNK_SIZE
+from langflow.services.storage.utils import parse_range_header
 from langflow.services.store.utils import get_lf_version_from_pypi
 
 if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+    from fastapi import UploadFile
+    from starlette.responses import Response
+
     from langflow.services.chat.service import ChatService
+    from langflow.services.storage.service import StorageService
     from langflow.services.store.schema import StoreComponentCreate
 
 
@@ -93,14 +102,18 @@ def validate_is_component(flows: list[Flow]):
         if not flow.data or flow.is_component is not None:
             continue
 
-        is_component = get_is_component_from_data(flow.data)
-        if is_component is not None:
-            flow.is_component = is_component
-        else:
-            flow.is_component = len(flow.data.get("nodes", [])) == 1
+        flow.is_component = infer_is_component(flow.data)
     return flows
 
 
+def infer_is_component(data: dict) -> bool:
+    """Returns whether flow data saved without an is_component flag is a component."""
+    is_component = get_is_component_from_data(data)
+    if is_component is not None:
+        return is_component
+    return len(data.get("nodes", [])) == 1
+
+
 def get_is_component_from_data(data: dict):
     """Returns True if the data is a component."""
     return data.get("is_component")
@@ -193,7 +206,7 @@ async def build_graph_from_db_no_cache(flow_id: uuid.UUID, session: AsyncSession
 
 async def build_graph_from_db(flow_id: uuid.UUID, session: AsyncSession, chat_service: ChatService, **kwargs):
     graph = await build_graph_from_db_no_cache(flow_id=flow_id, session=session, **kwargs)
-    await chat_service.set_cache(str(flow_id), graph)
+    await chat_service.set_graph_cache(str(flow_id), graph)
     return graph
 
 
@@ -206,7 +219,7 @@ async def build_and_cache_graph_from_data(
     # Convert flow_id to str if it's UUID
     str_flow_id = str(flow_id) if isinstance(flow_id, uuid.UUID) else flow_id
     graph = Graph.from_payload(graph_data, str_flow_id)
-    await chat_service.set_cache(str_flow_id, graph)
+    await chat_service.set_graph_cache(str_flow_id, graph)
     return graph
 
 
@@ -378,3 +391,60 @@ async def verify_public_flow_and_get_user(flow_id: uuid.UUID, client_id: str | N
         raise HTTPException(status_code=403, detail=msg)
 
     return user, new_flow_id
+
+
+async def iter_upload_file(file: UploadFile, chunk_size: int = DEFAULT_CHUNK_SIZE) -> AsyncIterator[bytes]:
+    """Yield the content of an uploaded file in chunks, without reading it into memory at once."""
+    while chunk := await file.read(chunk_size):
+        yield chunk
+
+
+async def build_file_response(
+    storage_service: StorageService,
+    flow_id: str,
+    file_name: str,
+    *,
+    range_header: str | None = None,
+    media_type: str = "application/octet-stream",
+    headers: dict[str, str] | None = None,
+) -> Response:
+    """Stream a stored file, or the byte range of it that was requested.
+
+    Files on the local filesystem are sent with a FileResponse, which handles Range requests itself
+    and lets servers that support it send the file without copying it through Python. Other files
+    are streamed from the storage in chunks.
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
+        HTTPException: 416 if the requested range is outside of the file.
+    """
+    headers = dict(headers or {})
+    local_path = storage_service.get_local_path(flow_id, file_name)
+    if local_path is not None:
+        if not await local_path.is_file():
+            msg = f"File {file_name} not found in flow {flow_id}"
+            raise FileNotFoundError(msg)
+        return FileResponse(str(local_path), media_type=media_type, headers=headers)
+
+    file_size = await storage_service.get_file_size(flow_id, file_name)
+    headers["Accept-Ranges"] = "bytes"
+    try:
+        byte_range = parse_range_header(range_header, file_size)
+    except ValueError as e:
+        raise HTTPException(status_code=416, detail=str(e), headers={"Content-Range": f"bytes */{file_size}"}) from e
+
+    if byte_range is None:
+        headers["Content-Length"] = str(file_size)
+        return StreamingResponse(
+            storage_service.get_file_stream(flow_id, file_name), media_type=media_type, headers=headers
+        )
+
+    start, end = byte_range
+    headers["Content-Range"] = f"bytes {start}-{end}/{file_size}"
+    headers["Content-Length"] = str(end - start + 1)
+    return StreamingResponse(
+        storage_service.get_file_stream(flow_id, file_name, start=start, end=end),
+        status_code=206,
+        media_type=media_type,
+        headers=headers,
+    )
@@ -113,7 +113,7 @@ async def retrieve_vertices_order(
         # and return the same structure but only with the ids
         components_count = len(graph.vertices)
         vertices_to_run = list(graph.vertices_to_run.union(get_top_level_vertices(graph, graph.vertices_to_run)))
-        await chat_service.set_cache(str(flow_id), graph)
+        await chat_service.set_graph_cache(str(flow_id), graph)
         background_tasks.add_task(
             telemetry_service.log_package_playground,
             PlaygroundPayload(
@@ -154,6 +154,7 @@ async def build_flow(
     queue_service: Annotated[JobQueueService, Depends(get_queue_service)],
     flow_name: str | None = None,
     event_delivery: EventDeliveryType = EventDeliveryType.POLLING,
+    coalesce_tokens: bool = False,
 ):
     """Build and process a flow, returning a job ID for event polling.
 
@@ -173,6 +174,7 @@ async def build_flow(
         queue_service: Queue service for job management
         flow_name: Optional name for the flow
         event_delivery: Optional event delivery type - default is streaming
+        coalesce_tokens: Whether to batch streamed tokens into fewer events
 
     Returns:
         Dict with job_id that can be used to poll for build status
@@ -195,6 +197,7 @@ async def build_flow(
         current_user=current_user,
         queue_service=queue_service,
         flow_name=flow_name,
+        coalesce_tokens=coalesce_tokens,
     )
 
     # This is required to support FE tests - we need to be able to set the event delivery to direct
@@ -213,12 +216,18 @@ async def get_build_events(
     queue_service: Annotated[JobQueueService, Depends(get_queue_service)],
     *,
     event_delivery: EventDeliveryType = EventDeliveryType.STREAMING,
+    cursor: str | None = None,
 ):
-    """Get events for a specific build job."""
+    """Get events for a specific build job.
+
+    With a shared job queue backend, `cursor` resumes after the event it identifies. Polling responses
+    return the cursor of their last event in the X-Langflow-Event-Cursor header.
+    """
     return await get_flow_events_response(
         job_id=job_id,
         queue_service=queue_service,
         event_delivery=event_delivery,
+        cursor=cursor,
     )
 
 
@@ -289,12 +298,12 @@ async def build_vertex(
     start_time = time.perf_counter()
     error_message = None
     try:
-        graph: Graph = await chat_service.get_cache(flow_id_str)
+        graph: Graph = await chat_service.get_graph_cache(flow_id_str)
     except KeyError as exc:
         raise HTTPException(status_code=404, detail="Graph not found") from exc
 
     try:
-        cache = await chat_service.get_cache(flow_id_str)
+        cache = await chat_service.get_graph_cache(flow_id_str)
         if isinstance(cache, CacheMiss):
             # If there's no cache
             logger.warning(f"No cache found for {flow_id_str}. Building graph starting at {vertex_id}")
@@ -343,7 +352,7 @@ async def build_vertex(
             background_tasks.add_task(graph.end_all_traces_in_context(error=exc))
             # If there's an error building the vertex
             # we need to clear the cache
-            await chat_service.clear_cache(flow_id_str)
+            await chat_service.clear_graph_cache(flow_id_str)
 
         result_data_response.message = artifacts
 
@@ -368,7 +377,7 @@ async def build_vertex(
         graph.reset_inactivated_vertices()
         graph.reset_activated_vertices()
 
-        await chat_service.set_cache(flow_id_str, graph)
+        await chat_service.set_graph_cache(flow_id_str, graph)
 
         # graph.stop_vertex tells us if the user asked
         # to stop the build of the graph at a certain vertex
@@ -419,7 +428,7 @@ async def _stream_vertex(flow_id: str, vertex_id: str, chat_service: ChatService
     graph = None
     try:
         try:
-            cache = await chat_service.get_cache(flow_id)
+            cache = await chat_service.get_graph_cache(flow_id)
         except Exception as exc:  # noqa: BLE001
             logger.exception("Error building Component")
             yield str(StreamData(event="error", data={"error": str(exc)}))
@@ -493,7 +502,7 @@ async def _stream_vertex(flow_id: str, vertex_id: str, chat_service: ChatService
     finally:
         logger.debug("Closing stream")
         if graph:
-            await chat_service.set_cache(flow_id, graph)
+            await chat_service.set_graph_cache(flow_id, graph)
         yield str(StreamData(event="close", data={"message": "Stream closed"}))
 
 
@@ -573,6 +582,7 @@ async def build_public_tmp(
     request: Request,
     queue_service: Annotated[JobQueueService, Depends(get_queue_service)],
     event_delivery: EventDeliveryType = EventDeliveryType.POLLING,
+    coalesce_tokens: bool = False,
 ):
     """Build a public flow without requiring authentication.
 
@@ -601,6 +611,7 @@ async def build_public_tmp(
         request: FastAPI request object (needed for cookie access)
         queue_service: Queue service for job management
         event_delivery: Optional event delivery type - default is streaming
+        coalesce_tokens: Whether to batch streamed tokens into fewer events
 
     Returns:
         Dict with job_id that can be used to poll for build status
@@ -623,6 +634,7 @@ async def build_public_tmp(
             current_user=owner_user,
             queue_service=queue_service,
             flow_name=flow_name or f"{client_id}_{flow_id}",
+            coalesce_tokens=coalesce_tokens,
         )
     except Exception as exc:
         logger.exception("Error building public flow")
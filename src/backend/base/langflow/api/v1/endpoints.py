@@ -1,21 +1,26 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import time
 from collections.abc import AsyncGenerator
 from http import HTTPStatus
 from typing import TYPE_CHECKING, Annotated
 from uuid import UUID
 
+import orjson
 import sqlalchemy as sa
 from fastapi import APIRouter, BackgroundTasks, Body, Depends, HTTPException, Request, UploadFile, status
 from fastapi.encoders import jsonable_encoder
-from fastapi.responses import StreamingResponse
+from fastapi.responses import Response, StreamingResponse
 from loguru import logger
 from sqlmodel import select
 
 from langflow.api.utils import CurrentActiveUser, DbSession, parse_value
 from langflow.api.v1.schemas import (
+    BatchRunRequest,
+    BatchRunResponse,
+    BatchRunResult,
     ConfigResponse,
     CustomComponentRequest,
     CustomComponentResponse,
@@ -27,8 +32,9 @@ from langflow.api.v1.schemas import (
     UploadFileResponse,
 )
 from langflow.custom.custom_component.component import Component
+from langflow.custom.eval import component_class_cache
 from langflow.custom.utils import build_custom_component_template, get_instance_name, update_component_build_config
-from langflow.events.event_manager import create_stream_tokens_event_manager
+from langflow.events.event_manager import create_event_queue, create_stream_tokens_event_manager
 from langflow.exceptions.api import APIException, InvalidChatInputError
 from langflow.exceptions.serialization import SerializationError
 from langflow.graph.graph.base import Graph
@@ -36,6 +42,8 @@ from langflow.graph.schema import RunOutputs
 from langflow.helpers.flow import get_flow_by_id_or_endpoint_name
 from langflow.helpers.user import get_user_by_flow_id_or_endpoint_name
 from langflow.interface.initialize.loading import update_params_with_load_from_db_fields
+from langflow.processing.batch import run_graph_batch
+from langflow.processing.graph_templates import graph_template_cache
 from langflow.processing.process import process_tweaks, run_graph_internal
 from langflow.schema.graph import Tweaks
 from langflow.services.auth.utils import api_key_security, get_current_active_user
@@ -47,10 +55,11 @@ from langflow.services.database.models.user.model import User, UserRead
 from langflow.services.deps import get_session_service, get_settings_service, get_telemetry_service
 from langflow.services.settings.feature_flags import FEATURE_FLAGS
 from langflow.services.telemetry.schema import RunPayload
-from langflow.utils.compression import compress_response
+from langflow.utils.compression import compressed_response
 from langflow.utils.version import get_version_info
 
 if TYPE_CHECKING:
+    from langflow.processing.batch import BatchItemResult
     from langflow.services.event_manager import EventManager
     from langflow.services.settings.service import SettingsService
 
@@ -58,17 +67,21 @@ router = APIRouter(tags=["Base"])
 
 
 @router.get("/all", dependencies=[Depends(get_current_active_user)])
-async def get_all():
+async def get_all(request: Request):
     """Retrieve all component types with compression for better performance.
 
-    Returns a compressed response containing all available component types.
+    Returns a compressed response containing all available component types. The response carries an
+    ETag, and requests whose If-None-Match header matches it get an empty 304 response.
     """
-    from langflow.interface.components import get_and_cache_all_types_dict
+    from langflow.interface.components import component_cache, get_and_cache_all_types_dict
 
     try:
-        all_types = await get_and_cache_all_types_dict(settings_service=get_settings_service())
-        # Return compressed response using our utility function
-        return compress_response(all_types)
+        await get_and_cache_all_types_dict(settings_service=get_settings_service())
+        # The catalog is serialized and compressed once, not on every request
+        etag, compressed = await asyncio.to_thread(component_cache.get_response)
+        if etag in request.headers.get("if-none-match", ""):
+            return Response(status_code=HTTPStatus.NOT_MODIFIED, headers={"ETag": etag})
+        return compressed_response(compressed, headers={"ETag": etag})
 
     except Exception as exc:
         raise HTTPException(status_code=500, detail=str(exc)) from exc
@@ -106,6 +119,22 @@ def validate_input_and_tweaks(input_request: SimplifiedAPIRequest) -> None:
             raise InvalidChatInputError(msg)
 
 
+def get_output_ids(graph: Graph, output_type: str | None, output_component: str | None) -> list[str]:
+    """Returns the IDs of the vertices whose outputs a run through the API returns."""
+    if output_component:
+        return [output_component]
+    return [
+        vertex.id
+        for vertex in graph.vertices
+        if output_type == "debug"
+        or (
+            vertex.is_output
+            # type: ignore[operator]
+            and (output_type == "any" or output_type in vertex.id.lower())
+        )
+    ]
+
+
 async def simple_run_flow(
     flow: Flow,
     input_request: SimplifiedAPIRequest,
@@ -122,11 +151,7 @@ async def simple_run_flow(
         if flow.data is None:
             msg = f"Flow {flow_id_str} has no data"
             raise ValueError(msg)
-        graph_data = flow.data.copy()
-        graph_data = process_tweaks(
-            graph_data, input_request.tweaks or {}, stream=stream)
-        graph = Graph.from_payload(
-            graph_data, flow_id=flow_id_str, user_id=str(user_id), flow_name=flow.name)
+        graph = graph_template_cache.get_graph(flow, input_request.tweaks, stream=stream, user_id=str(user_id))
         inputs = None
         if input_request.input_value is not None:
             inputs = [
@@ -136,19 +161,7 @@ async def simple_run_flow(
                     type=input_request.input_type,
                 )
             ]
-        if input_request.output_component:
-            outputs = [input_request.output_component]
-        else:
-            outputs = [
-                vertex.id
-                for vertex in graph.vertices
-                if input_request.output_type == "debug"
-                or (
-                    vertex.is_output
-                    # type: ignore[operator]
-                    and (input_request.output_type == "any" or input_request.output_type in vertex.id.lower())
-                )
-            ]
+        outputs = get_output_ids(graph, input_request.output_type, input_request.output_component)
         task_result, session_id = await run_graph_internal(
             graph=graph,
             flow_id=flow_id_str,
@@ -296,6 +309,7 @@ async def run_flow_generator(
         event_manager.on_error(data={"error": f"Unexpected error: {error_msg}"})
     finally:
         logger.debug(f"[run_flow_generator][{exec_id}] Flow execution process completed, sending final event")
+        await event_manager.drain(flush=True)
         await event_manager.queue.put((None, None, time.time))
 
 
@@ -306,6 +320,7 @@ async def simplified_run_flow(
     flow: Annotated[FlowRead | None, Depends(get_flow_by_id_or_endpoint_name)],
     input_request: SimplifiedAPIRequest | None = None,
     stream: bool = False,
+    coalesce_tokens: bool = False,
     api_key_user: Annotated[UserRead, Depends(api_key_security)],
     flow_id_or_name: str,
 ):
@@ -319,6 +334,7 @@ async def simplified_run_flow(
         flow (FlowRead | None): The flow to execute, loaded via dependency
         input_request (SimplifiedAPIRequest | None): Input parameters for the flow
         stream (bool): Whether to stream the response
+        coalesce_tokens (bool): Whether to batch streamed tokens into fewer events
         api_key_user (UserRead): Authenticated user from API key
         request (Request): The incoming HTTP request
 
@@ -358,9 +374,9 @@ async def simplified_run_flow(
     start_time = time.perf_counter()
 
     if stream:
-        asyncio_queue: asyncio.Queue = asyncio.Queue()
+        asyncio_queue = create_event_queue(coalesce_tokens=coalesce_tokens)
         asyncio_queue_client_consumed: asyncio.Queue = asyncio.Queue()
-        event_manager = create_stream_tokens_event_manager(queue=asyncio_queue)
+        event_manager = create_stream_tokens_event_manager(queue=asyncio_queue, coalesce_tokens=coalesce_tokens)
         main_task = asyncio.create_task(
             run_flow_generator(
                 flow=flow,
@@ -437,6 +453,112 @@ async def simplified_run_flow(
     return result
 
 
+def _to_batch_run_result(item: BatchItemResult) -> BatchRunResult:
+    return BatchRunResult(
+        index=item.index,
+        session_id=item.session_id,
+        outputs=item.outputs,
+        error=str(item.error) if item.error is not None else None,
+    )
+
+
+@router.post("/run/batch/{flow_id_or_name}", response_model=None, response_model_exclude_none=True)
+async def batch_run_flow(
+    *,
+    background_tasks: BackgroundTasks,
+    flow: Annotated[FlowRead | None, Depends(get_flow_by_id_or_endpoint_name)],
+    batch_request: BatchRunRequest,
+    stream: bool = False,
+    api_key_user: Annotated[UserRead, Depends(api_key_security)],
+    flow_id_or_name: str,
+):
+    """Runs a flow once for each of many inputs, concurrently.
+
+    Each input runs on its own copy of the flow's graph, while the components that do not depend
+    on the inputs are built once and shared by all runs. An input that fails gets an error in its
+    result instead of failing the whole request.
+
+    Args:
+        background_tasks (BackgroundTasks): FastAPI background task manager
+        flow (FlowRead | None): The flow to execute, loaded via dependency
+        batch_request (BatchRunRequest): The inputs and the parameters shared by all runs
+        stream (bool): Whether to stream each result as soon as its run completes
+        api_key_user (UserRead): Authenticated user from API key
+        flow_id_or_name (str): The ID or endpoint name of the flow
+
+    Returns:
+        Union[StreamingResponse, BatchRunResponse]: Either a stream of newline-delimited JSON results
+        in the order the runs complete, or a BatchRunResponse with the results in the order of the inputs
+
+    Raises:
+        HTTPException: For flow not found (404) or invalid input (400)
+        APIException: For errors building the flow (500)
+    """
+    logger.debug(f"[batch_run_flow] Running {len(batch_request.inputs)} inputs on flow {flow_id_or_name}")
+    if flow is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Flow not found")
+    settings = get_settings_service().settings
+    if len(batch_request.inputs) > settings.batch_run_max_inputs:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"A batch run accepts at most {settings.batch_run_max_inputs} inputs",
+        )
+    max_concurrency = settings.batch_run_max_concurrency
+    if batch_request.max_concurrency is not None:
+        max_concurrency = min(batch_request.max_concurrency, max_concurrency or batch_request.max_concurrency)
+
+    input_value = next((item.input_value for item in batch_request.inputs if item.input_value is not None), None)
+    try:
+        validate_input_and_tweaks(
+            SimplifiedAPIRequest(
+                input_value=input_value, input_type=batch_request.input_type, tweaks=batch_request.tweaks
+            )
+        )
+        graph = graph_template_cache.get_graph(flow, batch_request.tweaks, user_id=str(api_key_user.id))
+    except InvalidChatInputError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+    except Exception as exc:
+        raise APIException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, exception=exc, flow=flow) from exc
+
+    inputs = [
+        InputValueRequest(components=[], input_value=item.input_value, type=batch_request.input_type)
+        if item.input_value is not None
+        else None
+        for item in batch_request.inputs
+    ]
+    batch_results = run_graph_batch(
+        graph,
+        inputs,
+        flow_id=str(flow.id),
+        outputs=get_output_ids(graph, batch_request.output_type, batch_request.output_component),
+        session_ids=[item.session_id for item in batch_request.inputs],
+        max_concurrency=max_concurrency,
+    )
+
+    if stream:
+
+        async def stream_results() -> AsyncGenerator[str, None]:
+            async with contextlib.aclosing(batch_results):
+                async for item in batch_results:
+                    yield orjson.dumps(jsonable_encoder(_to_batch_run_result(item))).decode("utf-8") + "\n"
+
+        return StreamingResponse(stream_results(), media_type="application/x-ndjson")
+
+    start_time = time.perf_counter()
+    results = sorted([_to_batch_run_result(item) async for item in batch_results], key=lambda result: result.index)
+    errors = [result.error for result in results if result.error is not None]
+    background_tasks.add_task(
+        get_telemetry_service().log_package_run,
+        RunPayload(
+            run_is_webhook=False,
+            run_seconds=int(time.perf_counter() - start_time),
+            run_success=not errors,
+            run_error_message=errors[0] if errors else "",
+        ),
+    )
+    return BatchRunResponse(results=results)
+
+
 @router.post("/webhook/{flow_id_or_name}", response_model=dict, status_code=HTTPStatus.ACCEPTED)  # noqa: RUF100, FAST003
 async def webhook_run_flow(
     flow: Annotated[Flow, Depends(get_flow_by_id_or_endpoint_name)],
@@ -758,6 +880,8 @@ async def custom_component(
     raw_code: CustomComponentRequest,
     user: CurrentActiveUser,
 ) -> CustomComponentResponse:
+    # The code was just edited, so compile it again in case the modules it imports changed
+    component_class_cache.invalidate(raw_code.code)
     component = Component(_code=raw_code.code)
 
     built_frontend_node, component_instance = build_custom_component_template(
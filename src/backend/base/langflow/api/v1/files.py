@@ -1,16 +1,14 @@
 import hashlib
 from datetime import datetime, timezone
 from http import HTTPStatus
-from io import BytesIO
 from pathlib import Path
 from typing import Annotated
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, UploadFile
-from fastapi.responses import StreamingResponse
+from fastapi import APIRouter, Depends, Header, HTTPException, UploadFile
 from loguru import logger
 
-from langflow.api.utils import CurrentActiveUser, DbSession
+from langflow.api.utils import CurrentActiveUser, DbSession, build_file_response, iter_upload_file
 from langflow.api.v1.schemas import UploadFileResponse
 from langflow.services.database.models.flow import Flow
 from langflow.services.deps import get_settings_service, get_storage_service
@@ -66,21 +64,32 @@ async def upload_file(
             status_code=403, detail="You don't have access to this flow")
 
     try:
-        file_content = await file.read()
         timestamp = datetime.now(
             tz=timezone.utc).astimezone().strftime("%Y-%m-%d_%H-%M-%S")
-        file_name = file.filename or hashlib.sha256(file_content).hexdigest()
+        file_name = file.filename or await _hash_upload_file(file)
         full_file_name = f"{timestamp}_{file_name}"
         folder = str(flow.id)
-        await storage_service.save_file(flow_id=folder, file_name=full_file_name, data=file_content)
+        await storage_service.save_file_stream(
+            flow_id=folder, file_name=full_file_name, chunks=iter_upload_file(file))
         return UploadFileResponse(flow_id=str(flow.id), file_path=f"{folder}/{full_file_name}")
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e)) from e
 
 
+async def _hash_upload_file(file: UploadFile) -> str:
+    sha256 = hashlib.sha256()
+    async for chunk in iter_upload_file(file):
+        sha256.update(chunk)
+    await file.seek(0)
+    return sha256.hexdigest()
+
+
 @router.get("/download/{flow_id}/{file_name}")
 async def download_file(
-    file_name: str, flow_id: UUID, storage_service: Annotated[StorageService, Depends(get_storage_service)]
+    file_name: str,
+    flow_id: UUID,
+    storage_service: Annotated[StorageService, Depends(get_storage_service)],
+    range_header: Annotated[str | None, Header(alias="Range")] = None,
 ):
     flow_id_str = str(flow_id)
     extension = file_name.split(".")[-1]
@@ -98,19 +107,23 @@ async def download_file(
             status_code=500, detail=f"Content type not found for extension {extension}")
 
     try:
-        file_content = await storage_service.get_file(flow_id=flow_id_str, file_name=file_name)
         headers = {
             "Content-Disposition": f"attachment; filename={file_name} filename*=UTF-8''{file_name}",
             "Content-Type": "application/octet-stream",
-            "Content-Length": str(len(file_content)),
         }
-        return StreamingResponse(BytesIO(file_content), media_type=content_type, headers=headers)
+        return await build_file_response(
+            storage_service, flow_id_str, file_name, range_header=range_header, media_type=content_type, headers=headers
+        )
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e)) from e
 
 
 @router.get("/images/{flow_id}/{file_name}")
-async def download_image(file_name: str, flow_id: UUID):
+async def download_image(
+    file_name: str, flow_id: UUID, range_header: Annotated[str | None, Header(alias="Range")] = None
+):
     storage_service = get_storage_service()
     extension = file_name.split(".")[-1]
     flow_id_str = str(flow_id)
@@ -131,8 +144,11 @@ async def download_image(file_name: str, flow_id: UUID):
             status_code=500, detail=f"Content type {content_type} is not an image")
 
     try:
-        file_content = await storage_service.get_file(flow_id=flow_id_str, file_name=file_name)
-        return StreamingResponse(BytesIO(file_content), media_type=content_type)
+        return await build_file_response(
+            storage_service, flow_id_str, file_name, range_header=range_header, media_type=content_type
+        )
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e)) from e
 
@@ -150,8 +166,7 @@ async def download_profile_picture(
         folder_path = config_path / "profile_pictures" / folder_name
         content_type = build_content_type_from_extension(extension)
         # type: ignore[arg-type]
-        file_content = await storage_service.get_file(flow_id=folder_path, file_name=file_name)
-        return StreamingResponse(BytesIO(file_content), media_type=content_type)
+        return await build_file_response(storage_service, folder_path, file_name, media_type=content_type)
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e)) from e
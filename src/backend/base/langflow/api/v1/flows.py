@@ -1,10 +1,12 @@
 from __future__ import annotations
 
+import asyncio
 import io
 import json
 import re
 import zipfile
 from datetime import datetime, timezone
+from http import HTTPStatus
 from typing import Annotated
 from uuid import UUID
 from loguru import logger
@@ -12,19 +14,28 @@ from loguru import logger
 import orjson
 from aiofile import async_open
 from anyio import Path
-from fastapi import APIRouter, Depends, File, HTTPException, UploadFile
+from fastapi import APIRouter, Depends, File, Header, HTTPException, Response, UploadFile
 from fastapi.encoders import jsonable_encoder
 from fastapi.responses import StreamingResponse
 from fastapi_pagination import Page, Params
 from fastapi_pagination.ext.sqlalchemy import paginate
-from sqlmodel import and_, col, select
+from sqlmodel import and_, col, func, select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
-from langflow.api.utils import CurrentActiveUser, DbSession, cascade_delete_flow, remove_api_keys, validate_is_component
+from langflow.api.utils import (
+    CurrentActiveUser,
+    DbSession,
+    cascade_delete_flow,
+    infer_is_component,
+    remove_api_keys,
+    validate_is_component,
+)
 from langflow.api.v1.schemas import FlowListCreate
 from langflow.helpers.user import get_user_by_flow_id_or_endpoint_name
 from langflow.initial_setup.constants import STARTER_FOLDER_NAME
 from langflow.logging import logger
+from langflow.processing.flow_listings import flow_listing_cache
+from langflow.processing.graph_templates import graph_template_cache
 from langflow.services.database.models.flow import Flow, FlowCreate, FlowRead, FlowUpdate
 from langflow.services.database.models.flow.model import AccessTypeEnum, FlowHeader
 from langflow.services.database.models.flow.utils import get_webhook_component_in_flow
@@ -32,7 +43,7 @@ from langflow.services.database.models.folder.constants import DEFAULT_FOLDER_NA
 from langflow.services.database.models.folder.model import Folder
 from langflow.services.deps import get_settings_service
 from langflow.services.settings.service import SettingsService
-from langflow.utils.compression import compress_response
+from langflow.utils.compression import compress_response, compressed_response
 
 # build router
 router = APIRouter(prefix="/flows", tags=["Flows"])
@@ -164,6 +175,8 @@ async def create_flow(
         db_flow = await _new_flow(session=session, flow=flow, user_id=current_user.id)
         await session.commit()
         await session.refresh(db_flow)
+        graph_template_cache.invalidate_flow(db_flow.id)
+        flow_listing_cache.invalidate_user(db_flow.user_id)
 
         await _save_flow_to_fs(db_flow)
 
@@ -198,6 +211,7 @@ async def read_flows(
     folder_id: UUID | None = None,
     params: Annotated[Params, Depends()],
     header_flows: bool = False,
+    if_none_match: Annotated[str | None, Header(alias="If-None-Match")] = None,
 ):
     """Retrieve a list of flows with pagination support.
 
@@ -214,10 +228,13 @@ async def read_flows(
         params (Params): Pagination parameters.
         remove_example_flows (bool, optional): Whether to remove example flows. Defaults to False.
         header_flows (bool, optional): Whether to return only specific headers of the flows. Defaults to False.
+        if_none_match (str, optional): The ETag of a listing the client already has. Defaults to None.
 
     Returns:
         list[FlowRead] | Page[FlowRead] | list[FlowHeader]
         A list of flows or a paginated response containing the list of flows or a list of flow headers.
+        Lists are compressed and carry an ETag, and requests whose If-None-Match header matches it
+        get an empty 304 response.
     """
     try:
         logger.debug(f"Reading flows for user: {current_user}")
@@ -242,33 +259,44 @@ async def read_flows(
             folder_id = default_folder_id
 
         if auth_settings.AUTO_LOGIN:
-            stmt = select(Flow).where(
-                (Flow.user_id == None) | (Flow.user_id == current_user.id)  # noqa: E711
-            )
+            conditions = [(Flow.user_id == None) | (Flow.user_id == current_user.id)]  # noqa: E711
         else:
-            stmt = select(Flow).where(Flow.user_id == current_user.id)
+            conditions = [Flow.user_id == current_user.id]
 
         if remove_example_flows:
-            stmt = stmt.where(Flow.folder_id != starter_folder_id)
+            conditions.append(Flow.folder_id != starter_folder_id)
 
         if components_only:
-            stmt = stmt.where(Flow.is_component == True)  # noqa: E712
+            conditions.append(Flow.is_component == True)  # noqa: E712
+
+        stmt = select(Flow).where(*conditions)
 
         if get_all:
-            flows = (await session.exec(stmt)).all()
-            flows = validate_is_component(flows)
-            if components_only:
-                flows = [flow for flow in flows if flow.is_component]
-            if remove_example_flows and starter_folder_id:
-                flows = [flow for flow in flows if flow.folder_id !=
-                         starter_folder_id]
-            if header_flows:
-                # Convert to FlowHeader objects and compress the response
-                flow_headers = [FlowHeader.model_validate(flow, from_attributes=True) for flow in flows]
-                return compress_response(flow_headers)
-
-            # Compress the full flows response
-            return compress_response(flows)
+            # Counting the flows and reading their last update is cheap next to loading them, and
+            # tells whether a cached listing is still current
+            version_stmt = select(func.count(Flow.id), func.max(Flow.updated_at)).where(*conditions)
+            version = tuple((await session.exec(version_stmt)).one())
+            key = flow_listing_cache.key(
+                current_user.id, auth_settings.AUTO_LOGIN, header_flows, components_only, remove_example_flows
+            )
+            listing = flow_listing_cache.get(key, version)
+            if listing is None:
+                if header_flows:
+                    # Headers never need the data of flows that are not components
+                    flows = await _read_flow_headers(session, conditions)
+                else:
+                    flows = validate_is_component((await session.exec(stmt)).all())
+                if components_only:
+                    flows = [flow for flow in flows if flow.is_component]
+                if remove_example_flows and starter_folder_id:
+                    flows = [flow for flow in flows if flow.folder_id !=
+                             starter_folder_id]
+                listing = await asyncio.to_thread(flow_listing_cache.set, key, version, flows)
+
+            etag, compressed = listing
+            if if_none_match and etag in if_none_match:
+                return Response(status_code=HTTPStatus.NOT_MODIFIED, headers={"ETag": etag})
+            return compressed_response(compressed, headers={"ETag": etag})
 
         stmt = stmt.where(Flow.folder_id == folder_id)
         flows = await paginate(session, stmt, params=params)
@@ -281,6 +309,28 @@ async def read_flows(
         raise HTTPException(status_code=500, detail=str(e)) from e
 
 
+async def _read_flow_headers(session: AsyncSession, conditions: list) -> list[FlowHeader]:
+    """Read the headers of the flows that match `conditions`, without loading the data of flows."""
+    columns = [getattr(Flow, name) for name in FlowHeader.model_fields if name != "data"]
+    rows = (await session.exec(select(*columns).where(*conditions))).all()
+
+    # Only components keep their data in a header, and flows saved without is_component need
+    # their data to tell whether they are one
+    data_ids = [row.id for row in rows if row.is_component is not False]
+    flows_data = {}
+    if data_ids:
+        flows_data = dict((await session.exec(select(Flow.id, Flow.data).where(col(Flow.id).in_(data_ids)))).all())
+
+    headers = []
+    for row in rows:
+        values = row._asdict()
+        data = flows_data.get(row.id)
+        if values["is_component"] is None and data:
+            values["is_component"] = infer_is_component(data)
+        headers.append(FlowHeader(**values, data=data))
+    return headers
+
+
 async def _read_flow(
     session: AsyncSession,
     flow_id: UUID,
@@ -370,6 +420,8 @@ async def update_flow(
         session.add(db_flow)
         await session.commit()
         await session.refresh(db_flow)
+        graph_template_cache.invalidate_flow(db_flow.id)
+        flow_listing_cache.invalidate_user(db_flow.user_id)
 
         await _save_flow_to_fs(db_flow)
 
@@ -413,6 +465,8 @@ async def delete_flow(
         raise HTTPException(status_code=404, detail="Flow not found")
     await cascade_delete_flow(session, flow.id)
     await session.commit()
+    graph_template_cache.invalidate_flow(flow.id)
+    flow_listing_cache.invalidate_user(flow.user_id)
     return {"message": "Flow deleted successfully"}
 
 
@@ -431,6 +485,7 @@ async def create_flows(
         session.add(db_flow)
         db_flows.append(db_flow)
     await session.commit()
+    flow_listing_cache.invalidate_user(current_user.id)
     for db_flow in db_flows:
         await session.refresh(db_flow)
     return db_flows
@@ -460,6 +515,7 @@ async def upload_file(
 
     try:
         await session.commit()
+        flow_listing_cache.invalidate_user(current_user.id)
         for db_flow in response_list:
             await session.refresh(db_flow)
             await _save_flow_to_fs(db_flow)
@@ -507,8 +563,10 @@ async def delete_multiple_flows(
         ).all()
         for flow in flows_to_delete:
             await cascade_delete_flow(db, flow.id)
+            graph_template_cache.invalidate_flow(flow.id)
 
         await db.commit()
+        flow_listing_cache.invalidate_user(user.id)
         return {"deleted": len(flows_to_delete)}
     except Exception as exc:
         raise HTTPException(status_code=500, detail=str(exc)) from exc
@@ -21,8 +21,7 @@ from starlette.background import BackgroundTasks
 
 from langflow.api.v1.chat import build_flow_and_stream
 from langflow.api.v1.schemas import InputValueRequest
-from langflow.base.mcp.util import get_flow_snake_case
-from langflow.helpers.flow import json_schema_from_flow
+from langflow.base.mcp.util import get_flow_snake_case, list_flow_tools
 from langflow.services.auth.utils import get_current_active_user
 from langflow.services.database.models import Flow, User
 from langflow.services.deps import (
@@ -172,37 +171,60 @@ async def handle_read_resource(uri: str) -> bytes:
         raise
 
 
-@server.list_tools()
-async def handle_list_tools():
+def register_list_tools(
+    mcp_server: Server, list_tools: Callable[[str | None], Awaitable[tuple[list[types.Tool], str | None]]]
+) -> None:
+    """Serve the list_tools requests of an MCP server one page at a time.
+
+    The `list_tools` decorator of the server ignores the cursor of requests, so the handler is
+    registered directly. `list_tools` gets the cursor of a request and returns the tools of the
+    page and the cursor of the next one.
+    """
+
+    async def handler(request: types.ListToolsRequest | None) -> types.ServerResult:
+        cursor = request.params.cursor if request is not None and request.params is not None else None
+        tools, next_cursor = await list_tools(cursor)
+        # The server validates the arguments of tool calls against the tools it listed
+        tool_cache = getattr(mcp_server, "_tool_cache", None)
+        if tool_cache is not None:
+            tool_cache.update((tool.name, tool) for tool in tools)
+        return types.ServerResult(types.ListToolsResult(tools=tools, nextCursor=next_cursor))
+
+    mcp_server.request_handlers[types.ListToolsRequest] = handler
+
+
+async def handle_list_tools(cursor: str | None = None) -> tuple[list[types.Tool], str | None]:
+    """List the flows of the current user as tools, from the input schemas stored with them."""
     tools = []
     try:
+        current_user = current_user_ctx.get()
+        page_size = get_settings_service().settings.mcp_server_tools_page_size
         db_service = get_db_service()
         async with db_service.with_session() as session:
-            flows = (await session.exec(select(Flow))).all()
-
-            for flow in flows:
-                if flow.user_id is None:
-                    continue
-
-                flow_name = "_".join(flow.name.lower().split())
-                try:
-                    tool = types.Tool(
-                        name=flow_name,
-                        description=f"{flow.id}: {flow.description}"
-                        if flow.description
-                        else f"Tool generated from flow: {flow_name}",
-                        inputSchema=json_schema_from_flow(flow),
-                    )
-                    tools.append(tool)
-                except Exception as e:  # noqa: BLE001
-                    msg = f"Error in listing tools: {e!s} from flow: {flow_name}"
-                    logger.warning(msg)
-                    continue
+            flows, next_cursor = await list_flow_tools(session, current_user.id, cursor=cursor, limit=page_size)
+
+        for flow in flows:
+            flow_name = "_".join(flow.name.lower().split())
+            if flow.input_schema is None:
+                msg = f"Error in listing tools: no input schema from flow: {flow_name}"
+                logger.warning(msg)
+                continue
+            tool = types.Tool(
+                name=flow_name,
+                description=f"{flow.id}: {flow.description}"
+                if flow.description
+                else f"Tool generated from flow: {flow_name}",
+                inputSchema=flow.input_schema,
+            )
+            tools.append(tool)
     except Exception as e:
         msg = f"Error in listing tools: {e!s}"
         logger.exception(msg)
         raise
-    return tools
+    return tools, next_cursor
+
+
+register_list_tools(server, handle_list_tools)
 
 
 @server.call_tool()
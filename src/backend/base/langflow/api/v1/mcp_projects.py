@@ -22,11 +22,12 @@ from langflow.api.v1.mcp import (
     current_user_ctx,
     get_mcp_config,
     handle_mcp_errors,
+    register_list_tools,
     with_db_session,
 )
 from langflow.api.v1.schemas import InputValueRequest, MCPSettings
-from langflow.base.mcp.util import get_flow_snake_case
-from langflow.helpers.flow import json_schema_from_flow
+from langflow.base.mcp.util import get_flow_snake_case, list_flow_tools
+from langflow.processing.flow_listings import flow_listing_cache
 from langflow.services.auth.utils import get_current_active_user, get_current_user
 from langflow.services.database.models import Flow, Folder, User
 from langflow.services.deps import get_db_service, get_settings_service, get_storage_service
@@ -75,19 +76,12 @@ async def list_project_tools(
             if not project:
                 raise HTTPException(status_code=404, detail="Project not found")
 
-            # Query flows in the project
-            flows_query = select(Flow).where(Flow.folder_id == project_id)
-
-            # Optionally filter for MCP-enabled flows only
-            if mcp_enabled:
-                flows_query = flows_query.where(Flow.mcp_enabled == True)  # noqa: E712
-
-            flows = (await session.exec(flows_query)).all()
+            # Read the tools of the project from the flows' headers and stored input schemas
+            flows, _ = await list_flow_tools(
+                session, current_user.id, project_id=project_id, mcp_enabled=True if mcp_enabled else None
+            )
 
             for flow in flows:
-                if flow.user_id is None:
-                    continue
-
                 # Format the flow name according to MCP conventions (snake_case)
                 flow_name = "_".join(flow.name.lower().split())
 
@@ -102,7 +96,6 @@ async def list_project_tools(
                         action_name=name,
                         action_description=description,
                         mcp_enabled=flow.mcp_enabled,
-                        # inputSchema=json_schema_from_flow(flow),
                         name=flow.name,
                         description=flow.description,
                     )
@@ -127,43 +120,51 @@ class ProjectMCPServer:
         self.server = Server(f"langflow-mcp-project-{project_id}")
 
         # Register handlers that filter by project
-        @self.server.list_tools()
         @handle_mcp_errors
-        async def handle_list_project_tools():
+        async def handle_list_project_tools(cursor: str | None = None) -> tuple[list[types.Tool], str | None]:
             """Handle listing tools for this specific project."""
             tools = []
+            next_cursor = None
             try:
+                current_user = current_user_ctx.get()
+                page_size = get_settings_service().settings.mcp_server_tools_page_size
                 db_service = get_db_service()
                 async with db_service.with_session() as session:
                     # Get flows with mcp_enabled flag set to True and in this project
-                    flows = (
-                        await session.exec(
-                            select(Flow).where(Flow.mcp_enabled == True, Flow.folder_id == self.project_id)  # noqa: E712
-                        )
-                    ).all()
-
-                    for flow in flows:
-                        if flow.user_id is None:
-                            continue
-
-                        # Use action_name if available, otherwise construct from flow name
-                        name = flow.action_name or "_".join(flow.name.lower().split())
+                    flows, next_cursor = await list_flow_tools(
+                        session,
+                        current_user.id,
+                        project_id=self.project_id,
+                        mcp_enabled=True,
+                        cursor=cursor,
+                        limit=page_size,
+                    )
 
-                        # Use action_description if available, otherwise use defaults
-                        description = flow.action_description or (
-                            flow.description if flow.description else f"Tool generated from flow: {name}"
-                        )
+                for flow in flows:
+                    # Use action_name if available, otherwise construct from flow name
+                    name = flow.action_name or "_".join(flow.name.lower().split())
 
-                        tool = types.Tool(
-                            name=name,
-                            description=description,
-                            inputSchema=json_schema_from_flow(flow),
-                        )
-                        tools.append(tool)
+                    # Use action_description if available, otherwise use defaults
+                    description = flow.action_description or (
+                        flow.description if flow.description else f"Tool generated from flow: {name}"
+                    )
+                    if flow.input_schema is None:
+                        msg = f"Error in listing project tools: no input schema from flow: {name}"
+                        logger.warning(msg)
+                        continue
+
+                    tool = types.Tool(
+                        name=name,
+                        description=description,
+                        inputSchema=flow.input_schema,
+                    )
+                    tools.append(tool)
             except Exception as e:  # noqa: BLE001
-                msg = f"Error in listing project tools: {e!s} from flow: {name}"
+                msg = f"Error in listing project tools: {e!s}"
                 logger.warning(msg)
-            return tools
+            return tools, next_cursor
+
+        register_list_tools(self.server, handle_list_project_tools)
 
         @self.server.list_prompts()
         async def handle_list_prompts():
@@ -547,6 +548,7 @@ async def update_project_mcp_settings(
                     updated_flows.append(flow)
 
             await session.commit()
+            flow_listing_cache.invalidate_user(current_user.id)
 
             return {"message": f"Updated MCP settings for {len(updated_flows)} flows"}
 
@@ -2,7 +2,7 @@ from typing import Annotated, List, Optional
 from uuid import UUID
 from datetime import datetime, timezone
 
-from fastapi import APIRouter, Depends, HTTPException, Query, Body
+from fastapi import APIRouter, Depends, HTTPException, Query, Body, Response
 from fastapi_pagination import Page, Params
 from fastapi_pagination.ext.sqlmodel import paginate
 from sqlalchemy import delete
@@ -15,6 +15,11 @@ from langflow.api.utils import DbSession, custom_params
 from langflow.services.database.models import User
 from langflow.schema.message import MessageResponse, Message
 from langflow.services.auth.utils import get_current_active_user
+from langflow.services.database.models.message.crud import (
+    decode_message_cursor,
+    encode_message_cursor,
+    paginate_messages,
+)
 from langflow.services.database.models.message.model import MessageRead, MessageTable, MessageUpdate
 from langflow.services.database.models.transactions.crud import transform_transaction_table
 from langflow.services.database.models.transactions.model import TransactionTable
@@ -24,9 +29,13 @@ from langflow.services.database.models.vertex_builds.crud import (
 )
 from langflow.services.database.models.vertex_builds.model import VertexBuildMapModel
 from langflow.memory import aadd_messages
+from langflow.services.deps import get_executor_service, get_monitor_writer_service
 
 router = APIRouter(prefix="/monitor", tags=["Monitor"])
 
+MAX_MESSAGES_PAGE_SIZE = 1000
+"""Largest page of messages, also used when only a cursor is given."""
+
 
 @router.get("/builds")
 async def get_vertex_builds(flow_id: Annotated[UUID, Query()], session: DbSession) -> VertexBuildMapModel:
@@ -40,22 +49,53 @@ async def get_vertex_builds(flow_id: Annotated[UUID, Query()], session: DbSessio
 @router.delete("/builds", status_code=204)
 async def delete_vertex_builds(flow_id: Annotated[UUID, Query()], session: DbSession) -> None:
     try:
+        # Buffered builds would otherwise be written after the delete
+        await get_monitor_writer_service().flush()
         await delete_vertex_builds_by_flow_id(session, flow_id)
         await session.commit()
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e)) from e
 
 
+@router.get("/writer", dependencies=[Depends(get_current_active_user)])
+async def get_monitor_writer_stats() -> dict:
+    """Return the queue depth and counters of the vertex build and transaction write-behind buffer."""
+    return get_monitor_writer_service().stats()
+
+
+@router.get("/executors", dependencies=[Depends(get_current_active_user)])
+async def get_executor_stats() -> dict:
+    """Return the queue wait and execution time of the synchronous outputs of each component."""
+    return get_executor_service().stats()
+
+
 @router.get("/messages")
 async def get_messages(
     session: DbSession,
+    response: Response,
     flow_id: Annotated[UUID | None, Query()] = None,
     session_id: Annotated[str | None, Query()] = None,
     sender: Annotated[str | None, Query()] = None,
     sender_name: Annotated[str | None, Query()] = None,
     order_by: Annotated[str | None, Query()] = "timestamp",
+    limit: Annotated[int | None, Query(ge=1, le=MAX_MESSAGES_PAGE_SIZE)] = None,
+    cursor: Annotated[str | None, Query()] = None,
     current_user: Annotated[User, Depends(get_current_active_user)] = None,
 ) -> list[MessageResponse]:
+    """List messages, optionally one page at a time.
+
+    When `limit` is set, messages are ordered by timestamp and id, and the cursor of the next
+    page, if any, is returned in the `X-Next-Cursor` header. Passing it back as `cursor`
+    returns the messages that follow.
+    """
+    paginated = limit is not None or cursor is not None
+    if paginated and order_by not in {None, "timestamp"}:
+        raise HTTPException(status_code=400, detail="Paginated messages can only be ordered by timestamp")
+    if cursor:
+        try:
+            decode_message_cursor(cursor)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e)) from e
     try:
         stmt = select(MessageTable)
         logger.debug("Current flow_id: {}", flow_id)
@@ -72,23 +112,11 @@ async def get_messages(
             if session_id.isdigit():
                 # If session_id is numeric, treat it as folder ID
                 folder_prefix = f"folder-{session_id}-{str(current_user.id)}"
-                logger.debug(f"Folder prefix: {folder_prefix}")
-                # Output the user ID for debugging
-                logger.debug(f"Current user ID for prefix: {current_user.id}")
-
-                # First, check if any matching sessions exist (for debugging)
-                check_stmt = select(MessageTable.session_id).where(
-                    MessageTable.session_id.startswith(folder_prefix))
-                sample_sessions = await session.exec(check_stmt)
-                sample_sessions_list = sample_sessions.all()
-                logger.debug(
-                    f"Found {len(sample_sessions_list)} sessions matching prefix {folder_prefix}")
-                if sample_sessions_list:
-                    logger.debug(
-                        f"Sample matching session: {sample_sessions_list[0]}")
-
-                # Filter for session_ids starting with this prefix
+                # Filter for session_ids starting with this prefix. The range lets the database
+                # seek the session index, which a LIKE prefix match does not do on every backend.
                 stmt = stmt.where(
+                    MessageTable.session_id >= folder_prefix,
+                    MessageTable.session_id < _prefix_upper_bound(folder_prefix),
                     MessageTable.session_id.startswith(folder_prefix))
                 logger.debug(
                     f"Numeric session_id detected, filtering for session_id starting with: {folder_prefix}")
@@ -99,15 +127,27 @@ async def get_messages(
             stmt = stmt.where(MessageTable.sender == sender)
         if sender_name:
             stmt = stmt.where(MessageTable.sender_name == sender_name)
-        if order_by:
+        if paginated:
+            page_size = limit or MAX_MESSAGES_PAGE_SIZE
+            # Read one message more than the page, to know whether another page follows
+            stmt = paginate_messages(stmt, cursor, page_size + 1)
+        elif order_by:
             col = getattr(MessageTable, order_by).asc()
-            stmt = stmt.order_by(col)
-        messages = await session.exec(stmt)
+            stmt = stmt.order_by(col, MessageTable.id.asc())
+        messages = (await session.exec(stmt)).all()
+        if paginated and len(messages) > page_size:
+            messages = messages[:page_size]
+            response.headers["X-Next-Cursor"] = encode_message_cursor(messages[-1])
         return [MessageResponse.model_validate(d, from_attributes=True) for d in messages]
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e)) from e
 
 
+def _prefix_upper_bound(prefix: str) -> str:
+    """Return the smallest string greater than every string that starts with `prefix`."""
+    return prefix[:-1] + chr(ord(prefix[-1]) + 1)
+
+
 @router.delete("/messages", status_code=204, dependencies=[Depends(get_current_active_user)])
 async def delete_messages(message_ids: list[UUID], session: DbSession) -> None:
     try:
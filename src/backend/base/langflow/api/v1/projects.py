@@ -21,6 +21,7 @@ from langflow.api.v1.schemas import FlowListCreate
 from langflow.helpers.flow import generate_unique_flow_name
 from langflow.helpers.folders import generate_unique_folder_name
 from langflow.initial_setup.constants import STARTER_FOLDER_NAME, SYSTEM_FOLDER_ID
+from langflow.processing.flow_listings import flow_listing_cache
 from langflow.services.database.models.flow.model import Flow, FlowCreate, FlowRead
 from langflow.services.database.models.folder.constants import DEFAULT_FOLDER_NAME
 from langflow.services.database.models.folder.model import (
@@ -86,6 +87,7 @@ async def create_project(
             )
             await session.exec(update_statement_flows)
             await session.commit()
+        flow_listing_cache.invalidate_user(current_user.id)
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e)) from e
@@ -220,6 +222,7 @@ async def update_project(
             )
             await session.exec(update_statement_components)
             await session.commit()
+        flow_listing_cache.invalidate_user(current_user.id)
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e)) from e
@@ -254,6 +257,7 @@ async def delete_project(
     try:
         await session.delete(project)
         await session.commit()
+        flow_listing_cache.invalidate_user(current_user.id)
         return Response(status_code=status.HTTP_204_NO_CONTENT)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e)) from e
@@ -363,6 +363,42 @@ class SimplifiedAPIRequest(BaseModel):
     session_id: str | None = Field(default=None, description="The session id")
 
 
+class BatchRunInput(BaseModel):
+    input_value: str | None = Field(default=None, description="The input value")
+    session_id: str | None = Field(default=None, description="The session id. Defaults to a new session.")
+
+
+class BatchRunRequest(BaseModel):
+    inputs: list[BatchRunInput] = Field(min_length=1, description="The inputs, each one run separately")
+    input_type: InputType | None = Field(default="chat", description="The input type")
+    output_type: OutputType | None = Field(default="chat", description="The output type")
+    output_component: str | None = Field(
+        default="",
+        description="If there are multiple output components, you can specify the component to get the output from.",
+    )
+    tweaks: Tweaks | None = Field(default=None, description="The tweaks, applied to every run")
+    max_concurrency: int | None = Field(
+        default=None,
+        gt=0,
+        description="The maximum number of inputs run at the same time, capped by the server settings.",
+    )
+
+
+class BatchRunResult(BaseModel):
+    """The result of one input of a batch run."""
+
+    index: int
+    session_id: str | None = None
+    outputs: list[RunOutputs] | None = None
+    error: str | None = None
+
+
+class BatchRunResponse(BaseModel):
+    """Batch run response schema. Results are in the order of the inputs."""
+
+    results: list[BatchRunResult] = []
+
+
 # (alias) type ReactFlowJsonObject<NodeData = any, EdgeData = any> = {
 #     nodes: Node<NodeData>[];
 #     edges: Edge<EdgeData>[];
@@ -1,16 +1,14 @@
 import re
 import uuid
-from collections.abc import AsyncGenerator
 from http import HTTPStatus
 from pathlib import Path
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, File, HTTPException, UploadFile
-from fastapi.responses import StreamingResponse
+from fastapi import APIRouter, Depends, File, Header, HTTPException, UploadFile
 from sqlmodel import String, cast, select
 
 from langflow.api.schemas import UploadFileResponse
-from langflow.api.utils import CurrentActiveUser, DbSession
+from langflow.api.utils import CurrentActiveUser, DbSession, build_file_response, iter_upload_file
 from langflow.services.database.models.file import File as UserFile
 from langflow.services.deps import get_settings_service, get_storage_service
 from langflow.services.storage.service import StorageService
@@ -18,12 +16,6 @@ from langflow.services.storage.service import StorageService
 router = APIRouter(tags=["Files"], prefix="/files")
 
 
-async def byte_stream_generator(file_bytes: bytes, chunk_size: int = 8192) -> AsyncGenerator[bytes, None]:
-    """Convert bytes object into an async generator that yields chunks."""
-    for i in range(0, len(file_bytes), chunk_size):
-        yield file_bytes[i : i + chunk_size]
-
-
 async def fetch_file_object(file_id: uuid.UUID, current_user: CurrentActiveUser, session: DbSession):
     # Fetch the file from the DB
     stmt = select(UserFile).where(UserFile.id == file_id)
@@ -68,11 +60,10 @@ async def upload_user_file(
             detail=f"File size is larger than the maximum file size {max_file_size_upload}MB.",
         )
 
-    # Read file content and create a unique file name
+    # Create a unique file name and stream the file content to the storage
     try:
         # Create a unique file name
         file_id = uuid.uuid4()
-        file_content = await file.read()
 
         # Get file extension of the file
         file_extension = "." + file.filename.split(".")[-1] if file.filename and "." in file.filename else ""
@@ -81,7 +72,9 @@ async def upload_user_file(
         # Here we use the current user's id as the folder name
         folder = str(current_user.id)
         # Save the file using the storage service.
-        await storage_service.save_file(flow_id=folder, file_name=anonymized_file_name, data=file_content)
+        file_size = await storage_service.save_file_stream(
+            flow_id=folder, file_name=anonymized_file_name, chunks=iter_upload_file(file)
+        )
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error saving file: {e}") from e
 
@@ -117,9 +110,6 @@ async def upload_user_file(
             # Split the extension from the filename
             root_filename = f"{root_filename} ({count + 1})"
 
-        # Compute the file size based on the path
-        file_size = await storage_service.get_file_size(flow_id=folder, file_name=anonymized_file_name)
-
         # Compute the file path
         file_path = f"{folder}/{anonymized_file_name}"
 
@@ -165,8 +155,9 @@ async def download_file(
     current_user: CurrentActiveUser,
     session: DbSession,
     storage_service: Annotated[StorageService, Depends(get_storage_service)],
+    range_header: Annotated[str | None, Header(alias="Range")] = None,
 ):
-    """Download a file by its ID."""
+    """Download a file by its ID, or the byte range of it given in the Range header."""
     try:
         # Fetch the file from the DB
         file = await fetch_file_object(file_id, current_user, session)
@@ -174,21 +165,19 @@ async def download_file(
         # Get the basename of the file path
         file_name = file.path.split("/")[-1]
 
-        # Get file stream
-        file_stream = await storage_service.get_file(flow_id=str(current_user.id), file_name=file_name)
-
-        # Ensure file_stream is an async iterator returning bytes
-        byte_stream = byte_stream_generator(file_stream)
+        # Stream the file from the storage, without reading it into memory
+        return await build_file_response(
+            storage_service,
+            str(current_user.id),
+            file_name,
+            range_header=range_header,
+            headers={"Content-Disposition": f'attachment; filename="{file.name}"'},
+        )
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error downloading file: {e}") from e
 
-    # Return the file as a streaming response
-    return StreamingResponse(
-        byte_stream,
-        media_type="application/octet-stream",
-        headers={"Content-Disposition": f'attachment; filename="{file.name}"'},
-    )
-
 
 @router.put("/{file_id}")
 async def edit_file_name(
@@ -34,6 +34,7 @@ DEFAULT_AGENT_NAME = "Agent ({tools_names})"
 
 class LCAgentComponent(Component):
     trace_type = "agent"
+    memoizable = False
     _base_inputs: list[InputTypes] = [
         MessageTextInput(
             name="input_value",
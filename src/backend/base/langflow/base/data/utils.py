@@ -110,9 +110,12 @@ def partition_file_to_data(file_path: str, *, silent_errors: bool) -> Data | Non
 
 def read_text_file(file_path: str) -> str:
     file_path_ = Path(file_path)
-    raw_data = file_path_.read_bytes()
-    result = chardet.detect(raw_data)
-    encoding = result["encoding"]
+    # Detect the encoding chunk by chunk, instead of holding the raw bytes next to the text
+    detector = chardet.UniversalDetector()
+    with file_path_.open("rb") as f:
+        while not detector.done and (chunk := f.read(64 * 1024)):
+            detector.feed(chunk)
+    encoding = detector.close()["encoding"]
 
     if encoding in {"Windows-1252", "Windows-1254", "MacRoman"}:
         encoding = "utf-8"
@@ -2,7 +2,7 @@ import asyncio
 import os
 from collections.abc import Awaitable, Callable
 from contextlib import AsyncExitStack
-from typing import Any
+from typing import Any, NamedTuple
 from urllib.parse import urlparse
 from uuid import UUID
 
@@ -12,7 +12,7 @@ from loguru import logger
 from mcp import ClientSession, StdioServerParameters, stdio_client
 from mcp.client.sse import sse_client
 from pydantic import BaseModel, Field, create_model
-from sqlmodel import select
+from sqlmodel import select, update
 
 from langflow.services.database.models import Flow
 
@@ -67,16 +67,92 @@ def create_tool_func(tool_name: str, arg_schema: type[BaseModel], session) -> Ca
 
 async def get_flow_snake_case(flow_name: str, user_id: str, session, is_action: bool | None = None) -> Flow | None:
     uuid_user_id = UUID(user_id) if isinstance(user_id, str) else user_id
-    stmt = select(Flow).where(Flow.user_id == uuid_user_id).where(Flow.is_component == False)  # noqa: E712
+    # Match on the names only, and load the data of the matching flow alone
+    stmt = (
+        select(Flow.id, Flow.name, Flow.action_name)
+        .where(Flow.user_id == uuid_user_id)
+        .where(Flow.is_component == False)  # noqa: E712
+    )
     flows = (await session.exec(stmt)).all()
 
     for flow in flows:
         this_flow_name = flow.action_name if is_action and flow.action_name else "_".join(flow.name.lower().split())
         if this_flow_name == flow_name:
-            return flow
+            return await session.get(Flow, flow.id)
     return None
 
 
+class FlowTool(NamedTuple):
+    """A flow listed as an MCP tool."""
+
+    id: UUID
+    name: str
+    description: str | None
+    action_name: str | None
+    action_description: str | None
+    mcp_enabled: bool | None
+    input_schema: dict | None
+
+
+async def list_flow_tools(
+    session,
+    user_id: UUID | str,
+    *,
+    project_id: UUID | None = None,
+    mcp_enabled: bool | None = None,
+    cursor: str | None = None,
+    limit: int | None = None,
+) -> tuple[list[FlowTool], str | None]:
+    """List the flows of a user as MCP tools, ordered by ID, and the cursor of the next page.
+
+    Input schemas are stored with flows when they are saved, so the data of flows is only read for
+    flows saved before schemas were stored, whose schema is then stored too.
+
+    Raises:
+        ValueError: If the cursor is not a flow ID.
+    """
+    uuid_user_id = UUID(user_id) if isinstance(user_id, str) else user_id
+    stmt = select(*(getattr(Flow, field) for field in FlowTool._fields)).where(Flow.user_id == uuid_user_id)
+    if project_id is not None:
+        stmt = stmt.where(Flow.folder_id == project_id)
+    if mcp_enabled is not None:
+        stmt = stmt.where(Flow.mcp_enabled == mcp_enabled)
+    if cursor:
+        stmt = stmt.where(Flow.id > UUID(cursor))
+    stmt = stmt.order_by(Flow.id)
+    if limit:
+        # Read one flow more than the page, to know whether another page follows
+        stmt = stmt.limit(limit + 1)
+    tools = [FlowTool(*row) for row in (await session.exec(stmt)).all()]
+
+    next_cursor = None
+    if limit and len(tools) > limit:
+        tools = tools[:limit]
+        next_cursor = str(tools[-1].id)
+
+    missing_ids = [tool.id for tool in tools if tool.input_schema is None]
+    if missing_ids:
+        input_schemas = await _store_input_schemas(session, missing_ids)
+        tools = [tool._replace(input_schema=input_schemas.get(tool.id, tool.input_schema)) for tool in tools]
+    return tools, next_cursor
+
+
+async def _store_input_schemas(session, flow_ids: list[UUID]) -> dict[UUID, dict]:
+    from langflow.helpers.flow import json_schema_from_flow_data
+
+    input_schemas = {}
+    rows = (await session.exec(select(Flow.id, Flow.data).where(Flow.id.in_(flow_ids)))).all()  # type: ignore[attr-defined]
+    for flow_id, data in rows:
+        try:
+            input_schemas[flow_id] = json_schema_from_flow_data(data)
+        except Exception as e:  # noqa: BLE001
+            logger.warning(f"Error computing the input schema of flow {flow_id}: {e!s}")
+            continue
+        await session.exec(update(Flow).where(Flow.id == flow_id).values(input_schema=input_schemas[flow_id]))
+    await session.commit()
+    return input_schemas
+
+
 def create_input_schema_from_json_schema(schema: dict[str, Any]) -> type[BaseModel]:
     """Dynamically build a Pydantic model from a JSON schema (with $defs).
 
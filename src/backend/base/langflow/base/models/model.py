@@ -46,6 +46,10 @@ class LCModelComponent(Component):
         Output(display_name="Language Model", name="model_output", method="build_model"),
     ]
 
+    def can_memoize(self) -> bool:
+        # The model client can be reused, the answers of the model cannot
+        return super().can_memoize() and all(output.name != "text_output" for output in self._get_outputs_to_process())
+
     def _get_exception_message(self, e: Exception):
         return str(e)
 
@@ -1,4 +1,5 @@
 from .base import (
+    AsyncTransport,
     ErrorPayload,
     ErrorResponse,
     FilterOp,
@@ -39,6 +40,7 @@ from .services import (
 
 __all__ = [
     "ArchiveRoomOptions",
+    "AsyncTransport",
     "AuthOptions",
     "AuthResponse",
     "AuthService",
@@ -13,8 +13,10 @@ from .response import (
 )
 from .service import Service
 from .transformer import Transformer, TransformerHandler
+from .transport import AsyncTransport
 
 __all__ = [
+    "AsyncTransport",
     "Client",
     "ErrorPayload",
     "ErrorResponse",
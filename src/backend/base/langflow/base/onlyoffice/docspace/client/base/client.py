@@ -9,8 +9,11 @@ from urllib.request import build_opener
 
 from .response import ErrorPayload, ErrorResponse, Response, SuccessPayload, SuccessResponse
 from .transformer import Transformer, TransformingOpener
+from .transport import AsyncTransport, default_transport
 
 if TYPE_CHECKING:
+    import httpx
+
     from .opener import Opener
 
 
@@ -20,12 +23,13 @@ class Client:
         return self._opener.copy()
 
 
-    def __init__(self, opener: Opener | None = None):
+    def __init__(self, opener: Opener | None = None, transport: AsyncTransport | None = None):
         self.base_url = ""
         self.user_agent = ""
 
         origin = opener if opener else build_opener()
         self._opener = TransformingOpener(origin)
+        self._transport = transport or default_transport
 
 
     def _with_transformer(self, transformer: Transformer) -> Self:
@@ -35,13 +39,20 @@ class Client:
 
 
     def _copy(self) -> Self:
-        client = self.__class__(self._opener)
+        client = self.__class__(self._opener, self._transport)
         client.base_url = self.base_url
         client.user_agent = self.user_agent
         client._opener = self._opener.copy()
         return client
 
 
+    def session_key(self) -> tuple[str, ...]:
+        """Identifies the portal and the headers, such as credentials, the transformers add to requests."""
+        request = self._opener.transform(HTTPRequest(self.base_url))  # noqa: S310
+        headers = sorted(f"{key}: {value}" for key, value in request.header_items())
+        return (self.base_url, *headers)
+
+
     def delete(
         self,
         path: str,
@@ -162,3 +173,81 @@ class Client:
             wrapper = ErrorResponse(request, error)
 
         return wrapper.content, wrapper
+
+
+    async def adelete(
+        self,
+        path: str,
+        query: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+        body: dict[str, Any] | None = None,
+    ) -> tuple[Any, Response]:
+        return await self.arequest("DELETE", path, query, headers, body)
+
+
+    async def aget(
+        self,
+        path: str,
+        query: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> tuple[Any, Response]:
+        return await self.arequest("GET", path, query, headers)
+
+
+    async def apost(
+        self,
+        path: str,
+        query: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+        body: dict[str, Any] | None = None,
+    ) -> tuple[Any, Response]:
+        return await self.arequest("POST", path, query, headers, body)
+
+
+    async def aput(
+        self,
+        path: str,
+        query: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+        body: dict[str, Any] | None = None,
+    ) -> tuple[Any, Response]:
+        return await self.arequest("PUT", path, query, headers, body)
+
+
+    async def arequest(
+        self,
+        method: str,
+        path: str,
+        query: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+        body: dict[str, Any] | None = None,
+    ) -> tuple[Any, Response]:
+        url = self.create_url(path, query)
+        request = self.create_request(method, url, headers, body)
+        body, response = await self.asend_request(request)
+        return body, response
+
+
+    async def aopen(self, request: HTTPRequest) -> httpx.Response:
+        """Sends a request through the transformers without blocking, like `opener.open` does."""
+        return await self._transport.send(self._opener.transform(request))
+
+
+    async def asend_request(self, request: HTTPRequest) -> tuple[Any, Response]:
+        wrapper: Response
+
+        try:
+            response = await self.aopen(request)
+            wrapper = SuccessResponse(request, response)
+            wrapper.payload = SuccessPayload.model_validate_json(response.content)
+
+        except HTTPError as error:
+            with error:
+                content = error.read()
+                wrapper = ErrorResponse(request, error)
+                wrapper.payload = ErrorPayload.model_validate_json(content)
+
+        except Exception as error:  # noqa: BLE001
+            wrapper = ErrorResponse(request, error)
+
+        return wrapper.content, wrapper
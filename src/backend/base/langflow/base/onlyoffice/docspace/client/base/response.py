@@ -8,6 +8,8 @@ if TYPE_CHECKING:
     from http.client import HTTPResponse
     from urllib.request import Request as HTTPRequest
 
+    import httpx
+
 # https://github.com/ONLYOFFICE/DocSpace-server/blob/v3.0.4-server/common/ASC.Api.Core/Middleware/CommonApiResponse.cs/
 # https://github.com/ONLYOFFICE/DocSpace-server/blob/v3.0.4-server/products/ASC.Files/Core/ApiModels/ResponseDto/UploadResultDto.cs/
 # https://github.com/ONLYOFFICE/DocSpace-server/blob/v3.0.4-server/products/ASC.Files/Server/Helpers/UploadControllerHelper.cs/#L97
@@ -20,11 +22,11 @@ class Response(Protocol):
 
 class SuccessResponse(Response):
     request: HTTPRequest
-    response: HTTPResponse
+    response: HTTPResponse | httpx.Response
     payload: SuccessPayload
 
 
-    def __init__(self, request: HTTPRequest, response: HTTPResponse):
+    def __init__(self, request: HTTPRequest, response: HTTPResponse | httpx.Response):
         self.request = request
         self.response = response
         self.payload = SuccessPayload()
@@ -39,8 +39,12 @@ class TransformingOpener:
 
 
     def open(self, request: HTTPRequest, *args: Any, **kwargs: Any) -> HTTPResponse:
+        return self._opener.open(self.transform(request), *args, **kwargs)
+
+
+    def transform(self, request: HTTPRequest) -> HTTPRequest:
         if not self._transformers:
-            return self._opener.open(request, *args, **kwargs)
+            return request
 
         origin = request
 
@@ -58,9 +62,7 @@ class TransformingOpener:
             request.add_header(key, value)
 
         chain = self._build_chain()
-        request = chain(request)
-
-        return self._opener.open(request, *args, **kwargs)
+        return chain(request)
 
 
     def _build_chain(self, index: int = 0) -> TransformerHandler:
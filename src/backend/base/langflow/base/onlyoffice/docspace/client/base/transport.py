@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import asyncio
+import io
+import weakref
+from http.client import HTTPMessage
+from typing import TYPE_CHECKING
+from urllib.error import HTTPError
+from urllib.parse import urlsplit
+
+import httpx
+
+if TYPE_CHECKING:
+    from urllib.request import Request as HTTPRequest
+
+
+_Pool = dict[str, httpx.AsyncClient]
+
+
+class AsyncTransport:
+    """Sends requests without blocking the event loop.
+
+    Every portal origin gets its own pooled, keep-alive HTTP client. Pools are
+    kept per event loop, because connections cannot be shared between loops,
+    and the pools of closed loops are dropped.
+    """
+
+    def __init__(
+        self,
+        timeout: float = 60.0,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+    ):
+        self.timeout = timeout
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+        )
+        self._pools: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _Pool] = weakref.WeakKeyDictionary()
+
+
+    def get_client(self, url: str) -> httpx.AsyncClient:
+        loop = asyncio.get_running_loop()
+        self._drop_closed_loops()
+        pool = self._pools.setdefault(loop, {})
+
+        origin = _origin(url)
+        client = pool.get(origin)
+
+        if client is None or client.is_closed:
+            # Redirects are followed to behave like the urllib opener of the sync API
+            client = httpx.AsyncClient(timeout=self.timeout, limits=self.limits, follow_redirects=True)
+            pool[origin] = client
+
+        return client
+
+
+    async def send(self, request: HTTPRequest) -> httpx.Response:
+        """Sends a urllib request and returns the read response.
+
+        Responses with an error status raise `HTTPError`, just like an opener does.
+        """
+        client = self.get_client(request.full_url)
+
+        response = await client.request(
+            request.get_method(),
+            request.full_url,
+            headers=dict(request.header_items()),
+            content=request.data,  # type: ignore[arg-type]
+        )
+
+        if response.is_error:
+            headers = HTTPMessage()
+            for key, value in response.headers.multi_items():
+                headers[key] = value
+
+            raise HTTPError(
+                request.full_url,
+                response.status_code,
+                response.reason_phrase,
+                headers,
+                io.BytesIO(response.content),
+            )
+
+        return response
+
+
+    async def aclose(self) -> None:
+        """Closes the clients created on the running event loop."""
+        loop = asyncio.get_running_loop()
+        pool = self._pools.pop(loop, {})
+
+        for client in pool.values():
+            await client.aclose()
+
+
+    async def aclose_all(self) -> None:
+        """Closes the clients of every event loop, for example when the app shuts down.
+
+        The clients of other loops are closed on their own loop, if it still runs.
+        """
+        current = asyncio.get_running_loop()
+        pools = list(self._pools.items())
+        self._pools.clear()
+
+        for loop, pool in pools:
+            for client in pool.values():
+                if loop is current:
+                    await client.aclose()
+                elif loop.is_running():
+                    asyncio.run_coroutine_threadsafe(client.aclose(), loop)
+
+
+    def _drop_closed_loops(self) -> None:
+        # The open connections of a pool refer to its loop, so the weak key alone never lets it go
+        for loop in [loop for loop in self._pools if loop.is_closed()]:
+            del self._pools[loop]
+
+
+def _origin(url: str) -> str:
+    parts = urlsplit(url)
+    return f"{parts.scheme}://{parts.netloc}"
+
+
+default_transport = AsyncTransport()
@@ -2,15 +2,15 @@ from __future__ import annotations
 
 from typing import Self
 
+from .base import AsyncTransport, Opener
 from .base import Client as Base
-from .base import Opener
 from .services import AuthService, FilesService, PortalService
 from .transformers import AuthTokenTransformer, OriginTransformer
 
 
 class Client(Base):
-    def __init__(self, opener: Opener | None = None):
-        super().__init__(opener)
+    def __init__(self, opener: Opener | None = None, transport: AsyncTransport | None = None):
+        super().__init__(opener, transport)
         self.auth = AuthService(self)
         self.files = FilesService(self)
         self.portal = PortalService(self)
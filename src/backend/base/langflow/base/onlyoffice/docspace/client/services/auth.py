@@ -27,6 +27,18 @@ class AuthService(Service):
         return model, response
 
 
+    async def aauth(self, options: AuthOptions) -> tuple[AuthResponse, Response]:
+        payload, response = await self._client.apost(
+            "api/2.0/authentication",
+            body=options.model_dump(),
+        )
+
+        model = AuthResponse.model_validate(payload) \
+            if isinstance(response, SuccessResponse) else AuthResponse()
+
+        return model, response
+
+
     def check(self) -> tuple[bool, Response]:
         _, response = self._client.get(
             "api/2.0/authentication",
@@ -35,3 +47,13 @@ class AuthService(Service):
         model = bool(isinstance(response, SuccessResponse))
 
         return model, response
+
+
+    async def acheck(self) -> tuple[bool, Response]:
+        _, response = await self._client.aget(
+            "api/2.0/authentication",
+        )
+
+        model = bool(isinstance(response, SuccessResponse))
+
+        return model, response
@@ -141,6 +141,12 @@ class FilesService(Service):
         )
 
 
+    async def alist_my(self) -> tuple[Any, Response]:
+        return await self._client.aget(
+            "api/2.0/files/@my",
+        )
+
+
     def list_operations(self) -> tuple[list[Operation], Response]:
         payload, response = self._client.get(
             "api/2.0/files/fileops",
@@ -152,6 +158,17 @@ class FilesService(Service):
         return ls, response
 
 
+    async def alist_operations(self) -> tuple[list[Operation], Response]:
+        payload, response = await self._client.aget(
+            "api/2.0/files/fileops",
+        )
+
+        ls = [Operation.model_validate(item) for item in payload] \
+            if isinstance(response, SuccessResponse) else []
+
+        return ls, response
+
+
     def bulk_download(self, options: dict) -> tuple[list[Operation], Response]:
         payload, response = self._client.put(
             "api/2.0/files/fileops/bulkdownload",
@@ -164,6 +181,18 @@ class FilesService(Service):
         return ls, response
 
 
+    async def abulk_download(self, options: dict) -> tuple[list[Operation], Response]:
+        payload, response = await self._client.aput(
+            "api/2.0/files/fileops/bulkdownload",
+            body=options,
+        )
+
+        ls = [Operation.model_validate(item) for item in payload] \
+            if isinstance(response, SuccessResponse) else []
+
+        return ls, response
+
+
     def copy(self, options: MoveOptions) -> tuple[list[Operation], Response]:
         payload, response = self._client.put(
             "api/2.0/files/fileops/copy",
@@ -176,6 +205,18 @@ class FilesService(Service):
         return ls, response
 
 
+    async def acopy(self, options: MoveOptions) -> tuple[list[Operation], Response]:
+        payload, response = await self._client.aput(
+            "api/2.0/files/fileops/copy",
+            body=options.model_dump(exclude_none=True, by_alias=True),
+        )
+
+        ls = [Operation.model_validate(item) for item in payload] \
+            if isinstance(response, SuccessResponse) else []
+
+        return ls, response
+
+
     def move(self, options: MoveOptions) -> tuple[list[Operation], Response]:
         payload, response = self._client.put(
             "api/2.0/files/fileops/move",
@@ -188,6 +229,18 @@ class FilesService(Service):
         return ls, response
 
 
+    async def amove(self, options: MoveOptions) -> tuple[list[Operation], Response]:
+        payload, response = await self._client.aput(
+            "api/2.0/files/fileops/move",
+            body=options.model_dump(exclude_none=True, by_alias=True),
+        )
+
+        ls = [Operation.model_validate(item) for item in payload] \
+            if isinstance(response, SuccessResponse) else []
+
+        return ls, response
+
+
     def create_file(self, folder_id: int, options: CreateFileOptions) -> tuple[Any, Response]:
         return self._client.post(
             f"api/2.0/files/{folder_id}/file",
@@ -195,6 +248,13 @@ class FilesService(Service):
         )
 
 
+    async def acreate_file(self, folder_id: int, options: CreateFileOptions) -> tuple[Any, Response]:
+        return await self._client.apost(
+            f"api/2.0/files/{folder_id}/file",
+            body=options.model_dump(exclude_none=True, by_alias=True),
+        )
+
+
     def create_session(self, folder_id: int, options: CreateSessionOptions) -> tuple[Any, Response]:
         return self._client.post(
             f"api/2.0/files/{folder_id}/upload/create_session",
@@ -202,6 +262,13 @@ class FilesService(Service):
         )
 
 
+    async def acreate_session(self, folder_id: int, options: CreateSessionOptions) -> tuple[Any, Response]:
+        return await self._client.apost(
+            f"api/2.0/files/{folder_id}/upload/create_session",
+            body=options.model_dump(exclude_none=True, by_alias=True),
+        )
+
+
     def get_folder(self, folder_id: int, filters: Filters | None = None) -> tuple[Any, Response]:
         query: dict[str, Any] | None = None
         if filters:
@@ -213,6 +280,17 @@ class FilesService(Service):
         )
 
 
+    async def aget_folder(self, folder_id: int, filters: Filters | None = None) -> tuple[Any, Response]:
+        query: dict[str, Any] | None = None
+        if filters:
+            query = filters.model_dump(exclude_none=True, by_alias=True)
+
+        return await self._client.aget(
+            f"api/2.0/files/{folder_id}",
+            query=query,
+        )
+
+
     def create_folder(self, parent_id: int, options: CreateFolderOptions) -> tuple[Any, Response]:
         return self._client.post(
             f"api/2.0/files/folder/{parent_id}",
@@ -220,6 +298,13 @@ class FilesService(Service):
         )
 
 
+    async def acreate_folder(self, parent_id: int, options: CreateFolderOptions) -> tuple[Any, Response]:
+        return await self._client.apost(
+            f"api/2.0/files/folder/{parent_id}",
+            body=options.model_dump(exclude_none=True, by_alias=True),
+        )
+
+
     def update_folder(self, folder_id: int, options: UpdateFolderOptions) -> tuple[Any, Response]:
         return self._client.put(
             f"api/2.0/files/folder/{folder_id}",
@@ -227,6 +312,13 @@ class FilesService(Service):
         )
 
 
+    async def aupdate_folder(self, folder_id: int, options: UpdateFolderOptions) -> tuple[Any, Response]:
+        return await self._client.aput(
+            f"api/2.0/files/folder/{folder_id}",
+            body=options.model_dump(exclude_none=True, by_alias=True),
+        )
+
+
     def delete_folder(self, folder_id: int, options: DeleteFileOptions) -> tuple[list[Operation], Response]:
         payload, response = self._client.delete(
             f"api/2.0/files/folder/{folder_id}",
@@ -239,18 +331,42 @@ class FilesService(Service):
         return ls, response
 
 
+    async def adelete_folder(self, folder_id: int, options: DeleteFileOptions) -> tuple[list[Operation], Response]:
+        payload, response = await self._client.adelete(
+            f"api/2.0/files/folder/{folder_id}",
+            body=options.model_dump(exclude_none=True, by_alias=True),
+        )
+
+        ls = [Operation.model_validate(item) for item in payload] \
+            if isinstance(response, SuccessResponse) else []
+
+        return ls, response
+
+
     def list_subfolders(self, folder_id: int) -> tuple[list[Any], Response]:
         return self._client.get(
             f"api/2.0/files/{folder_id}/subfolders",
         )
 
 
+    async def alist_subfolders(self, folder_id: int) -> tuple[list[Any], Response]:
+        return await self._client.aget(
+            f"api/2.0/files/{folder_id}/subfolders",
+        )
+
+
     def get_file(self, file_id: int) -> tuple[Any, Response]:
         return self._client.get(
             f"api/2.0/files/file/{file_id}",
         )
 
 
+    async def aget_file(self, file_id: int) -> tuple[Any, Response]:
+        return await self._client.aget(
+            f"api/2.0/files/file/{file_id}",
+        )
+
+
     def delete_file(self, file_id: int, options: DeleteFileOptions) -> tuple[list[Operation], Response]:
         payload, response = self._client.delete(
             f"api/2.0/files/file/{file_id}",
@@ -263,6 +379,18 @@ class FilesService(Service):
         return ls, response
 
 
+    async def adelete_file(self, file_id: int, options: DeleteFileOptions) -> tuple[list[Operation], Response]:
+        payload, response = await self._client.adelete(
+            f"api/2.0/files/file/{file_id}",
+            body=options.model_dump(exclude_none=True, by_alias=True),
+        )
+
+        ls = [Operation.model_validate(item) for item in payload] \
+            if isinstance(response, SuccessResponse) else []
+
+        return ls, response
+
+
     def update_file(self, file_id: int, options: UpdateFileOptions) -> tuple[Any, Response]:
         return self._client.put(
             f"api/2.0/files/file/{file_id}",
@@ -270,12 +398,25 @@ class FilesService(Service):
         )
 
 
+    async def aupdate_file(self, file_id: int, options: UpdateFileOptions) -> tuple[Any, Response]:
+        return await self._client.aput(
+            f"api/2.0/files/file/{file_id}",
+            body=options.model_dump(exclude_none=True, by_alias=True),
+        )
+
+
     def get_file_download_link(self, file_id: int) -> tuple[Any, Response]:
         return self._client.get(
             f"api/2.0/files/file/{file_id}/presigneduri",
         )
 
 
+    async def aget_file_download_link(self, file_id: int) -> tuple[Any, Response]:
+        return await self._client.aget(
+            f"api/2.0/files/file/{file_id}/presigneduri",
+        )
+
+
     def create_room(self, options: CreateRoomOptions) -> tuple[Any, Response]:
         # There is a bug on the DocSpace that does not allow using string cases
         # of the RoomType enum.
@@ -305,18 +446,59 @@ class FilesService(Service):
         )
 
 
+    async def acreate_room(self, options: CreateRoomOptions) -> tuple[Any, Response]:
+        # There is a bug on the DocSpace that does not allow using string cases
+        # of the RoomType enum.
+
+        room_type = options.room_type
+
+        if room_type is not None and isinstance(room_type, str):
+            if room_type == "FillingFormsRoom":
+                room_type = 1
+            elif room_type == "EditingRoom":
+                room_type = 2
+            elif room_type == "CustomRoom":
+                room_type = 5
+            elif room_type == "PublicRoom":
+                room_type = 6
+            elif room_type == "VirtualDataRoom":
+                room_type = 8
+
+        options = CreateRoomOptions(
+            roomType=room_type,
+            title=options.title,
+        )
+
+        return await self._client.apost(
+            "api/2.0/files/rooms",
+            body=options.model_dump(exclude_none=True, by_alias=True),
+        )
+
+
     def list_rooms(self) -> tuple[Any, Response]:
         return self._client.get(
             "api/2.0/files/rooms",
         )
 
 
+    async def alist_rooms(self) -> tuple[Any, Response]:
+        return await self._client.aget(
+            "api/2.0/files/rooms",
+        )
+
+
     def get_room(self, room_id: int) -> tuple[Any, Response]:
         return self._client.get(
             f"api/2.0/files/rooms/{room_id}",
         )
 
 
+    async def aget_room(self, room_id: int) -> tuple[Any, Response]:
+        return await self._client.aget(
+            f"api/2.0/files/rooms/{room_id}",
+        )
+
+
     def update_room(self, room_id: int, options: UpdateRoomOptions) -> tuple[Any, Response]:
         return self._client.put(
             f"api/2.0/files/rooms/{room_id}",
@@ -324,6 +506,13 @@ class FilesService(Service):
         )
 
 
+    async def aupdate_room(self, room_id: int, options: UpdateRoomOptions) -> tuple[Any, Response]:
+        return await self._client.aput(
+            f"api/2.0/files/rooms/{room_id}",
+            body=options.model_dump(exclude_none=True, by_alias=True),
+        )
+
+
     def archive_room(self, room_id: int, options: ArchiveRoomOptions) -> tuple[Operation, Response]:
         payload, response = self._client.put(
             f"api/2.0/files/rooms/{room_id}/archive",
@@ -336,6 +525,18 @@ class FilesService(Service):
         return model, response
 
 
+    async def aarchive_room(self, room_id: int, options: ArchiveRoomOptions) -> tuple[Operation, Response]:
+        payload, response = await self._client.aput(
+            f"api/2.0/files/rooms/{room_id}/archive",
+            body=options.model_dump(exclude_none=True, by_alias=True),
+        )
+
+        model = Operation.model_validate(payload) \
+            if isinstance(response, SuccessResponse) else Operation()
+
+        return model, response
+
+
     def set_room_access_right(self, room_id: int, options: SetRoomAccessRightOptions) -> tuple[Any, Response]:
         return self._client.put(
             f"api/2.0/files/rooms/{room_id}/share",
@@ -343,6 +544,13 @@ class FilesService(Service):
         )
 
 
+    async def aset_room_access_right(self, room_id: int, options: SetRoomAccessRightOptions) -> tuple[Any, Response]:
+        return await self._client.aput(
+            f"api/2.0/files/rooms/{room_id}/share",
+            body=options.model_dump(exclude_none=True, by_alias=True),
+        )
+
+
     def upload_chunk(self, session_id: int, options: UploadChunkOptions) -> tuple[Any, Response]:
         url = self._client.create_url(f"ChunkedUploader.ashx?uid={session_id}")
         content_type, data = encode_multipart_formdata(options.filename, options.chunk)
@@ -350,3 +558,12 @@ class FilesService(Service):
         req.headers["Content-Type"] = content_type
         req.data = data
         return self._client.send_request(req)
+
+
+    async def aupload_chunk(self, session_id: int, options: UploadChunkOptions) -> tuple[Any, Response]:
+        url = self._client.create_url(f"ChunkedUploader.ashx?uid={session_id}")
+        content_type, data = encode_multipart_formdata(options.filename, options.chunk)
+        req = self._client.create_request("POST", url)
+        req.headers["Content-Type"] = content_type
+        req.data = data
+        return await self._client.asend_request(req)
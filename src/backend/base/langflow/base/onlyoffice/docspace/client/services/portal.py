@@ -10,3 +10,9 @@ class PortalService(Service):
         return self._client.get(
             "api/2.0/portal",
         )
+
+
+    async def aget_current(self) -> tuple[Any, Response]:
+        return await self._client.aget(
+            "api/2.0/portal",
+        )
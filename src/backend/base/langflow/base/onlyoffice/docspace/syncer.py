@@ -1,6 +1,9 @@
-from collections.abc import Callable
+import asyncio
+import random
+import time
+import weakref
+from collections.abc import Awaitable, Callable, Hashable
 from dataclasses import dataclass
-from time import sleep
 from typing import ParamSpec, overload
 
 from .client import ErrorResponse, Operation, Response
@@ -13,22 +16,87 @@ class _State:
     error: Exception | None
 
 
-ListOperationsFunc = Callable[[], tuple[list[Operation], Response]]
+ListOperationsFunc = Callable[[], Awaitable[tuple[list[Operation], Response]]]
 
 P = ParamSpec("P")
 
 
+class _Poller:
+    """Shares the listing of active operations between the waiters of one portal.
+
+    A listing that is in flight, or that finished less than `tick` seconds ago,
+    is handed to every waiter that asks for one instead of sending a new request.
+    """
+
+    def __init__(self, list: ListOperationsFunc, tick: float):  # noqa: A002
+        self._list = list
+        self._tick = tick
+        self._task: asyncio.Task[list[Operation]] | None = None
+        self._finished_at = 0.0
+        self.waiters = 0
+
+
+    async def get(self) -> list[Operation]:
+        task = self._task
+
+        if task is None or (task.done() and time.monotonic() - self._finished_at >= self._tick):
+            task = asyncio.create_task(self._fetch())
+            self._task = task
+
+        # A cancelled waiter must not cancel the listing other waiters share
+        return await asyncio.shield(task)
+
+
+    async def _fetch(self) -> list[Operation]:
+        try:
+            ls, res = await self._list()
+            if isinstance(res, ErrorResponse):
+                raise res.exception
+        except Exception as err:
+            msg = "Listing active operations"
+            raise ValueError(msg) from err
+        finally:
+            self._finished_at = time.monotonic()
+
+        return ls
+
+
+_Pollers = dict[Hashable, _Poller]
+
+_pollers: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _Pollers] = weakref.WeakKeyDictionary()
+
+
 class Syncer:
-    def __init__(self, list: ListOperationsFunc):  # noqa: A002
+    """Waits for DocSpace operations to finish without blocking the event loop.
+
+    Active operations are polled with exponential backoff and jitter until they
+    finish, the deadline passes, or the waiting task is cancelled. Syncers created
+    with the same `key`, usually `Client.session_key()`, share one listing per poll.
+    """
+
+    def __init__(
+        self,
+        list: ListOperationsFunc,  # noqa: A002
+        *,
+        key: Hashable | None = None,
+        delay: float = 0.1,
+        max_delay: float = 2.0,
+        deadline: float = 10.0,
+        max_attempts: int | None = None,
+    ):
         self._list = list
-        self._delay = 100 / 1000  # 100ms
-        self._limit = 100
+        self._key = key
+        self._delay = delay
+        self._max_delay = max_delay
+        self._deadline = deadline
+        self._max_attempts = max_attempts
+        self._tick = delay / 2
 
 
     @overload
-    def do(
+    async def do(
         self,
-        func: Callable[P, tuple[Operation, Response]],
+        func: Callable[P, Awaitable[tuple[Operation, Response]]],
         *args: P.args,
         **kwargs: P.kwargs,
     ) -> Operation:
@@ -36,43 +104,43 @@ class Syncer:
 
 
     @overload
-    def do(
+    async def do(
         self,
-        func: Callable[P, tuple[list[Operation], Response]],
+        func: Callable[P, Awaitable[tuple[list[Operation], Response]]],
         *args: P.args,
         **kwargs: P.kwargs,
     ) -> list[Operation]:
         ...
 
 
-    def do(
+    async def do(
         self,
-        func: Callable[P, tuple[Operation | list[Operation], Response]],
+        func: Callable[P, Awaitable[tuple[Operation | list[Operation], Response]]],
         *args: P.args,
         **kwargs: P.kwargs,
     ) -> Operation | list[Operation]:
         try:
-            ops, res = func(*args, **kwargs)
+            ops, res = await func(*args, **kwargs)
             if isinstance(res, ErrorResponse):
                 raise res.exception
         except Exception as err:
             msg = "Calling async operation"
             raise ValueError(msg) from err
 
-        return self.wait(ops)
+        return await self.wait(ops)
 
 
     @overload
-    def wait(self, ops: Operation) -> Operation:
+    async def wait(self, ops: Operation) -> Operation:
         ...
 
 
     @overload
-    def wait(self, ops: list[Operation]) -> list[Operation]: # type: ignore [overload-cannot-match]
+    async def wait(self, ops: list[Operation]) -> list[Operation]: # type: ignore [overload-cannot-match]
         ...
 
 
-    def wait(self, ops: Operation | list[Operation]) -> Operation | list[Operation]:
+    async def wait(self, ops: Operation | list[Operation]) -> Operation | list[Operation]:
         states: dict[str, _State] = {}
 
         if isinstance(ops, list):
@@ -87,16 +155,45 @@ class Syncer:
 
         results: dict[str, Operation] = {}
 
-        limit = self._limit
+        poller = self._acquire_poller()
+
+        try:
+            await self._poll(poller, states, results)
+        finally:
+            self._release_poller(poller)
 
-        while limit > 0:
-            try:
-                ls, res = self._list()
-                if isinstance(res, ErrorResponse):
-                    raise res.exception
-            except Exception as err:
-                msg = "Listing active operations"
-                raise ValueError(msg) from err
+        errs: list[Exception] = []
+        done = True
+
+        for st in states.values():
+            if st.error:
+                errs.append(st.error)
+
+            if not st.done:
+                done = False
+
+        if errs:
+            msg = "Multiple errors while waiting for operations"
+            raise ExceptionGroup(msg, errs)
+
+        if not done:
+            msg = "Operations did not finish in time"
+            raise ValueError(msg)
+
+        if isinstance(ops, list):
+            return list(results.values())
+
+        return results[ops.id]
+
+
+    async def _poll(self, poller: _Poller, states: dict[str, _State], results: dict[str, Operation]) -> None:
+        deadline = time.monotonic() + self._deadline
+        delay = self._delay
+        attempts = 0
+
+        while True:
+            ls = await poller.get()
+            attempts += 1
 
             for op in ls:
                 if op.id not in states:
@@ -116,41 +213,44 @@ class Syncer:
 
                 results[op.id] = op
 
-            done = True
+            if all(st.done for st in states.values()):
+                return
 
-            for st in states.values():
-                if not st.done:
-                    done = False
-                    break
+            if self._max_attempts is not None and attempts >= self._max_attempts:
+                return
 
-            if done:
-                break
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return
 
-            limit -= 1
-            sleep(self._delay)
+            # Jitter keeps concurrent waiters from polling in lockstep
+            await asyncio.sleep(min(random.uniform(delay / 2, delay), remaining))  # noqa: S311
+            delay = min(delay * 2, self._max_delay)
 
-        errs: list[Exception] = []
-        done = True
 
-        for st in states.values():
-            if st.error:
-                errs.append(st.error)
+    def _acquire_poller(self) -> _Poller:
+        if self._key is None:
+            poller = _Poller(self._list, self._tick)
+        else:
+            pollers = _pollers.setdefault(asyncio.get_running_loop(), {})
+            poller = pollers.get(self._key)
+            if poller is None:
+                poller = _Poller(self._list, self._tick)
+                pollers[self._key] = poller
 
-            if not st.done:
-                done = False
+        poller.waiters += 1
+        return poller
 
-        if errs:
-            msg = "Multiple errors while waiting for operations"
-            raise ExceptionGroup(msg, errs)
 
-        if not done:
-            msg = "Operations did not finish in time"
-            raise ValueError(msg)
+    def _release_poller(self, poller: _Poller) -> None:
+        poller.waiters -= 1
 
-        if isinstance(ops, list):
-            return list(results.values())
+        if self._key is None or poller.waiters > 0:
+            return
 
-        return results[ops.id]
+        pollers = _pollers.get(asyncio.get_running_loop(), {})
+        if pollers.get(self._key) is poller:
+            del pollers[self._key]
 
 
 def _is_finished(op: Operation) -> bool:
@@ -25,6 +25,8 @@ if TYPE_CHECKING:
 
 
 class RunFlowBaseComponent(Component):
+    memoizable = False
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.add_tool_output = True
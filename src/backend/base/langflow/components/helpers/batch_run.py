@@ -1,19 +1,27 @@
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import json
+import random
 from typing import TYPE_CHECKING, Any, cast
 
 import toml  # type: ignore[import-untyped]
 from loguru import logger
 
-from langflow.custom import Component
-from langflow.io import BoolInput, DataFrameInput, HandleInput, MessageTextInput, MultilineInput, Output
+from langflow.custom.custom_component.component_with_cache import ComponentWithCache
+from langflow.io import BoolInput, DataFrameInput, HandleInput, IntInput, MessageTextInput, MultilineInput, Output
 from langflow.schema import DataFrame
+from langflow.services.cache.utils import CacheMiss
 
 if TYPE_CHECKING:
     from langchain_core.runnables import Runnable
 
+RETRY_BASE_DELAY = 1.0
+"""Seconds to wait before the first retry of a failed row. The delay doubles with every retry."""
 
-class BatchRunComponent(Component):
+
+class BatchRunComponent(ComponentWithCache):
     display_name = "Batch Run"
     description = "Runs an LLM over each row of a DataFrame's column. If no column is set, the entire row is passed."
     icon = "List"
@@ -65,6 +73,37 @@ class BatchRunComponent(Component):
             required=False,
             advanced=True,
         ),
+        IntInput(
+            name="chunk_size",
+            display_name="Chunk Size",
+            info="Number of rows sent to the model at a time. Progress is reported after each chunk.",
+            value=100,
+            advanced=True,
+        ),
+        IntInput(
+            name="max_concurrency",
+            display_name="Max Concurrent Requests",
+            info="Maximum number of requests to the model in flight at the same time.",
+            value=10,
+            advanced=True,
+        ),
+        IntInput(
+            name="max_retries",
+            display_name="Max Retries",
+            info="Number of times a failed row is retried, with exponential backoff.",
+            value=2,
+            advanced=True,
+        ),
+        BoolInput(
+            name="cache_results",
+            display_name="Cache Results",
+            info=(
+                "If True, the responses of successful rows are cached by prompt and model, "
+                "so that a re-run only processes rows that failed or changed."
+            ),
+            value=True,
+            advanced=True,
+        ),
     ]
 
     outputs = [
@@ -110,9 +149,79 @@ class BatchRunComponent(Component):
                 "processing_status": "failed",
             }
 
+    def _model_cache_key(self, model: Any) -> str:
+        """Identify the model and its parameters, so that cached responses of another model are not reused."""
+        try:
+            params = getattr(model, "_identifying_params", None)
+        except Exception:  # noqa: BLE001
+            params = None
+        return json.dumps([type(model).__name__, params], sort_keys=True, default=str)
+
+    def _row_cache_key(self, model_key: str, conversation: list[dict[str, str]]) -> str:
+        prompt = json.dumps([model_key, conversation], sort_keys=True)
+        return f"batch_run:{hashlib.sha256(prompt.encode()).hexdigest()}"
+
+    async def _run_row(
+        self,
+        model: Runnable,
+        conversation: list[dict[str, str]],
+        semaphore: asyncio.Semaphore,
+        error: Exception | None = None,
+    ) -> Any:
+        """Run a single row, retrying failures with exponential backoff. Returns the final error on failure.
+
+        A row that already failed as part of a chunk passes its `error` and is only retried.
+        """
+        first_attempt = 0 if error is None else 1
+        for attempt in range(first_attempt, max(0, self.max_retries) + 1):
+            if attempt:
+                await asyncio.sleep(RETRY_BASE_DELAY * 2 ** (attempt - 1) * random.uniform(0.5, 1.5))  # noqa: S311
+            try:
+                async with semaphore:
+                    return (await model.abatch([conversation]))[0]
+            except (KeyError, AttributeError):
+                raise
+            except Exception as e:  # noqa: BLE001
+                error = e
+                logger.debug(f"Batch run row failed on attempt {attempt + 1}: {e!s}")
+        return error
+
+    async def _run_chunk(
+        self, model: Runnable, conversations: list[list[dict[str, str]]], semaphore: asyncio.Semaphore
+    ) -> list[Any]:
+        """Run a chunk of rows in one batch, then retry only the rows that failed."""
+        config = {"max_concurrency": max(1, self.max_concurrency)}
+        try:
+            results = list(await model.abatch(conversations, config, return_exceptions=True))
+        except (KeyError, AttributeError):
+            raise
+        except Exception as e:  # noqa: BLE001
+            logger.warning(f"Batch of {len(conversations)} rows failed, running rows one by one: {e!s}")
+            return await asyncio.gather(
+                *(self._run_row(model, conversation, semaphore) for conversation in conversations)
+            )
+
+        for result in results:
+            if isinstance(result, KeyError | AttributeError):
+                raise result
+        failed = [index for index, result in enumerate(results) if isinstance(result, Exception)]
+        if failed:
+            logger.warning(f"{len(failed)} of {len(conversations)} rows of a batch failed, retrying them")
+            retried = await asyncio.gather(
+                *(self._run_row(model, conversations[index], semaphore, results[index]) for index in failed)
+            )
+            for index, result in zip(failed, retried, strict=True):
+                results[index] = result
+        return results
+
     async def run_batch(self) -> DataFrame:
         """Process each row in df[column_name] with the language model asynchronously.
 
+        Rows are sent to the model in chunks of `chunk_size`, with at most `max_concurrency` requests in
+        flight. The rows of a chunk that fail are retried one by one, and rows that still fail are returned
+        with an empty response instead of failing the whole batch. With `cache_results`, responses are
+        cached per prompt, so a re-run only processes rows that failed or changed.
+
         Returns:
             DataFrame: A new DataFrame containing:
                 - All original columns
@@ -144,7 +253,7 @@ class BatchRunComponent(Component):
                 user_texts = df[col_name].astype(str).tolist()
             else:
                 user_texts = [
-                    self._format_row_as_toml(cast(dict[str, Any], row)) for row in df.to_dict(orient="records")
+                    self._format_row_as_toml(cast("dict[str, Any]", row)) for row in df.to_dict(orient="records")
                 ]
 
             total_rows = len(user_texts)
@@ -158,6 +267,21 @@ class BatchRunComponent(Component):
                 for text in user_texts
             ]
 
+            # Reuse the cached responses of rows that did not change
+            responses: list[Any] = [None] * total_rows
+            cache_keys: list[str] = []
+            if self.cache_results:
+                model_key = self._model_cache_key(model)
+                cache_keys = [self._row_cache_key(model_key, conversation) for conversation in conversations]
+                for idx, key in enumerate(cache_keys):
+                    cached = self._shared_component_cache.get(key)
+                    if not isinstance(cached, CacheMiss):
+                        responses[idx] = cached
+            pending = [idx for idx, response in enumerate(responses) if response is None]
+            cached_rows = total_rows - len(pending)
+            if cached_rows:
+                logger.info(f"Reusing {cached_rows} cached responses")
+
             # Configure the model with project info and callbacks
             model = model.with_config(
                 {
@@ -166,35 +290,43 @@ class BatchRunComponent(Component):
                     "callbacks": self.get_langchain_callbacks(),
                 }
             )
-            # Process batches and track progress
-            responses_with_idx = list(
-                zip(
-                    range(len(conversations)),
-                    await model.abatch(list(conversations)),
-                    strict=True,
-                )
-            )
-
-            # Sort by index to maintain order
-            responses_with_idx.sort(key=lambda x: x[0])
+            semaphore = asyncio.Semaphore(max(1, self.max_concurrency))
+            chunk_size = max(1, self.chunk_size)
+            processed = failed = 0
+            for start in range(0, len(pending), chunk_size):
+                chunk = pending[start : start + chunk_size]
+                results = await self._run_chunk(model, [conversations[idx] for idx in chunk], semaphore)
+                for idx, result in zip(chunk, results, strict=True):
+                    if isinstance(result, Exception):
+                        responses[idx] = result
+                        failed += 1
+                        continue
+                    response_text = result.content if hasattr(result, "content") else str(result)
+                    responses[idx] = response_text
+                    if self.cache_results:
+                        self._shared_component_cache.set(cache_keys[idx], response_text)
+                processed += len(chunk)
+                progress = {"processed": processed, "cached": cached_rows, "failed": failed, "total": total_rows}
+                logger.info(f"Processed {processed + cached_rows}/{total_rows} rows")
+                self.log(progress, name="Batch Run Progress")
 
             # Build the final data with enhanced metadata
             rows: list[dict[str, Any]] = []
-            for idx, (original_row, response) in enumerate(
-                zip(df.to_dict(orient="records"), responses_with_idx, strict=False)
-            ):
-                response_text = response[1].content if hasattr(response[1], "content") else str(response[1])
-                row = self._create_base_row(
-                    cast(dict[str, Any], original_row), model_response=response_text, batch_index=idx
-                )
-                self._add_metadata(row, success=True, system_msg=system_msg)
+            for idx, (original_row, response) in enumerate(zip(df.to_dict(orient="records"), responses, strict=False)):
+                if isinstance(response, Exception):
+                    row = self._create_base_row(cast("dict[str, Any]", original_row), batch_index=idx)
+                    self._add_metadata(row, success=False, error=str(response))
+                else:
+                    row = self._create_base_row(
+                        cast("dict[str, Any]", original_row), model_response=response, batch_index=idx
+                    )
+                    self._add_metadata(row, success=True, system_msg=system_msg)
                 rows.append(row)
 
-                # Log progress
-                if (idx + 1) % max(1, total_rows // 10) == 0:
-                    logger.info(f"Processed {idx + 1}/{total_rows} rows")
-
-            logger.info("Batch processing completed successfully")
+            if failed:
+                logger.warning(f"Batch processing completed with {failed} failed rows")
+            else:
+                logger.info("Batch processing completed successfully")
             return DataFrame(rows)
 
         except (KeyError, AttributeError) as e:
@@ -2,7 +2,7 @@ from langflow.custom import Component
 from langflow.helpers.data import data_to_text
 from langflow.inputs import HandleInput
 from langflow.io import DropdownInput, IntInput, MessageTextInput, MultilineInput, Output
-from langflow.memory import aget_messages
+from langflow.memory import aget_last_messages, aget_messages
 from langflow.schema import Data
 from langflow.schema.dataframe import DataFrame
 from langflow.schema.message import Message
@@ -103,12 +103,21 @@ class MemoryComponent(Component):
             if sender:
                 expected_type = MESSAGE_SENDER_AI if sender == MESSAGE_SENDER_AI else MESSAGE_SENDER_USER
                 stored = [m for m in stored if m.type == expected_type]
+        elif n_messages:
+            # Read the last messages of the session through its index, oldest first
+            stored = await aget_last_messages(
+                session_id=session_id,
+                limit=n_messages,
+                sender=sender,
+                sender_name=sender_name,
+            )
+            if order == "DESC":
+                stored = stored[::-1]
         else:
             stored = await aget_messages(
                 sender=sender,
                 sender_name=sender_name,
                 session_id=session_id,
-                limit=n_messages,
                 order=order,
             )
         self.status = stored
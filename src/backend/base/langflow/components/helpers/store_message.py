@@ -1,7 +1,7 @@
 from langflow.custom import Component
 from langflow.inputs import HandleInput
 from langflow.inputs.inputs import MessageTextInput
-from langflow.memory import aget_messages, astore_message
+from langflow.memory import aget_last_messages, astore_message
 from langflow.schema.message import Message
 from langflow.template import Output
 from langflow.utils.constants import MESSAGE_SENDER_AI, MESSAGE_SENDER_NAME_AI
@@ -71,11 +71,8 @@ class MessageStoreComponent(Component):
                 stored_messages = [m for m in stored_messages if m.sender == message.sender]
         else:
             await astore_message(message, flow_id=self.graph.flow_id)
-            stored_messages = (
-                await aget_messages(
-                    session_id=message.session_id, sender_name=message.sender_name, sender=message.sender
-                )
-                or []
+            stored_messages = await aget_last_messages(
+                message.session_id, 1, sender=message.sender, sender_name=message.sender_name
             )
 
         if not stored_messages:
@@ -1,6 +1,13 @@
+import asyncio
+import copy
+
+from loguru import logger
+
 from langflow.custom import Component
-from langflow.io import DataInput, Output
+from langflow.graph.graph.base import Graph
+from langflow.io import DataInput, DropdownInput, IntInput, Output
 from langflow.schema import Data
+from langflow.services.deps import get_settings_service
 
 
 class LoopComponent(Component):
@@ -16,6 +23,23 @@ class LoopComponent(Component):
             display_name="Data",
             info="The initial list of Data objects to iterate over.",
         ),
+        DropdownInput(
+            name="mode",
+            display_name="Mode",
+            options=["Sequential", "Map"],
+            value="Sequential",
+            info=(
+                "Sequential runs the loop body once per item, one item after the other. "
+                "Map runs an independent copy of the loop body for each item, several items at the same time."
+            ),
+        ),
+        IntInput(
+            name="max_parallel",
+            display_name="Max Parallel Items",
+            info="The maximum number of items processed at the same time in Map mode.",
+            value=4,
+            advanced=True,
+        ),
     ]
 
     outputs = [
@@ -61,6 +85,11 @@ class LoopComponent(Component):
         self.initialize_data()
         current_item = Data(text="")
 
+        if self.mode == "Map":
+            # The loop body is run by done_output, once per item
+            self.stop("item")
+            return Data(text="")
+
         if self.evaluate_stop_loop():
             self.stop("item")
             return Data(text="")
@@ -77,10 +106,14 @@ class LoopComponent(Component):
         self.update_ctx({f"{self._id}_index": current_index + 1})
         return current_item
 
-    def done_output(self) -> Data:
+    async def done_output(self) -> Data:
         """Trigger the done output when iteration is complete."""
         self.initialize_data()
 
+        if self.mode == "Map":
+            self.stop("item")
+            return await self.map_items(self.ctx.get(f"{self._id}_data", []))
+
         if self.evaluate_stop_loop():
             self.stop("item")
             self.start("done")
@@ -109,3 +142,104 @@ class LoopComponent(Component):
             aggregated.append(self.item)
             self.update_ctx({f"{self._id}_aggregated": aggregated})
         return aggregated
+
+    async def map_items(self, items: list[Data]) -> list[Data | None]:
+        """Run a copy of the loop body for each item and return the results in the order of the items.
+
+        An item whose body fails is replaced by a Data object with the error, so that it does not
+        stop the other items. An item whose body sends nothing back to the loop is replaced by None,
+        so that every result keeps the position of its item.
+        """
+        if self._vertex is None:
+            msg = "The Map mode runs the loop body of a flow, so the Loop must be part of a flow."
+            raise ValueError(msg)
+        body = _LoopBody(self._vertex.graph, self._vertex.id)
+        semaphore = asyncio.Semaphore(max(1, self.max_parallel or 1))
+        failed: list[int] = []
+
+        async def run(index: int, item: Data):
+            async with semaphore:
+                try:
+                    return await body.run(item, event_manager=self._event_manager)
+                except Exception as exc:  # noqa: BLE001
+                    logger.warning(f"Loop item {index} failed: {exc}")
+                    failed.append(index)
+                    return Data(data={"error": str(exc)})
+
+        results = await asyncio.gather(*(run(index, item) for index, item in enumerate(items)))
+        self.status = f"Processed {len(items)} items, {len(failed)} failed."
+        return list(results)
+
+
+class _LoopBody:
+    """The vertices that a loop runs for each item, between its item output and its item input."""
+
+    def __init__(self, graph: Graph, loop_id: str) -> None:
+        self.graph = graph
+        entry_edges = [edge for edge in graph.edges if edge.source_id == loop_id and edge.source_handle.name == "item"]
+        vertex_ids: set[str] = set()
+        to_visit = [edge.target_id for edge in entry_edges]
+        while to_visit:
+            vertex_id = to_visit.pop()
+            if vertex_id == loop_id or vertex_id in vertex_ids:
+                continue
+            vertex_ids.add(vertex_id)
+            to_visit.extend(graph.successor_map.get(vertex_id, []))
+
+        # Inputs from outside of the body are passed to each copy when they are already built.
+        # Otherwise they are run again in each copy, along with their own unbuilt inputs.
+        external_edges = []
+        to_visit = list(vertex_ids)
+        while to_visit:
+            vertex_id = to_visit.pop()
+            for edge in graph.get_vertex(vertex_id).incoming_edges:
+                if edge.source_id == loop_id or edge.source_id in vertex_ids:
+                    continue
+                if graph.get_vertex(edge.source_id).built:
+                    external_edges.append(edge)
+                else:
+                    vertex_ids.add(edge.source_id)
+                    to_visit.append(edge.source_id)
+
+        self.entry_params = [(edge.target_id, edge.target_param) for edge in entry_edges]
+        self.external_edges = external_edges
+        self.return_edge = next(
+            (edge for edge in graph.edges if edge.target_id == loop_id and edge.source_id in vertex_ids),
+            None,
+        )
+        self.payload = {
+            "nodes": [graph.get_vertex(vertex_id).to_data() for vertex_id in sorted(vertex_ids)],
+            "edges": [
+                edge.to_data() for edge in graph.edges if edge.source_id in vertex_ids and edge.target_id in vertex_ids
+            ],
+        }
+
+    async def run(self, item: Data, event_manager=None):
+        """Run an independent copy of the body for one item and return what it sends back to the loop."""
+        graph = Graph.from_payload(
+            copy.deepcopy(self.payload),
+            flow_id=self.graph.flow_id,
+            flow_name=self.graph.flow_name,
+            user_id=self.graph.user_id,
+        )
+        graph.session_id = self.graph.session_id
+        graph.context = dict(self.graph.context)
+
+        params: dict[str, dict] = {}
+        for vertex_id, param in self.entry_params:
+            params.setdefault(vertex_id, {})[param] = item
+        for edge in self.external_edges:
+            source = self.graph.get_vertex(edge.source_id)
+            params.setdefault(edge.target_id, {})[edge.target_param] = source.results.get(edge.source_handle.name)
+        for vertex_id, vertex_params in params.items():
+            graph.get_vertex(vertex_id).update_raw_params(vertex_params, overwrite=True)
+
+        fallback_to_env_vars = get_settings_service().settings.fallback_to_env_var
+        for vertex in graph.topological_sort():
+            await vertex.build(
+                user_id=self.graph.user_id, fallback_to_env_vars=fallback_to_env_vars, event_manager=event_manager
+            )
+
+        if self.return_edge is None:
+            return None
+        return graph.get_vertex(self.return_edge.source_id).results.get(self.return_edge.source_handle.name)
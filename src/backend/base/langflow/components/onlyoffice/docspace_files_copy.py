@@ -90,12 +90,12 @@ class OnlyofficeDocspaceCopy(
 
     async def _copy(self, schema: Schema) -> list[Any]:
         client = await self._get_client()
-        syncer = Syncer(client.files.list_operations)
+        syncer = Syncer(client.files.alist_operations, key=client.session_key())
         options = MoveOptions(
             folderIds=schema.folder_ids,
             fileIds=schema.file_ids,
             destFolderId=schema.dest_folder_id,
         )
-        operations = syncer.do(client.files.copy, options)
+        operations = await syncer.do(client.files.acopy, options)
         return [operation.model_dump(exclude_none=True, by_alias=True) \
             for operation in operations]
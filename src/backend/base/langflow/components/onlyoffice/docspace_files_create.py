@@ -103,7 +103,7 @@ class OnlyofficeDocspaceCreateFile(Component, EnableExternalExtMixin, FormIdMixi
             formId=schema.form_id,
             enableExternalExt=schema.enable_external_ext,
         )
-        result, response = client.files.create_file(schema.folder_id, options)
+        result, response = await client.files.acreate_file(schema.folder_id, options)
         if isinstance(response, ErrorResponse):
             raise response.exception
 
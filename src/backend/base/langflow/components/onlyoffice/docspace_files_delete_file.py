@@ -66,7 +66,7 @@ class OnlyofficeDocspaceDeleteFile(Component):
 
     async def _delete_file(self, schema: Schema) -> Any:
         client = await self._get_client()
-        syncer = Syncer(client.files.list_operations)
+        syncer = Syncer(client.files.alist_operations, key=client.session_key())
         options = DeleteFileOptions(DeleteAfter=False, immediately=False)
-        operations = syncer.do(client.files.delete_file, schema.file_id, options)
+        operations = await syncer.do(client.files.adelete_file, schema.file_id, options)
         return operations[0].model_dump(exclude_none=True, by_alias=True)
@@ -65,9 +65,9 @@ class OnlyofficeDocspaceDownloadAsText(Component):
 
     async def _download_as_text(self, schema: Schema) -> str:
         client = await self._get_client()
-        syncer = Syncer(client.files.list_operations)
+        syncer = Syncer(client.files.alist_operations, key=client.session_key())
 
-        result, response = client.files.get_file(schema.file_id)
+        result, response = await client.files.aget_file(schema.file_id)
         if isinstance(response, ErrorResponse):
             raise response.exception
 
@@ -75,15 +75,14 @@ class OnlyofficeDocspaceDownloadAsText(Component):
         ext = self._get_ext(file_type)
         options = {"fileIds": [{"key": schema.file_id, "value": ext}]}
 
-        result = syncer.do(client.files.bulk_download, options)
+        result = await syncer.do(client.files.abulk_download, options)
 
         request = client.create_request("GET", result[0].url)
         request.headers["Accept"] = "text/plain"
 
-        with client.opener.open(request) as response:
-            content = response.read()
+        response = await client.aopen(request)
 
-        return content.decode("utf-8")
+        return response.content.decode("utf-8")
 
 
     def _get_ext(self, file_type: str) -> str:
@@ -1,3 +1,4 @@
+from collections.abc import Mapping
 from urllib.request import Request
 
 from pydantic import BaseModel, Field
@@ -62,20 +63,19 @@ class OnlyofficeDocspaceDownloadFile(Component):
     async def _download_file(self, schema: Schema):
         client = await self._get_client()
 
-        url, response = client.files.get_file_download_link(schema.file_id)
+        url, response = await client.files.aget_file_download_link(schema.file_id)
         if isinstance(response, ErrorResponse):
             raise response.exception
 
-        opener = client.opener
-
         try:
             req = Request(url, method="HEAD")  # noqa: S310
-            with opener.open(req) as res:
-                total_size = int(res.headers.get("Content-Length", 0))
+            res = await client.aopen(req)
+            total_size = int(res.headers.get("Content-Length", 0))
         except:  # noqa: E722
-            req = Request(url, method="GET")  # noqa: S310
-            with opener.open(req) as res:
-                total_size = int(res.headers.get("Content-Length", 0))
+            # Ask for the first byte only, Content-Range holds the size of the whole file
+            req = Request(url, method="GET", headers={"Range": "bytes=0-0"})  # noqa: S310
+            res = await client.aopen(req)
+            total_size = _total_size(res.headers)
 
         downloaded = 0
 
@@ -83,13 +83,21 @@ class OnlyofficeDocspaceDownloadFile(Component):
             end = min(downloaded + schema.chunk_size - 1, total_size - 1)
             req = Request(url, method="GET", headers={"Range": f"bytes={downloaded}-{end}"})  # noqa: S310
 
-            with opener.open(req) as res:
-                chunk = res.read()
+            res = await client.aopen(req)
+            chunk = res.content
+
+            actual_size = len(chunk)
+            downloaded += actual_size
+
+            yield Message(content=chunk.decode("utf-8"))
 
-                actual_size = len(chunk)
-                downloaded += actual_size
+            if actual_size < (end - downloaded + 1) and actual_size > 0:
+                break
 
-                yield Message(content=chunk.decode("utf-8"))
 
-                if actual_size < (end - downloaded + 1) and actual_size > 0:
-                    break
+def _total_size(headers: Mapping[str, str]) -> int:
+    # A partial response has "Content-Range: bytes 0-0/<size>", a full one only a Content-Length
+    _, _, size = headers.get("Content-Range", "").rpartition("/")
+    if size.isdigit():
+        return int(size)
+    return int(headers.get("Content-Length", 0))
@@ -66,7 +66,7 @@ class OnlyofficeDocspaceGetFile(Component):
     async def _get_file(self, schema: Schema) -> Any:
         client = await self._get_client()
 
-        result, response = client.files.get_file(schema.file_id)
+        result, response = await client.files.aget_file(schema.file_id)
         if isinstance(response, ErrorResponse):
             raise response.exception
 
@@ -77,7 +77,7 @@ class OnlyofficeDocspaceGetFiles(Component, IdSeparatorMixin, FileIdsMixin):
         errs: list[Exception] = []
 
         for file_id in schema.file_ids:
-            result, response = client.files.get_file(file_id)
+            result, response = await client.files.aget_file(file_id)
             if isinstance(response, ErrorResponse):
                 errs.append(response.exception)
             else:
@@ -51,7 +51,7 @@ class OnlyofficeDocspaceListOperations(Component):
     async def _list_operations(self) -> list[Any]:
         client = await self._get_client()
 
-        result, response = client.files.list_operations()
+        result, response = await client.files.alist_operations()
         if isinstance(response, ErrorResponse):
             raise response.exception
 
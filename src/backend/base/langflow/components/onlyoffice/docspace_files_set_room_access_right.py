@@ -89,7 +89,7 @@ class OnlyofficeDocspaceSetRoomAccessRights(Component):
             invitations=schema.invitations,
         )
 
-        result, response = client.files.set_room_access_right(
+        result, response = await client.files.aset_room_access_right(
             schema.room_id,
             options,
         )
@@ -68,7 +68,7 @@ class OnlyofficeDocspaceStartDeletingFile(Component):
 
         options = DeleteFileOptions(DeleteAfter=False, immediately=False)
 
-        operations, response = client.files.delete_file(schema.file_id, options)
+        operations, response = await client.files.adelete_file(schema.file_id, options)
         if isinstance(response, ErrorResponse):
             raise response.exception
 
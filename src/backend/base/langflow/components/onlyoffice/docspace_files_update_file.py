@@ -77,7 +77,7 @@ class OnlyofficeDocspaceUpdateFile(Component):
 
         options = UpdateFileOptions(title=schema.title)
 
-        result, response = client.files.update_file(schema.file_id, options)
+        result, response = await client.files.aupdate_file(schema.file_id, options)
         if isinstance(response, ErrorResponse):
             raise response.exception
 
@@ -63,7 +63,7 @@ class OnlyofficeDocspaceUploadFile(Component):
             CreateOn=create_on,
         )
 
-        session_result, response = client.files.create_session(self.folder_id, session_options)
+        session_result, response = await client.files.acreate_session(self.folder_id, session_options)
         if isinstance(response, ErrorResponse):
             raise response.exception
 
@@ -80,7 +80,7 @@ class OnlyofficeDocspaceUploadFile(Component):
                 chunk=chunk,
             )
 
-            upload_result, response = client.files.upload_chunk(session_id, upload_options)
+            upload_result, response = await client.files.aupload_chunk(session_id, upload_options)
             if isinstance(response, ErrorResponse):
                 raise response.exception
 
@@ -32,7 +32,7 @@ class OnlyofficeDocspaceWaitOperation(Component):
         MessageTextInput(
             name="delay",
             display_name="Delay",
-            info="The delay between each check in seconds.",
+            info="The delay before the first check in seconds. It doubles after each check, up to 2 seconds.",
             value="0.1",
             advanced=True,
         ),
@@ -43,6 +43,13 @@ class OnlyofficeDocspaceWaitOperation(Component):
             value="100",
             advanced=True,
         ),
+        MessageTextInput(
+            name="timeout",
+            display_name="Timeout",
+            info="The maximum time to wait in seconds.",
+            value="10",
+            advanced=True,
+        ),
     ]
 
 
@@ -54,8 +61,9 @@ class OnlyofficeDocspaceWaitOperation(Component):
 
     class Schema(BaseModel):
         operation_id: str = Field(..., description="The ID of the operation to wait for.")
-        delay: float = Field(0.1, description="The delay between each check in seconds.")
+        delay: float = Field(0.1, description="The delay before the first check in seconds.")
         max_retries: int = Field(100, description="The maximum number of retries.")
+        timeout: float = Field(10, description="The maximum time to wait in seconds.")
 
 
     def _create_schema(self) -> Schema:
@@ -63,6 +71,7 @@ class OnlyofficeDocspaceWaitOperation(Component):
             operation_id=self.operation_id,
             delay=self.delay,
             max_retries=self.max_retries,
+            timeout=self.timeout,
         )
 
 
@@ -88,7 +97,13 @@ class OnlyofficeDocspaceWaitOperation(Component):
 
     async def _wait_operation(self, schema: Schema) -> Any:
         client = await self._get_client()
-        syncer = Syncer(client.files.list_operations)
+        syncer = Syncer(
+            client.files.alist_operations,
+            key=client.session_key(),
+            delay=schema.delay,
+            deadline=schema.timeout,
+            max_attempts=schema.max_retries,
+        )
         operation = Operation(id=schema.operation_id)
-        operation = syncer.wait(operation)
+        operation = await syncer.wait(operation)
         return operation.model_dump(exclude_none=True, by_alias=True)
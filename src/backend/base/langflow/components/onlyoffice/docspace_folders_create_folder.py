@@ -80,7 +80,7 @@ class OnlyofficeDocspaceCreateFolder(Component):
 
         options = CreateFolderOptions(title=schema.title)
 
-        result, response = client.files.create_folder(schema.room_id_or_folder_id, options)
+        result, response = await client.files.acreate_folder(schema.room_id_or_folder_id, options)
         if isinstance(response, ErrorResponse):
             raise response.exception
 
@@ -72,7 +72,7 @@ class OnlyofficeDocspaceGetFolder(Component, FiltersMixin):
     async def _get_folder(self, schema: Schema) -> Any:
         client = await self._get_client()
 
-        result, response = client.files.get_folder(
+        result, response = await client.files.aget_folder(
             schema.folder_id,
             schema.filters.to_filters(),
         )
@@ -52,7 +52,7 @@ class OnlyofficeDocspaceListMy(Component):
     async def _list_my(self) -> Any:
         client = await self._get_client()
 
-        result, response = client.files.list_my()
+        result, response = await client.files.alist_my()
         if isinstance(response, ErrorResponse):
             raise response.exception
 
@@ -65,7 +65,7 @@ class OnlyofficeDocspaceListSubfolders(Component):
     async def _list_subfolders(self, schema: Schema) -> list[Any]:
         client = await self._get_client()
 
-        result, response = client.files.list_subfolders(schema.folder_id)
+        result, response = await client.files.alist_subfolders(schema.folder_id)
         if isinstance(response, ErrorResponse):
             raise response.exception
 
@@ -77,7 +77,7 @@ class OnlyofficeDocspaceUpdateFolder(Component):
 
         options = UpdateFolderOptions(title=schema.title)
 
-        result, response = client.files.update_folder(schema.folder_id, options)
+        result, response = await client.files.aupdate_folder(schema.folder_id, options)
         if isinstance(response, ErrorResponse):
             raise response.exception
 
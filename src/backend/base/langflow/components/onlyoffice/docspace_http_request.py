@@ -112,7 +112,7 @@ class OnlyofficeDocspaceHttpRequest(Component):
     async def _send_request(self, schema: Schema) -> Any:
         client = await self._get_client()
 
-        result, response = client.request(
+        result, response = await client.arequest(
             schema.method,
             schema.path,
             schema.query,
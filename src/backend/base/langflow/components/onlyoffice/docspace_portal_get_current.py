@@ -52,7 +52,7 @@ class OnlyofficeDocspaceGetCurrentPortal(Component):
     async def _get_current_portal(self) -> Any:
         client = await self._get_client()
 
-        result, response = client.portal.get_current()
+        result, response = await client.portal.aget_current()
         if isinstance(response, ErrorResponse):
             raise response.exception
 
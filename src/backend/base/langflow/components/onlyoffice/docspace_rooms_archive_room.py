@@ -66,7 +66,7 @@ class OnlyofficeDocspaceArchiveRoom(Component):
 
     async def _archive_room(self, schema: Schema) -> Any:
         client = await self._get_client()
-        syncer = Syncer(client.files.list_operations)
+        syncer = Syncer(client.files.alist_operations, key=client.session_key())
         options = ArchiveRoomOptions(DeleteAfter=False)
-        operation = syncer.do(client.files.archive_room, schema.room_id, options)
+        operation = await syncer.do(client.files.aarchive_room, schema.room_id, options)
         return operation.model_dump(exclude_none=True, by_alias=True)
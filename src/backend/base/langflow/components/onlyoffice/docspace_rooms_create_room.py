@@ -92,7 +92,7 @@ class OnlyofficeDocspaceCreateRoom(Component):
             title=schema.title,
         )
 
-        room, response = client.files.create_room(options)
+        room, response = await client.files.acreate_room(options)
         if isinstance(response, ErrorResponse):
             raise response.exception
 
@@ -66,7 +66,7 @@ class OnlyofficeDocspaceGetRoom(Component):
     async def _get_room(self, schema: Schema) -> Any:
         client = await self._get_client()
 
-        room, response = client.files.get_room(schema.room_id)
+        room, response = await client.files.aget_room(schema.room_id)
         if isinstance(response, ErrorResponse):
             raise response.exception
 
@@ -52,7 +52,7 @@ class OnlyofficeDocspaceListRooms(Component):
     async def _list_rooms(self) -> Any:
         client = await self._get_client()
 
-        ls, response = client.files.list_rooms()
+        ls, response = await client.files.alist_rooms()
         if isinstance(response, ErrorResponse):
             raise response.exception
 
@@ -77,7 +77,7 @@ class OnlyofficeDocspaceUpdateRoom(Component):
 
         options = UpdateRoomOptions(title=schema.title)
 
-        result, response = client.files.update_room(schema.room_id, options)
+        result, response = await client.files.aupdate_room(schema.room_id, options)
         if isinstance(response, ErrorResponse):
             raise response.exception
 
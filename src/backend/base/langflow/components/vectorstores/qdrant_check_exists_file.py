@@ -1,6 +1,3 @@
-from langchain.embeddings.base import Embeddings
-from langchain_community.vectorstores import Qdrant
-from langchain_core.documents import Document
 from langflow.custom import Component
 from langflow.schema import Message
 from langflow.io import (
@@ -8,7 +5,7 @@ from langflow.io import (
     Output,
 )
 
-from langflow.utils.qdrant import get_qdrant_client, check_collection_exists, create_collection, check_document_exists, qdrant_inputs
+from langflow.utils.qdrant import get_qdrant_client, check_collection_exists, document_exists, qdrant_inputs
 
 
 class QdrantCheckFileComponent(Component):
@@ -30,39 +27,20 @@ class QdrantCheckFileComponent(Component):
                method="check_document")
     ]
 
-    def build_vector_store(self) -> Qdrant | None:
-        try:
-            collection_name: str = self.collection_name.get_text()
-            embedding: Embeddings = self.embedding
-
-            client = get_qdrant_client(
-                self.qdrant_host.get_text(), self.qdrant_port.get_text())
-
-            if not check_collection_exists(client, collection_name):
-                # Get vector size from first document
-                return None
-
-            qdrant = Qdrant(client=client,
-                            embeddings=embedding,
-                            collection_name=collection_name)
-
-            return qdrant
-
-        except Exception as e:
-            raise Exception(f"Error building vector store: {str(e)}")
-
     def check_document(self) -> Message:
-        qdrant = self.build_vector_store()
+        collection_name: str = self.collection_name.get_text()
 
-        if not qdrant:
+        client = get_qdrant_client(
+            self.qdrant_host.get_text(), self.qdrant_port.get_text())
+
+        if not check_collection_exists(client, collection_name):
             return Message(text="not_found")
 
         if not self.metadata:
             return Message(text="No metadata provided")
 
-        doc = Document(page_content="content", metadata={**self.metadata.data})
-
-        if check_document_exists(qdrant, doc):
+        # The check filters on the metadata only, so nothing is embedded
+        if document_exists(client, collection_name, self.metadata.data):
             return Message(text="exist")
 
         return Message(text="not_found")
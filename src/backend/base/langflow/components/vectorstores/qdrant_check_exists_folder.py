@@ -1,15 +1,11 @@
-from langchain.embeddings.base import Embeddings
-from langchain_community.vectorstores import Qdrant
-from langchain_core.documents import Document
 from qdrant_client.models import Filter
 from langflow.custom import Component
 from langflow.schema import Message
 from langflow.io import (
-    DataInput,
     Output,
 )
 
-from langflow.utils.qdrant import get_qdrant_client, check_collection_exists, create_collection, check_document_exists, qdrant_inputs
+from langflow.utils.qdrant import get_qdrant_client, check_collection_exists, scroll_metadata, qdrant_inputs
 
 
 class QdrantCheckFolderComponent(Component):
@@ -27,31 +23,13 @@ class QdrantCheckFolderComponent(Component):
                method="check_folder")
     ]
 
-    def build_vector_store(self) -> Qdrant | None:
-        try:
-            collection_name: str = self.collection_name.get_text()
-            embedding: Embeddings = self.embedding
-
-            client = get_qdrant_client(
-                self.qdrant_host.get_text(), self.qdrant_port.get_text())
-
-            if not check_collection_exists(client, collection_name):
-                # Get vector size from first document
-                return None
-
-            qdrant = Qdrant(client=client,
-                            embeddings=embedding,
-                            collection_name=collection_name)
-
-            return qdrant
-
-        except Exception as e:
-            raise Exception(f"Error building vector store: {str(e)}")
-
     def check_folder(self) -> Message:
-        qdrant = self.build_vector_store()
+        collection_name: str = self.collection_name.get_text()
 
-        if not qdrant:
+        client = get_qdrant_client(
+            self.qdrant_host.get_text(), self.qdrant_port.get_text())
+
+        if not check_collection_exists(client, collection_name):
             return Message(text="")
 
         filter = Filter(must=[
@@ -60,16 +38,10 @@ class QdrantCheckFolderComponent(Component):
             }}
         ])
 
-        docs = qdrant.similarity_search(
-            query="content",
-            k=1000,
-            filter=filter
-        )
-
-        files_ids = [doc.metadata.get('id') for doc in docs]
-        files_versions = [doc.metadata.get('version') for doc in docs]
+        # Only the metadata of the first pages is read, nothing is embedded
+        files = scroll_metadata(client, collection_name, filter)
 
         response = ', '.join(
-            [f'{id}:{version}' for id, version in zip(files_ids, files_versions)])
+            [f"{file.get('id')}:{file.get('version')}" for file in files])
 
         return Message(text=response)
@@ -1,15 +1,16 @@
-from typing import Dict
-from langchain.embeddings.base import Embeddings
-from langchain_community.vectorstores import Qdrant
+import asyncio
+
 from langchain_core.documents import Document
+from loguru import logger
 
 from langflow.custom import Component
 from langflow.schema import Message
 from langflow.io import (
     DataInput,
+    IntInput,
     Output,
 )
-from langflow.utils.qdrant import get_qdrant_client, check_collection_exists, create_collection, check_document_exists, qdrant_inputs
+from langflow.utils.qdrant import get_qdrant_client, check_collection_exists, document_exists, upsert_documents, qdrant_inputs
 
 
 class QdrantVectorizeVectorStoreComponent(Component):
@@ -28,6 +29,20 @@ class QdrantVectorizeVectorStoreComponent(Component):
             name='metadata',
             display_name="Metadata"
         ),
+        IntInput(
+            name="batch_size",
+            display_name="Batch Size",
+            info="Number of pages embedded and written in one call.",
+            value=64,
+            advanced=True,
+        ),
+        IntInput(
+            name="max_concurrency",
+            display_name="Max Concurrency",
+            info="Number of batches embedded at the same time.",
+            value=4,
+            advanced=True,
+        ),
     ]
 
     outputs = [
@@ -36,43 +51,17 @@ class QdrantVectorizeVectorStoreComponent(Component):
                method="vectorize_documents"),
     ]
 
-    def build_vector_store(self) -> Qdrant:
+    async def vectorize_documents(self) -> Message:
         try:
-            collection_name: str = self.collection_name.get_text()
-            embedding: Embeddings = self.embedding
-
-            client = get_qdrant_client(
-                self.qdrant_host.get_text(), self.qdrant_port.get_text())
-
-            if not check_collection_exists(client, collection_name):
-                # Get vector size from first document
-                doc = Document(page_content='content for vectorize',
-                               metadata={**self.metadata.data})
-                vector = embedding.embed_query(doc.page_content)
-                vector_size = len(vector)
-
-                create_collection(
-                    client, collection_name, vector_size)
-
-            qdrant = Qdrant(client=client,
-                            embeddings=embedding,
-                            collection_name=collection_name)
-
-            return qdrant
-
-        except Exception as e:
-            raise Exception(f"Error building vector store: {str(e)}")
-
-    def vectorize_documents(self) -> Message:
-        try:
-            qdrant = self.build_vector_store()
-
             if not self.documents:
                 return Message(text="No documents to process")
 
-            metadata = self.metadata.data
+            metadata = self.metadata.data if self.metadata else {}
 
-            docs: Dict[str, str] = [
+            if not metadata:
+                return Message(text="No metadata provided")
+
+            docs: list[Document] = [
                 Document(page_content=doc.data.get('text'),
                          metadata={
                     "title": metadata.get('title'),
@@ -81,16 +70,32 @@ class QdrantVectorizeVectorStoreComponent(Component):
                     "page": i})
                 for i, doc in enumerate(self.documents)]
 
-            if not docs:
-                return Message(text="No documents to process")
+            collection_name: str = self.collection_name.get_text()
 
-            if not metadata:
-                return Message(text="No metadata provided")
+            client = get_qdrant_client(
+                self.qdrant_host.get_text(), self.qdrant_port.get_text())
 
-            if check_document_exists(qdrant, docs[0]):
+            if await asyncio.to_thread(check_collection_exists, client, collection_name) and await asyncio.to_thread(
+                    document_exists, client, collection_name, docs[0].metadata):
                 return Message(text="exist")
 
-            qdrant.add_documents(docs)
+            # Pages get IDs derived from the document id, version and page, so that
+            # ingesting a document version again does not duplicate its points
+            metrics = await upsert_documents(
+                client,
+                collection_name,
+                self.embedding,
+                docs,
+                batch_size=self.batch_size,
+                max_concurrency=self.max_concurrency,
+            )
+            rate = metrics["documents"] / metrics["seconds"] if metrics["seconds"] else 0.0
+            self.status = (
+                f"Added {metrics['documents']} pages in {metrics['batches']} batches in {metrics['seconds']:.2f}s "
+                f"({rate:.1f} pages/s, {metrics['embedding_seconds']:.2f}s embedding, "
+                f"{metrics['upsert_seconds']:.2f}s writing)"
+            )
+            logger.info(f"Vectorized document {metadata.get('id')}:{metadata.get('version')}: {self.status}")
 
             return Message(
                 text='added'
@@ -3,7 +3,9 @@ from __future__ import annotations
 import ast
 import asyncio
 import inspect
+import time
 from collections.abc import AsyncIterator, Iterator
+from contextlib import aclosing
 from copy import deepcopy
 from textwrap import dedent
 from typing import TYPE_CHECKING, Any, ClassVar, NamedTuple, get_type_hints
@@ -32,10 +34,11 @@ from langflow.schema.artifact import get_artifact_type, post_process_raw
 from langflow.schema.data import Data
 from langflow.schema.message import ErrorMessage, Message
 from langflow.schema.properties import Source
+from langflow.services.deps import get_executor_service, get_telemetry_service
 from langflow.services.tracing.schema import Log
 from langflow.template.field.base import UNDEFINED, Input, Output
 from langflow.template.frontend_node.custom_components import ComponentFrontendNode
-from langflow.utils.async_helpers import run_until_complete
+from langflow.utils.async_helpers import iterate_in_thread, run_until_complete
 from langflow.utils.util import find_closest_match
 
 from loguru import logger
@@ -98,6 +101,11 @@ class Component(CustomComponent):
     inputs: list[InputTypes] = []
     outputs: list[Output] = []
     code_class_base_inheritance: ClassVar[str] = "Component"
+    sync_executor: ClassVar[str | None] = None
+    """The named pool that runs the synchronous output methods, unless the output sets its own."""
+    memoizable: ClassVar[bool] = True
+    """Whether results can be reused across runs while the parameters stay the same. Set it to False
+    for components that may return different results for the same parameters."""
 
     def __init__(self, **kwargs) -> None:
         # Initialize instance-specific attributes first
@@ -120,6 +128,10 @@ class Component(CustomComponent):
         self._components: list[Component] = []
         self._event_manager: EventManager | None = None
         self._state_model = None
+        # Copy the class-level lists, shared by every instance of a cached class, before they are mutated
+        if self.inputs is not None:
+            self.inputs = list(self.inputs)
+        self.outputs = list(self.outputs)
 
         # Process input kwargs
         inputs = {}
@@ -983,6 +995,13 @@ class Component(CustomComponent):
         ) or self.add_tool_output:
             self._append_tool_to_outputs_map()
 
+    def can_memoize(self) -> bool:
+        """Whether the results of this build can be reused by later runs with the same parameters.
+
+        False if the component is not `memoizable` or one of the outputs it builds sets `cache=False`.
+        """
+        return self.memoizable and all(output.cache for output in self._get_outputs_to_process())
+
     def _should_process_output(self, output):
         if not self._vertex or not self._vertex.outgoing_edges:
             return True
@@ -1001,7 +1020,10 @@ class Component(CustomComponent):
 
         method = getattr(self, output.method)
         try:
-            result = await method() if inspect.iscoroutinefunction(method) else await asyncio.to_thread(method)
+            if inspect.iscoroutinefunction(method):
+                result = await method()
+            else:
+                result = await self._run_sync_output(output, method)
         except TypeError as e:
             msg = f'Error running method "{output.method}": {e}'
             raise TypeError(msg) from e
@@ -1018,6 +1040,12 @@ class Component(CustomComponent):
 
         return result
 
+    async def _run_sync_output(self, output: Output, method):
+        executor_service = get_executor_service()
+        component_name = type(self).__name__
+        executor = executor_service.resolve(component_name, output.name, output.executor or self.sync_executor)
+        return await executor_service.run(method, key=component_name, executor=executor)
+
     def _build_artifact(self, result):
         custom_repr = self.custom_repr()
         if custom_repr is None and isinstance(result, dict | Data | str):
@@ -1343,17 +1371,20 @@ class Component(CustomComponent):
                 data_dict["id"] = id_
             category = category or data_dict.get("category", None)
 
-            def _send_event():
-                match category:
-                    case "error":
-                        self._event_manager.on_error(data=data_dict)
-                    case "remove_message":
-                        self._event_manager.on_remove_message(
-                            data={"id": data_dict["id"]})
-                    case _:
-                        self._event_manager.on_message(data=data_dict)
-
-            await asyncio.to_thread(_send_event)
+            match category:
+                case "error":
+                    await self._dispatch_event("on_error", data=data_dict)
+                case "remove_message":
+                    await self._dispatch_event("on_remove_message", data={"id": data_dict["id"]})
+                case _:
+                    await self._dispatch_event("on_message", data=data_dict)
+
+    async def _dispatch_event(self, name: str, *, data: dict) -> None:
+        # Events that only enqueue data are sent right away, custom callbacks may block
+        if self._event_manager.is_nonblocking(name):
+            getattr(self._event_manager, name)(data=data)
+        else:
+            await asyncio.to_thread(getattr(self._event_manager, name), data=data)
 
     def _should_stream_message(self, stored_message: Message, original_message: Message) -> bool:
         return bool(
@@ -1389,47 +1420,32 @@ class Component(CustomComponent):
         if isinstance(iterator, AsyncIterator):
             return await self._handle_async_iterator(iterator, message.id, message)
         try:
-            complete_message = ""
-            first_chunk = True
-            for chunk in iterator:
-                complete_message = await self._process_chunk(
-                    chunk.content, complete_message, message.id, message, first_chunk=first_chunk
-                )
-                first_chunk = False
+            # Blocking iterators are consumed in a worker thread to keep the event loop free
+            async with aclosing(iterate_in_thread(iterator)) as chunks:
+                return await self._handle_async_iterator(chunks, message.id, message)
         except Exception as e:
-            raise StreamingError(
-                cause=e, source=message.properties.source) from e
-        else:
-            return complete_message
+            raise StreamingError(cause=e, source=message.properties.source) from e
 
     async def _handle_async_iterator(self, iterator: AsyncIterator, message_id: str, message: Message) -> str:
-        complete_message = ""
-        first_chunk = True
+        chunks: list[str] = []
+        started = time.perf_counter()
         async for chunk in iterator:
-            complete_message = await self._process_chunk(
-                chunk.content, complete_message, message_id, message, first_chunk=first_chunk
-            )
-            first_chunk = False
-        return complete_message
+            await self._process_chunk(chunk.content, chunks, message_id, message)
+        # Each chunk of a chat model stream is a token
+        get_telemetry_service().record_token_stream(type(self).__name__, len(chunks), time.perf_counter() - started)
+        return "".join(chunks)
 
-    async def _process_chunk(
-        self, chunk: str, complete_message: str, message_id: str, message: Message, *, first_chunk: bool = False
-    ) -> str:
-        complete_message += chunk
+    async def _process_chunk(self, chunk: str, chunks: list[str], message_id: str, message: Message) -> None:
+        chunks.append(chunk)
         if self._event_manager:
-            if first_chunk:
+            if len(chunks) == 1:
                 # Send the initial message only on the first chunk
                 msg_copy = message.model_copy()
-                msg_copy.text = complete_message
+                msg_copy.text = chunk
                 await self._send_message_event(msg_copy, id_=message_id)
-            await asyncio.to_thread(
-                self._event_manager.on_token,
-                data={
-                    "chunk": chunk,
-                    "id": str(message_id),
-                },
-            )
-        return complete_message
+            await self._dispatch_event("on_token", data={"chunk": chunk, "id": str(message_id)})
+            # Waits for a slow client when the event queue is bounded
+            await self._event_manager.drain()
 
     async def send_error(
         self,
@@ -443,21 +443,39 @@ class CustomComponent(BaseComponent):
         Returns:
             The variable for the current user with the specified name.
         """
-        if hasattr(self, "_user_id") and not self.user_id:
-            msg = f"User id is not set for {self.__class__.__name__}"
-            raise ValueError(msg)
+        user_id = self._get_variables_user_id()
         variable_service = get_variable_service()  # Get service instance
+        # Variables fetched shortly before, e.g. by prefetch_variables, are served without a query
+        value = variable_service.get_cached_variable(user_id=user_id, name=name, field=field)
+        if value is not None:
+            return value
         # Retrieve and decrypt the variable by name for the current user
-        if isinstance(self.user_id, str):
-            user_id = uuid.UUID(self.user_id)
-        elif isinstance(self.user_id, uuid.UUID):
-            user_id = self.user_id
-        else:
-            msg = f"Invalid user id: {self.user_id}"
-            raise TypeError(msg)
         async with session_scope() as session:
             return await variable_service.get_variable(user_id=user_id, name=name, field=field, session=session)
 
+    async def prefetch_variables(self, names: list[str]) -> None:
+        """Loads the variables of the current user with the specified names in a single query.
+
+        Later calls to get_variables for these names are answered from the variable service's cache.
+
+        Raises:
+            ValueError: If the user id is not set.
+        """
+        user_id = self._get_variables_user_id()
+        async with session_scope() as session:
+            await get_variable_service().prefetch_variables(user_id=user_id, names=names, session=session)
+
+    def _get_variables_user_id(self) -> uuid.UUID:
+        if hasattr(self, "_user_id") and not self.user_id:
+            msg = f"User id is not set for {self.__class__.__name__}"
+            raise ValueError(msg)
+        if isinstance(self.user_id, str):
+            return uuid.UUID(self.user_id)
+        if isinstance(self.user_id, uuid.UUID):
+            return self.user_id
+        msg = f"Invalid user id: {self.user_id}"
+        raise TypeError(msg)
+
     async def list_key_names(self):
         """Lists the names of the variables for the current user.
 
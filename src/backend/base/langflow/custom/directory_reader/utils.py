@@ -1,4 +1,5 @@
 import asyncio
+from pathlib import Path
 
 from loguru import logger
 
@@ -96,6 +97,40 @@ async def abuild_custom_component_list_from_path(path: str):
     return merge_nested_dicts_with_renaming(valid_menu, invalid_menu)
 
 
+async def abuild_component_entries_from_files(path: str, file_list: list[str]) -> dict[str, dict]:
+    """Build the component templates of the given files, keyed by file path.
+
+    Each entry holds the menu (`category`) the component belongs to, its `name`, its `template`
+    and whether it is `valid`, so that the templates of single files can be reused.
+    """
+    reader = DirectoryReader(path, compress_code_field=False)
+    valid_components, invalid_components = await abuild_and_validate_all_files(reader, file_list)
+
+    entries: dict[str, dict] = {}
+    for menu_item in valid_components["menu"]:
+        for component_name, component_template, component in menu_item["components"]:
+            entries[str(Path(menu_item["path"]) / component["file"])] = {
+                "category": menu_item["name"],
+                "name": component_name,
+                "template": component_template,
+                "valid": True,
+            }
+    for menu_item in invalid_components.get("menu", []):
+        for component in menu_item["components"]:
+            try:
+                component_name, component_template = build_invalid_component(component)
+            except Exception:  # noqa: BLE001
+                logger.exception(f"Error while creating custom component in [{menu_item['name']}]")
+                continue
+            entries[str(Path(menu_item["path"]) / component["file"])] = {
+                "category": menu_item["name"],
+                "name": component_name,
+                "template": component_template,
+                "valid": False,
+            }
+    return entries
+
+
 def create_invalid_component_template(component, component_name):
     """Create a template for an invalid component."""
     component_code = component["code"]
@@ -1,12 +1,93 @@
+import hashlib
+import threading
+from collections import OrderedDict
 from typing import TYPE_CHECKING
 
+from langflow.services.deps import get_telemetry_service
 from langflow.utils import validate
 
 if TYPE_CHECKING:
     from langflow.custom import CustomComponent
 
 
+class ComponentClassCache:
+    """A process-wide LRU cache of compiled component classes.
+
+    Classes are keyed by the SHA-256 of their source code, so editing the code of a
+    component naturally produces a new entry. Thread-safe using a threading Lock.
+
+    Attributes:
+        max_size (int): Maximum number of classes to keep. The least recently used one is evicted first.
+        hits (int): Number of lookups served from the cache.
+        misses (int): Number of lookups that had to compile the code.
+        evictions (int): Number of classes evicted because the cache was full.
+    """
+
+    def __init__(self, max_size: int = 512) -> None:
+        self._classes: OrderedDict[str, type] = OrderedDict()
+        self._lock = threading.Lock()
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def key(code: str) -> str:
+        return hashlib.sha256(code.encode("utf-8")).hexdigest()
+
+    def get(self, code: str) -> type | None:
+        key = self.key(code)
+        with self._lock:
+            class_object = self._classes.get(key)
+            if class_object is None:
+                self.misses += 1
+                return None
+            self._classes.move_to_end(key)
+            self.hits += 1
+            return class_object
+
+    def set(self, code: str, class_object: type) -> None:
+        key = self.key(code)
+        with self._lock:
+            self._classes[key] = class_object
+            self._classes.move_to_end(key)
+            while self.max_size and len(self._classes) > self.max_size:
+                self._classes.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, code: str) -> None:
+        """Drops the compiled class of `code` so that it is compiled again on next use."""
+        with self._lock:
+            self._classes.pop(self.key(code), None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._classes.clear()
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "size": len(self._classes),
+                "max_size": self.max_size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+    def __len__(self) -> int:
+        return len(self._classes)
+
+
+component_class_cache = ComponentClassCache()
+
+
 def eval_custom_component_code(code: str) -> type["CustomComponent"]:
-    """Evaluate custom component code."""
+    """Evaluate custom component code, reusing the compiled class when the same code was seen before."""
+    class_object = component_class_cache.get(code)
+    get_telemetry_service().record_cache_request("component_class", hit=class_object is not None)
+    if class_object is not None:
+        return class_object
     class_name = validate.extract_class_name(code)
-    return validate.create_class(code, class_name)
+    class_object = validate.create_class(code, class_name)
+    component_class_cache.set(code, class_object)
+    return class_object
@@ -1,9 +1,13 @@
 from __future__ import annotations
 
+import asyncio
 import inspect
+import itertools
 import json
+import threading
 import time
 import uuid
+from collections import deque
 from functools import partial
 from typing import TYPE_CHECKING, Literal
 
@@ -14,10 +18,13 @@ from typing_extensions import Protocol
 from langflow.schema.playground_events import create_event_by_type
 
 if TYPE_CHECKING:
-    import asyncio
-
     from langflow.schema.log import LoggableType
 
+# Defaults of the token coalescing mode
+TOKEN_FLUSH_INTERVAL = 0.05
+TOKEN_FLUSH_BYTES = 4096
+EVENT_QUEUE_MAX_SIZE = 1024
+
 
 class EventCallback(Protocol):
     def __call__(self, *, manager: EventManager, event_type: str, data: LoggableType): ...
@@ -28,9 +35,41 @@ class PartialEventCallback(Protocol):
 
 
 class EventManager:
-    def __init__(self, queue: asyncio.Queue):
+    """Serializes events into NDJSON frames and puts them on a queue.
+
+    With `coalesce_tokens` enabled, token events are buffered per message and sent
+    as one frame every `flush_interval` seconds or `flush_bytes` bytes, whichever
+    comes first. Any other event flushes the buffered tokens before it, so the order
+    of events is kept. When a bounded queue is full, frames wait in a backlog and
+    `drain()` lets the producer wait until the consumer catches up.
+    """
+
+    def __init__(
+        self,
+        queue: asyncio.Queue,
+        *,
+        coalesce_tokens: bool = False,
+        flush_interval: float = TOKEN_FLUSH_INTERVAL,
+        flush_bytes: int = TOKEN_FLUSH_BYTES,
+    ):
         self.queue = queue
         self.events: dict[str, PartialEventCallback] = {}
+        self.coalesce_tokens = coalesce_tokens
+        self.flush_interval = flush_interval
+        self.flush_bytes = flush_bytes
+        # Tokens are sent from worker threads too, so the buffers are guarded by a lock
+        self._lock = threading.Lock()
+        self._pending_tokens: dict[str, list[str]] = {}
+        self._pending_bytes = 0
+        self._pending_since = 0.0
+        self._backlog: deque[tuple[str, bytes, float]] = deque()
+        self._flush_scheduled = False
+        self._id_prefix = uuid.uuid4().hex[:8]
+        self._id_counter = itertools.count()
+        try:
+            self._loop: asyncio.AbstractEventLoop | None = asyncio.get_running_loop()
+        except RuntimeError:
+            self._loop = None
 
     @staticmethod
     def _validate_callback(callback: EventCallback) -> None:
@@ -65,7 +104,47 @@ class EventManager:
             callback_ = partial(callback, manager=self, event_type=event_type)
         self.events[name] = callback_
 
+    def is_nonblocking(self, name: str) -> bool:
+        """Whether the event only enqueues data, so it can be sent from the event loop thread.
+
+        Events registered with a custom callback may block and should be sent from a worker thread.
+        """
+        callback = self.events.get(name)
+        return callback is None or getattr(callback, "func", None) == self.send_event
+
     def send_event(self, *, event_type: Literal["message", "error", "warning", "info", "token"], data: LoggableType):
+        if not self.coalesce_tokens:
+            self.queue.put_nowait(self._encode_event(event_type, data))
+            return
+
+        with self._lock:
+            if event_type == "token" and isinstance(data, dict) and isinstance(data.get("chunk"), str):
+                self._buffer_token(data)
+            else:
+                self._flush_tokens(force=True)
+                self._put(self._encode_event(event_type, data))
+            self._schedule_flush()
+
+    def flush(self) -> None:
+        """Sends the buffered tokens and as much of the backlog as the queue can take."""
+        with self._lock:
+            self._flush_tokens(force=True)
+            self._put_backlog()
+
+    async def drain(self, *, flush: bool = False) -> None:
+        """Waits until the backlog fits in a bounded queue, flushing buffered tokens first if `flush` is set."""
+        if not self.coalesce_tokens:
+            return
+        if flush:
+            self.flush()
+        while True:
+            with self._lock:
+                if not self._backlog:
+                    return
+                item = self._backlog.popleft()
+            await self.queue.put(item)
+
+    def _encode_event(self, event_type: str, data: LoggableType) -> tuple[str, bytes, float]:
         try:
             if isinstance(data, dict) and event_type in {"message", "error", "warning", "info", "token"}:
                 data = create_event_by_type(event_type, **data)
@@ -75,9 +154,72 @@ class EventManager:
             raise
         jsonable_data = jsonable_encoder(data)
         json_data = {"event": event_type, "data": jsonable_data}
-        event_id = f"{event_type}-{uuid.uuid4()}"
         str_data = json.dumps(json_data) + "\n\n"
-        self.queue.put_nowait((event_id, str_data.encode("utf-8"), time.time()))
+        return self._next_event_id(event_type), str_data.encode("utf-8"), time.time()
+
+    def _next_event_id(self, event_type: str) -> str:
+        if self.coalesce_tokens:
+            # A counter is unique within the manager and far cheaper than a uuid per token
+            return f"{event_type}-{self._id_prefix}-{next(self._id_counter)}"
+        return f"{event_type}-{uuid.uuid4()}"
+
+    def _buffer_token(self, data: dict) -> None:
+        chunk = data["chunk"]
+        if not self._pending_tokens:
+            self._pending_since = time.monotonic()
+        self._pending_tokens.setdefault(str(data.get("id")), []).append(chunk)
+        self._pending_bytes += len(chunk)
+        if self._pending_bytes >= self.flush_bytes or time.monotonic() - self._pending_since >= self.flush_interval:
+            self._flush_tokens()
+
+    def _flush_tokens(self, *, force: bool = False) -> None:
+        if not self._pending_tokens:
+            return
+        # While the queue is full the tokens keep merging instead of piling up as frames
+        if not force and self._is_full():
+            return
+        pending = self._pending_tokens
+        self._pending_tokens = {}
+        self._pending_bytes = 0
+        for message_id, chunks in pending.items():
+            self._put(self._encode_event("token", {"chunk": "".join(chunks), "id": message_id}))
+
+    def _put(self, item: tuple[str, bytes, float]) -> None:
+        self._put_backlog()
+        if self._backlog:
+            self._backlog.append(item)
+            return
+        try:
+            self.queue.put_nowait(item)
+        except asyncio.QueueFull:
+            self._backlog.append(item)
+
+    def _put_backlog(self) -> None:
+        while self._backlog:
+            try:
+                self.queue.put_nowait(self._backlog[0])
+            except asyncio.QueueFull:
+                return
+            self._backlog.popleft()
+
+    def _is_full(self) -> bool:
+        return bool(self._backlog) or self.queue.full()
+
+    def _schedule_flush(self) -> None:
+        if self._flush_scheduled or self._loop is None or self._loop.is_closed():
+            return
+        if not self._pending_tokens and not self._backlog:
+            return
+        self._flush_scheduled = True
+        # Tokens may arrive from a worker thread, so the timer is armed on the loop thread
+        self._loop.call_soon_threadsafe(self._loop.call_later, self.flush_interval, self._on_flush_timer)
+
+    def _on_flush_timer(self) -> None:
+        with self._lock:
+            self._flush_scheduled = False
+            self._flush_tokens()
+            self._put_backlog()
+            self._schedule_flush()
 
     def noop(self, *, data: LoggableType) -> None:
         pass
@@ -86,8 +228,8 @@ class EventManager:
         return self.events.get(name, self.noop)
 
 
-def create_default_event_manager(queue):
-    manager = EventManager(queue)
+def create_default_event_manager(queue, *, coalesce_tokens: bool = False):
+    manager = EventManager(queue, coalesce_tokens=coalesce_tokens)
     manager.register_event("on_token", "token")
     manager.register_event("on_vertices_sorted", "vertices_sorted")
     manager.register_event("on_error", "error")
@@ -100,9 +242,14 @@ def create_default_event_manager(queue):
     return manager
 
 
-def create_stream_tokens_event_manager(queue):
-    manager = EventManager(queue)
+def create_stream_tokens_event_manager(queue, *, coalesce_tokens: bool = False):
+    manager = EventManager(queue, coalesce_tokens=coalesce_tokens)
     manager.register_event("on_message", "add_message")
     manager.register_event("on_token", "token")
     manager.register_event("on_end", "end")
     return manager
+
+
+def create_event_queue(*, coalesce_tokens: bool = False) -> asyncio.Queue:
+    """Creates the queue for an event manager, bounded when tokens are coalesced."""
+    return asyncio.Queue(maxsize=EVENT_QUEUE_MAX_SIZE if coalesce_tokens else 0)
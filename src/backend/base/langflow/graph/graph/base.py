@@ -7,11 +7,11 @@ import copy
 import json
 import queue
 import threading
+import time
 import traceback
 import uuid
 from collections import defaultdict, deque
 from datetime import datetime, timezone
-from functools import partial
 from itertools import chain
 from typing import TYPE_CHECKING, Any, cast
 
@@ -20,8 +20,9 @@ from loguru import logger
 from langflow.exceptions.component import ComponentBuildError
 from langflow.graph.edge.base import CycleEdge, Edge
 from langflow.graph.graph.constants import Finish, lazy_load_vertex_dict
+from langflow.graph.graph.memoization import is_memoizable, vertex_fingerprint, vertex_result_cache
 from langflow.graph.graph.runnable_vertices_manager import RunnableVerticesManager
-from langflow.graph.graph.schema import GraphData, GraphDump, StartConfigDict, VertexBuildResult
+from langflow.graph.graph.schema import ExecutionMode, GraphData, GraphDump, StartConfigDict, VertexBuildResult
 from langflow.graph.graph.state_manager import GraphStateManager
 from langflow.graph.graph.state_model import create_state_model_from_graph
 from langflow.graph.graph.utils import (
@@ -41,7 +42,12 @@ from langflow.logging.logger import LogConfig, configure
 from langflow.schema.dotdict import dotdict
 from langflow.schema.schema import INPUT_FIELD_NAME, InputType, OutputValue
 from langflow.services.cache.utils import CacheMiss
-from langflow.services.deps import get_chat_service, get_tracing_service
+from langflow.services.deps import (
+    get_chat_service,
+    get_settings_service,
+    get_telemetry_service,
+    get_tracing_service,
+)
 from langflow.utils.async_helpers import run_until_complete
 
 if TYPE_CHECKING:
@@ -110,6 +116,7 @@ class Graph:
         self.vertices_to_run: set[str] = set()
         self.stop_vertex: str | None = None
         self.inactive_vertices: set = set()
+        self._vertex_edges: dict[str, list[CycleEdge]] = defaultdict(list)
         self.edges: list[CycleEdge] = []
         self.vertices: list[Vertex] = []
         self.run_manager = RunnableVerticesManager()
@@ -130,9 +137,14 @@ class Graph:
         self._is_cyclic: bool | None = None
         self._cycles: list[tuple[str, str]] | None = None
         self._cycle_vertices: set[str] | None = None
+        self._edges_cycle_vertices: set[str] | None = None
         self._call_order: list[str] = []
         self._snapshots: list[dict[str, Any]] = []
         self._end_trace_tasks: set[asyncio.Task] = set()
+        self._checkpoint_token: str | None = None
+        self._dirty_vertices: set[str] = set()
+        self._shared_vertex_ids: set[str] = set()
+        self._vertex_fingerprints: dict[str, str] | None = None
 
         if context and not isinstance(context, dict):
             msg = "Context must be a dictionary"
@@ -165,6 +177,31 @@ class Graph:
             value = dotdict(value)
         self._context = value
 
+    @property
+    def edges(self) -> list[CycleEdge]:
+        return self._built_edges
+
+    @edges.setter
+    def edges(self, edges: list[CycleEdge]) -> None:
+        self._built_edges = edges
+        self._index_edges()
+
+    def _index_edges(self) -> None:
+        """Rebuilds the index of edges by vertex ID.
+
+        Every edge is listed under its source and its target, in the order of `self.edges`, so the
+        edges of a vertex can be looked up without scanning all the edges of the graph.
+        """
+        self._vertex_edges = defaultdict(list)
+        for edge in self._built_edges:
+            self._add_edge_to_index(edge)
+
+    def _add_edge_to_index(self, edge: CycleEdge) -> None:
+        self._vertex_fingerprints = None
+        self._vertex_edges[edge.source_id].append(edge)
+        if edge.target_id != edge.source_id:
+            self._vertex_edges[edge.target_id].append(edge)
+
     @property
     def session_id(self):
         return self._session_id
@@ -253,6 +290,7 @@ class Graph:
 
         self._vertices = self._graph_data["nodes"]
         self._edges = self._graph_data["edges"]
+        self._edges_cycle_vertices = None
         self.initialize()
 
     def add_component(self, component: Component, component_id: str | None = None) -> str:
@@ -488,6 +526,7 @@ class Graph:
         if edge in self._edges:
             return
         self._edges.append(edge)
+        self._edges_cycle_vertices = None
 
     def initialize(self) -> None:
         self._build_graph()
@@ -778,7 +817,7 @@ class Graph:
         try:
             cache_service = get_chat_service()
             if self.flow_id:
-                await cache_service.set_cache(self.flow_id, self)
+                await cache_service.set_graph_cache(self.flow_id, self)
         except Exception:  # noqa: BLE001
             logger.exception("Error setting cache")
 
@@ -964,7 +1003,7 @@ class Graph:
 
     def get_edge(self, source_id: str, target_id: str) -> CycleEdge | None:
         """Returns the edge between two vertices."""
-        for edge in self.edges:
+        for edge in self._vertex_edges.get(source_id, []):
             if edge.source_id == source_id and edge.target_id == target_id:
                 return edge
         return None
@@ -1013,6 +1052,7 @@ class Graph:
             "_is_output_vertices": self._is_output_vertices,
             "has_session_id_vertices": self.has_session_id_vertices,
             "_sorted_vertices_layers": self._sorted_vertices_layers,
+            "_checkpoint_token": self._checkpoint_token,
         }
 
     def __deepcopy__(self, memo):
@@ -1049,13 +1089,19 @@ class Graph:
         return new_graph
 
     def __setstate__(self, state):
+        edges = state.pop("edges", [])
         run_manager = state["run_manager"]
         if isinstance(run_manager, RunnableVerticesManager):
             state["run_manager"] = run_manager
         else:
             state["run_manager"] = RunnableVerticesManager.from_dict(run_manager)
         self.__dict__.update(state)
+        self.edges = edges
         self.vertex_map = {vertex.id: vertex for vertex in self.vertices}
+        self._dirty_vertices = set()
+        self._shared_vertex_ids = set()
+        self._vertex_fingerprints = None
+        self._edges_cycle_vertices = None
         self.state_manager = GraphStateManager()
         self.tracing_service = get_tracing_service()
         self.set_run_id(self._run_id)
@@ -1097,6 +1143,186 @@ class Graph:
         else:
             return graph
 
+    def copy_for_run(self, user_id: str | None = None) -> Graph:
+        """Creates an unbuilt copy of this graph that can be run independently of it.
+
+        The processed nodes and edges, the cycle information and the lists of input, output and
+        session vertices are shared with this graph, so flattening groups and detecting cycles is
+        skipped. Only vertices, edges and components, which hold the state of a run, are created again.
+
+        Args:
+            user_id: The user ID of the copy. Defaults to the user ID of this graph.
+
+        Returns:
+            Graph: The new graph.
+        """
+        new_graph = type(self)(
+            flow_id=self.flow_id,
+            flow_name=self.flow_name,
+            description=self.description,
+            user_id=user_id if user_id is not None else self.user_id,
+            context=dict(self.context),
+        )
+        new_graph.raw_graph_data = self.raw_graph_data
+        new_graph._vertices = self._vertices
+        new_graph._edges = self._edges
+        new_graph.top_level_vertices = self.top_level_vertices
+        new_graph._cycle_vertices = self.cycle_vertices
+        new_graph._is_cyclic = self._is_cyclic
+        new_graph._edges_cycle_vertices = self._edges_cycle_vertices
+        new_graph._build_graph()
+
+        new_graph.predecessor_map = defaultdict(list, {key: list(value) for key, value in self.predecessor_map.items()})
+        new_graph.successor_map = defaultdict(list, {key: list(value) for key, value in self.successor_map.items()})
+        new_graph.in_degree_map = defaultdict(int, self.in_degree_map)
+        new_graph.parent_child_map = defaultdict(
+            list, {key: list(value) for key, value in self.parent_child_map.items()}
+        )
+        new_graph._is_input_vertices = list(self._is_input_vertices)
+        new_graph._is_output_vertices = list(self._is_output_vertices)
+        new_graph._is_state_vertices = list(self._is_state_vertices)
+        new_graph.has_session_id_vertices = list(self.has_session_id_vertices)
+        new_graph._vertex_fingerprints = self.vertex_fingerprints
+        return new_graph
+
+    @property
+    def vertex_fingerprints(self) -> dict[str, str]:
+        """The fingerprints of the vertices that do not depend on the inputs of a run, by vertex ID.
+
+        Vertices whose fingerprint cannot be computed, and their successors, are left out.
+        See `memoization.vertex_fingerprint`.
+        """
+        if self._vertex_fingerprints is None:
+            fingerprints: dict[str, str] = {}
+            pending = self.get_input_independent_vertex_ids()
+            while pending:
+                ready = [
+                    vertex_id
+                    for vertex_id in pending
+                    if all(predecessor_id not in pending for predecessor_id in self.predecessor_map.get(vertex_id, []))
+                ]
+                if not ready:
+                    break
+                pending.difference_update(ready)
+                for vertex_id in ready:
+                    fingerprint = vertex_fingerprint(self.get_vertex(vertex_id), fingerprints)
+                    if fingerprint is not None:
+                        fingerprints[vertex_id] = fingerprint
+            self._vertex_fingerprints = fingerprints
+        return self._vertex_fingerprints
+
+    def _get_memo_key(self, vertex: Vertex, *, fallback_to_env_vars: bool) -> tuple | None:
+        """Returns the key of the memoized result of `vertex`, or None if its result must not be reused."""
+        if not get_settings_service().settings.vertex_memoization:
+            return None
+        fingerprint = self.vertex_fingerprints.get(vertex.id)
+        if fingerprint is None or not is_memoizable(vertex):
+            return None
+        return vertex_result_cache.key(self.user_id, fingerprint, fallback_to_env_vars=fallback_to_env_vars)
+
+    @staticmethod
+    def _restore_memoized_vertex(vertex: Vertex, memo_key: tuple) -> bool:
+        """Sets the memoized result of `vertex`, returning whether there was one."""
+        vertex_dict = vertex_result_cache.get(memo_key)
+        if vertex_dict is None:
+            return False
+        vertex.built = vertex_dict["built"]
+        vertex.artifacts = vertex_dict["artifacts"]
+        vertex.built_object = vertex_dict["built_object"]
+        vertex.built_result = vertex_dict["built_result"]
+        vertex.results = vertex_dict["results"]
+        try:
+            vertex.finalize_build()
+        except Exception:  # noqa: BLE001
+            logger.opt(exception=True).debug(f"Error restoring the memoized result of vertex {vertex.id}")
+            return False
+        return True
+
+    def get_input_independent_vertex_ids(self) -> set[str]:
+        """Returns the IDs of the vertices whose results do not depend on the inputs of a run.
+
+        Input, output, session and state vertices, the vertices of cycles and all of their successors
+        depend on the run. Every other vertex builds to the same result in every run of the graph.
+        """
+        dependent_ids = {
+            *self._is_input_vertices,
+            *self._is_output_vertices,
+            *self.has_session_id_vertices,
+            *self._is_state_vertices,
+            *self.cycle_vertices,
+        }
+        to_visit = list(dependent_ids)
+        while to_visit:
+            for successor_id in self.successor_map.get(to_visit.pop(), []):
+                if successor_id not in dependent_ids:
+                    dependent_ids.add(successor_id)
+                    to_visit.append(successor_id)
+        return {vertex.id for vertex in self.vertices if vertex.id not in dependent_ids}
+
+    async def build_shared_vertices(self, vertex_ids: set[str], *, fallback_to_env_vars: bool = False) -> set[str]:
+        """Builds the given vertices so that other copies of this graph can use them with `use_shared_vertices`.
+
+        The predecessors of every vertex must be in `vertex_ids`, as they are in the result of
+        `get_input_independent_vertex_ids`. A vertex that fails to build is skipped together with
+        its successors, which are then left for each run to build.
+
+        Args:
+            vertex_ids: The IDs of the vertices to build.
+            fallback_to_env_vars: Whether to fallback to environment variables.
+
+        Returns:
+            set[str]: The IDs of the vertices that were built.
+        """
+        built_ids: set[str] = set()
+        pending = set(vertex_ids)
+        await self.initialize_run()
+        try:
+            while pending:
+                ready = [
+                    vertex_id
+                    for vertex_id in pending
+                    if all(predecessor_id in built_ids for predecessor_id in self.predecessor_map.get(vertex_id, []))
+                ]
+                if not ready:
+                    break
+                pending.difference_update(ready)
+                results = await asyncio.gather(
+                    *(
+                        self.build_vertex(vertex_id, user_id=self.user_id, fallback_to_env_vars=fallback_to_env_vars)
+                        for vertex_id in ready
+                    ),
+                    return_exceptions=True,
+                )
+                for vertex_id, result in zip(ready, results, strict=True):
+                    if isinstance(result, BaseException):
+                        logger.debug(f"Could not build shared vertex {vertex_id}: {result}")
+                    else:
+                        built_ids.add(vertex_id)
+        finally:
+            await self.end_all_traces()
+        return built_ids
+
+    def use_shared_vertices(self, graph: Graph, vertex_ids: Iterable[str]) -> None:
+        """Uses the results of vertices built in `graph`, a copy of this graph, instead of building them.
+
+        The built objects are shared rather than copied, so only vertices that do not depend on the
+        inputs of a run should be shared.
+
+        Args:
+            graph: The graph the vertices were built in.
+            vertex_ids: The IDs of the vertices to use.
+        """
+        for vertex_id in vertex_ids:
+            shared_vertex = graph.get_vertex(vertex_id)
+            vertex = self.get_vertex(vertex_id)
+            vertex.built = shared_vertex.built
+            vertex.artifacts = shared_vertex.artifacts
+            vertex.built_object = shared_vertex.built_object
+            vertex.built_result = shared_vertex.built_result
+            vertex.results = shared_vertex.results
+            vertex.finalize_build()
+            self._shared_vertex_ids.add(vertex_id)
+
     def __eq__(self, /, other: object) -> bool:
         if not isinstance(other, Graph):
             return False
@@ -1186,6 +1412,7 @@ class Graph:
             vertex (Vertex): The vertex to be updated.
             other_vertex (Vertex): The vertex to update from.
         """
+        self._vertex_fingerprints = None
         vertex.full_data = other_vertex.full_data
         vertex.parse_data()
         # Now we update the edges of the vertex
@@ -1213,6 +1440,7 @@ class Graph:
 
     def _add_vertex(self, vertex: Vertex) -> None:
         """Adds a vertex to the graph."""
+        self._vertex_fingerprints = None
         self.vertices.append(vertex)
         self.vertex_map[vertex.id] = vertex
 
@@ -1225,8 +1453,13 @@ class Graph:
         """Updates the edges of a vertex."""
         # Vertex has edges, so we need to update the edges
         for edge in vertex.edges:
-            if edge not in self.edges and edge.source_id in self.vertex_map and edge.target_id in self.vertex_map:
-                self.edges.append(edge)
+            if (
+                edge.source_id in self.vertex_map
+                and edge.target_id in self.vertex_map
+                and edge not in self._vertex_edges.get(edge.source_id, [])
+            ):
+                self._built_edges.append(edge)
+                self._add_edge_to_index(edge)
 
     def _build_graph(self) -> None:
         """Builds the graph from the vertices and edges."""
@@ -1250,11 +1483,15 @@ class Graph:
         return [(e["data"]["sourceHandle"]["id"], e["data"]["targetHandle"]["id"]) for e in self._edges]
 
     def _set_cache_to_vertices_in_cycle(self) -> None:
-        """Sets the cache to the vertices in cycle."""
-        edges = self._get_edges_as_list_of_tuples()
-        cycle_vertices = set(find_cycle_vertices(edges))
+        """Sets the cache to the vertices in cycle.
+
+        The vertices in cycle are found once per set of edges, so copies made with `copy_for_run` reuse them.
+        """
+        if self._edges_cycle_vertices is None:
+            edges = self._get_edges_as_list_of_tuples()
+            self._edges_cycle_vertices = set(find_cycle_vertices(edges))
         for vertex in self.vertices:
-            if vertex.id in cycle_vertices:
+            if vertex.id in self._edges_cycle_vertices:
                 vertex.apply_on_outputs(lambda output_object: setattr(output_object, "cache", False))
 
     def _instantiate_components_in_vertices(self) -> None:
@@ -1267,9 +1504,18 @@ class Graph:
         vertex = self.get_vertex(vertex_id)
         if vertex is None:
             return
+        self._vertex_fingerprints = None
         self.vertices.remove(vertex)
         self.vertex_map.pop(vertex_id)
-        self.edges = [edge for edge in self.edges if vertex_id not in {edge.source_id, edge.target_id}]
+        removed_edges = self._vertex_edges.pop(vertex_id, [])
+        for edge in removed_edges:
+            neighbor_id = edge.target_id if edge.source_id == vertex_id else edge.source_id
+            if neighbor_id in self._vertex_edges:
+                self._vertex_edges[neighbor_id] = [
+                    neighbor_edge for neighbor_edge in self._vertex_edges[neighbor_id] if neighbor_edge is not edge
+                ]
+        removed_edge_ids = {id(edge) for edge in removed_edges}
+        self._built_edges = [edge for edge in self._built_edges if id(edge) not in removed_edge_ids]
 
     def _build_vertex_params(self) -> None:
         """Identifies and handles the LLM vertex within the graph."""
@@ -1346,10 +1592,51 @@ class Graph:
         self.reset_inactivated_vertices()
         self.reset_activated_vertices()
 
-        await chat_service.set_cache(str(self.flow_id or self._run_id), self)
+        await chat_service.set_graph_cache(str(self.flow_id or self._run_id), self)
         self._record_snapshot(vertex_id)
         return vertex_build_result
 
+    def get_checkpoint_delta(self) -> dict[str, Any]:
+        """Returns the changes to persist since the previous checkpoint of the graph.
+
+        The delta holds the run state and the build state of the vertices built since the
+        last call, so its size depends on what changed rather than on the size of the graph.
+        """
+        vertices = {
+            vertex_id: self.vertex_map[vertex_id].get_build_state()
+            for vertex_id in self._dirty_vertices
+            if vertex_id in self.vertex_map
+        }
+        self._dirty_vertices = set()
+        run_state = copy.deepcopy(
+            {
+                "run_manager": self.run_manager.to_dict(),
+                "vertex_states": {vertex.id: vertex.state for vertex in self.vertices},
+                "inactivated_vertices": self.inactivated_vertices,
+                "activated_vertices": self.activated_vertices,
+                "vertices_layers": self.vertices_layers,
+                "vertices_to_run": self.vertices_to_run,
+                "stop_vertex": self.stop_vertex,
+                "_run_queue": self._run_queue,
+                "_first_layer": self._first_layer,
+                "_run_id": self._run_id,
+            }
+        )
+        return {"vertices": vertices, **run_state}
+
+    def apply_checkpoint_delta(self, delta: dict[str, Any]) -> None:
+        """Applies a delta returned by `get_checkpoint_delta` to the graph."""
+        delta = delta.copy()
+        for vertex_id, build_state in delta.pop("vertices").items():
+            if vertex_id in self.vertex_map:
+                self.vertex_map[vertex_id].set_build_state(build_state)
+        for vertex_id, state in delta.pop("vertex_states").items():
+            if vertex_id in self.vertex_map:
+                self.vertex_map[vertex_id].state = state
+        # Keep the cycle vertices, they are not part of the run state
+        self.run_manager.__setstate__(copy.deepcopy(delta.pop("run_manager")))
+        self.__dict__.update(copy.deepcopy(delta))
+
     def get_snapshot(self):
         return copy.deepcopy(
             {
@@ -1422,8 +1709,14 @@ class Graph:
         try:
             params = ""
             should_build = False
-            if not vertex.frozen:
-                should_build = True
+            memo_key = None
+            if vertex_id in self._shared_vertex_ids:
+                logger.debug(f"Using the shared result of vertex {vertex_id}")
+            elif not vertex.frozen:
+                memo_key = self._get_memo_key(vertex, fallback_to_env_vars=fallback_to_env_vars)
+                should_build = memo_key is None or not self._restore_memoized_vertex(vertex, memo_key)
+                if memo_key is not None:
+                    get_telemetry_service().record_cache_request("memoized_vertex", hit=not should_build)
             else:
                 # Check the cache for the vertex
                 if get_cache is not None:
@@ -1452,31 +1745,43 @@ class Graph:
                             should_build = True
                     except KeyError:
                         should_build = True
+                get_telemetry_service().record_cache_request("frozen_vertex", hit=not should_build)
 
             if should_build:
-                await vertex.build(
-                    user_id=user_id,
-                    inputs=inputs_dict,
-                    fallback_to_env_vars=fallback_to_env_vars,
-                    files=files,
-                    event_manager=event_manager,
-                )
+                started = time.perf_counter()
+                status = "error"
+                try:
+                    await vertex.build(
+                        user_id=user_id,
+                        inputs=inputs_dict,
+                        fallback_to_env_vars=fallback_to_env_vars,
+                        files=files,
+                        event_manager=event_manager,
+                    )
+                    status = "success"
+                finally:
+                    get_telemetry_service().record_vertex_build(
+                        vertex.vertex_type, time.perf_counter() - started, status=status
+                    )
+                vertex_dict = {
+                    "built": vertex.built,
+                    "results": vertex.results,
+                    "artifacts": vertex.artifacts,
+                    "built_object": vertex.built_object,
+                    "built_result": vertex.built_result,
+                    "full_data": vertex.full_data,
+                }
                 if set_cache is not None:
-                    vertex_dict = {
-                        "built": vertex.built,
-                        "results": vertex.results,
-                        "artifacts": vertex.artifacts,
-                        "built_object": vertex.built_object,
-                        "built_result": vertex.built_result,
-                        "full_data": vertex.full_data,
-                    }
-
                     await set_cache(key=vertex.id, data=vertex_dict)
+                if memo_key is not None:
+                    vertex_result_cache.set(memo_key, vertex_dict)
 
         except Exception as exc:
             if not isinstance(exc, ComponentBuildError):
                 logger.exception("Error building Component")
             raise
+        finally:
+            self._dirty_vertices.add(vertex_id)
 
         if vertex.result is not None:
             params = f"{vertex.built_object_repr()}{params}"
@@ -1503,7 +1808,7 @@ class Graph:
         # or both
         return [
             edge
-            for edge in self.edges
+            for edge in self._vertex_edges.get(vertex_id, [])
             if (edge.source_id == vertex_id and is_source is not False)
             or (edge.target_id == vertex_id and is_target is not False)
         ]
@@ -1511,7 +1816,7 @@ class Graph:
     def get_vertices_with_target(self, vertex_id: str) -> list[Vertex]:
         """Returns the vertices connected to a vertex."""
         vertices: list[Vertex] = []
-        for edge in self.edges:
+        for edge in self._vertex_edges.get(vertex_id, []):
             if edge.target_id == vertex_id:
                 vertex = self.get_vertex(edge.source_id)
                 if vertex is None:
@@ -1525,15 +1830,43 @@ class Graph:
         fallback_to_env_vars: bool,
         start_component_id: str | None = None,
         event_manager: EventManager | None = None,
+        execution_mode: ExecutionMode | None = None,
+        max_concurrency: int | None = None,
     ) -> Graph:
-        """Processes the graph with vertices in each layer run in parallel."""
+        """Processes the graph, running independent vertices concurrently.
+
+        Args:
+            fallback_to_env_vars: Whether to fallback to environment variables.
+            start_component_id: The ID of the component to start from.
+            event_manager: The event manager for the graph.
+            execution_mode: "layered" runs the graph layer by layer, waiting for the whole
+                layer before scheduling the next one. "dataflow" schedules each vertex as soon
+                as its last predecessor finishes. Defaults to the `graph_execution_mode` setting.
+            max_concurrency: Maximum number of vertices built at the same time in "dataflow"
+                mode. Zero means unlimited. Defaults to the `graph_max_concurrency` setting.
+        """
+        if execution_mode is None or max_concurrency is None:
+            settings = get_settings_service().settings
+            execution_mode = execution_mode or settings.graph_execution_mode
+            max_concurrency = settings.graph_max_concurrency if max_concurrency is None else max_concurrency
         has_webhook_component = "webhook" in start_component_id.lower() if start_component_id else False
         first_layer = self.sort_vertices(start_component_id=start_component_id)
+        await self.initialize_run()
+        if execution_mode == "dataflow":
+            await self._process_dataflow(
+                first_layer,
+                fallback_to_env_vars=fallback_to_env_vars,
+                event_manager=event_manager,
+                max_concurrency=max_concurrency,
+                has_webhook_component=has_webhook_component,
+            )
+            logger.debug("Graph processing complete")
+            return self
+
         vertex_task_run_count: dict[str, int] = {}
         to_process = deque(first_layer)
         layer_index = 0
         chat_service = get_chat_service()
-        await self.initialize_run()
         lock = asyncio.Lock()
         while to_process:
             current_batch = list(to_process)  # Copy current deque items to a list
@@ -1572,6 +1905,87 @@ class Graph:
         logger.debug("Graph processing complete")
         return self
 
+    async def _process_dataflow(
+        self,
+        first_layer: list[str],
+        *,
+        fallback_to_env_vars: bool,
+        event_manager: EventManager | None,
+        max_concurrency: int,
+        has_webhook_component: bool = False,
+    ) -> None:
+        """Runs the graph scheduling each vertex as soon as all of its predecessors are built.
+
+        Unlike the layered mode, a slow vertex only delays its own successors. Readiness is
+        tracked by the `RunnableVerticesManager`, exactly as in the layered mode.
+
+        Args:
+            first_layer: The IDs of the vertices that can run immediately.
+            fallback_to_env_vars: Whether to fallback to environment variables.
+            event_manager: The event manager for the graph.
+            max_concurrency: Maximum number of vertices built at the same time. Zero means unlimited.
+            has_webhook_component: Whether the graph has a webhook component.
+        """
+        chat_service = get_chat_service()
+        lock = asyncio.Lock()
+        semaphore = asyncio.Semaphore(max_concurrency) if max_concurrency > 0 else None
+        vertex_task_run_count: dict[str, int] = {}
+        pending: set[asyncio.Task] = set()
+
+        async def build(vertex_id: str) -> VertexBuildResult:
+            kwargs = {
+                "vertex_id": vertex_id,
+                "user_id": self.user_id,
+                "inputs_dict": {},
+                "fallback_to_env_vars": fallback_to_env_vars,
+                "get_cache": chat_service.get_cache,
+                "set_cache": chat_service.set_cache,
+                "event_manager": event_manager,
+            }
+            if semaphore is None:
+                return await self.build_vertex(**kwargs)
+            async with semaphore:
+                return await self.build_vertex(**kwargs)
+
+        def schedule(vertex_id: str) -> None:
+            # Mark the vertex as being run right away so that a sibling finishing
+            # before this task starts does not schedule it a second time
+            self.run_manager.add_to_vertices_being_run(vertex_id)
+            run_count = vertex_task_run_count.get(vertex_id, 0)
+            pending.add(asyncio.create_task(build(vertex_id), name=f"{vertex_id} Run {run_count}"))
+            vertex_task_run_count[vertex_id] = run_count + 1
+
+        for vertex_id in first_layer:
+            schedule(vertex_id)
+
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in sorted(done, key=lambda t: t.get_name()):
+                task_name = task.get_name()
+                vertex_id = task_name.split(" ")[0]
+                exc = task.exception()
+                if exc is not None:
+                    logger.error(f"Task {task_name} failed with exception: {exc}")
+                    if has_webhook_component:
+                        await self._log_vertex_build_from_exception(vertex_id, exc)
+                    for pending_task in pending:
+                        pending_task.cancel()
+                    await asyncio.gather(*pending, return_exceptions=True)
+                    raise exc
+                result = task.result()
+                await log_vertex_build(
+                    flow_id=self.flow_id or "",
+                    vertex_id=result.vertex.id,
+                    valid=result.valid,
+                    params=result.params,
+                    data=result.result_dict,
+                    artifacts=result.artifacts,
+                )
+                logger.debug(f"Vertex {vertex_id}, result: {result.vertex.built_result}")
+                next_runnable_vertices = await self.get_next_runnable_vertices(lock, vertex=result.vertex, cache=False)
+                for next_vertex_id in next_runnable_vertices:
+                    schedule(next_vertex_id)
+
     def find_next_runnable_vertices(self, vertex_successors_ids: list[str]) -> list[str]:
         next_runnable_vertices = set()
         for v_id in sorted(vertex_successors_ids):
@@ -1595,8 +2009,7 @@ class Graph:
                 else:
                     self.run_manager.add_to_vertices_being_run(next_v_id)
             if cache and self.flow_id is not None:
-                set_cache_coro = partial(get_chat_service().set_cache, key=self.flow_id)
-                await set_cache_coro(data=self, lock=lock)
+                await get_chat_service().set_graph_cache(self.flow_id, self)
         return next_runnable_vertices
 
     async def _log_vertex_build_from_exception(self, vertex_id: str, result: Exception) -> None:
@@ -1789,7 +2202,7 @@ class Graph:
     def get_vertex_neighbors(self, vertex: Vertex) -> dict[Vertex, int]:
         """Returns the neighbors of a vertex."""
         neighbors: dict[Vertex, int] = {}
-        for edge in self.edges:
+        for edge in self._vertex_edges.get(vertex.id, []):
             if edge.source_id == vertex.id:
                 neighbor = self.get_vertex(edge.target_id)
                 if neighbor is None:
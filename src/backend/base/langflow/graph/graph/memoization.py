@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+import copy
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any
+
+import orjson
+from loguru import logger
+
+from langflow.services.deps import get_settings_service
+
+if TYPE_CHECKING:
+    from langflow.graph.vertex.base import Vertex
+
+# Built-in components whose results change between runs with the same parameters. Components opt
+# out with their `memoizable` class attribute too, but flows saved before it existed lack it.
+NON_MEMOIZABLE_COMPONENTS = {
+    "APIRequest",
+    "CurrentDate",
+    "IDGenerator",
+    "LLMRouterComponent",
+    "SQLComponent",
+    "SubFlow",
+    "URLComponent",
+}
+
+
+def vertex_fingerprint(vertex: Vertex, fingerprints: dict[str, str]) -> str | None:
+    """Returns a fingerprint of everything the result of `vertex` depends on.
+
+    That is its type, the values of its template, which includes its code, the outputs it builds
+    and the fingerprints of the vertices connected to its inputs.
+
+    Args:
+        vertex: The vertex.
+        fingerprints: The fingerprints of the other vertices of the graph, by vertex ID.
+
+    Returns:
+        str | None: The fingerprint, or None if a predecessor has none or the template cannot be serialized.
+    """
+    upstream = []
+    for edge in vertex.incoming_edges:
+        source_fingerprint = fingerprints.get(edge.source_id)
+        if source_fingerprint is None:
+            return None
+        upstream.append((edge.target_handle.field_name, edge.source_handle.name, source_fingerprint))
+    template = {
+        key: (field.get("value"), field.get("load_from_db", False))
+        for key, field in vertex.data["node"].get("template", {}).items()
+        if isinstance(field, dict)
+    }
+    try:
+        payload = orjson.dumps(
+            [vertex.vertex_type, template, sorted(map(str, vertex.edges_source_names)), sorted(upstream)],
+            option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS,
+        )
+    except TypeError:
+        return None
+    return hashlib.sha256(payload).hexdigest()
+
+
+def is_memoizable(vertex: Vertex) -> bool:
+    """Whether the component of `vertex` builds the same result every time it gets the same parameters.
+
+    See `Component.can_memoize`. Legacy custom components are never memoized.
+    """
+    component = vertex.custom_component
+    if component is None or vertex.vertex_type in NON_MEMOIZABLE_COMPONENTS:
+        return False
+    can_memoize = getattr(component, "can_memoize", None)
+    return can_memoize is not None and can_memoize()
+
+
+class VertexResultCache:
+    """A process-wide LRU cache of the results of vertices that do not depend on the inputs of a run.
+
+    Results are keyed by the user ID and the fingerprint of the vertex, so editing a vertex or any
+    vertex upstream of it never matches an older result. The variable service drops the results of
+    a user when one of their variables changes. Entries also expire after a while, which bounds how
+    long a variable changed outside of Langflow, e.g. in the environment, can go unnoticed.
+    Results are deep copied when stored and again when handed out, so that concurrent runs never
+    share a built object. Results that cannot be copied are not memoized.
+    Thread-safe using a threading Lock.
+
+    Attributes:
+        max_size (int | None): Maximum number of results to keep. Defaults to the `vertex_memoization_max_size` setting.
+        ttl (float | None): Seconds a result is kept. Zero keeps it until it is evicted. Defaults to the
+            `vertex_memoization_ttl` setting.
+        hits (int): Number of builds served from the cache.
+        misses (int): Number of builds that were not.
+    """
+
+    def __init__(self, max_size: int | None = None, ttl: float | None = None) -> None:
+        self._results: OrderedDict[tuple, tuple[float, dict[str, Any]]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.max_size = max_size
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(user_id: str | None, fingerprint: str, *, fallback_to_env_vars: bool) -> tuple:
+        return str(user_id), fingerprint, fallback_to_env_vars
+
+    def get(self, key: tuple) -> dict[str, Any] | None:
+        ttl = self.ttl if self.ttl is not None else get_settings_service().settings.vertex_memoization_ttl
+        with self._lock:
+            entry = self._results.get(key)
+            if entry is not None and ttl and time.monotonic() - entry[0] > ttl:
+                del self._results[key]
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._results.move_to_end(key)
+            self.hits += 1
+            data = entry[1]
+        return copy.deepcopy(data)
+
+    def set(self, key: tuple, data: dict[str, Any]) -> bool:
+        """Stores a copy of `data`, returning whether it could be copied."""
+        try:
+            data = copy.deepcopy(data)
+        except Exception:  # noqa: BLE001
+            logger.opt(exception=True).debug("The result cannot be copied, so it is not memoized")
+            return False
+        max_size = self.max_size
+        if max_size is None:
+            max_size = get_settings_service().settings.vertex_memoization_max_size
+        with self._lock:
+            self._results[key] = (time.monotonic(), data)
+            self._results.move_to_end(key)
+            while len(self._results) > max_size:
+                self._results.popitem(last=False)
+        return True
+
+    def invalidate_user(self, user_id: str | None) -> None:
+        """Drops the results of the user with ID `user_id`, e.g. after one of their variables changed."""
+        user_id = str(user_id)
+        with self._lock:
+            for key in [k for k in self._results if k[0] == user_id]:
+                del self._results[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._results.clear()
+
+    def __len__(self) -> int:
+        return len(self._results)
+
+
+vertex_result_cache = VertexResultCache()
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import time
 from collections.abc import Generator
 from enum import Enum
 from typing import TYPE_CHECKING, Any
@@ -18,7 +19,12 @@ from langflow.services.database.models.transactions.model import TransactionBase
 from langflow.services.database.models.vertex_builds.crud import log_vertex_build as crud_log_vertex_build
 from langflow.services.database.models.vertex_builds.model import VertexBuildBase
 from langflow.services.database.utils import session_getter
-from langflow.services.deps import get_db_service, get_settings_service
+from langflow.services.deps import (
+    get_db_service,
+    get_monitor_writer_service,
+    get_settings_service,
+    get_telemetry_service,
+)
 
 if TYPE_CHECKING:
     from langflow.api.v1.schemas import ResultDataResponse
@@ -149,11 +155,17 @@ async def log_transaction(
             error=error,
             flow_id=flow_id if isinstance(flow_id, UUID) else UUID(flow_id),
         )
+        monitor_writer = get_monitor_writer_service()
+        if monitor_writer.enabled:
+            monitor_writer.enqueue(transaction)
+            return
+        started = time.perf_counter()
         async with session_getter(get_db_service()) as session:
             with session.no_autoflush:
                 inserted = await crud_log_transaction(session, transaction)
                 if inserted:
                     logger.debug(f"Logged transaction: {inserted.id}")
+        get_telemetry_service().record_db_write("transaction", time.perf_counter() - started)
     except Exception as exc:  # noqa: BLE001
         logger.error(f"Error logging transaction: {exc!s}")
 
@@ -179,9 +191,15 @@ async def log_vertex_build(
             data=serialize(data, max_length=MAX_TEXT_LENGTH, max_items=MAX_ITEMS_LENGTH),
             artifacts=serialize(artifacts, max_length=MAX_TEXT_LENGTH, max_items=MAX_ITEMS_LENGTH),
         )
+        monitor_writer = get_monitor_writer_service()
+        if monitor_writer.enabled:
+            monitor_writer.enqueue(vertex_build)
+            return
+        started = time.perf_counter()
         async with session_getter(get_db_service()) as session:
             inserted = await crud_log_vertex_build(session, vertex_build)
             logger.debug(f"Logged vertex build: {inserted.build_id}")
+        get_telemetry_service().record_db_write("vertex_build", time.perf_counter() - started)
     except Exception:  # noqa: BLE001
         logger.exception("Error logging vertex build")
 
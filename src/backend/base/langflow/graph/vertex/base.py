@@ -185,11 +185,11 @@ class Vertex:
 
     @property
     def outgoing_edges(self) -> list[CycleEdge]:
-        return [edge for edge in self.edges if edge.source_id == self.id]
+        return self.graph.get_vertex_edges(self.id, is_target=False)
 
     @property
     def incoming_edges(self) -> list[CycleEdge]:
-        return [edge for edge in self.edges if edge.target_id == self.id]
+        return self.graph.get_vertex_edges(self.id, is_source=False)
 
     @property
     def edges_source_names(self) -> set[str | None]:
@@ -220,6 +220,35 @@ class Vertex:
         self.built_object = state.get("built_object") or UnbuiltObject()
         self.built_result = state.get("built_result") or UnbuiltResult()
 
+    def get_build_state(self) -> dict[str, Any]:
+        """Returns the part of the vertex state that changes when it is built.
+
+        This is what graph checkpoints persist for each vertex, so it must not
+        reference the graph or other vertices.
+        """
+        return {
+            "built": self.built,
+            "built_object": None if isinstance(self.built_object, UnbuiltObject) else self.built_object,
+            "built_result": None if isinstance(self.built_result, UnbuiltResult) else self.built_result,
+            "artifacts": self.artifacts,
+            "artifacts_raw": self.artifacts_raw,
+            "artifacts_type": self.artifacts_type,
+            "results": self.results,
+            "result": self.result,
+            "outputs_logs": self.outputs_logs,
+            "logs": self.logs,
+            "state": self.state,
+            "build_times": self.build_times,
+        }
+
+    def set_build_state(self, build_state: dict[str, Any]) -> None:
+        """Restores a state previously returned by `get_build_state`."""
+        self.__dict__.update(build_state)
+        # Inactive vertices are built with None results, so only unbuilt vertices get the sentinels back
+        if not self.built:
+            self.built_object = UnbuiltObject()
+            self.built_result = UnbuiltResult()
+
     def set_top_level(self, top_level_vertices: list[str]) -> None:
         self.parent_is_top_level = self.parent_node_id in top_level_vertices
 
@@ -370,18 +370,34 @@ async def generate_unique_flow_name(flow_name, user_id, session):
 
 def json_schema_from_flow(flow: Flow) -> dict:
     """Generate JSON schema from flow input nodes."""
-    from langflow.graph.graph.base import Graph
+    if flow.input_schema is not None:
+        return flow.input_schema
+    return json_schema_from_flow_data(flow.data)
 
-    # Get the flow's data which contains the nodes and their configurations
-    flow_data = flow.data or {}
 
-    graph = Graph.from_payload(flow_data)
-    input_nodes = [vertex for vertex in graph.vertices if vertex.is_input]
+def json_schema_from_flow_data(flow_data: dict | None) -> dict:
+    """Generate JSON schema from the input nodes of flow data.
+
+    The input nodes are found the way a graph finds its input vertices, but without building the
+    graph and its components.
+    """
+    from langflow.graph.graph.utils import process_flow
+    from langflow.graph.schema import INPUT_COMPONENTS
+
+    # Get the flow's data which contains the nodes and their configurations
+    flow_data = flow_data or {}
+    nodes = flow_data.get("nodes", [])
+    if any(node.get("data", {}).get("node", {}).get("flow") for node in nodes):
+        # Group nodes hold a flow of their own, whose inputs are inputs of this flow
+        nodes = process_flow({"edges": [], **flow_data})["nodes"]
 
     properties = {}
     required = []
-    for node in input_nodes:
-        node_data = node.data["node"]
+    for node in nodes:
+        node_data = node.get("data", {}).get("node") or {}
+        is_input = any(input_component_name in node.get("id", "") for input_component_name in INPUT_COMPONENTS)
+        if not (node_data.get("is_input") or is_input):
+            continue
         template = node_data["template"]
 
         for field_name, field_data in template.items():
@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any
+
+from fastapi.encoders import jsonable_encoder
+from loguru import logger
+
+from langflow.custom.directory_reader.utils import (
+    abuild_component_entries_from_files,
+    load_files_from_path,
+    merge_nested_dicts_with_renaming,
+)
+from langflow.utils.version import get_version_info
+
+INDEX_FORMAT = 1
+
+
+class ComponentIndex:
+    """On-disk index of built component templates.
+
+    Templates are stored per component file together with the file's modification time, size
+    and content hash. The index is discarded as a whole when the langflow version changes, and
+    single files are rebuilt when their content changes.
+    """
+
+    def __init__(self, path: str | Path, version: str | None = None):
+        self.path = Path(path)
+        self.version = version or get_version_info()["version"]
+        self.files: dict[str, dict[str, Any]] = {}
+        self.rebuilt: list[str] = []
+        self.changed = False
+
+    def load(self) -> None:
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as exc:
+            logger.warning(f"Ignoring unreadable component index {self.path}: {exc}")
+            return
+        if data.get("format") != INDEX_FORMAT or data.get("version") != self.version:
+            logger.debug(f"Component index {self.path} was written by another version, rebuilding it")
+            return
+        self.files = data.get("files", {})
+
+    def save(self) -> None:
+        data = {"format": INDEX_FORMAT, "version": self.version, "files": self.files}
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # Writing to a temporary file first keeps concurrent readers from seeing a partial index
+        fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, prefix=f".{self.path.name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as file:
+                json.dump(data, file)
+            Path(tmp_path).replace(self.path)
+        except BaseException:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+
+    def stale_files(self, file_list: list[str]) -> list[str]:
+        """Return the files whose indexed templates cannot be reused."""
+        stale = []
+        for file_path in file_list:
+            entry = self.files.get(file_path)
+            stat = Path(file_path).stat()
+            if entry is None:
+                stale.append(file_path)
+                continue
+            if entry["mtime_ns"] == stat.st_mtime_ns and entry["size"] == stat.st_size:
+                continue
+            # A new modification time alone, e.g. after a fresh checkout, does not need a rebuild
+            if entry["sha256"] == _file_hash(file_path):
+                entry["mtime_ns"] = stat.st_mtime_ns
+                entry["size"] = stat.st_size
+                self.changed = True
+                continue
+            stale.append(file_path)
+        return stale
+
+    def update(self, file_list: list[str], entries: dict[str, dict]) -> None:
+        self.changed = True
+        for file_path in file_list:
+            stat = Path(file_path).stat()
+            self.files[file_path] = {
+                "mtime_ns": stat.st_mtime_ns,
+                "size": stat.st_size,
+                "sha256": _file_hash(file_path),
+                "entry": jsonable_encoder(entries[file_path]) if file_path in entries else None,
+            }
+
+    def build_menu(self, file_list: list[str]) -> dict:
+        """Merge the indexed templates of the given files like `abuild_custom_component_list_from_path` does."""
+        valid_menu: dict[str, dict] = {}
+        invalid_menu: dict[str, dict] = {}
+        for file_path in file_list:
+            entry = self.files.get(file_path, {}).get("entry")
+            if not entry:
+                continue
+            menu = valid_menu if entry["valid"] else invalid_menu
+            menu.setdefault(entry["category"], {})[entry["name"]] = entry["template"]
+        return merge_nested_dicts_with_renaming(valid_menu, invalid_menu)
+
+
+def _file_hash(file_path: str) -> str:
+    return hashlib.sha256(Path(file_path).read_bytes()).hexdigest()
+
+
+async def abuild_custom_components_with_index(components_paths: list[str], index_path: str | Path) -> dict:
+    """Build the component catalog like `abuild_custom_components`, reusing the templates of unchanged files."""
+    if not components_paths:
+        return {}
+
+    index = ComponentIndex(index_path)
+    await asyncio.to_thread(index.load)
+
+    custom_components_from_file: dict = {}
+    processed_paths = set()
+    indexed_files: set[str] = set()
+    for path in components_paths:
+        path_str = str(path)
+        if path_str in processed_paths:
+            continue
+        processed_paths.add(path_str)
+
+        file_list = await asyncio.to_thread(load_files_from_path, path_str)
+        indexed_files.update(file_list)
+        stale = await asyncio.to_thread(index.stale_files, file_list)
+        if stale:
+            logger.debug(f"Building {len(stale)} of {len(file_list)} component file(s) from {path_str}")
+            entries = await abuild_component_entries_from_files(path_str, stale)
+            await asyncio.to_thread(index.update, stale, entries)
+            index.rebuilt.extend(stale)
+
+        custom_component_dict = index.build_menu(file_list)
+        if custom_component_dict:
+            custom_components_from_file = merge_nested_dicts_with_renaming(
+                custom_components_from_file, custom_component_dict
+            )
+
+    for file_path in index.files.keys() - indexed_files:
+        del index.files[file_path]
+        index.changed = True
+
+    if index.changed:
+        try:
+            await asyncio.to_thread(index.save)
+        except OSError as exc:
+            logger.warning(f"Could not write component index {index.path}: {exc}")
+    logger.debug(f"Component index reused the templates of all but {len(index.rebuilt)} file(s)")
+    return custom_components_from_file
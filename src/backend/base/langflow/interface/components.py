@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import hashlib
 import json
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
@@ -7,6 +8,8 @@ from typing import TYPE_CHECKING, Any
 from loguru import logger
 
 from langflow.custom.utils import abuild_custom_components
+from langflow.interface.component_index import abuild_custom_components_with_index
+from langflow.utils.compression import compress_data
 
 if TYPE_CHECKING:
     from langflow.services.settings.service import SettingsService
@@ -17,6 +20,18 @@ class ComponentCache:
     def __init__(self):
         self.all_types_dict: dict[str, Any] | None = None
         self.fully_loaded_components: dict[str, bool] = {}
+        self._response: tuple[int, str, bytes] | None = None
+
+    def get_response(self) -> tuple[str, bytes]:
+        """Return the ETag and the gzipped JSON of `all_types_dict`, built once per catalog."""
+        if self._response is None or self._response[0] != id(self.all_types_dict):
+            compressed = compress_data(self.all_types_dict)
+            etag = f'"{hashlib.sha256(compressed).hexdigest()}"'
+            self._response = (id(self.all_types_dict), etag, compressed)
+        return self._response[1], self._response[2]
+
+    def invalidate_response(self) -> None:
+        self._response = None
 
 
 # Singleton instance
@@ -34,6 +49,11 @@ async def get_and_cache_all_types_dict(
             # Partial loading mode - just load component metadata
             logger.debug("Using partial component loading")
             component_cache.all_types_dict = await aget_component_metadata(settings_service.settings.components_path)
+        elif settings_service.settings.components_index_path:
+            # Full loading that reuses the templates of unchanged files
+            component_cache.all_types_dict = await abuild_custom_components_with_index(
+                settings_service.settings.components_path, settings_service.settings.components_index_path
+            )
         else:
             # Traditional full loading
             component_cache.all_types_dict = await aget_all_types_dict(settings_service.settings.components_path)
@@ -204,6 +224,7 @@ async def ensure_component_loaded(component_type: str, component_name: str, sett
 
             # Mark as fully loaded
             component_cache.fully_loaded_components[component_key] = True
+            component_cache.invalidate_response()
             logger.debug(f"Component {component_type}:{component_name} fully loaded")
         else:
             logger.warning(f"Failed to fully load component {component_type}:{component_name}")
@@ -12,11 +12,12 @@ from pydantic import PydanticDeprecatedSince20
 from langflow.custom.eval import eval_custom_component_code
 from langflow.schema import Data
 from langflow.schema.artifact import get_artifact_type, post_process_raw
-from langflow.services.deps import get_tracing_service
+from langflow.services.deps import get_settings_service, get_tracing_service
 
 if TYPE_CHECKING:
     from langflow.custom import Component, CustomComponent
     from langflow.events.event_manager import EventManager
+    from langflow.graph.graph.base import Graph
     from langflow.graph.vertex.base import Vertex
 
 
@@ -110,6 +111,19 @@ async def update_params_with_load_from_db_fields(
     *,
     fallback_to_env_vars=False,
 ):
+    names = [params[field] for field in load_from_db_fields if isinstance(params.get(field), str) and params[field]]
+    # Prefetched variables are only kept in the cache, so without it prefetching is an extra query
+    if names and get_settings_service().settings.variable_cache_ttl > 0:
+        vertex = getattr(custom_component, "_vertex", None)
+        if vertex is not None and vertex.graph is not None:
+            # Fetch the variables of the whole graph at once, the other vertices then read them from the cache
+            names.extend(get_graph_variable_names(vertex.graph))
+        try:
+            await custom_component.prefetch_variables(names)
+        except Exception as e:  # noqa: BLE001
+            # get_variables reports the error of each field below
+            logger.debug(f"Could not prefetch variables: {e}")
+
     for field in load_from_db_fields:
         if field not in params or not params[field]:
             continue
@@ -136,6 +150,16 @@ async def update_params_with_load_from_db_fields(
     return params
 
 
+def get_graph_variable_names(graph: Graph) -> list[str]:
+    """Return the names of the variables that the load_from_db fields of a graph refer to."""
+    return [
+        value
+        for vertex in graph.vertices
+        for field in vertex.load_from_db_fields
+        if isinstance(value := vertex.params.get(field), str) and value
+    ]
+
+
 async def build_component(
     params: dict,
     custom_component: Component,
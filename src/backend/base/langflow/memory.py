@@ -1,5 +1,6 @@
 import asyncio
 import json
+import time
 from collections.abc import Sequence
 from uuid import UUID
 
@@ -12,7 +13,7 @@ from sqlmodel.ext.asyncio.session import AsyncSession
 
 from langflow.schema.message import Message
 from langflow.services.database.models.message.model import MessageRead, MessageTable
-from langflow.services.deps import session_scope
+from langflow.services.deps import get_telemetry_service, session_scope
 from langflow.utils.async_helpers import run_until_complete
 
 
@@ -36,7 +37,9 @@ def _get_variable_query(
         stmt = stmt.where(MessageTable.flow_id == flow_id)
     if order_by:
         col = getattr(MessageTable, order_by).desc() if order == "DESC" else getattr(MessageTable, order_by).asc()
-        stmt = stmt.order_by(col)
+        # Messages of the same second are ordered by id, so that the order does not depend on the query plan
+        id_col = MessageTable.id.desc() if order == "DESC" else MessageTable.id.asc()
+        stmt = stmt.order_by(col, id_col)
     if limit:
         stmt = stmt.limit(limit)
     return stmt
@@ -99,6 +102,31 @@ async def aget_messages(
         return [await Message.create(**d.model_dump()) for d in messages]
 
 
+async def aget_last_messages(
+    session_id: str | UUID,
+    limit: int,
+    sender: str | None = None,
+    sender_name: str | None = None,
+    flow_id: UUID | None = None,
+) -> list[Message]:
+    """Retrieves the last messages of a session, in chronological order.
+
+    Only the last `limit` messages are read, walking the session's index backwards from the newest one.
+
+    Args:
+        session_id (str): The session ID associated with the messages.
+        limit (int): The maximum number of messages to retrieve.
+        sender (Optional[str]): The sender of the messages (e.g., "Machine" or "User")
+        sender_name (Optional[str]): The name of the sender.
+        flow_id (Optional[UUID]): The flow ID associated with the messages.
+
+    Returns:
+        List[Message]: The last messages of the session, oldest first.
+    """
+    messages = await aget_messages(sender, sender_name, session_id, "timestamp", "DESC", flow_id, limit)
+    return messages[::-1]
+
+
 def add_messages(messages: Message | list[Message], flow_id: str | UUID | None = None):
     """DEPRECATED - Add a message to the monitor service.
 
@@ -119,8 +147,10 @@ async def aadd_messages(messages: Message | list[Message], flow_id: str | UUID |
 
     try:
         messages_models = [MessageTable.from_message(msg, flow_id=flow_id) for msg in messages]
+        started = time.perf_counter()
         async with session_scope() as session:
             messages_models = await aadd_messagetables(messages_models, session)
+        get_telemetry_service().record_db_write("message", time.perf_counter() - started)
         return [await Message.create(**message.model_dump()) for message in messages_models]
     except Exception as e:
         logger.exception(e)
@@ -131,6 +161,7 @@ async def aupdate_messages(messages: Message | list[Message]) -> list[Message]:
     if not isinstance(messages, list):
         messages = [messages]
 
+    started = time.perf_counter()
     async with session_scope() as session:
         updated_messages: list[MessageTable] = []
         for message in messages:
@@ -148,7 +179,8 @@ async def aupdate_messages(messages: Message | list[Message]) -> list[Message]:
                 error_message = f"Message with id {message.id} not found"
                 logger.warning(error_message)
                 raise ValueError(error_message)
-        return [MessageRead.model_validate(message, from_attributes=True) for message in updated_messages]
+    get_telemetry_service().record_db_write("message", time.perf_counter() - started)
+    return [MessageRead.model_validate(message, from_attributes=True) for message in updated_messages]
 
 
 async def aadd_messagetables(messages: list[MessageTable], session: AsyncSession):
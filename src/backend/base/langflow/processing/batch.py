@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+from typing import TYPE_CHECKING, NamedTuple
+from uuid import uuid4
+
+from loguru import logger
+
+from langflow.processing.process import run_graph_internal
+from langflow.services.deps import get_settings_service
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+    from langflow.api.v1.schemas import InputValueRequest
+    from langflow.graph.graph.base import Graph
+    from langflow.graph.schema import RunOutputs
+
+
+class BatchItemResult(NamedTuple):
+    """The result of one input of a batch run. `error` is set instead of `outputs` if the run failed."""
+
+    index: int
+    session_id: str
+    outputs: list[RunOutputs] | None = None
+    error: Exception | None = None
+
+
+async def run_graph_batch(
+    graph: Graph,
+    inputs: list[InputValueRequest | None],
+    *,
+    flow_id: str,
+    outputs: list[str] | None = None,
+    session_ids: list[str | None] | None = None,
+    max_concurrency: int | None = None,
+) -> AsyncIterator[BatchItemResult]:
+    """Runs the graph once for each input, concurrently, yielding the results as they complete.
+
+    Every input runs on its own copy of the graph, so runs do not share any state except the
+    vertices that do not depend on the inputs: those are built once, before the runs start,
+    and their results are shared by all of them. A failed run yields its error and does not
+    stop the others.
+
+    Args:
+        graph: The graph to run. It is only copied, never run itself.
+        inputs: The inputs of the runs. A run without an input uses the values in the graph.
+        flow_id: The ID of the flow of the graph.
+        outputs: The outputs to retrieve from each run.
+        session_ids: The session ID of each run. Runs without one get a new session.
+        max_concurrency: The maximum number of runs at the same time. Zero means unlimited.
+            Defaults to the `batch_run_max_concurrency` setting.
+
+    Yields:
+        BatchItemResult: The result of each input, in the order the runs complete.
+    """
+    settings = get_settings_service().settings
+    if max_concurrency is None:
+        max_concurrency = settings.batch_run_max_concurrency
+    session_ids = session_ids or []
+
+    shared_graph = graph.copy_for_run()
+    shared_vertex_ids = await shared_graph.build_shared_vertices(
+        graph.get_input_independent_vertex_ids(), fallback_to_env_vars=settings.fallback_to_env_var
+    )
+    logger.debug(f"Running {len(inputs)} inputs sharing vertices {sorted(shared_vertex_ids)}")
+    semaphore = asyncio.Semaphore(max_concurrency) if max_concurrency else contextlib.nullcontext()
+
+    async def run_input(index: int, input_request: InputValueRequest | None) -> BatchItemResult:
+        session_id = (session_ids[index] if index < len(session_ids) else None) or str(uuid4())
+        async with semaphore:
+            run_graph = graph.copy_for_run()
+            run_graph.use_shared_vertices(shared_graph, shared_vertex_ids)
+            try:
+                run_outputs, _ = await run_graph_internal(
+                    graph=run_graph,
+                    flow_id=flow_id,
+                    session_id=session_id,
+                    inputs=[input_request] if input_request is not None else None,
+                    outputs=outputs,
+                )
+            except Exception as exc:  # noqa: BLE001
+                logger.opt(exception=True).debug(f"Error running input {index} of the batch")
+                return BatchItemResult(index=index, session_id=session_id, error=exc)
+        return BatchItemResult(index=index, session_id=session_id, outputs=run_outputs)
+
+    tasks = [asyncio.create_task(run_input(index, input_request)) for index, input_request in enumerate(inputs)]
+    try:
+        for task in asyncio.as_completed(tasks):
+            yield await task
+    finally:
+        # The consumer stopped early, e.g. a streaming client disconnected
+        for task in tasks:
+            task.cancel()
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any
+
+from langflow.utils.compression import compress_data
+
+if TYPE_CHECKING:
+    from uuid import UUID
+
+
+class FlowListingCache:
+    """A process-wide LRU cache of the gzipped flow listings of users, with their ETags.
+
+    Listings are keyed by the user and the listing options, and stored with the version of the
+    listed flows, their count and the time the last one was updated, so that a listing changed by
+    another worker is not served. Endpoints that change flows without touching `updated_at`, like
+    moving or deleting them, invalidate the listings of their owner. Thread-safe using a threading Lock.
+
+    Attributes:
+        max_size (int): Maximum number of listings to keep. The least recently used one is evicted first.
+        hits (int): Number of listings served from the cache.
+        misses (int): Number of listings that had to be compressed.
+    """
+
+    def __init__(self, max_size: int = 256) -> None:
+        self._listings: OrderedDict[tuple, tuple[tuple, str, bytes]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(user_id: UUID | str, *options: Any) -> tuple:
+        return str(user_id), *options
+
+    def get(self, key: tuple, version: tuple) -> tuple[str, bytes] | None:
+        """Returns the ETag and gzipped JSON of a listing, or None if it is missing or outdated."""
+        with self._lock:
+            entry = self._listings.get(key)
+            if entry is None or entry[0] != version:
+                self.misses += 1
+                return None
+            self._listings.move_to_end(key)
+            self.hits += 1
+            return entry[1], entry[2]
+
+    def set(self, key: tuple, version: tuple, data: Any) -> tuple[str, bytes]:
+        """Compresses a listing, stores it and returns its ETag and gzipped JSON."""
+        compressed = compress_data(data)
+        etag = f'"{hashlib.sha256(compressed).hexdigest()}"'
+        with self._lock:
+            self._listings[key] = (version, etag, compressed)
+            self._listings.move_to_end(key)
+            while self.max_size and len(self._listings) > self.max_size:
+                self._listings.popitem(last=False)
+        return etag, compressed
+
+    def invalidate_user(self, user_id: UUID | str | None) -> None:
+        """Drops the listings of the user with ID `user_id`.
+
+        Flows without a user are listed for every user when auto login is enabled, so a None
+        `user_id` drops every listing.
+        """
+        with self._lock:
+            if user_id is None:
+                self._listings.clear()
+                return
+            user_id = str(user_id)
+            for key in [k for k in self._listings if k[0] == user_id]:
+                del self._listings[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._listings.clear()
+
+    def __len__(self) -> int:
+        return len(self._listings)
+
+
+flow_listing_cache = FlowListingCache()
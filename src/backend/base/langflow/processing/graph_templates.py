@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import copy
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any
+
+import orjson
+
+from langflow.graph.graph.base import Graph
+from langflow.processing.process import process_tweaks
+
+if TYPE_CHECKING:
+    from uuid import UUID
+
+    from langflow.schema.graph import Tweaks
+    from langflow.services.database.models.flow import Flow
+
+
+class GraphTemplateCache:
+    """A process-wide LRU cache of graphs built from flows, used as templates for runs.
+
+    Templates are keyed by the flow ID, the time the flow was last updated, the tweaks and the
+    stream flag, so a saved flow never matches an older template. Templates are never run themselves;
+    every run gets a copy from `Graph.copy_for_run`. Thread-safe using a threading Lock.
+
+    Attributes:
+        max_size (int): Maximum number of templates to keep. The least recently used one is evicted first.
+        hits (int): Number of runs served from a template.
+        misses (int): Number of runs that had to build a template.
+    """
+
+    def __init__(self, max_size: int = 128) -> None:
+        self._templates: OrderedDict[tuple, Graph] = OrderedDict()
+        self._lock = threading.Lock()
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(flow: Flow, tweaks: Tweaks | dict[str, Any] | None, *, stream: bool) -> tuple:
+        if tweaks is not None and not isinstance(tweaks, dict):
+            tweaks = tweaks.model_dump()
+        tweaks_hash = hashlib.sha256(orjson.dumps(tweaks or {}, option=orjson.OPT_SORT_KEYS, default=str)).hexdigest()
+        updated_at = flow.updated_at.isoformat() if flow.updated_at else None
+        return str(flow.id), updated_at, stream, tweaks_hash
+
+    def get_graph(
+        self,
+        flow: Flow,
+        tweaks: Tweaks | dict[str, Any] | None = None,
+        *,
+        stream: bool = False,
+        user_id: str | None = None,
+    ) -> Graph:
+        """Returns a graph of `flow` ready to be run, building its template first if needed.
+
+        Args:
+            flow: The flow to build the graph from.
+            tweaks: The tweaks to apply to the flow.
+            stream: Whether streaming is enabled.
+            user_id: The user ID of the returned graph.
+
+        Returns:
+            Graph: A new graph that shares its template's structure.
+        """
+        key = self.key(flow, tweaks, stream=stream)
+        with self._lock:
+            template = self._templates.get(key)
+            if template is not None:
+                self._templates.move_to_end(key)
+                self.hits += 1
+            else:
+                self.misses += 1
+        if template is None:
+            template = self._build_template(flow, tweaks, stream=stream, user_id=user_id)
+            self._set(key, template)
+        return template.copy_for_run(user_id=user_id)
+
+    @staticmethod
+    def _build_template(
+        flow: Flow, tweaks: Tweaks | dict[str, Any] | None, *, stream: bool, user_id: str | None
+    ) -> Graph:
+        if flow.data is None:
+            msg = f"Flow {flow.id} has no data"
+            raise ValueError(msg)
+        # Tweaks are applied in place, so the flow data is copied to keep the flow untouched
+        graph_data = process_tweaks(copy.deepcopy(flow.data), tweaks or {}, stream=stream)
+        return Graph.from_payload(graph_data, flow_id=str(flow.id), flow_name=flow.name, user_id=user_id)
+
+    def _set(self, key: tuple, template: Graph) -> None:
+        with self._lock:
+            # Drop the templates of older versions of the same flow
+            for stale_key in [k for k in self._templates if k[0] == key[0] and k[1] != key[1]]:
+                del self._templates[stale_key]
+            self._templates[key] = template
+            self._templates.move_to_end(key)
+            while self.max_size and len(self._templates) > self.max_size:
+                self._templates.popitem(last=False)
+
+    def invalidate_flow(self, flow_id: UUID | str) -> None:
+        """Drops every template of the flow with ID `flow_id`."""
+        flow_id = str(flow_id)
+        with self._lock:
+            for key in [k for k in self._templates if k[0] == flow_id]:
+                del self._templates[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._templates.clear()
+
+    def __len__(self) -> int:
+        return len(self._templates)
+
+
+graph_template_cache = GraphTemplateCache()
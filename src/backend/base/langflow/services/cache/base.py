@@ -13,6 +13,8 @@ class CacheService(Service, Generic[LockType]):
     """Abstract base class for a cache."""
 
     name = "cache_service"
+    serializes = False
+    """Whether values are pickled when stored, rather than kept as references to the objects."""
 
     @abc.abstractmethod
     def get(self, key, lock: LockType | None = None):
@@ -111,6 +113,8 @@ class AsyncBaseCacheService(Service, Generic[AsyncLockType]):
     """Abstract base class for a async cache."""
 
     name = "cache_service"
+    serializes = False
+    """Whether values are pickled when stored, rather than kept as references to the objects."""
 
     @abc.abstractmethod
     async def get(self, key, lock: AsyncLockType | None = None):
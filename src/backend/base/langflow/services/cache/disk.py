@@ -11,6 +11,8 @@ from langflow.services.cache.utils import CACHE_MISS
 
 
 class AsyncDiskCache(AsyncBaseCacheService, Generic[AsyncLockType]):
+    serializes = True
+
     def __init__(self, cache_dir, max_size=None, expiration_time=3600) -> None:
         self.cache = Cache(cache_dir)
         # Let's clear the cache for now to maintain a similar
@@ -1,22 +1,44 @@
+from __future__ import annotations
+
 import asyncio
+import uuid
+import weakref
 from collections import defaultdict
+from functools import partial
 from threading import RLock
-from typing import Any
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+from loguru import logger
 
 from langflow.services.base import Service
 from langflow.services.cache.base import AsyncBaseCacheService, CacheService
+from langflow.services.cache.utils import CacheMiss
 from langflow.services.deps import get_cache_service
 
+if TYPE_CHECKING:
+    from langflow.graph.graph.base import Graph
+
+
+class GraphCheckpoint(NamedTuple):
+    """The last checkpoint written by this process for a cache key."""
+
+    graph: weakref.ref
+    token: str
+    deltas: int
+
 
 class ChatService(Service):
     """Service class for managing chat-related operations."""
 
     name = "chat_service"
+    max_checkpoint_deltas = 64
+    """Number of deltas written for a graph before it is compacted into a new full snapshot."""
 
     def __init__(self) -> None:
         self.async_cache_locks: dict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
         self._sync_cache_locks: dict[str, RLock] = defaultdict(RLock)
         self.cache_service: CacheService | AsyncBaseCacheService = get_cache_service()
+        self._graph_checkpoints: dict[str, GraphCheckpoint] = {}
 
     async def set_cache(self, key: str, data: Any, lock: asyncio.Lock | None = None) -> bool:
         """Set the cache for a client.
@@ -65,3 +87,121 @@ class ChatService(Service):
         if isinstance(self.cache_service, AsyncBaseCacheService):
             return await self.cache_service.delete(key, lock=lock or self.async_cache_locks[key])
         return await asyncio.to_thread(self.cache_service.delete, key, lock=lock or self._sync_cache_locks[key])
+
+    async def set_graph_cache(self, key: str, graph: Graph, lock: asyncio.Lock | None = None) -> bool:
+        """Checkpoint a graph in the cache.
+
+        With a cache that serializes its values, the first checkpoint of a graph stores the whole
+        graph under `key`. The following ones only append a delta with the run state and the
+        vertices built since the previous checkpoint, so the cost of a write grows with the size
+        of the change instead of the size of the graph. After `max_checkpoint_deltas` deltas the
+        log is compacted into a new full snapshot. A cache that keeps references already sees
+        every change to the graph, so it simply stores the graph.
+
+        Args:
+            key (str): The cache key, usually the flow ID.
+            graph (Graph): The graph to checkpoint.
+            lock (Optional[asyncio.Lock], optional): The lock to use for the cache operation. Defaults to None.
+
+        Returns:
+            bool: True if the checkpoint was written successfully, False otherwise.
+        """
+        if not self.cache_service.serializes:
+            return await self.set_cache(key, graph, lock=lock)
+
+        checkpoint = self._graph_checkpoints.get(key)
+        if (
+            checkpoint is None
+            or checkpoint.graph() is not graph
+            or checkpoint.token != graph._checkpoint_token
+            or checkpoint.deltas >= self.max_checkpoint_deltas
+        ):
+            return await self._set_graph_snapshot(key, graph, previous=checkpoint, lock=lock)
+
+        delta_key = self._checkpoint_delta_key(key, checkpoint.token, checkpoint.deltas)
+        if not await self.set_cache(delta_key, graph.get_checkpoint_delta()):
+            return False
+        self._graph_checkpoints[key] = checkpoint._replace(deltas=checkpoint.deltas + 1)
+        return await self.set_cache(self._checkpoint_head_key(key, checkpoint.token), checkpoint.deltas + 1)
+
+    async def get_graph_cache(self, key: str, lock: asyncio.Lock | None = None) -> Any:
+        """Get a graph checkpointed with `set_graph_cache`.
+
+        The deltas written after the last full snapshot are replayed on top of it. If the cache
+        still holds the very graph instance this process checkpointed, it is returned as is.
+
+        Args:
+            key (str): The cache key, usually the flow ID.
+            lock (Optional[asyncio.Lock], optional): The lock to use for the cache operation. Defaults to None.
+
+        Returns:
+            Any: The cached data, with the restored graph under "result", or a CacheMiss.
+        """
+        cached = await self.get_cache(key, lock=lock)
+        if isinstance(cached, CacheMiss) or not isinstance(cached, dict):
+            return cached
+        graph = cached.get("result")
+        token = getattr(graph, "_checkpoint_token", None)
+        if token is None:
+            return cached
+        checkpoint = self._graph_checkpoints.get(key)
+        if checkpoint is not None and checkpoint.graph() is graph:
+            return cached
+
+        deltas = await self.get_cache(self._checkpoint_head_key(key, token))
+        if isinstance(deltas, CacheMiss):
+            return cached
+        for index in range(deltas["result"]):
+            delta = await self.get_cache(self._checkpoint_delta_key(key, token, index))
+            if isinstance(delta, CacheMiss):
+                logger.warning(f"Checkpoint delta {index} of {key} is missing, restoring up to the previous one")
+                # Force the next checkpoint to be a full snapshot
+                graph._checkpoint_token = None
+                return cached
+            graph.apply_checkpoint_delta(delta["result"])
+        # Keep appending to the same log when the restored graph is checkpointed again
+        self._track_checkpoint(key, graph, token, deltas["result"])
+        return cached
+
+    async def clear_graph_cache(self, key: str, lock: asyncio.Lock | None = None) -> None:
+        """Clear a graph checkpointed with `set_graph_cache` along with its deltas."""
+        checkpoint = self._graph_checkpoints.pop(key, None)
+        if checkpoint is not None:
+            await self._clear_checkpoint_deltas(key, checkpoint)
+        await self.clear_cache(key, lock=lock)
+
+    async def _set_graph_snapshot(
+        self, key: str, graph: Graph, *, previous: GraphCheckpoint | None, lock: asyncio.Lock | None
+    ) -> bool:
+        token = f"{graph._run_id or 'graph'}:{uuid.uuid4().hex}"
+        graph._checkpoint_token = token
+        # The snapshot already holds every vertex, so start the next delta from a clean slate
+        graph.get_checkpoint_delta()
+        result = await self.set_cache(key, graph, lock=lock)
+        self._track_checkpoint(key, graph, token, 0)
+        if previous is not None:
+            await self._clear_checkpoint_deltas(key, previous)
+        return result
+
+    def _track_checkpoint(self, key: str, graph: Graph, token: str, deltas: int) -> None:
+        graph_ref = weakref.ref(graph, partial(self._forget_checkpoint, key))
+        self._graph_checkpoints[key] = GraphCheckpoint(graph=graph_ref, token=token, deltas=deltas)
+
+    def _forget_checkpoint(self, key: str, graph_ref: weakref.ref) -> None:
+        # Once its graph is gone, the next checkpoint of the key is a full snapshot anyway
+        checkpoint = self._graph_checkpoints.get(key)
+        if checkpoint is not None and checkpoint.graph is graph_ref:
+            del self._graph_checkpoints[key]
+
+    async def _clear_checkpoint_deltas(self, key: str, checkpoint: GraphCheckpoint) -> None:
+        for index in range(checkpoint.deltas):
+            await self.clear_cache(self._checkpoint_delta_key(key, checkpoint.token, index))
+        await self.clear_cache(self._checkpoint_head_key(key, checkpoint.token))
+
+    @staticmethod
+    def _checkpoint_head_key(key: str, token: str) -> str:
+        return f"{key}:checkpoint:{token}"
+
+    @staticmethod
+    def _checkpoint_delta_key(key: str, token: str, index: int) -> str:
+        return f"{key}:checkpoint:{token}:{index}"
@@ -17,7 +17,7 @@ from pydantic import (
     field_validator,
 )
 from sqlalchemy import Enum as SQLEnum
-from sqlalchemy import Text, UniqueConstraint, text
+from sqlalchemy import Text, UniqueConstraint, event, inspect, text
 from sqlmodel import JSON, Column, Field, Relationship, SQLModel
 
 from langflow.schema import Data
@@ -216,6 +216,8 @@ class Flow(FlowBase, table=True):  # type: ignore[call-arg]
     locked: bool | None = Field(default=False, nullable=True)
     folder_id: UUID | None = Field(default=None, foreign_key="folder.id", nullable=True, index=True)
     fs_path: str | None = Field(default=None, nullable=True)
+    # The JSON schema of the inputs of the flow as an MCP tool, kept in step with `data` on save
+    input_schema: dict | None = Field(default=None, sa_column=Column(JSON, nullable=True))
     folder: Optional["Folder"] = Relationship(back_populates="flows")
 
     def to_data(self):
@@ -235,6 +237,21 @@ class Flow(FlowBase, table=True):  # type: ignore[call-arg]
     )
 
 
+@event.listens_for(Flow, "before_insert")
+@event.listens_for(Flow, "before_update")
+def update_input_schema(mapper, connection, target: Flow) -> None:  # noqa: ARG001
+    """Computes the input schema of a flow when its data is saved, so that listing tools never reads the data."""
+    if not inspect(target).attrs.data.history.has_changes() and target.input_schema is not None:
+        return
+    from langflow.helpers.flow import json_schema_from_flow_data
+
+    try:
+        target.input_schema = json_schema_from_flow_data(target.data)
+    except Exception:  # noqa: BLE001
+        logger.opt(exception=True).debug(f"Could not compute the input schema of flow {target.id}")
+        target.input_schema = None
+
+
 class FlowCreate(FlowBase):
     id: UUID | None = Field(default=None)
     user_id: UUID | None = Field(default=None)
@@ -1,9 +1,18 @@
+import base64
+import json
+from datetime import datetime
+from typing import TYPE_CHECKING
 from uuid import UUID
 
+from sqlalchemy import and_, or_
+
 from langflow.services.database.models.message.model import MessageTable, MessageUpdate
 from langflow.services.deps import session_scope
 from langflow.utils.async_helpers import run_until_complete
 
+if TYPE_CHECKING:
+    from sqlmodel.sql.expression import SelectOfScalar
+
 
 async def _update_message(message_id: UUID | str, message: MessageUpdate | dict):
     if not isinstance(message, MessageUpdate):
@@ -24,3 +33,40 @@ async def _update_message(message_id: UUID | str, message: MessageUpdate | dict)
 def update_message(message_id: UUID | str, message: MessageUpdate | dict):
     """DEPRECATED - Kept for backward compatibility. Do not use."""
     return run_until_complete(_update_message(message_id, message))
+
+
+def encode_message_cursor(message: MessageTable) -> str:
+    """Return the cursor that continues a listing after `message`, in (timestamp, id) order."""
+    payload = json.dumps([message.timestamp.isoformat(), str(message.id)])
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii")
+
+
+def decode_message_cursor(cursor: str) -> tuple[datetime, UUID]:
+    """Return the timestamp and id of the message a cursor points to.
+
+    Raises:
+        ValueError: If the cursor is malformed.
+    """
+    try:
+        timestamp, message_id = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        return datetime.fromisoformat(timestamp), UUID(message_id)
+    except (TypeError, ValueError, UnicodeError) as exc:
+        msg = f"Invalid message cursor: {cursor}"
+        raise ValueError(msg) from exc
+
+
+def paginate_messages(stmt: "SelectOfScalar", cursor: str | None, limit: int) -> "SelectOfScalar":
+    """Order a message query by (timestamp, id) and select the `limit` messages after `cursor`.
+
+    Unlike an offset, the cursor is matched against the message indexes, so each page costs the
+    same however far the listing goes, and messages stored meanwhile do not shift the pages.
+    """
+    if cursor:
+        timestamp, message_id = decode_message_cursor(cursor)
+        stmt = stmt.where(
+            or_(
+                MessageTable.timestamp > timestamp,
+                and_(MessageTable.timestamp == timestamp, MessageTable.id > message_id),
+            )
+        )
+    return stmt.order_by(MessageTable.timestamp.asc(), MessageTable.id.asc()).limit(limit)
@@ -1,7 +1,7 @@
 from uuid import UUID
 
 from loguru import logger
-from sqlmodel import col, delete, select
+from sqlmodel import col, delete, func, select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from langflow.services.database.models.transactions.model import (
@@ -74,6 +74,54 @@ async def log_transaction(db: AsyncSession, transaction: TransactionBase) -> Tra
     return table
 
 
+async def log_transactions(db: AsyncSession, transactions: list[TransactionBase]) -> list[TransactionTable]:
+    """Insert a batch of transactions in a single database transaction.
+
+    Unlike `log_transaction`, this does not enforce the transaction limit. Retention is left to
+    `prune_transactions`, which the monitor writer runs periodically.
+
+    Args:
+        db: Database session
+        transactions: Transaction data to log
+
+    Returns:
+        The created TransactionTable entries
+    """
+    tables = [TransactionTable(**transaction.model_dump()) for transaction in transactions if transaction.flow_id]
+    try:
+        db.add_all(tables)
+        await db.commit()
+    except Exception:
+        await db.rollback()
+        raise
+    return tables
+
+
+async def prune_transactions(db: AsyncSession, max_entries: int | None = None) -> None:
+    """Delete the oldest transactions of every flow that exceed the maximum number to keep.
+
+    Args:
+        db: Database session
+        max_entries: Maximum number of transactions to keep per flow. If None, uses system settings.
+    """
+    max_entries = max_entries or get_settings_service().settings.max_transactions_to_keep
+    try:
+        ranked = select(
+            TransactionTable.id,
+            func.row_number()
+            .over(partition_by=TransactionTable.flow_id, order_by=col(TransactionTable.timestamp).desc())
+            .label("position"),
+        ).subquery()
+        delete_older = delete(TransactionTable).where(
+            col(TransactionTable.id).in_(select(ranked.c.id).where(ranked.c.position > max_entries))
+        )
+        await db.exec(delete_older)
+        await db.commit()
+    except Exception:
+        await db.rollback()
+        raise
+
+
 def transform_transaction_table(
     transaction: list[TransactionTable] | TransactionTable,
 ) -> list[TransactionReadResponse]:
@@ -130,6 +130,77 @@ async def log_vertex_build(
     return table
 
 
+async def log_vertex_builds(db: AsyncSession, vertex_builds: list[VertexBuildBase]) -> list[VertexBuildTable]:
+    """Insert a batch of vertex builds in a single transaction.
+
+    Unlike `log_vertex_build`, this does not enforce the build limits. Retention is left to
+    `prune_vertex_builds`, which the monitor writer runs periodically.
+
+    Args:
+        db (AsyncSession): The database session for executing queries.
+        vertex_builds (list[VertexBuildBase]): The vertex builds to insert.
+
+    Returns:
+        list[VertexBuildTable]: The inserted vertex build records.
+    """
+    tables = [VertexBuildTable(**vertex_build.model_dump()) for vertex_build in vertex_builds]
+    try:
+        db.add_all(tables)
+        await db.commit()
+    except Exception:
+        await db.rollback()
+        raise
+    return tables
+
+
+async def prune_vertex_builds(
+    db: AsyncSession,
+    *,
+    max_builds_to_keep: int | None = None,
+    max_builds_per_vertex: int | None = None,
+) -> None:
+    """Delete the vertex builds that exceed the per-vertex and global limits.
+
+    Args:
+        db (AsyncSession): The database session for executing queries.
+        max_builds_to_keep (int | None, optional): Maximum number of builds to keep globally.
+            If None, uses system settings.
+        max_builds_per_vertex (int | None, optional): Maximum number of builds to keep per vertex.
+            If None, uses system settings.
+    """
+    settings = get_settings_service().settings
+    max_global = max_builds_to_keep or settings.max_vertex_builds_to_keep
+    max_per_vertex = max_builds_per_vertex or settings.max_vertex_builds_per_vertex
+
+    try:
+        # Rank the builds of every vertex at once instead of running one delete per vertex
+        ranked = select(
+            VertexBuildTable.build_id,
+            func.row_number()
+            .over(
+                partition_by=(VertexBuildTable.flow_id, VertexBuildTable.id),
+                order_by=(col(VertexBuildTable.timestamp).desc(), col(VertexBuildTable.build_id).desc()),
+            )
+            .label("position"),
+        ).subquery()
+        delete_vertex_older = delete(VertexBuildTable).where(
+            col(VertexBuildTable.build_id).in_(select(ranked.c.build_id).where(ranked.c.position > max_per_vertex))
+        )
+        await db.exec(delete_vertex_older)
+
+        keep_global_subq = (
+            select(VertexBuildTable.build_id)
+            .order_by(col(VertexBuildTable.timestamp).desc(), col(VertexBuildTable.build_id).desc())
+            .limit(max_global)
+        )
+        delete_global_older = delete(VertexBuildTable).where(col(VertexBuildTable.build_id).not_in(keep_global_subq))
+        await db.exec(delete_global_older)
+        await db.commit()
+    except Exception:
+        await db.rollback()
+        raise
+
+
 async def delete_vertex_builds_by_flow_id(db: AsyncSession, flow_id: UUID) -> None:
     """Delete all vertex builds associated with a specific flow ID.
 
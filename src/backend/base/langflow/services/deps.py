@@ -15,7 +15,9 @@ if TYPE_CHECKING:
     from langflow.services.cache.service import AsyncBaseCacheService, CacheService
     from langflow.services.chat.service import ChatService
     from langflow.services.database.service import DatabaseService
+    from langflow.services.executor.service import ExecutorService
     from langflow.services.job_queue.service import JobQueueService
+    from langflow.services.monitor_writer.service import MonitorWriterService
     from langflow.services.session.service import SessionService
     from langflow.services.settings.service import SettingsService
     from langflow.services.socket.service import SocketIOService
@@ -248,3 +250,17 @@ def get_queue_service() -> JobQueueService:
     from langflow.services.job_queue.factory import JobQueueServiceFactory
 
     return get_service(ServiceType.JOB_QUEUE_SERVICE, JobQueueServiceFactory())
+
+
+def get_monitor_writer_service() -> MonitorWriterService:
+    """Retrieves the MonitorWriterService instance from the service manager."""
+    from langflow.services.monitor_writer.factory import MonitorWriterServiceFactory
+
+    return get_service(ServiceType.MONITOR_WRITER_SERVICE, MonitorWriterServiceFactory())
+
+
+def get_executor_service() -> ExecutorService:
+    """Retrieves the ExecutorService instance from the service manager."""
+    from langflow.services.executor.factory import ExecutorServiceFactory
+
+    return get_service(ServiceType.EXECUTOR_SERVICE, ExecutorServiceFactory())
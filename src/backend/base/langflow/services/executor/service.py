@@ -0,0 +1,170 @@
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import pickle
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import asdict, dataclass
+from functools import partial
+from typing import TYPE_CHECKING, Any
+
+from loguru import logger
+
+from langflow.services.base import Service
+from langflow.services.deps import get_telemetry_service
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from langflow.services.settings.service import SettingsService
+
+PROCESS_POOL = "process"
+"""Name of the process pool, for picklable CPU-bound outputs."""
+
+DEFAULT_POOL_SIZE = 4
+"""Number of threads of a named pool that has no size configured."""
+
+
+@dataclass
+class ExecutionStats:
+    calls: int = 0
+    failures: int = 0
+    queue_wait: float = 0.0
+    max_queue_wait: float = 0.0
+    execution: float = 0.0
+    max_execution: float = 0.0
+
+    def record(self, queue_wait: float, execution: float, *, failed: bool) -> None:
+        self.calls += 1
+        self.failures += failed
+        self.queue_wait += queue_wait
+        self.max_queue_wait = max(self.max_queue_wait, queue_wait)
+        self.execution += execution
+        self.max_execution = max(self.max_execution, execution)
+
+
+def _timed_call(func: Callable[[], Any]) -> tuple[float, float, Any, Exception | None]:
+    # time.monotonic is system-wide, so the timestamps of a worker process can be compared to ours
+    started = time.monotonic()
+    try:
+        result, error = func(), None
+    except Exception as exc:  # noqa: BLE001
+        result, error = None, exc
+    return started, time.monotonic(), result, error
+
+
+def _timed_process_call(payload: bytes) -> tuple[float, float, Any, Exception | None]:
+    func = pickle.loads(payload)  # noqa: S301
+    started, finished, result, error = _timed_call(func)
+    if error is None:
+        # Fail here rather than in the pool, so that a failure of the pool means the function never ran
+        try:
+            pickle.dumps(result)
+        except Exception as exc:  # noqa: BLE001
+            msg = (
+                f"The result of {getattr(func, '__qualname__', func)} cannot be sent back from a worker process: {exc}"
+            )
+            result, error = None, TypeError(msg)
+    return started, finished, result, error
+
+
+class ExecutorService(Service):
+    """Runs the synchronous output methods of components.
+
+    By default a method runs on the event loop's default thread pool, like `asyncio.to_thread`.
+    A component can instead name a dedicated pool with its `sync_executor` class attribute or
+    with the `executor` of an output, and `component_executor_overrides` can set the pool of a
+    component or of a single output without changing its code. Pools are sized through
+    `component_executors`, so that slow components cannot starve the others. The `process`
+    pool runs picklable CPU-bound outputs in worker processes, outside of the GIL.
+
+    Queue wait and execution time are recorded per component.
+    """
+
+    name = "executor_service"
+
+    def __init__(self, settings_service: SettingsService):
+        super().__init__()
+        settings = settings_service.settings
+        self.pool_sizes = dict(settings.component_executors)
+        self.overrides = dict(settings.component_executor_overrides)
+        self.process_pool_size = settings.component_process_pool_size
+        self._executors: dict[str, Executor] = {}
+        self._stats: defaultdict[str, ExecutionStats] = defaultdict(ExecutionStats)
+        self._unpicklable: set[str] = set()
+        self._lock = threading.Lock()
+
+    def resolve(self, component_name: str, output_name: str, default: str | None = None) -> str | None:
+        """Return the name of the pool that runs an output, or None for the default thread pool."""
+        return self.overrides.get(f"{component_name}.{output_name}") or self.overrides.get(component_name) or default
+
+    def get_executor(self, name: str) -> Executor:
+        with self._lock:
+            executor = self._executors.get(name)
+            if executor is None:
+                if name == PROCESS_POOL:
+                    executor = ProcessPoolExecutor(max_workers=self.process_pool_size)
+                else:
+                    executor = ThreadPoolExecutor(
+                        max_workers=self.pool_sizes.get(name, DEFAULT_POOL_SIZE),
+                        thread_name_prefix=f"langflow-{name}",
+                    )
+                self._executors[name] = executor
+        return executor
+
+    async def run(self, func: Callable[[], Any], *, key: str, executor: str | None = None) -> Any:
+        """Run a synchronous function on the named pool and record its timings under `key`."""
+        if executor == PROCESS_POOL and key not in self._unpicklable:
+            # Pickle the function here, once, so that only a function that never ran falls back to threads
+            try:
+                payload = pickle.dumps(func)
+            except Exception as exc:  # noqa: BLE001
+                logger.warning(f"Running {key} in the default thread pool, it cannot run in a process: {exc}")
+                self._unpicklable.add(key)
+            else:
+                pool = self.get_executor(PROCESS_POOL)
+                try:
+                    return await self._run(func, key, pool, _timed_process_call, payload)
+                except BrokenProcessPool:
+                    with self._lock:
+                        if self._executors.get(PROCESS_POOL) is pool:
+                            del self._executors[PROCESS_POOL]
+                    raise
+
+        pool = self.get_executor(executor) if executor and executor != PROCESS_POOL else None
+        # Like asyncio.to_thread, run the function in a copy of the caller's context
+        context = contextvars.copy_context()
+        return await self._run(func, key, pool, _timed_call, partial(context.run, func))
+
+    async def _run(
+        self,
+        func: Callable[[], Any],
+        key: str,
+        pool: Executor | None,
+        timed_call: Callable[[Any], tuple[float, float, Any, Exception | None]],
+        call: Callable[[], Any] | bytes,
+    ) -> Any:
+        loop = asyncio.get_running_loop()
+        submitted = time.monotonic()
+        started, finished, result, error = await loop.run_in_executor(pool, timed_call, call)
+        self._stats[key].record(started - submitted, finished - started, failed=error is not None)
+        get_telemetry_service().record_component_execution(key, started - submitted, finished - started)
+        if error is not None:
+            raise error
+        name = getattr(func, "__qualname__", key)
+        logger.trace(f"{name} waited {started - submitted:.4f}s and ran {finished - started:.4f}s")
+        return result
+
+    def stats(self) -> dict[str, dict[str, int | float]]:
+        """Return the recorded timings per component, in seconds."""
+        return {key: asdict(stats) for key, stats in self._stats.items()}
+
+    async def teardown(self) -> None:
+        with self._lock:
+            executors, self._executors = self._executors, {}
+        for executor in executors.values():
+            executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,189 @@
+from __future__ import annotations
+
+import time
+from abc import ABC, abstractmethod
+from typing import Any
+
+from langflow.services.job_queue.exceptions import JobQueueNotFoundError
+
+START_CURSOR = "0-0"
+"""Cursor that reads the events of a job from the start."""
+
+
+class JobQueueBackend(ABC):
+    """Shared storage for the state and events of build jobs.
+
+    A job is run by the worker that created it. That worker appends the job's events, and any
+    worker can read them with a cursor. Reading without a cursor continues from where the last
+    such read stopped, so that a client which reconnects to another worker resumes the stream.
+    """
+
+    @abstractmethod
+    async def create_job(self, job_id: str, owner: str) -> None:
+        """Register a running job."""
+
+    @abstractmethod
+    async def append(self, job_id: str, events: list[tuple[str, bytes]]) -> None:
+        """Append encoded events, given as (event id, data) pairs, to the events of a job."""
+
+    @abstractmethod
+    async def finish(self, job_id: str, status: str = "done") -> None:
+        """Mark the end of the events of a job."""
+
+    @abstractmethod
+    async def read(
+        self, job_id: str, cursor: str | None = None, *, timeout: float | None = None, count: int = 100
+    ) -> tuple[list[bytes | None], str]:
+        """Return the events after `cursor` and the cursor of the last one.
+
+        The end of the events is returned as None. If there are no events yet, waits up to `timeout`
+        seconds for one.
+
+        Raises:
+            JobQueueNotFoundError: If the job does not exist or has expired.
+        """
+
+    @abstractmethod
+    async def get_status(self, job_id: str) -> str | None:
+        """Return the status of a job, or None if it does not exist."""
+
+    @abstractmethod
+    async def request_cancel(self, job_id: str) -> None:
+        """Ask the worker that runs a job to cancel it."""
+
+    @abstractmethod
+    async def is_cancel_requested(self, job_id: str) -> bool:
+        """Whether the cancellation of a job was requested."""
+
+    @abstractmethod
+    async def close(self) -> None:
+        """Release the connection to the storage."""
+
+
+class RedisJobQueueBackend(JobQueueBackend):
+    """Keeps the events of a job in a Redis stream and its state in a Redis hash.
+
+    Both keys expire `retention` seconds after the last event, and streams are trimmed to
+    about `max_events` entries. Any client that implements the used subset of the redis-py
+    asyncio API can be passed as `client`.
+    """
+
+    def __init__(
+        self,
+        client: Any = None,
+        *,
+        url: str | None = None,
+        host: str = "localhost",
+        port: int = 6379,
+        db: int = 0,
+        prefix: str = "langflow:job:",
+        retention: int = 3600,
+        max_events: int = 10000,
+    ) -> None:
+        if client is None:
+            try:
+                from redis.asyncio import Redis
+            except ImportError as exc:
+                msg = (
+                    "The redis job queue backend requires the redis-py package."
+                    " Please install Langflow with the deploy extra: pip install langflow[deploy]"
+                )
+                raise ImportError(msg) from exc
+            client = Redis.from_url(url) if url else Redis(host=host, port=port, db=db)
+        self._client = client
+        self.prefix = prefix
+        self.retention = retention
+        self.max_events = max_events
+
+    def _state_key(self, job_id: str) -> str:
+        return f"{self.prefix}{job_id}"
+
+    def _events_key(self, job_id: str) -> str:
+        return f"{self.prefix}{job_id}:events"
+
+    async def create_job(self, job_id: str, owner: str) -> None:
+        state_key = self._state_key(job_id)
+        async with self._client.pipeline(transaction=True) as pipe:
+            pipe.hset(
+                state_key,
+                mapping={"status": "running", "owner": owner, "cursor": START_CURSOR, "created_at": str(time.time())},
+            )
+            pipe.expire(state_key, self.retention)
+            await pipe.execute()
+
+    async def append(self, job_id: str, events: list[tuple[str, bytes]]) -> None:
+        events_key = self._events_key(job_id)
+        async with self._client.pipeline(transaction=False) as pipe:
+            for event_id, data in events:
+                pipe.xadd(events_key, {"id": event_id, "data": data}, maxlen=self.max_events, approximate=True)
+            pipe.expire(events_key, self.retention)
+            pipe.expire(self._state_key(job_id), self.retention)
+            await pipe.execute()
+
+    async def finish(self, job_id: str, status: str = "done") -> None:
+        events_key = self._events_key(job_id)
+        state_key = self._state_key(job_id)
+        async with self._client.pipeline(transaction=True) as pipe:
+            pipe.xadd(events_key, {"end": status}, maxlen=self.max_events, approximate=True)
+            pipe.hset(state_key, "status", status)
+            pipe.expire(events_key, self.retention)
+            pipe.expire(state_key, self.retention)
+            await pipe.execute()
+
+    async def read(
+        self, job_id: str, cursor: str | None = None, *, timeout: float | None = None, count: int = 100
+    ) -> tuple[list[bytes | None], str]:
+        state_key = self._state_key(job_id)
+        resume = cursor is None
+        if resume:
+            stored_cursor = await self._client.hget(state_key, "cursor")
+            if stored_cursor is None:
+                raise JobQueueNotFoundError(job_id)
+            cursor = _decode(stored_cursor)
+        elif not await self._client.exists(state_key):
+            raise JobQueueNotFoundError(job_id)
+
+        block = None if timeout is None else max(1, int(timeout * 1000))
+        response = await self._client.xread({self._events_key(job_id): cursor}, count=count, block=block)
+
+        events: list[bytes | None] = []
+        for _stream, entries in response or []:
+            for entry_id, fields in entries:
+                cursor = _decode(entry_id)
+                data = _field(fields, "data")
+                if data is None:
+                    events.append(None)
+                    break
+                events.append(data if isinstance(data, bytes) else data.encode("utf-8"))
+
+        if resume and events:
+            await self._client.hset(state_key, "cursor", cursor)
+        return events, cursor
+
+    async def get_status(self, job_id: str) -> str | None:
+        status = await self._client.hget(self._state_key(job_id), "status")
+        return None if status is None else _decode(status)
+
+    async def request_cancel(self, job_id: str) -> None:
+        state_key = self._state_key(job_id)
+        if not await self._client.exists(state_key):
+            raise JobQueueNotFoundError(job_id)
+        await self._client.hset(state_key, "cancel", "1")
+
+    async def is_cancel_requested(self, job_id: str) -> bool:
+        return await self._client.hget(self._state_key(job_id), "cancel") is not None
+
+    async def close(self) -> None:
+        # redis-py 5 renamed close to aclose
+        close = getattr(self._client, "aclose", None) or self._client.close
+        await close()
+
+
+def _decode(value: bytes | str) -> str:
+    return value.decode("utf-8") if isinstance(value, bytes) else value
+
+
+def _field(fields: dict, name: str) -> Any:
+    if name in fields:
+        return fields[name]
+    return fields.get(name.encode("utf-8"))
@@ -0,0 +1,6 @@
+class JobQueueNotFoundError(Exception):
+    """Exception raised when a job queue is not found."""
+
+    def __init__(self, job_id: str) -> None:
+        self.job_id = job_id
+        super().__init__(f"Job queue not found for job_id: {job_id}")
@@ -1,11 +1,33 @@
-from langflow.services.base import Service
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from typing_extensions import override
+
 from langflow.services.factory import ServiceFactory
+from langflow.services.job_queue.backend import RedisJobQueueBackend
 from langflow.services.job_queue.service import JobQueueService
 
+if TYPE_CHECKING:
+    from langflow.services.settings.service import SettingsService
+
 
 class JobQueueServiceFactory(ServiceFactory):
     def __init__(self):
         super().__init__(JobQueueService)
 
-    def create(self) -> Service:
+    @override
+    def create(self, settings_service: SettingsService):
+        settings = settings_service.settings
+        if settings.job_queue_backend == "redis":
+            return JobQueueService(
+                RedisJobQueueBackend(
+                    url=settings.redis_url,
+                    host=settings.redis_host,
+                    port=settings.redis_port,
+                    db=settings.redis_db,
+                    retention=settings.job_queue_retention,
+                    max_events=settings.job_queue_max_events,
+                )
+            )
         return JobQueueService()
@@ -1,19 +1,24 @@
 from __future__ import annotations
 
 import asyncio
+import os
+import socket
+from typing import TYPE_CHECKING
 
 from loguru import logger
 
-from langflow.events.event_manager import EventManager, create_default_event_manager
+from langflow.events.event_manager import EventManager, create_default_event_manager, create_event_queue
 from langflow.services.base import Service
+from langflow.services.job_queue.exceptions import JobQueueNotFoundError
 
+if TYPE_CHECKING:
+    from langflow.services.job_queue.backend import JobQueueBackend
 
-class JobQueueNotFoundError(Exception):
-    """Exception raised when a job queue is not found."""
+FORWARD_BATCH_SIZE = 100
+"""Maximum number of events written to the shared backend at once."""
 
-    def __init__(self, job_id: str) -> None:
-        self.job_id = job_id
-        super().__init__(f"Job queue not found for job_id: {job_id}")
+CANCEL_CHECK_INTERVAL = 1.0
+"""Interval in seconds at which a worker checks whether another worker asked to cancel one of its jobs."""
 
 
 class JobQueueService(Service):
@@ -26,6 +31,9 @@ class JobQueueService(Service):
       - Safely clean up resources by cancelling active tasks and emptying queues.
       - Automatically perform periodic cleanup of inactive or completed job queues.
 
+    With a shared `backend`, the events of every job are also forwarded to it, so that any worker
+    can serve the events of any job, and jobs can be cancelled from any worker.
+
     The cleanup process follows a two-phase approach:
       1. When a task is cancelled or fails, it is marked for cleanup by setting a timestamp
       2. The actual cleanup only occurs after CLEANUP_GRACE_PERIOD seconds have elapsed
@@ -33,6 +41,7 @@ class JobQueueService(Service):
 
     Attributes:
         name (str): Unique identifier for the service.
+        backend (JobQueueBackend | None): Shared storage for job events, or None to keep them in this process.
         _queues (dict[str, tuple[asyncio.Queue, EventManager, asyncio.Task | None, float | None]]):
             Dictionary mapping job IDs to a tuple containing:
               * The job's asyncio.Queue instance.
@@ -61,18 +70,33 @@ class JobQueueService(Service):
 
     name = "job_queue_service"
 
-    def __init__(self) -> None:
+    def __init__(self, backend: JobQueueBackend | None = None) -> None:
         """Initialize the JobQueueService.
 
         Sets up the internal registry for job queues, initializes the cleanup task, and sets the service state
         to active.
+
+        Args:
+            backend (JobQueueBackend | None): Shared storage for job events, for deployments with several workers.
         """
+        self.backend = backend
+        self.worker_id = f"{socket.gethostname()}-{os.getpid()}"
+        self._forwarders: dict[str, asyncio.Task] = {}
         self._queues: dict[str, tuple[asyncio.Queue, EventManager, asyncio.Task | None, float | None]] = {}
         self._cleanup_task: asyncio.Task | None = None
         self._closed = False
         self.ready = False
         self.CLEANUP_GRACE_PERIOD = 300  # 5 minutes before cleaning up marked tasks
 
+    @property
+    def is_shared(self) -> bool:
+        """Whether job events are kept in a backend that all workers share."""
+        return self.backend is not None
+
+    def owns_job(self, job_id: str) -> bool:
+        """Whether the job runs in this worker."""
+        return job_id in self._queues
+
     def is_started(self) -> bool:
         """Check if the JobQueueService has started.
 
@@ -117,16 +141,19 @@ class JobQueueService(Service):
         # Clean up each registered job queue.
         for job_id in list(self._queues.keys()):
             await self.cleanup_job(job_id)
+        if self.backend is not None:
+            await self.backend.close()
         logger.info("JobQueueService stopped: all job queues have been cleaned up.")
 
     async def teardown(self) -> None:
         await self.stop()
 
-    def create_queue(self, job_id: str) -> tuple[asyncio.Queue, EventManager]:
+    def create_queue(self, job_id: str, *, coalesce_tokens: bool = False) -> tuple[asyncio.Queue, EventManager]:
         """Create and register a new queue along with its corresponding event manager for a job.
 
         Args:
             job_id (str): Unique identifier for the job.
+            coalesce_tokens (bool): Whether token events are batched into fewer frames on a bounded queue.
 
         Returns:
             tuple[asyncio.Queue, EventManager]: A tuple containing:
@@ -143,14 +170,22 @@ class JobQueueService(Service):
             logger.error(msg)
             raise RuntimeError(msg)
 
-        main_queue: asyncio.Queue = asyncio.Queue()
-        event_manager = create_default_event_manager(main_queue)
+        main_queue = create_event_queue(coalesce_tokens=coalesce_tokens)
+        event_manager = create_default_event_manager(main_queue, coalesce_tokens=coalesce_tokens)
 
         # Register the queue without an active task.
         self._queues[job_id] = (main_queue, event_manager, None, None)
         logger.debug(f"Queue and event manager successfully created for job_id {job_id}")
         return main_queue, event_manager
 
+    async def register_job(self, job_id: str) -> None:
+        """Publish a job created with `create_queue` to the shared backend, if there is one.
+
+        Must be awaited before the job id is handed out, so that any worker can find the job.
+        """
+        if self.backend is not None:
+            await self.backend.create_job(job_id, self.worker_id)
+
     def start_job(self, job_id: str, task_coro) -> None:
         """Start an asynchronous task for a given job, replacing any existing active task.
 
@@ -183,6 +218,8 @@ class JobQueueService(Service):
         # Initiate the new asynchronous task.
         task = asyncio.create_task(task_coro)
         self._queues[job_id] = (main_queue, event_manager, task, None)
+        if self.backend is not None and job_id not in self._forwarders:
+            self._forwarders[job_id] = asyncio.create_task(self._forward_events(job_id, main_queue))
         logger.debug(f"New task started for job_id {job_id}")
 
     def get_queue_data(self, job_id: str) -> tuple[asyncio.Queue, EventManager, asyncio.Task | None, float | None]:
@@ -228,6 +265,13 @@ class JobQueueService(Service):
         logger.info(f"Commencing cleanup for job_id {job_id}")
         main_queue, _event_manager, task, _ = self._queues[job_id]
 
+        forwarder = self._forwarders.pop(job_id, None)
+        if forwarder and not forwarder.done() and forwarder is not asyncio.current_task():
+            forwarder.cancel()
+            await asyncio.wait([forwarder])
+            # Readers on other workers would otherwise wait for the end of the events
+            await self._finish_shared_job(job_id, "cancelled")
+
         # Cancel the associated task if it is still running.
         if task and not task.done():
             logger.debug(f"Cancelling active task for job_id {job_id}")
@@ -252,6 +296,98 @@ class JobQueueService(Service):
         self._queues.pop(job_id, None)
         logger.info(f"Cleanup successful for job_id {job_id}: resources have been released.")
 
+    async def read_events(
+        self, job_id: str, cursor: str | None = None, *, timeout: float | None = None
+    ) -> tuple[list[bytes | None], str]:
+        """Read the events of a job from the shared backend.
+
+        Args:
+            job_id (str): Unique identifier for the job.
+            cursor (str | None): Cursor returned by a previous read. If None, continues after the events
+                returned by the last read without a cursor.
+            timeout (float | None): Seconds to wait for an event if there are none yet.
+
+        Returns:
+            tuple[list[bytes | None], str]: The encoded events, with None marking their end, and the cursor
+                of the last one.
+
+        Raises:
+            JobQueueNotFoundError: If the job does not exist.
+            RuntimeError: If the service has no shared backend.
+        """
+        if self.backend is None:
+            msg = "Reading job events requires a shared job queue backend"
+            raise RuntimeError(msg)
+        return await self.backend.read(job_id, cursor, timeout=timeout)
+
+    async def request_cancel(self, job_id: str) -> None:
+        """Ask the worker that runs a job to cancel it.
+
+        Raises:
+            JobQueueNotFoundError: If the job does not exist.
+        """
+        if self.backend is None:
+            raise JobQueueNotFoundError(job_id)
+        await self.backend.request_cancel(job_id)
+
+    async def _forward_events(self, job_id: str, queue: asyncio.Queue) -> None:
+        """Move the events of a job from its local queue to the shared backend, until the end of the events.
+
+        Also cancels the job when another worker asks for it.
+        """
+        loop = asyncio.get_running_loop()
+        last_cancel_check = loop.time()
+        try:
+            while True:
+                items = []
+                try:
+                    items.append(await asyncio.wait_for(queue.get(), timeout=CANCEL_CHECK_INTERVAL))
+                    while len(items) < FORWARD_BATCH_SIZE and not queue.empty():
+                        items.append(queue.get_nowait())
+                except asyncio.TimeoutError:
+                    pass
+
+                events = [(event_id, value) for event_id, value, _ in items if value is not None]
+                if events:
+                    await self.backend.append(job_id, events)
+                if any(value is None for _, value, _ in items):
+                    await self.backend.finish(job_id)
+                    return
+
+                _, _, task, _ = self._queues.get(job_id, (None, None, None, None))
+                if task is not None and task.done() and queue.empty():
+                    # The job ended without sending the end of its events
+                    status = "cancelled" if task.cancelled() else "failed" if task.exception() else "done"
+                    await self.backend.finish(job_id, status)
+                    return
+
+                if loop.time() - last_cancel_check >= CANCEL_CHECK_INTERVAL:
+                    last_cancel_check = loop.time()
+                    if await self.backend.is_cancel_requested(job_id):
+                        logger.info(f"Cancelling job_id {job_id} as requested by another worker")
+                        await self._cancel_job_task(job_id)
+                        await self.backend.finish(job_id, "cancelled")
+                        return
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:  # noqa: BLE001
+            logger.error(f"Error forwarding events for job_id {job_id}: {exc}")
+            await self._finish_shared_job(job_id, "failed")
+
+    async def _cancel_job_task(self, job_id: str) -> None:
+        _, event_manager, task, _ = self._queues[job_id]
+        if task and not task.done():
+            task.cancel()
+            await asyncio.wait([task])
+            event_manager.on_end(data={})
+
+    async def _finish_shared_job(self, job_id: str, status: str) -> None:
+        try:
+            if await self.backend.get_status(job_id) == "running":
+                await self.backend.finish(job_id, status)
+        except Exception as exc:  # noqa: BLE001
+            logger.error(f"Could not mark job_id {job_id} as {status}: {exc}")
+
     async def _periodic_cleanup(self) -> None:
         """Execute a periodic task that cleans up completed or cancelled job queues.
 
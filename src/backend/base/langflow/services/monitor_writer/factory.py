@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from typing_extensions import override
+
+from langflow.services.factory import ServiceFactory
+from langflow.services.monitor_writer.service import MonitorWriterService
+
+if TYPE_CHECKING:
+    from langflow.services.settings.service import SettingsService
+
+
+class MonitorWriterServiceFactory(ServiceFactory):
+    def __init__(self) -> None:
+        super().__init__(MonitorWriterService)
+
+    @override
+    def create(self, settings_service: SettingsService):
+        return MonitorWriterService(settings_service)
@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import TYPE_CHECKING
+
+from loguru import logger
+
+from langflow.services.base import Service
+from langflow.services.database.models.transactions.crud import log_transactions, prune_transactions
+from langflow.services.database.models.transactions.model import TransactionBase
+from langflow.services.database.models.vertex_builds.crud import log_vertex_builds, prune_vertex_builds
+from langflow.services.database.models.vertex_builds.model import VertexBuildBase
+from langflow.services.database.utils import session_getter
+from langflow.services.deps import get_db_service, get_telemetry_service
+
+if TYPE_CHECKING:
+    from langflow.services.settings.service import SettingsService
+
+
+class MonitorWriterService(Service):
+    """Write-behind buffer for vertex builds and transactions.
+
+    When `monitor_write_behind` is enabled, rows are queued instead of being written as they
+    are produced. A worker writes them with one bulk insert per batch, either when
+    `monitor_write_behind_batch_size` rows are waiting or when the oldest one has waited
+    `monitor_write_behind_flush_interval` seconds. Retention, which would otherwise run with
+    every insert, is applied by a compaction task every `monitor_compaction_interval` seconds.
+
+    The queue is bounded by `monitor_write_behind_max_queue_size`. Rows that do not fit are
+    dropped and counted, so that monitoring never holds up the flows themselves.
+    """
+
+    name = "monitor_writer_service"
+
+    def __init__(self, settings_service: SettingsService):
+        super().__init__()
+        settings = settings_service.settings
+        self.enabled = settings.monitor_write_behind
+        self.batch_size = max(1, settings.monitor_write_behind_batch_size)
+        self.flush_interval = settings.monitor_write_behind_flush_interval
+        self.compaction_interval = settings.monitor_compaction_interval
+        self.queue: asyncio.Queue[VertexBuildBase | TransactionBase] = asyncio.Queue(
+            maxsize=settings.monitor_write_behind_max_queue_size
+        )
+        self.written = 0
+        self.dropped = 0
+        self.failed = 0
+        self.batches = 0
+        self.last_compaction: float | None = None
+        self._worker_task: asyncio.Task | None = None
+        self._compaction_task: asyncio.Task | None = None
+        self._closed = False
+
+    def is_started(self) -> bool:
+        return self._worker_task is not None
+
+    def start(self) -> None:
+        if not self.enabled or self.is_started():
+            return
+        self._closed = False
+        self._worker_task = asyncio.create_task(self._write_worker())
+        self._compaction_task = asyncio.create_task(self._periodic_compaction())
+        logger.debug("MonitorWriterService started")
+
+    def enqueue(self, row: VertexBuildBase | TransactionBase) -> bool:
+        """Queue a vertex build or transaction to be written.
+
+        Returns:
+            bool: False if the row was dropped because the service is stopped or the queue is full.
+        """
+        if self._closed:
+            self.dropped += 1
+            return False
+        if not self.is_started():
+            self.start()
+        try:
+            self.queue.put_nowait(row)
+        except asyncio.QueueFull:
+            self.dropped += 1
+            logger.warning("Monitor write-behind queue is full, dropping a row")
+            return False
+        return True
+
+    def stats(self) -> dict[str, int | float | bool | None]:
+        return {
+            "enabled": self.enabled,
+            "queue_depth": self.queue.qsize(),
+            "max_queue_size": self.queue.maxsize,
+            "written": self.written,
+            "dropped": self.dropped,
+            "failed": self.failed,
+            "batches": self.batches,
+            "last_compaction": self.last_compaction,
+        }
+
+    async def flush(self) -> None:
+        """Wait until every queued row has been written."""
+        if self.is_started():
+            await self.queue.join()
+
+    async def compact(self) -> None:
+        """Apply the retention limits to vertex builds and transactions."""
+        async with session_getter(get_db_service()) as session:
+            await prune_vertex_builds(session)
+            await prune_transactions(session)
+        self.last_compaction = time.time()
+
+    async def _write_worker(self) -> None:
+        while True:
+            batch = [await self.queue.get()]
+            deadline = time.monotonic() + self.flush_interval
+            while len(batch) < self.batch_size:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self.queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            try:
+                await self._write_batch(batch)
+            finally:
+                for _ in batch:
+                    self.queue.task_done()
+
+    async def _write_batch(self, batch: list[VertexBuildBase | TransactionBase]) -> None:
+        vertex_builds = [row for row in batch if isinstance(row, VertexBuildBase)]
+        transactions = [row for row in batch if isinstance(row, TransactionBase)]
+        for table, rows, log_rows in (
+            ("vertex_build", vertex_builds, log_vertex_builds),
+            ("transaction", transactions, log_transactions),
+        ):
+            if not rows:
+                continue
+            started = time.perf_counter()
+            try:
+                async with session_getter(get_db_service()) as session:
+                    await log_rows(session, rows)
+            except Exception:  # noqa: BLE001
+                self.failed += len(rows)
+                logger.exception(f"Error writing a batch of {len(rows)} monitor rows")
+            else:
+                self.written += len(rows)
+                self.batches += 1
+                get_telemetry_service().record_db_write(table, time.perf_counter() - started)
+
+    async def _periodic_compaction(self) -> None:
+        while True:
+            await asyncio.sleep(self.compaction_interval)
+            try:
+                await self.compact()
+            except Exception:  # noqa: BLE001
+                logger.exception("Error compacting vertex builds and transactions")
+
+    async def stop(self) -> None:
+        """Stop accepting rows, write the ones already queued and cancel the background tasks."""
+        self._closed = True
+        if self._worker_task is not None:
+            try:
+                await asyncio.wait_for(self.flush(), timeout=max(self.flush_interval * 5, 5))
+            except asyncio.TimeoutError:
+                logger.warning(f"Dropping {self.queue.qsize()} unwritten monitor rows on shutdown")
+        for task in (self._worker_task, self._compaction_task):
+            if task is not None:
+                task.cancel()
+                await asyncio.wait([task])
+        self._worker_task = None
+        self._compaction_task = None
+
+    async def teardown(self) -> None:
+        await self.stop()
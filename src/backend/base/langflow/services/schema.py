@@ -20,3 +20,5 @@ class ServiceType(str, Enum):
     TRACING_SERVICE = "tracing_service"
     TELEMETRY_SERVICE = "telemetry_service"
     JOB_QUEUE_SERVICE = "job_queue_service"
+    MONITOR_WRITER_SERVICE = "monitor_writer_service"
+    EXECUTOR_SERVICE = "executor_service"
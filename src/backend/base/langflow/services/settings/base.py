@@ -128,6 +128,9 @@ class Settings(BaseSettings):
     """The cache expire in seconds."""
     variable_store: str = "db"
     """The store can be 'db' or 'kubernetes'."""
+    variable_cache_ttl: float = 10.0
+    """The time in seconds decrypted variables of the 'db' store are cached per user. Changes made through this
+    worker are seen at once, changes made through other workers after at most this delay. 0 disables the cache."""
 
     prometheus_enabled: bool = False
     """If set to True, Langflow will expose Prometheus metrics."""
@@ -146,6 +149,13 @@ class Settings(BaseSettings):
     redis_db: int = 0
     redis_url: str | None = None
     redis_cache_expire: int = 3600
+    job_queue_backend: Literal["memory", "redis"] = "memory"
+    """Where build jobs keep their events. With 'redis', which uses the redis settings above, any worker can serve
+    the events of any job, so polling and streaming also work with several workers."""
+    job_queue_retention: int = 3600
+    """The time in seconds the events of a build job are kept after its last event, with the 'redis' backend."""
+    job_queue_max_events: int = 10000
+    """The approximate maximum number of events kept per build job, with the 'redis' backend."""
 
     # Sentry
     sentry_dsn: str | None = None
@@ -220,6 +230,23 @@ class Settings(BaseSettings):
     """The maximum number of vertex builds to keep in the database."""
     max_vertex_builds_per_vertex: int = 2
     """The maximum number of builds to keep per vertex. Older builds will be deleted."""
+    monitor_write_behind: bool = False
+    """If set to True, vertex builds and transactions are buffered and written to the database in batches."""
+    monitor_write_behind_batch_size: int = 100
+    """The maximum number of buffered vertex builds and transactions written in one batch."""
+    monitor_write_behind_flush_interval: float = 1.0
+    """The maximum time in seconds a vertex build or transaction waits in the buffer before it is written."""
+    monitor_write_behind_max_queue_size: int = 10000
+    """The maximum number of buffered vertex builds and transactions. Further ones are dropped."""
+    monitor_compaction_interval: int = 60
+    """The interval in seconds at which old vertex builds and transactions are deleted in write-behind mode."""
+    component_executors: dict[str, int] = {}
+    """Named thread pools for the synchronous outputs of components, mapping the pool name to its number of threads."""
+    component_executor_overrides: dict[str, str] = {}
+    """The pool that runs the synchronous outputs of a component, keyed by component class name or by
+    `ComponentName.output_name`. `process` selects the process pool."""
+    component_process_pool_size: int | None = None
+    """The number of worker processes of the `process` pool. Defaults to the number of CPUs."""
     webhook_polling_interval: int = 5000
     """The polling interval for the webhook in ms."""
     fs_flows_polling_interval: int = 10000
@@ -234,6 +261,8 @@ class Settings(BaseSettings):
     """If set to False, Langflow will not enable the MCP server."""
     mcp_server_enable_progress_notifications: bool = False
     """If set to False, Langflow will not send progress notifications in the MCP server."""
+    mcp_server_tools_page_size: int = Field(default=100, gt=0)
+    """Number of tools returned per page by the list_tools requests of the MCP servers."""
 
     # Public Flow Settings
     public_flow_cleanup_interval: int = Field(default=3600, gt=600)
@@ -247,14 +276,36 @@ class Settings(BaseSettings):
     lazy_load_components: bool = False
     """If set to True, Langflow will only partially load components at startup and fully load them on demand.
     This significantly reduces startup time but may cause a slight delay when a component is first used."""
+    components_index_path: str | None = None
+    """Path of a file in which the built component templates are kept between restarts. If set, startup
+    only rebuilds the component files that changed since the index was written. The index is discarded
+    when the langflow version changes."""
+    graph_execution_mode: Literal["layered", "dataflow"] = "layered"
+    """How vertices are scheduled when running a graph. 'layered' waits for a whole layer of vertices
+    to finish before starting the next one. 'dataflow' starts each vertex as soon as all of its
+    predecessors are built, so a slow vertex does not stall independent branches."""
+    graph_max_concurrency: int = Field(default=0, ge=0)
+    """The maximum number of vertices built at the same time in 'dataflow' mode. 0 means unlimited."""
+    batch_run_max_concurrency: int = Field(default=8, ge=0)
+    """The maximum number of inputs of a batch run that run at the same time. 0 means unlimited."""
+    batch_run_max_inputs: int = Field(default=1000, gt=0)
+    """The maximum number of inputs accepted by a single batch run request."""
+    vertex_memoization: bool = False
+    """If set to True, the results of components that do not depend on the inputs of a run are reused
+    across runs while their parameters, code and upstream components stay the same. Opt-in, since a
+    custom component that reads anything besides its parameters must set `memoizable = False`."""
+    vertex_memoization_max_size: int = Field(default=256, ge=0)
+    """The maximum number of memoized component results. The least recently used ones are evicted first."""
+    vertex_memoization_ttl: int = Field(default=3600, ge=0)
+    """Seconds a memoized component result is reused for. 0 means until it is evicted."""
 
     @field_validator("event_delivery", mode="before")
     @classmethod
     def set_event_delivery(cls, value, info):
         # If workers > 1, we need to use direct delivery
         # because polling and streaming are not supported
-        # in multi-worker environments
-        if info.data.get("workers", 1) > 1:
+        # in multi-worker environments, unless the workers share the job queue
+        if info.data.get("workers", 1) > 1 and info.data.get("job_queue_backend", "memory") == "memory":
             logger.warning("Multi-worker environment detected, using direct event delivery")
             return "direct"
         return value
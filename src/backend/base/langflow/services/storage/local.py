@@ -1,8 +1,16 @@
+from __future__ import annotations
+
+import uuid
+from typing import TYPE_CHECKING
+
 import anyio
 from aiofile import async_open
 from loguru import logger
 
-from .service import StorageService
+from .service import DEFAULT_CHUNK_SIZE, StorageService
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterable, AsyncIterator
 
 
 class LocalStorageService(StorageService):
@@ -67,6 +75,81 @@ class LocalStorageService(StorageService):
         logger.debug(f"File {file_name} retrieved successfully from flow {flow_id}.")
         return content
 
+    async def save_file_stream(self, flow_id: str, file_name: str, chunks: AsyncIterable[bytes]) -> int:
+        """Save a file in the local storage chunk by chunk.
+
+        The chunks are written to a temporary file that replaces the file once complete, so a
+        failed upload never leaves a truncated file behind.
+
+        Args:
+            flow_id: The identifier for the flow.
+            file_name: The name of the file to be saved.
+            chunks: The byte content of the file, in chunks.
+
+        Returns:
+            The size of the file.
+        """
+        folder_path = self.data_dir / flow_id
+        await folder_path.mkdir(parents=True, exist_ok=True)
+        file_path = folder_path / file_name
+        partial_path = folder_path / f".{file_name}.{uuid.uuid4().hex}.part"
+
+        size = 0
+        try:
+            async with async_open(str(partial_path), "wb") as f:
+                async for chunk in chunks:
+                    await f.write(chunk)
+                    size += len(chunk)
+            await partial_path.replace(file_path)
+            logger.info(f"File {file_name} saved successfully in flow {flow_id}.")
+        except BaseException:
+            logger.exception(f"Error saving file {file_name} in flow {flow_id}")
+            await partial_path.unlink(missing_ok=True)
+            raise
+        return size
+
+    async def get_file_stream(
+        self,
+        flow_id: str,
+        file_name: str,
+        *,
+        start: int = 0,
+        end: int | None = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> AsyncIterator[bytes]:
+        """Read a file from the local storage chunk by chunk.
+
+        Args:
+            flow_id: The identifier for the flow.
+            file_name: The name of the file to be retrieved.
+            start: The offset of the first byte to read.
+            end: The offset of the last byte to read, the end of the file if None.
+            chunk_size: The maximum size of the chunks.
+
+        Raises:
+            FileNotFoundError: If the file does not exist.
+        """
+        file_path = self.data_dir / flow_id / file_name
+        if not await file_path.exists():
+            logger.warning(f"File {file_name} not found in flow {flow_id}.")
+            msg = f"File {file_name} not found in flow {flow_id}"
+            raise FileNotFoundError(msg)
+
+        remaining = None if end is None else end + 1 - start
+        async with async_open(str(file_path), "rb") as f:
+            f.seek(start)
+            while remaining is None or remaining > 0:
+                chunk = await f.read(chunk_size if remaining is None else min(chunk_size, remaining))
+                if not chunk:
+                    break
+                if remaining is not None:
+                    remaining -= len(chunk)
+                yield chunk
+
+    def get_local_path(self, flow_id: str, file_name: str) -> anyio.Path:
+        """Return the path of a file in the local storage."""
+        return self.data_dir / flow_id / file_name
+
     async def list_files(self, flow_id: str):
         """List all files in a specified flow.
 
@@ -90,7 +173,7 @@ class LocalStorageService(StorageService):
         files = [
             file.name
             async for file in await anyio.to_thread.run_sync(folder_path.iterdir)
-            if await anyio.Path(file).is_file()
+            if await anyio.Path(file).is_file() and not _is_partial_file(file.name)
         ]
 
         logger.info(f"Listed {len(files)} files in flow {flow_id}.")
@@ -113,7 +196,7 @@ class LocalStorageService(StorageService):
         """Perform any cleanup operations when the service is being torn down."""
         # No specific teardown actions required for local
 
-    async def get_file_size(self, flow_id: str, file_name: str) -> None:
+    async def get_file_size(self, flow_id: str, file_name: str) -> int:
         """Get the size of a file in the local storage."""
         # Get the file size from the file path
         file_path = self.data_dir / flow_id / file_name
@@ -124,3 +207,8 @@ class LocalStorageService(StorageService):
 
         file_size_stat = await file_path.stat()
         return file_size_stat.st_size
+
+
+def _is_partial_file(file_name: str) -> bool:
+    # Files that are still being written by save_file_stream
+    return file_name.startswith(".") and file_name.endswith(".part")
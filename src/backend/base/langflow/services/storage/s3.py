@@ -1,8 +1,21 @@
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+
 import boto3
 from botocore.exceptions import ClientError, NoCredentialsError
 from loguru import logger
 
-from .service import StorageService
+from langflow.utils.async_helpers import iterate_in_thread
+
+from .service import DEFAULT_CHUNK_SIZE, StorageService
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterable, AsyncIterator
+
+MULTIPART_PART_SIZE = 8 * 1024 * 1024
+"""Size of the parts of streamed uploads, S3 requires at least 5 MiB for all but the last one."""
 
 
 class S3StorageService(StorageService):
@@ -57,6 +70,116 @@ class S3StorageService(StorageService):
             logger.exception(f"Error retrieving file {file_name} from folder {folder}")
             raise
 
+    async def save_file_stream(self, flow_id: str, file_name: str, chunks: AsyncIterable[bytes]) -> int:
+        """Save a file to the S3 bucket with a multipart upload, one part in memory at a time.
+
+        Files smaller than a part are saved with a single request.
+
+        Args:
+            flow_id: The folder in the bucket to save the file.
+            file_name: The name of the file to be saved.
+            chunks: The byte content of the file, in chunks.
+
+        Returns:
+            The size of the file.
+        """
+        key = f"{flow_id}/{file_name}"
+        buffer = bytearray()
+        parts: list[dict] = []
+        upload_id = None
+        size = 0
+        try:
+            async for chunk in chunks:
+                buffer.extend(chunk)
+                size += len(chunk)
+                if len(buffer) < MULTIPART_PART_SIZE:
+                    continue
+                if upload_id is None:
+                    response = await asyncio.to_thread(
+                        self.s3_client.create_multipart_upload, Bucket=self.bucket, Key=key
+                    )
+                    upload_id = response["UploadId"]
+                parts.append(await self._upload_part(key, upload_id, len(parts) + 1, bytes(buffer)))
+                buffer.clear()
+
+            if upload_id is None:
+                await asyncio.to_thread(self.s3_client.put_object, Bucket=self.bucket, Key=key, Body=bytes(buffer))
+            else:
+                if buffer:
+                    parts.append(await self._upload_part(key, upload_id, len(parts) + 1, bytes(buffer)))
+                await asyncio.to_thread(
+                    self.s3_client.complete_multipart_upload,
+                    Bucket=self.bucket,
+                    Key=key,
+                    UploadId=upload_id,
+                    MultipartUpload={"Parts": parts},
+                )
+            logger.info(f"File {file_name} saved successfully in folder {flow_id}.")
+        except BaseException:
+            logger.exception(f"Error saving file {file_name} in folder {flow_id}")
+            if upload_id is not None:
+                await asyncio.to_thread(
+                    self.s3_client.abort_multipart_upload, Bucket=self.bucket, Key=key, UploadId=upload_id
+                )
+            raise
+        return size
+
+    async def _upload_part(self, key: str, upload_id: str, part_number: int, data: bytes) -> dict:
+        response = await asyncio.to_thread(
+            self.s3_client.upload_part,
+            Bucket=self.bucket,
+            Key=key,
+            UploadId=upload_id,
+            PartNumber=part_number,
+            Body=data,
+        )
+        return {"ETag": response["ETag"], "PartNumber": part_number}
+
+    async def get_file_stream(
+        self,
+        flow_id: str,
+        file_name: str,
+        *,
+        start: int = 0,
+        end: int | None = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> AsyncIterator[bytes]:
+        """Read a file, or a range of it, from the S3 bucket chunk by chunk.
+
+        Args:
+            flow_id: The folder in the bucket where the file is stored.
+            file_name: The name of the file to be retrieved.
+            start: The offset of the first byte to read.
+            end: The offset of the last byte to read, the end of the file if None.
+            chunk_size: The maximum size of the chunks.
+        """
+        kwargs = {"Bucket": self.bucket, "Key": f"{flow_id}/{file_name}"}
+        if start or end is not None:
+            kwargs["Range"] = f"bytes={start}-{'' if end is None else end}"
+        try:
+            response = await asyncio.to_thread(self.s3_client.get_object, **kwargs)
+        except ClientError:
+            logger.exception(f"Error retrieving file {file_name} from folder {flow_id}")
+            raise
+
+        body = response["Body"]
+        try:
+            async for chunk in iterate_in_thread(body.iter_chunks(chunk_size)):
+                yield chunk
+        finally:
+            body.close()
+
+    async def get_file_size(self, flow_id: str, file_name: str) -> int:
+        """Get the size of a file in the S3 bucket without downloading it."""
+        try:
+            response = await asyncio.to_thread(
+                self.s3_client.head_object, Bucket=self.bucket, Key=f"{flow_id}/{file_name}"
+            )
+        except ClientError:
+            logger.exception(f"Error retrieving the size of file {file_name} from folder {flow_id}")
+            raise
+        return response["ContentLength"]
+
     async def list_files(self, folder: str):
         """List all files in a specified folder of the S3 bucket.
 
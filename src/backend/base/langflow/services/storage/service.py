@@ -8,10 +8,16 @@ import anyio
 from langflow.services.base import Service
 
 if TYPE_CHECKING:
+    from collections.abc import AsyncIterable, AsyncIterator
+
     from langflow.services.session.service import SessionService
     from langflow.services.settings.service import SettingsService
 
 
+DEFAULT_CHUNK_SIZE = 64 * 1024
+"""Size of the chunks in which files are read and written, in bytes."""
+
+
 class StorageService(Service):
     name = "storage_service"
 
@@ -43,5 +49,44 @@ class StorageService(Service):
     async def delete_file(self, flow_id: str, file_name: str) -> None:
         raise NotImplementedError
 
+    async def get_file_size(self, flow_id: str, file_name: str) -> int:
+        return len(await self.get_file(flow_id, file_name))
+
+    async def get_file_stream(
+        self,
+        flow_id: str,
+        file_name: str,
+        *,
+        start: int = 0,
+        end: int | None = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> AsyncIterator[bytes]:
+        """Yield the bytes of a file from `start` to `end`, inclusive, in chunks.
+
+        Storages that can read part of a file should override this, the default reads the
+        whole file into memory.
+        """
+        content = await self.get_file(flow_id, file_name)
+        stop = len(content) if end is None else min(end + 1, len(content))
+        for offset in range(start, stop, chunk_size):
+            yield content[offset : min(offset + chunk_size, stop)]
+
+    async def save_file_stream(self, flow_id: str, file_name: str, chunks: AsyncIterable[bytes]) -> int:
+        """Save a file from an iterable of chunks and return its size.
+
+        Storages that can write a file in parts should override this, the default collects
+        the chunks in memory.
+        """
+        data = b"".join([chunk async for chunk in chunks])
+        await self.save_file(flow_id, file_name, data)
+        return len(data)
+
+    def get_local_path(self, flow_id: str, file_name: str) -> anyio.Path | None:  # noqa: ARG002
+        """Return the path of a file on the local filesystem, or None if it is stored elsewhere.
+
+        A file with a local path can be sent without reading it, and opened by components directly.
+        """
+        return None
+
     async def teardown(self) -> None:
         raise NotImplementedError
@@ -3,3 +3,35 @@ from langflow.services.storage.constants import EXTENSION_TO_CONTENT_TYPE
 
 def build_content_type_from_extension(extension: str):
     return EXTENSION_TO_CONTENT_TYPE.get(extension.lower(), "application/octet-stream")
+
+
+def parse_range_header(range_header: str | None, file_size: int) -> tuple[int, int] | None:
+    """Parse a single byte range of an HTTP Range header into inclusive offsets.
+
+    Returns None if the header is missing, malformed or asks for several ranges, in which case
+    the whole file is sent.
+
+    Raises:
+        ValueError: If the range starts past the end of the file.
+    """
+    if not range_header or not range_header.startswith("bytes=") or "," in range_header:
+        return None
+    first, _, last = range_header.removeprefix("bytes=").strip().partition("-")
+    if not (first or last) or not (first or "0").isdigit() or not (last or "0").isdigit():
+        return None
+
+    if not first:
+        # A suffix range, the last bytes of the file
+        if int(last) == 0 or file_size == 0:
+            msg = f"Range {range_header} is not satisfiable for a file of {file_size} bytes"
+            raise ValueError(msg)
+        return max(0, file_size - int(last)), file_size - 1
+
+    start = int(first)
+    end = min(int(last), file_size - 1) if last else file_size - 1
+    if last and int(last) < start:
+        return None
+    if start >= file_size:
+        msg = f"Range {range_header} is not satisfiable for a file of {file_size} bytes"
+        raise ValueError(msg)
+    return start, end
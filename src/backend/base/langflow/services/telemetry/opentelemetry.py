@@ -34,6 +34,14 @@ class MetricType(Enum):
 mandatory_label = True
 optional_label = False
 
+MAX_LABEL_VALUES = 100
+"""Distinct values kept per label of a bounded metric, further values are reported as OVERFLOW_LABEL_VALUE."""
+
+OVERFLOW_LABEL_VALUE = "other"
+
+DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 300.0)
+"""Histogram buckets for durations in seconds, from a cheap component to a long LLM call."""
+
 
 class ObservableGaugeWrapper:
     """Wrapper class for ObservableGauge.
@@ -66,6 +74,8 @@ class Metric:
         metric_type: MetricType,
         labels: dict[str, bool],
         unit: str = "",
+        max_label_values: int | None = None,
+        buckets: tuple[float, ...] | None = None,
     ):
         self.name = name
         self.description = description
@@ -74,6 +84,10 @@ class Metric:
         self.labels = labels
         self.mandatory_labels = [label for label, required in labels.items() if required]
         self.allowed_labels = list(labels.keys())
+        self.max_label_values = max_label_values
+        self.buckets = buckets
+        self._label_values: dict[str, set[str]] = {}
+        self._label_values_lock = threading.Lock()
 
     def validate_labels(self, labels: Mapping[str, str]) -> None:
         """Validate if the labels provided are valid."""
@@ -86,6 +100,25 @@ class Metric:
             msg = f"Missing required labels: {missing_labels}"
             raise ValueError(msg)
 
+    def bound_labels(self, labels: Mapping[str, str]) -> Mapping[str, str]:
+        """Replace the label values seen after the first `max_label_values` ones with OVERFLOW_LABEL_VALUE.
+
+        This keeps the number of exported time series bounded when a label comes from user data,
+        such as the type of a custom component.
+        """
+        if self.max_label_values is None:
+            return labels
+        bounded = {}
+        with self._label_values_lock:
+            for label, value in labels.items():
+                seen = self._label_values.setdefault(label, set())
+                if value not in seen and len(seen) >= self.max_label_values:
+                    value = OVERFLOW_LABEL_VALUE  # noqa: PLW2901
+                else:
+                    seen.add(value)
+                bounded[label] = value
+        return bounded
+
     def __repr__(self) -> str:
         return f"Metric(name='{self.name}', description='{self.description}', type={self.type}, unit='{self.unit}')"
 
@@ -113,9 +146,24 @@ class OpenTelemetry(metaclass=ThreadSafeSingletonMetaUsingWeakref):
     prometheus_enabled: bool = True
 
     def _add_metric(
-        self, name: str, description: str, unit: str, metric_type: MetricType, labels: dict[str, bool]
+        self,
+        name: str,
+        description: str,
+        unit: str,
+        metric_type: MetricType,
+        labels: dict[str, bool],
+        max_label_values: int | None = None,
+        buckets: tuple[float, ...] | None = None,
     ) -> None:
-        metric = Metric(name=name, description=description, metric_type=metric_type, unit=unit, labels=labels)
+        metric = Metric(
+            name=name,
+            description=description,
+            metric_type=metric_type,
+            unit=unit,
+            labels=labels,
+            max_label_values=max_label_values,
+            buckets=buckets,
+        )
         self._metrics_registry[name] = metric
         if labels is None or len(labels) == 0:
             msg = "Labels must be provided for the metric upon registration"
@@ -140,6 +188,73 @@ class OpenTelemetry(metaclass=ThreadSafeSingletonMetaUsingWeakref):
             metric_type=MetricType.COUNTER,
             labels={"flow_id": mandatory_label},
         )
+        self._add_metric(
+            name="vertex_build_duration",
+            description="The time taken to build a vertex",
+            unit="s",
+            metric_type=MetricType.HISTOGRAM,
+            labels={"component": mandatory_label, "status": mandatory_label},
+            max_label_values=MAX_LABEL_VALUES,
+            buckets=DURATION_BUCKETS,
+        )
+        self._add_metric(
+            name="component_queue_wait",
+            description="The time a synchronous component output waited for a worker",
+            unit="s",
+            metric_type=MetricType.HISTOGRAM,
+            labels={"component": mandatory_label},
+            max_label_values=MAX_LABEL_VALUES,
+            buckets=DURATION_BUCKETS,
+        )
+        self._add_metric(
+            name="component_execution_duration",
+            description="The time a synchronous component output ran on a worker",
+            unit="s",
+            metric_type=MetricType.HISTOGRAM,
+            labels={"component": mandatory_label},
+            max_label_values=MAX_LABEL_VALUES,
+            buckets=DURATION_BUCKETS,
+        )
+        self._add_metric(
+            name="cache_requests",
+            description="The number of lookups of frozen vertex results and compiled component classes",
+            unit="",
+            metric_type=MetricType.COUNTER,
+            labels={"cache": mandatory_label, "result": mandatory_label},
+        )
+        self._add_metric(
+            name="event_queue_depth",
+            description="The number of build events waiting in the queue when one is sent to the client",
+            unit="",
+            metric_type=MetricType.HISTOGRAM,
+            labels={"delivery": mandatory_label},
+            buckets=(0, 1, 2, 5, 10, 25, 50, 100, 250, 500, 1000),
+        )
+        self._add_metric(
+            name="db_write_duration",
+            description="The time taken to write messages and monitoring rows to the database",
+            unit="s",
+            metric_type=MetricType.HISTOGRAM,
+            labels={"table": mandatory_label},
+            buckets=DURATION_BUCKETS,
+        )
+        self._add_metric(
+            name="streamed_tokens",
+            description="The number of tokens streamed by components",
+            unit="",
+            metric_type=MetricType.COUNTER,
+            labels={"component": mandatory_label},
+            max_label_values=MAX_LABEL_VALUES,
+        )
+        self._add_metric(
+            name="token_stream_rate",
+            description="The number of tokens per second of a streamed message",
+            unit="1/s",
+            metric_type=MetricType.HISTOGRAM,
+            labels={"component": mandatory_label},
+            max_label_values=MAX_LABEL_VALUES,
+            buckets=(1, 5, 10, 25, 50, 100, 250, 500, 1000),
+        )
 
     def __init__(self, *, prometheus_enabled: bool = True):
         # Only initialize once
@@ -154,8 +269,8 @@ class OpenTelemetry(metaclass=ThreadSafeSingletonMetaUsingWeakref):
             # Get existing meter provider if any
             existing_provider = metrics.get_meter_provider()
 
-            # Check if FastAPI instrumentation is already set up
-            if hasattr(existing_provider, "get_meter") and existing_provider.get_meter("http.server"):
+            # Reuse a provider that was already configured, the default one is a proxy that exports nothing
+            if isinstance(existing_provider, MeterProvider):
                 self._meter_provider = existing_provider
             else:
                 resource = Resource.create({"service.name": "langflow"})
@@ -205,19 +320,21 @@ class OpenTelemetry(metaclass=ThreadSafeSingletonMetaUsingWeakref):
                 name=metric.name,
                 unit=metric.unit,
                 description=metric.description,
+                explicit_bucket_boundaries_advisory=metric.buckets,
             )
         msg = f"Unknown metric type: {metric.type}"
         raise ValueError(msg)
 
-    def validate_labels(self, metric_name: str, labels: Mapping[str, str]) -> None:
+    def validate_labels(self, metric_name: str, labels: Mapping[str, str]) -> Mapping[str, str]:
         reg = self._metrics_registry.get(metric_name)
         if reg is None:
             msg = f"Metric '{metric_name}' is not registered"
             raise ValueError(msg)
         reg.validate_labels(labels)
+        return reg.bound_labels(labels)
 
     def increment_counter(self, metric_name: str, labels: Mapping[str, str], value: float = 1.0) -> None:
-        self.validate_labels(metric_name, labels)
+        labels = self.validate_labels(metric_name, labels)
         counter = self._metrics.get(metric_name)
         if isinstance(counter, Counter):
             counter.add(value, labels)
@@ -226,7 +343,7 @@ class OpenTelemetry(metaclass=ThreadSafeSingletonMetaUsingWeakref):
             raise TypeError(msg)
 
     def up_down_counter(self, metric_name: str, value: float, labels: Mapping[str, str]) -> None:
-        self.validate_labels(metric_name, labels)
+        labels = self.validate_labels(metric_name, labels)
         up_down_counter = self._metrics.get(metric_name)
         if isinstance(up_down_counter, UpDownCounter):
             up_down_counter.add(value, labels)
@@ -235,7 +352,7 @@ class OpenTelemetry(metaclass=ThreadSafeSingletonMetaUsingWeakref):
             raise TypeError(msg)
 
     def update_gauge(self, metric_name: str, value: float, labels: Mapping[str, str]) -> None:
-        self.validate_labels(metric_name, labels)
+        labels = self.validate_labels(metric_name, labels)
         gauge = self._metrics.get(metric_name)
         if isinstance(gauge, ObservableGaugeWrapper):
             gauge.set_value(value, labels)
@@ -244,7 +361,7 @@ class OpenTelemetry(metaclass=ThreadSafeSingletonMetaUsingWeakref):
             raise TypeError(msg)
 
     def observe_histogram(self, metric_name: str, value: float, labels: Mapping[str, str]) -> None:
-        self.validate_labels(metric_name, labels)
+        labels = self.validate_labels(metric_name, labels)
         histogram = self._metrics.get(metric_name)
         if isinstance(histogram, Histogram):
             histogram.record(value, labels)
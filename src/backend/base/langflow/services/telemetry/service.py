@@ -119,6 +119,29 @@ class TelemetryService(Service):
     async def log_package_component(self, payload: ComponentPayload) -> None:
         await self._queue_event((self.send_telemetry_data, payload, "component"))
 
+    def record_vertex_build(self, component: str, duration: float, *, status: str) -> None:
+        self.ot.observe_histogram("vertex_build_duration", duration, {"component": component, "status": status})
+
+    def record_component_execution(self, component: str, queue_wait: float, execution: float) -> None:
+        labels = {"component": component}
+        self.ot.observe_histogram("component_queue_wait", queue_wait, labels)
+        self.ot.observe_histogram("component_execution_duration", execution, labels)
+
+    def record_cache_request(self, cache: str, *, hit: bool) -> None:
+        self.ot.increment_counter("cache_requests", {"cache": cache, "result": "hit" if hit else "miss"})
+
+    def record_event_queue_depth(self, depth: int, *, delivery: str) -> None:
+        self.ot.observe_histogram("event_queue_depth", depth, {"delivery": delivery})
+
+    def record_db_write(self, table: str, duration: float) -> None:
+        self.ot.observe_histogram("db_write_duration", duration, {"table": table})
+
+    def record_token_stream(self, component: str, tokens: int, duration: float) -> None:
+        labels = {"component": component}
+        self.ot.increment_counter("streamed_tokens", labels, value=tokens)
+        if tokens and duration > 0:
+            self.ot.observe_histogram("token_stream_rate", tokens / duration, labels)
+
     def start(self) -> None:
         if self.running or self.do_not_track:
             return
@@ -142,6 +142,12 @@ async def teardown_services() -> None:
         await service_manager.teardown()
     except Exception as exc:  # noqa: BLE001
         logger.exception(exc)
+    try:
+        from langflow.base.onlyoffice.docspace.client.base.transport import default_transport
+
+        await default_transport.aclose_all()
+    except Exception as exc:  # noqa: BLE001
+        logger.exception(exc)
 
 
 def initialize_settings_service() -> None:
@@ -1,4 +1,5 @@
 import abc
+from collections.abc import Sequence
 from uuid import UUID
 
 from sqlmodel.ext.asyncio.session import AsyncSession
@@ -35,6 +36,28 @@ class VariableService(Service):
             The value of the variable.
         """
 
+    def get_cached_variable(self, user_id: UUID | str, name: str, field: str) -> str | None:  # noqa: ARG002
+        """Get a variable value without querying the store, if it was recently loaded.
+
+        Args:
+            user_id: The user ID.
+            name: The name of the variable.
+            field: The field of the variable.
+
+        Returns:
+            The value of the variable, or None if it is not cached.
+        """
+        return None
+
+    async def prefetch_variables(self, user_id: UUID | str, names: Sequence[str], session: AsyncSession) -> None:
+        """Load the values of several variables at once, so that getting them does not query the store again.
+
+        Args:
+            user_id: The user ID.
+            names: The names of the variables.
+            session: The database session.
+        """
+
     @abc.abstractmethod
     async def list_variables(self, user_id: UUID | str, session: AsyncSession) -> list[str | None]:
         """List all variables.
@@ -2,10 +2,11 @@ from __future__ import annotations
 
 import os
 from datetime import datetime, timezone
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, NamedTuple
 
+from cachetools import LRUCache, TTLCache
 from loguru import logger
-from sqlmodel import select
+from sqlmodel import col, select
 from typing_extensions import override
 
 from langflow.services.auth import utils as auth_utils
@@ -23,9 +24,100 @@ if TYPE_CHECKING:
     from langflow.services.settings.service import SettingsService
 
 
+VARIABLE_CACHE_MAX_USERS = 1024
+"""Number of users whose variables are cached. The least recently used users are evicted first."""
+
+VARIABLE_CACHE_MAX_SIZE = 1024
+"""Number of variables cached per user."""
+
+
+class CachedVariable(NamedTuple):
+    type: str | None
+    value: str | None
+    """The decrypted value, None if the variable does not exist."""
+
+
 class DatabaseVariableService(VariableService, Service):
+    """Stores encrypted variables in the database.
+
+    Decrypted values, and the names of variables that do not exist, are cached per user for
+    `variable_cache_ttl` seconds. Creating, updating or deleting a variable through the service
+    drops the cached values of its user. Expired values are evicted, and so are the users that
+    did not use their variables for the longest time once `VARIABLE_CACHE_MAX_USERS` are cached.
+    """
+
     def __init__(self, settings_service: SettingsService):
         self.settings_service = settings_service
+        self._cache: LRUCache[str, TTLCache[str, CachedVariable]] = LRUCache(maxsize=VARIABLE_CACHE_MAX_USERS)
+
+    def invalidate_cache(self, user_id: UUID | str | None = None) -> None:
+        """Drop the cached variables of a user, or of all users.
+
+        Memoized component results may hold the old values, so they are dropped too.
+        """
+        # Imported here to avoid a circular import through the graph
+        from langflow.graph.graph.memoization import vertex_result_cache
+
+        if user_id is None:
+            self._cache.clear()
+            vertex_result_cache.clear()
+        else:
+            self._cache.pop(str(user_id), None)
+            vertex_result_cache.invalidate_user(str(user_id))
+
+    def _get_cache_entry(self, user_id: UUID | str, name: str) -> CachedVariable | None:
+        variables = self._cache.get(str(user_id))
+        if variables is None:
+            return None
+        variables.expire()
+        if not variables:
+            del self._cache[str(user_id)]
+            return None
+        return variables.get(name)
+
+    async def _load_variables(
+        self, user_id: UUID | str, names: Sequence[str], session: AsyncSession, *, raise_errors: bool = True
+    ) -> dict[str, CachedVariable]:
+        stmt = select(Variable).where(Variable.user_id == user_id, col(Variable.name).in_(names))
+        variables = {variable.name: variable for variable in (await session.exec(stmt)).all()}
+
+        ttl = self.settings_service.settings.variable_cache_ttl
+        entries: dict[str, CachedVariable] = {}
+        for name in names:
+            variable = variables.get(name)
+            if not variable or not variable.value:
+                entries[name] = CachedVariable(None, None)
+                continue
+            try:
+                value = auth_utils.decrypt_api_key(variable.value, settings_service=self.settings_service)
+            except Exception:
+                if raise_errors:
+                    raise
+                logger.opt(exception=True).debug(f"Could not decrypt variable {name}")
+                continue
+            entries[name] = CachedVariable(variable.type, value)
+
+        if ttl > 0:
+            variables = self._cache.get(str(user_id))
+            if variables is None:
+                variables = TTLCache(maxsize=VARIABLE_CACHE_MAX_SIZE, ttl=ttl)
+                self._cache[str(user_id)] = variables
+            variables.update(entries)
+        return entries
+
+    @staticmethod
+    def _resolve(entry: CachedVariable, name: str, field: str) -> str:
+        if entry.value is None:
+            msg = f"{name} variable not found."
+            raise ValueError(msg)
+
+        if entry.type == CREDENTIAL_TYPE and field == "session_id":
+            msg = (
+                f"variable {name} of type 'Credential' cannot be used in a Session ID field "
+                "because its purpose is to prevent the exposure of values."
+            )
+            raise TypeError(msg)
+        return entry.value
 
     async def initialize_user_variables(self, user_id: UUID | str, session: AsyncSession) -> None:
         if not self.settings_service.settings.store_environment_variables:
@@ -54,6 +146,22 @@ class DatabaseVariableService(VariableService, Service):
                 except Exception as e:  # noqa: BLE001
                     logger.exception(f"Error processing {var_name} variable: {e!s}")
 
+    @override
+    def get_cached_variable(self, user_id: UUID | str, name: str, field: str) -> str | None:
+        entry = self._get_cache_entry(user_id, name)
+        if entry is None:
+            return None
+        return self._resolve(entry, name, field)
+
+    @override
+    async def prefetch_variables(self, user_id: UUID | str, names: Sequence[str], session: AsyncSession) -> None:
+        if self.settings_service.settings.variable_cache_ttl <= 0:
+            return
+        missing = [name for name in dict.fromkeys(names) if self._get_cache_entry(user_id, name) is None]
+        if missing:
+            # Variables that cannot be decrypted are left out, get_variable reports their error
+            await self._load_variables(user_id, missing, session, raise_errors=False)
+
     async def get_variable(
         self,
         user_id: UUID | str,
@@ -61,24 +169,10 @@ class DatabaseVariableService(VariableService, Service):
         field: str,
         session: AsyncSession,
     ) -> str:
-        # we get the credential from the database
-        # credential = session.query(Variable).filter(Variable.user_id == user_id, Variable.name == name).first()
-        stmt = select(Variable).where(Variable.user_id == user_id, Variable.name == name)
-        variable = (await session.exec(stmt)).first()
-
-        if not variable or not variable.value:
-            msg = f"{name} variable not found."
-            raise ValueError(msg)
-
-        if variable.type == CREDENTIAL_TYPE and field == "session_id":
-            msg = (
-                f"variable {name} of type 'Credential' cannot be used in a Session ID field "
-                "because its purpose is to prevent the exposure of values."
-            )
-            raise TypeError(msg)
-
-        # we decrypt the value
-        return auth_utils.decrypt_api_key(variable.value, settings_service=self.settings_service)
+        entry = self._get_cache_entry(user_id, name)
+        if entry is None:
+            entry = (await self._load_variables(user_id, [name], session))[name]
+        return self._resolve(entry, name, field)
 
     async def get_all(self, user_id: UUID | str, session: AsyncSession) -> list[VariableRead]:
         stmt = select(Variable).where(Variable.user_id == user_id)
@@ -149,6 +243,7 @@ class DatabaseVariableService(VariableService, Service):
         variable.value = encrypted
         session.add(variable)
         await session.commit()
+        self.invalidate_cache(user_id)
         await session.refresh(variable)
         return variable
 
@@ -173,6 +268,7 @@ class DatabaseVariableService(VariableService, Service):
 
         session.add(db_variable)
         await session.commit()
+        self.invalidate_cache(user_id)
         await session.refresh(db_variable)
         return db_variable
 
@@ -190,6 +286,7 @@ class DatabaseVariableService(VariableService, Service):
             raise ValueError(msg)
         await session.delete(variable)
         await session.commit()
+        self.invalidate_cache(user_id)
 
     @override
     async def delete_variable_by_id(self, user_id: UUID | str, variable_id: UUID, session: AsyncSession) -> None:
@@ -200,6 +297,7 @@ class DatabaseVariableService(VariableService, Service):
             raise ValueError(msg)
         await session.delete(variable)
         await session.commit()
+        self.invalidate_cache(user_id)
 
     async def create_variable(
         self,
@@ -220,5 +318,6 @@ class DatabaseVariableService(VariableService, Service):
         variable = Variable.model_validate(variable_base, from_attributes=True, update={"user_id": user_id})
         session.add(variable)
         await session.commit()
+        self.invalidate_cache(user_id)
         await session.refresh(variable)
         return variable
@@ -214,6 +214,9 @@ class Output(BaseModel):
     tool_mode: bool = Field(default=True)
     """Specifies if the output should be used as a tool"""
 
+    executor: str | None = Field(default=None)
+    """The named pool that runs a synchronous output method. If None, the default thread pool is used."""
+
     def to_dict(self):
         return self.model_dump(by_alias=True, exclude_none=True)
 
@@ -1,5 +1,10 @@
 import asyncio
+import threading
+from collections.abc import AsyncIterator, Iterator
 from contextlib import asynccontextmanager
+from typing import TypeVar
+
+T = TypeVar("T")
 
 if hasattr(asyncio, "timeout"):
 
@@ -26,3 +31,55 @@ def run_until_complete(coro):
         # If there's no event loop, create a new one and run the coroutine
         return asyncio.run(coro)
     return loop.run_until_complete(coro)
+
+
+_DONE = object()
+
+
+async def iterate_in_thread(iterator: Iterator[T], max_buffer: int = 64) -> AsyncIterator[T]:
+    """Consume a blocking iterator in a worker thread and yield its items on the event loop.
+
+    A single worker thread drives the whole iterator, instead of one thread hop per item, so a
+    slow producer never blocks the loop. At most `max_buffer` items are read ahead. Exceptions
+    raised by the iterator are re-raised here.
+    """
+    loop = asyncio.get_running_loop()
+    buffer: asyncio.Queue = asyncio.Queue()
+    slots = threading.Semaphore(max_buffer)
+    stopped = threading.Event()
+
+    def _put(item) -> bool:
+        slots.acquire()
+        if stopped.is_set():
+            return False
+        try:
+            loop.call_soon_threadsafe(buffer.put_nowait, item)
+        except RuntimeError:
+            # The loop is closed, nobody is waiting for items anymore
+            return False
+        return True
+
+    def _produce() -> None:
+        try:
+            for item in iterator:
+                if not _put((item, None)):
+                    return
+        except Exception as exc:  # noqa: BLE001
+            _put((_DONE, exc))
+        else:
+            _put((_DONE, None))
+
+    loop.run_in_executor(None, _produce)
+    try:
+        while True:
+            item, exc = await buffer.get()
+            slots.release()
+            if exc is not None:
+                raise exc
+            if item is _DONE:
+                break
+            yield item
+    finally:
+        stopped.set()
+        # Unblock a producer waiting for room in the buffer
+        slots.release()
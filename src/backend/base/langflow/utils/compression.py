@@ -6,14 +6,29 @@ from fastapi import Response
 from fastapi.encoders import jsonable_encoder
 
 
-def compress_response(data: Any) -> Response:
-    """Compress data and return it as a FastAPI Response with appropriate headers."""
+def compress_data(data: Any) -> bytes:
+    """Serialize data to JSON and gzip it.
+
+    The gzip header carries no timestamp, so equal data always compresses to equal bytes.
+    """
     json_data = json.dumps(jsonable_encoder(data)).encode("utf-8")
+    return gzip.compress(json_data, compresslevel=6, mtime=0)
 
-    compressed_data = gzip.compress(json_data, compresslevel=6)
 
+def compressed_response(compressed_data: bytes, headers: dict[str, str] | None = None) -> Response:
+    """Return already gzipped JSON as a FastAPI Response with appropriate headers."""
     return Response(
         content=compressed_data,
         media_type="application/json",
-        headers={"Content-Encoding": "gzip", "Vary": "Accept-Encoding", "Content-Length": str(len(compressed_data))},
+        headers={
+            "Content-Encoding": "gzip",
+            "Vary": "Accept-Encoding",
+            "Content-Length": str(len(compressed_data)),
+            **(headers or {}),
+        },
     )
+
+
+def compress_response(data: Any) -> Response:
+    """Compress data and return it as a FastAPI Response with appropriate headers."""
+    return compressed_response(compress_data(data))
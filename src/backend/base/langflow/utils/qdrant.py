@@ -1,24 +1,24 @@
+import asyncio
 import os
-
-from typing import Optional, List
-
-from qdrant_client import QdrantClient
-from qdrant_client.models import Distance, VectorParams, Filter
+import threading
+import time
+import uuid
+from collections.abc import Iterator
+from typing import Any
 
 from langchain_community.vectorstores import Qdrant
 from langchain_core.documents import Document
+from langchain_core.embeddings import Embeddings
+from qdrant_client import QdrantClient
+from qdrant_client.models import Distance, Filter, PointStruct, VectorParams
 
 from langflow.io import (
-    MessageInput,
     HandleInput,
+    MessageInput,
 )
 
 qdrant_inputs = [
-    MessageInput(
-        name="collection_name",
-        display_name="Collection Name",
-        required=True
-    ),
+    MessageInput(name="collection_name", display_name="Collection Name", required=True),
     MessageInput(
         name="qdrant_host",
         display_name="Qdrant Host",
@@ -29,87 +29,246 @@ qdrant_inputs = [
         display_name="Qdrant Port",
         required=False,
     ),
-    HandleInput(
-        name="embedding",
-        display_name="Embedding",
-        input_types=["Embeddings"]
-    ),
+    HandleInput(name="embedding", display_name="Embedding", input_types=["Embeddings"]),
 ]
 
+COLLECTION_CACHE_TTL = 60.0
+"""Seconds during which a collection that was found is assumed to still exist."""
+
+POINT_ID_NAMESPACE = uuid.UUID("6f1b9a52-6e4a-4c35-9d7e-2b8f3c0a5d11")
+"""Namespace of the point IDs derived from the id, version and page of a document."""
+
+_clients: dict[tuple[str, int], QdrantClient] = {}
+_clients_lock = threading.Lock()
+_existing_collections: dict[tuple[int, str], float] = {}
+
 
 def check_collection_exists(client: QdrantClient, collection_name: str) -> bool:
-    """Check if collection exists in Qdrant."""
+    """Check if collection exists in Qdrant.
+
+    Collections that exist are remembered for COLLECTION_CACHE_TTL seconds, so that
+    repeated checks against the same collection do not query the server.
+    """
+    key = (id(client), collection_name)
+    checked_at = _existing_collections.get(key)
+    if checked_at is not None and time.monotonic() - checked_at < COLLECTION_CACHE_TTL:
+        return True
+
     try:
-        collections = client.get_collections()
-        return any(collection.name == collection_name for collection in collections.collections)
+        exists = client.collection_exists(collection_name)
     except Exception as e:
-        raise Exception(f"Error checking collections list: {str(e)}")
+        msg = f"Error checking collections list: {e!s}"
+        raise ValueError(msg) from e
+
+    if exists:
+        _existing_collections[key] = time.monotonic()
+    else:
+        _existing_collections.pop(key, None)
+    return exists
 
 
 def create_collection(client: QdrantClient, collection_name: str, vector_size: int) -> bool:
     """Create a new collection in Qdrant."""
     try:
-        # Create new collection
         client.create_collection(
-            collection_name=collection_name,
-            vectors_config=VectorParams(
-                size=vector_size,
-                distance=Distance.COSINE
-            )
+            collection_name=collection_name, vectors_config=VectorParams(size=vector_size, distance=Distance.COSINE)
         )
+    except Exception as e:
+        msg = f"Failed to create collection {collection_name}: {e!s}"
+        raise ValueError(msg) from e
 
-        return True
+    _existing_collections[(id(client), collection_name)] = time.monotonic()
+    return True
 
-    except Exception as e:
-        raise Exception(
-            f"Failed to create collection {collection_name}: {str(e)}")
 
+def get_qdrant_client(host: str | None, port: int | None) -> QdrantClient:
+    """Return the shared client of a Qdrant server.
+
+    Clients are created once per host and port and reused by every component of the
+    process, so that their HTTP connections are kept alive between calls.
+    """
+    # If not provided in inputs, use environment variables
+    qdrant_host = host or os.getenv("HOST_QDRANT_SERVICE", "onlyoffice-qdrant")
+    qdrant_port = port or os.getenv("HOST_QDRANT_PORT", "6333")
 
-def get_qdrant_client(host: Optional[str], port: Optional[int]) -> QdrantClient:
     try:
+        key = (str(qdrant_host), int(qdrant_port))
+        with _clients_lock:
+            client = _clients.get(key)
+            if client is None:
+                client = QdrantClient(
+                    host=key[0],
+                    port=key[1],  # HTTP/REST API port
+                    prefer_grpc=False,  # Use HTTP
+                    timeout=10.0,
+                )
+                _clients[key] = client
+    except Exception as e:
+        msg = f"Error building vector store: {e!s}"
+        raise ValueError(msg) from e
 
-        # Get host and port from inputs or environment variables
-        qdrant_host = host if host else None
-        qdrant_port = port if port else None
+    return client
 
-        # If not provided in inputs, check environment variables
-        if not qdrant_host:
-            qdrant_host = os.getenv(
-                'HOST_QDRANT_SERVICE', 'onlyoffice-qdrant')
 
-        if not qdrant_port:
-            qdrant_port = os.getenv('HOST_QDRANT_PORT', "6333")
+def close_qdrant_clients() -> None:
+    """Close the shared clients and forget the collections that were found."""
+    with _clients_lock:
+        clients = list(_clients.values())
+        _clients.clear()
+        _existing_collections.clear()
+    for client in clients:
+        client.close()
 
-            # Create QdrantClient with HTTP and timeout
-            client = QdrantClient(
-                host=qdrant_host,
-                port=qdrant_port,  # HTTP/REST API port
-                prefer_grpc=False,  # Use HTTP
-                timeout=10.0  # Add timeout
-            )
 
-        return client
+def document_filter(metadata: dict[str, Any], page: int | None = 0) -> Filter:
+    """Filter the points of a document version, by default only its first page."""
+    conditions = [
+        {"key": "metadata.id", "match": {"value": metadata["id"]}},
+        {"key": "metadata.version", "match": {"value": metadata["version"]}},
+    ]
+    if page is not None:
+        conditions.append({"key": "metadata.page", "match": {"value": page}})
+    return Filter(must=conditions)
+
+
+def count_points(client: QdrantClient, collection_name: str, points_filter: Filter | None = None) -> int:
+    """Count the points that match a filter, without loading them."""
+    return client.count(collection_name=collection_name, count_filter=points_filter, exact=True).count
 
-    except Exception as e:
-        raise Exception(f"Error building vector store: {str(e)}")
 
+def document_exists(client: QdrantClient, collection_name: str, metadata: dict[str, Any]) -> bool:
+    """Check if a document version is stored, using its metadata only."""
+    if not metadata or "id" not in metadata or "version" not in metadata:
+        return False
 
-def check_document_exists(qdrant: Qdrant, document: Document) -> List[Document]:
+    points, _ = client.scroll(
+        collection_name=collection_name,
+        scroll_filter=document_filter(metadata),
+        limit=1,
+        with_payload=False,
+        with_vectors=False,
+    )
+    return bool(points)
+
+
+def scroll_metadata(
+    client: QdrantClient,
+    collection_name: str,
+    points_filter: Filter | None = None,
+    batch_size: int = 256,
+) -> Iterator[dict[str, Any]]:
+    """Yield the metadata of the points that match a filter, without their vectors."""
+    offset = None
+    while True:
+        points, offset = client.scroll(
+            collection_name=collection_name,
+            scroll_filter=points_filter,
+            limit=batch_size,
+            offset=offset,
+            with_payload=["metadata"],
+            with_vectors=False,
+        )
+        for point in points:
+            yield (point.payload or {}).get("metadata") or {}
+        if offset is None:
+            return
+
+
+def check_document_exists(qdrant: Qdrant, document: Document) -> list[Document]:
     # Only check if document has metadata with id and version
-    if not document.metadata or 'id' not in document.metadata or 'version' not in document.metadata:
+    if not document.metadata or "id" not in document.metadata or "version" not in document.metadata:
         return []
 
-    return qdrant.similarity_search(
-        query=document.page_content,
-        k=1,
-        filter=Filter(
-            must=[
-                {"key": "metadata.id", "match": {
-                        "value": document.metadata['id']}},
-                {"key": "metadata.version", "match": {
-                        "value": document.metadata['version']}},
-                {"key": "metadata.page", "match": {
-                        "value": 0}}
-            ]
-        )
+    # Filter on the metadata only, the content of the document is not embedded
+    points, _ = qdrant.client.scroll(
+        collection_name=qdrant.collection_name,
+        scroll_filter=document_filter(document.metadata),
+        limit=1,
+        with_payload=True,
+        with_vectors=False,
     )
+    return [
+        Document(
+            page_content=(point.payload or {}).get(qdrant.content_payload_key) or "",
+            metadata=(point.payload or {}).get(qdrant.metadata_payload_key) or {},
+        )
+        for point in points
+    ]
+
+
+def document_point_id(metadata: dict[str, Any]) -> str:
+    """Return the point ID of a page, the same for every ingestion of a document version.
+
+    Documents without a page are stored as their first page, like `document_filter` assumes.
+    """
+    return str(uuid.uuid5(POINT_ID_NAMESPACE, f"{metadata['id']}:{metadata['version']}:{metadata.get('page', 0)}"))
+
+
+async def upsert_documents(
+    client: QdrantClient,
+    collection_name: str,
+    embedding: Embeddings,
+    documents: list[Document],
+    batch_size: int = 64,
+    max_concurrency: int = 4,
+) -> dict[str, float]:
+    """Embed documents in batches and upsert them into a collection, creating it if needed.
+
+    Up to `max_concurrency` batches are embedded and upserted at the same time, and each
+    batch is written as soon as it is embedded. Point IDs are derived from the id, version
+    and page of the documents, so ingesting the same document version again overwrites its
+    points instead of duplicating them.
+
+    Returns:
+        The number of documents and batches, and the time spent embedding, upserting and in
+        total, in seconds.
+    """
+    started = time.perf_counter()
+    batch_size = max(1, batch_size)
+    batches = [documents[start : start + batch_size] for start in range(0, len(documents), batch_size)]
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+    collection_lock = asyncio.Lock()
+    collection_ready = False
+    metrics = {"documents": len(documents), "batches": len(batches), "embedding_seconds": 0.0, "upsert_seconds": 0.0}
+
+    async def ensure_collection(vector_size: int) -> None:
+        nonlocal collection_ready
+        async with collection_lock:
+            if collection_ready:
+                return
+            # The size of the vectors is only known once the first batch is embedded
+            if not await asyncio.to_thread(check_collection_exists, client, collection_name):
+                await asyncio.to_thread(create_collection, client, collection_name, vector_size)
+            collection_ready = True
+
+    async def ingest(batch: list[Document]) -> None:
+        async with semaphore:
+            embedding_started = time.perf_counter()
+            vectors = await embedding.aembed_documents([document.page_content for document in batch])
+            metrics["embedding_seconds"] += time.perf_counter() - embedding_started
+
+            await ensure_collection(len(vectors[0]))
+            points = [
+                PointStruct(
+                    id=document_point_id(document.metadata),
+                    vector=vector,
+                    payload={"page_content": document.page_content, "metadata": document.metadata},
+                )
+                # An embedding that returns fewer vectors than documents must not store pages with wrong vectors
+                for document, vector in zip(batch, vectors, strict=True)
+            ]
+            upsert_started = time.perf_counter()
+            await asyncio.to_thread(client.upsert, collection_name=collection_name, points=points, wait=True)
+            metrics["upsert_seconds"] += time.perf_counter() - upsert_started
+
+    tasks = [asyncio.ensure_future(ingest(batch)) for batch in batches]
+    try:
+        await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
+    metrics["seconds"] = time.perf_counter() - started
+    return metrics
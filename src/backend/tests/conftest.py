@@ -19,6 +19,7 @@ from fastapi.testclient import TestClient
 from httpx import ASGITransport, AsyncClient
 from langflow.components.inputs import ChatInput
 from langflow.graph import Graph
+from langflow.graph.graph.memoization import vertex_result_cache
 from langflow.initial_setup.constants import STARTER_FOLDER_NAME
 from langflow.main import create_app
 from langflow.services.auth.utils import get_password_hash
@@ -79,6 +80,11 @@ def blockbuster(request):
             for func in ["os.stat", "os.path.abspath", "os.scandir"]:
                 bb.functions[func].can_block_in("alembic/util/pyfiles.py", "load_python_file")
 
+            # The OpenTelemetry resource detectors run in a thread pool once, when the meter provider is created
+            bb.functions["threading.Lock.acquire"].can_block_in(
+                "opentelemetry/sdk/resources/__init__.py", "get_aggregated_resources"
+            )
+
             for func in ["os.path.abspath", "os.scandir"]:
                 bb.functions[func].can_block_in("alembic/script/base.py", "_load_revisions")
 
@@ -353,6 +359,13 @@ def deactivate_tracing(monkeypatch):
     monkeypatch.undo()
 
 
+@pytest.fixture(autouse=True)
+def clear_vertex_result_cache():
+    # Memoized component results must not leak between tests
+    yield
+    vertex_result_cache.clear()
+
+
 @pytest.fixture(name="client")
 async def client_fixture(
     session: Session,  # noqa: ARG001
@@ -0,0 +1,57 @@
+import asyncio
+import time
+
+import pytest
+from langchain_core.messages import AIMessageChunk
+from langflow.custom import Component
+from langflow.events.event_manager import create_default_event_manager
+from langflow.schema.message import Message
+
+TOKEN_COUNT = 10_000
+
+
+class _StreamingComponent(Component):
+    """Sends messages without touching the database."""
+
+    async def _store_message(self, message: Message) -> Message:
+        message.id = "message-id"
+        return message
+
+    async def _update_stored_message(self, message: Message) -> Message:
+        return message
+
+
+def _tokens():
+    for index in range(TOKEN_COUNT):
+        yield AIMessageChunk(content=f"token-{index} ")
+
+
+async def _atokens():
+    for chunk in _tokens():
+        yield chunk
+
+
+async def _stream(tokens) -> tuple[Message, int]:
+    queue: asyncio.Queue = asyncio.Queue()
+    component = _StreamingComponent()
+    component._event_manager = create_default_event_manager(queue)
+    message = await component.send_message(Message(text=tokens, sender="Machine", sender_name="AI"))
+    return message, queue.qsize()
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("source", [_tokens, _atokens], ids=["sync_iterator", "async_iterator"])
+def test_stream_tokens_through_send_message(benchmark, source):
+    """Benchmark streaming 10k tokens through `send_message` and report the overhead per token."""
+
+    def stream():
+        start = time.perf_counter()
+        result = asyncio.run(_stream(source()))
+        elapsed = time.perf_counter() - start
+        benchmark.extra_info["us_per_token"] = elapsed / TOKEN_COUNT * 1e6
+        return result
+
+    message, events = benchmark(stream)
+    assert message.text == "".join(f"token-{index} " for index in range(TOKEN_COUNT))
+    # One message event for the first chunk and one token event per chunk
+    assert events == TOKEN_COUNT + 1
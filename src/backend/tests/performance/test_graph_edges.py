@@ -0,0 +1,40 @@
+import pytest
+from langflow.components.inputs import ChatInput
+from langflow.components.outputs import TextOutputComponent
+from langflow.graph import Graph
+
+
+@pytest.fixture(scope="module", params=[100, 500, 1000, 2000], ids=lambda size: f"{size}_vertices")
+def chain_graph(request):
+    """A synthetic graph of `size` vertices, each one connected to the next."""
+    graph = Graph()
+    previous = ChatInput(_id="vertex-0")
+    graph.add_component(previous)
+    for index in range(1, request.param):
+        component = TextOutputComponent(_id=f"vertex-{index}")
+        graph.add_component(component)
+        output_name = "message" if index == 1 else "text"
+        graph.add_component_edge(previous._id, (output_name, "input_value"), component._id)
+        previous = component
+    graph.initialize()
+    return graph
+
+
+@pytest.mark.benchmark
+def test_vertex_edges_lookup(benchmark, chain_graph):
+    """Benchmark looking up the incoming and outgoing edges of every vertex."""
+
+    def lookup_edges():
+        for vertex in chain_graph.vertices:
+            _ = vertex.incoming_edges
+            _ = vertex.outgoing_edges
+
+    benchmark(lookup_edges)
+    assert all(len(vertex.edges) <= 2 for vertex in chain_graph.vertices)
+
+
+@pytest.mark.benchmark
+def test_build_vertex_params(benchmark, chain_graph):
+    """Benchmark building the params of every vertex, which reads the edges of each vertex."""
+    benchmark(chain_graph._build_vertex_params)
+    assert chain_graph.get_vertex("vertex-1").params
@@ -67,6 +67,26 @@ async def test_read_flows(client: AsyncClient, logged_in_headers):
     assert isinstance(result, list), "The result must be a list"
 
 
+async def test_read_flows_etag(client: AsyncClient, logged_in_headers):
+    params = {"get_all": True, "header_flows": True}
+    response = await client.get("api/v1/flows/", params=params, headers=logged_in_headers)
+    assert response.status_code == status.HTTP_200_OK
+    etag = response.headers["ETag"]
+
+    response = await client.get("api/v1/flows/", params=params, headers={**logged_in_headers, "If-None-Match": etag})
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+    assert response.content == b""
+
+    flow = {"name": "Listed flow", "data": {}}
+    response = await client.post("api/v1/flows/", json=flow, headers=logged_in_headers)
+    assert response.status_code == status.HTTP_201_CREATED
+
+    response = await client.get("api/v1/flows/", params=params, headers={**logged_in_headers, "If-None-Match": etag})
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["ETag"] != etag
+    assert "Listed flow" in [header["name"] for header in response.json()]
+
+
 async def test_read_flow(client: AsyncClient, logged_in_headers):
     basic_case = {
         "name": "string",
@@ -4,8 +4,11 @@ from uuid import uuid4
 import pytest
 from fastapi import status
 from httpx import AsyncClient
+from langflow.api.v1.mcp import register_list_tools
 from langflow.services.auth.utils import get_password_hash
 from langflow.services.database.models.user import User
+from mcp import types
+from mcp.server import Server
 
 # Mark all tests in this module as asyncio
 pytestmark = pytest.mark.asyncio
@@ -111,3 +114,18 @@ async def test_mcp_post_endpoint_server_error(client: AsyncClient, logged_in_hea
 
     assert response.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
     assert "Internal server error" in response.json()["detail"]
+
+
+async def test_register_list_tools_passes_cursor():
+    mcp_server = Server("test")
+    tool = types.Tool(name="flow", description="Flow", inputSchema={"type": "object", "properties": {}})
+    list_tools = AsyncMock(return_value=([tool], "next"))
+    register_list_tools(mcp_server, list_tools)
+
+    handler = mcp_server.request_handlers[types.ListToolsRequest]
+    request = types.ListToolsRequest(method="tools/list", params=types.PaginatedRequestParams(cursor="cursor"))
+    result = await handler(request)
+
+    list_tools.assert_awaited_once_with("cursor")
+    assert result.root.tools == [tool]
+    assert result.root.nextCursor == "next"
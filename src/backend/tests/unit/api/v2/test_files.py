@@ -156,6 +156,26 @@ async def test_download_file(files_client, files_created_api_key):
     assert response.content == b"test content"
 
 
+async def test_download_file_range(files_client, files_created_api_key):
+    headers = {"x-api-key": files_created_api_key.api_key}
+
+    response = await files_client.post(
+        "api/v2/files",
+        files={"file": ("test.txt", b"test content")},
+        headers=headers,
+    )
+    assert response.status_code == 201
+    upload_response = response.json()
+
+    response = await files_client.get(
+        f"api/v2/files/{upload_response['id']}", headers={**headers, "Range": "bytes=5-11"}
+    )
+
+    assert response.status_code == 206
+    assert response.content == b"content"
+    assert response.headers["content-range"] == "bytes 5-11/12"
+
+
 async def test_list_files(files_client, files_created_api_key):
     headers = {"x-api-key": files_created_api_key.api_key}
 
@@ -0,0 +1,60 @@
+from uuid import uuid4
+
+import orjson
+import pytest
+from langflow.base.mcp.util import list_flow_tools
+from langflow.services.database.models.flow import Flow
+from sqlmodel import update
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+
+@pytest.fixture
+def memory_chatbot_data(json_memory_chatbot_no_llm):
+    return orjson.loads(json_memory_chatbot_no_llm)["data"]
+
+
+async def test_input_schema_is_stored_when_flow_is_saved(async_session: AsyncSession, memory_chatbot_data):
+    flow = Flow(name="Memory Chatbot", data=memory_chatbot_data, user_id=uuid4())
+    async_session.add(flow)
+    await async_session.commit()
+
+    assert "input_value" in flow.input_schema["properties"]
+
+    flow.data = {"nodes": [], "edges": []}
+    async_session.add(flow)
+    await async_session.commit()
+
+    assert flow.input_schema == {"type": "object", "properties": {}, "required": []}
+
+
+async def test_list_flow_tools_pages_through_the_flows_of_a_user(async_session: AsyncSession):
+    user_id = uuid4()
+    async_session.add_all([Flow(name=f"Flow {index}", data={"nodes": []}, user_id=user_id) for index in range(5)])
+    async_session.add(Flow(name="Other flow", data={"nodes": []}, user_id=uuid4()))
+    await async_session.commit()
+
+    names = []
+    cursor = None
+    while True:
+        tools, cursor = await list_flow_tools(async_session, user_id, cursor=cursor, limit=2)
+        names.extend(tool.name for tool in tools)
+        if cursor is None:
+            break
+
+    assert sorted(names) == [f"Flow {index}" for index in range(5)]
+
+
+async def test_list_flow_tools_stores_missing_input_schemas(async_session: AsyncSession, memory_chatbot_data):
+    user_id = uuid4()
+    flow = Flow(name="Memory Chatbot", data=memory_chatbot_data, user_id=user_id)
+    async_session.add(flow)
+    await async_session.commit()
+    # Flows saved before input schemas were stored have none
+    await async_session.exec(update(Flow).where(Flow.id == flow.id).values(input_schema=None))
+    await async_session.commit()
+
+    tools, _ = await list_flow_tools(async_session, user_id)
+
+    assert "input_value" in tools[0].input_schema["properties"]
+    await async_session.refresh(flow)
+    assert flow.input_schema == tools[0].input_schema
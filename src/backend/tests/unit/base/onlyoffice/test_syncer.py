@@ -0,0 +1,98 @@
+import asyncio
+from urllib.request import Request
+
+import pytest
+from langflow.base.onlyoffice.docspace import ErrorResponse, Operation, SuccessResponse, Syncer
+
+
+class FakeOperations:
+    """Lists the operations of a fake portal, finishing each one after `polls` listings."""
+
+    def __init__(self, polls: int, error: str | None = None):
+        self.polls = polls
+        self.error = error
+        self.calls = 0
+
+    async def list(self):
+        self.calls += 1
+        await asyncio.sleep(0.01)
+        finished = self.calls >= self.polls
+        op = Operation(id="op", finished=finished, error=self.error if finished else None)
+        return [op], SuccessResponse(Request("https://portal.example"), None)
+
+
+async def test_wait_polls_until_the_operation_finishes():
+    operations = FakeOperations(polls=3)
+    syncer = Syncer(operations.list, delay=0.01)
+
+    result = await syncer.wait(Operation(id="op"))
+
+    assert result.finished
+    assert operations.calls == 3
+
+
+async def test_wait_raises_errors_of_operations():
+    operations = FakeOperations(polls=1, error="Access denied")
+    syncer = Syncer(operations.list, delay=0.01)
+
+    with pytest.raises(Exception, match="Multiple errors") as exc_info:
+        await syncer.wait([Operation(id="op")])
+
+    assert str(exc_info.value.exceptions[0]) == "Operation op failed"
+
+
+async def test_wait_gives_up_after_max_attempts():
+    operations = FakeOperations(polls=10)
+    syncer = Syncer(operations.list, delay=0.01, max_attempts=2)
+
+    with pytest.raises(ValueError, match="did not finish in time"):
+        await syncer.wait(Operation(id="op"))
+
+    assert operations.calls == 2
+
+
+async def test_wait_gives_up_at_the_deadline():
+    operations = FakeOperations(polls=1000)
+    syncer = Syncer(operations.list, delay=0.01, max_delay=0.02, deadline=0.1)
+
+    with pytest.raises(ValueError, match="did not finish in time"):
+        await syncer.wait(Operation(id="op"))
+
+    assert operations.calls < 10
+
+
+async def test_do_raises_error_responses():
+    async def start():
+        return [], ErrorResponse(Request("https://portal.example"), RuntimeError("Forbidden"))
+
+    syncer = Syncer(FakeOperations(polls=1).list)
+
+    with pytest.raises(ValueError, match="Calling async operation") as exc_info:
+        await syncer.do(start)
+
+    assert isinstance(exc_info.value.__cause__, RuntimeError)
+
+
+@pytest.mark.parametrize(("key", "expected_calls"), [("portal", 1), (None, 3)])
+async def test_waiters_with_the_same_key_share_listings(key, expected_calls):
+    operations = FakeOperations(polls=1)
+
+    await asyncio.gather(*(Syncer(operations.list, key=key).wait(Operation(id="op")) for _ in range(3)))
+
+    assert operations.calls == expected_calls
+
+
+async def test_cancelling_the_waiter_stops_polling():
+    operations = FakeOperations(polls=1000)
+    task = asyncio.create_task(
+        Syncer(operations.list, key="portal", delay=0.01, max_delay=0.01).wait(Operation(id="op"))
+    )
+    await asyncio.sleep(0.1)
+
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    calls = operations.calls
+    await asyncio.sleep(0.1)
+
+    assert operations.calls == calls
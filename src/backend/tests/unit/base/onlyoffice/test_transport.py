@@ -0,0 +1,99 @@
+import asyncio
+import functools
+from urllib.error import HTTPError
+
+import httpx
+import pytest
+from langflow.base.onlyoffice.docspace import Client
+from langflow.base.onlyoffice.docspace.client import AsyncTransport
+
+
+@pytest.fixture
+def requests(monkeypatch):
+    """Answers the requests of the transport from a fake portal instead of the network."""
+    sent = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        sent.append(request)
+        if request.url.path == "/api/2.0/files/file/404":
+            return httpx.Response(404, json={"error": {"message": "File not found"}, "statusCode": 404})
+        return httpx.Response(200, json={"response": {"id": 1, "title": "Report.docx"}})
+
+    async_client = functools.partial(httpx.AsyncClient, transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(httpx, "AsyncClient", async_client)
+    return sent
+
+
+def _client(transport: AsyncTransport) -> Client:
+    client = Client(transport=transport).with_auth_token("token")
+    client.base_url = "https://portal.example/"
+    return client
+
+
+async def test_requests_go_through_the_transformers(requests):
+    transport = AsyncTransport()
+
+    result, _ = await _client(transport).files.aget_file(1)
+
+    assert result == {"id": 1, "title": "Report.docx"}
+    assert requests[0].method == "GET"
+    assert str(requests[0].url) == "https://portal.example/api/2.0/files/file/1"
+    assert requests[0].headers["Authorization"] == "token"
+    await transport.aclose()
+
+
+async def test_error_statuses_become_error_responses(requests):
+    transport = AsyncTransport()
+
+    result, response = await _client(transport).files.aget_file(404)
+
+    assert isinstance(response.exception, HTTPError)
+    assert response.exception.code == 404
+    assert result.message == "File not found"
+    assert len(requests) == 1
+    await transport.aclose()
+
+
+async def test_clients_are_pooled_per_origin(requests):  # noqa: ARG001
+    transport = AsyncTransport()
+
+    client = transport.get_client("https://portal.example/api/2.0/files/file/1")
+
+    assert transport.get_client("https://portal.example/api/2.0/people/@self") is client
+    assert transport.get_client("https://other.example/api/2.0/files/file/1") is not client
+    await transport.aclose()
+    assert client.is_closed
+    assert transport.get_client("https://portal.example/api/2.0/files/file/1") is not client
+    await transport.aclose()
+
+
+async def test_pools_of_closed_loops_are_dropped(requests):  # noqa: ARG001
+    transport = AsyncTransport()
+
+    async def get_client():
+        return transport.get_client("https://portal.example/")
+
+    def run_in_other_loop():
+        # The loop is kept alive like the open connections of its pool would
+        loop = asyncio.new_event_loop()
+        loop.run_until_complete(get_client())
+        loop.close()
+        return loop
+
+    other_loop = await asyncio.to_thread(run_in_other_loop)
+    assert other_loop in transport._pools
+
+    transport.get_client("https://portal.example/")
+
+    assert other_loop not in transport._pools
+    await transport.aclose()
+
+
+async def test_aclose_all_closes_every_client(requests):  # noqa: ARG001
+    transport = AsyncTransport()
+    client = transport.get_client("https://portal.example/")
+
+    await transport.aclose_all()
+
+    assert client.is_closed
+    assert len(transport._pools) == 0
@@ -1,4 +1,5 @@
 import re
+from uuid import uuid4
 
 import pytest
 from langflow.components.helpers.batch_run import BatchRunComponent
@@ -256,3 +257,50 @@ class TestBatchRunComponent(ComponentTestBaseWithoutClient):
         )
         result_dicts = result.to_dict("records")
         assert all(row["metadata"]["processing_status"] == "success" for row in result_dicts)
+
+    async def test_failed_rows_are_retried_and_reported(self, monkeypatch):
+        monkeypatch.setattr("langflow.components.helpers.batch_run.RETRY_BASE_DELAY", 0)
+        run_id = uuid4().hex
+        calls: list[list[str]] = []
+
+        class FlakyModel(MockLanguageModel):
+            async def abatch(self, messages, *args, return_exceptions=False, **kwargs):
+                texts = [conversation[-1]["content"] for conversation in messages]
+                calls.append(texts)
+                responses = await super().abatch(messages, *args, **kwargs)
+                results = [
+                    RuntimeError("Rate limited") if text.startswith("boom") else response
+                    for text, response in zip(texts, responses, strict=True)
+                ]
+                error = next((result for result in results if isinstance(result, Exception)), None)
+                if error is not None and not return_exceptions:
+                    raise error
+                return results
+
+        texts = [f"row-{index}-{run_id}" for index in range(5)] + [f"boom-{run_id}"]
+        component = BatchRunComponent(
+            model=FlakyModel(),
+            df=DataFrame({"text": texts}),
+            column_name="text",
+            enable_metadata=True,
+            chunk_size=2,
+            max_retries=1,
+        )
+
+        result = await component.run_batch()
+
+        assert len(result) == 6
+        statuses = [row["metadata"]["processing_status"] for row in result.to_dict("records")]
+        assert statuses == ["success"] * 5 + ["failed"]
+        assert "Rate limited" in result.iloc[5]["metadata"]["error"]
+        assert result.iloc[0]["model_response"] == f"Response for row-0-{run_id}"
+        # Three chunks, then one retry of the failing row only
+        assert calls[:3] == [texts[0:2], texts[2:4], texts[4:6]]
+        assert calls[3:] == [[texts[5]]]
+
+        # A re-run only sends the rows that failed or changed
+        calls.clear()
+        component.df = DataFrame({"text": [*texts[:4], f"changed-{run_id}", texts[5]]})
+        result = await component.run_batch()
+        assert {text for call in calls for text in call} == {f"changed-{run_id}", texts[5]}
+        assert result.iloc[0]["model_response"] == f"Response for row-0-{run_id}"
@@ -4,6 +4,8 @@ import orjson
 import pytest
 from httpx import AsyncClient
 from langflow.components.logic.loop import LoopComponent
+from langflow.graph import Graph
+from langflow.graph.vertex.base import Vertex
 from langflow.memory import aget_messages
 from langflow.schema.data import Data
 from langflow.services.database.models.flow import FlowCreate
@@ -100,3 +102,76 @@ class TestLoopComponentWithAPI(ComponentTestBaseWithClient):
         assert "outputs" in data
         assert "session_id" in data
         assert len(data["outputs"][-1]["outputs"]) > 0
+
+
+def loop_graph(json_loop_test: str, mode: str, input_value: str, body_code=None) -> Graph:
+    data = orjson.loads(json_loop_test)["data"]
+    for node in data["nodes"]:
+        template = node["data"]["node"]["template"]
+        if node["data"]["type"] == "LoopComponent":
+            loop_template = LoopComponent().to_frontend_node()["data"]["node"]["template"]
+            template.update({name: loop_template[name] for name in ("code", "mode", "max_parallel")})
+            template["mode"]["value"] = mode
+        elif node["id"] == "ParseData-Lh223" and body_code is not None:
+            template["code"]["value"] = body_code(template["code"]["value"])
+    graph = Graph.from_payload(data)
+    graph.prepare()
+    graph.get_vertex("ChatInput-g0cMv").update_raw_params({"input_value": input_value}, overwrite=True)
+    return graph
+
+
+async def run_loop_graph(graph: Graph) -> list[Data]:
+    await graph.initialize_run()
+    async for _ in graph.async_start():
+        pass
+    return graph.get_vertex("LoopComponent-nT1ru").results["done"]
+
+
+async def test_map_mode_aggregates_like_the_sequential_mode(json_loop_test):
+    input_value = " ".join(f"word{index}." for index in range(20))
+
+    sequential = await run_loop_graph(loop_graph(json_loop_test, "Sequential", input_value))
+    mapped = await run_loop_graph(loop_graph(json_loop_test, "Map", input_value))
+
+    assert len(mapped) > 1
+    assert [item.text for item in mapped] == [item.text for item in sequential]
+
+
+async def test_map_mode_isolates_failing_items(json_loop_test):
+    def failing_body(code: str) -> str:
+        return code.replace(
+            "        result_string = data_to_text(template, data, sep)\n",
+            "        result_string = data_to_text(template, data, sep)\n"
+            "        if 'fail' in result_string:\n"
+            "            raise ValueError(result_string)\n",
+        )
+
+    graph = loop_graph(
+        json_loop_test, "Map", "first item is ok. second item fails. third item is ok.", body_code=failing_body
+    )
+    results = await run_loop_graph(graph)
+
+    assert len(results) == 3
+    assert results[0].text == "text_first item is ok"
+    assert "second item fails" in results[1].data["error"]
+    assert results[2].text == "text_third item is ok"
+
+
+async def test_map_mode_keeps_the_positions_of_items_without_results(json_loop_test, monkeypatch):
+    build = Vertex.build
+
+    async def build_without_skipped_results(self, *args, **kwargs):
+        result = await build(self, *args, **kwargs)
+        # The last vertex of the loop body sends nothing back for skipped items
+        if self.id == "MessagetoData-s1tjF" and "skipped" in self.results["data"].text:
+            self.results = {}
+        return result
+
+    monkeypatch.setattr(Vertex, "build", build_without_skipped_results)
+    graph = loop_graph(json_loop_test, "Map", "first item is ok. second item is skipped. third item is ok.")
+    results = await run_loop_graph(graph)
+
+    assert len(results) == 3
+    assert results[0].text == "text_first item is ok"
+    assert results[1] is None
+    assert results[2].text == "text_third item is ok"
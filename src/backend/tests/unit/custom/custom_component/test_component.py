@@ -1,3 +1,4 @@
+import threading
 from typing import Any
 
 import pytest
@@ -5,6 +6,7 @@ from langflow.components.crewai import CrewAIAgentComponent, SequentialTaskCompo
 from langflow.components.custom_component import CustomComponent
 from langflow.components.inputs import ChatInput
 from langflow.components.outputs import ChatOutput
+from langflow.custom import Component
 from langflow.custom.utils import update_component_build_config
 from langflow.schema import dotdict
 from langflow.template import Output
@@ -99,3 +101,20 @@ async def test_update_component_build_config_async():
     build_config = dotdict()
     build_config = await update_component_build_config(component, build_config, "", "")
     assert build_config["foo"] == "bar"
+
+
+async def test_sync_outputs_run_on_the_named_executor():
+    class ThreadNameComponent(Component):
+        sync_executor = "parsing"
+        outputs = [
+            Output(name="default", method="thread_name"),
+            Output(name="other", method="thread_name", executor="other"),
+        ]
+
+        def thread_name(self) -> str:
+            return threading.current_thread().name
+
+    component = ThreadNameComponent()
+
+    assert (await component._get_output_result(component._outputs_map["default"])).startswith("langflow-parsing")
+    assert (await component._get_output_result(component._outputs_map["other"])).startswith("langflow-other")
@@ -0,0 +1,68 @@
+from unittest.mock import patch
+
+import pytest
+from langflow.custom.eval import ComponentClassCache, component_class_cache, eval_custom_component_code
+from langflow.utils import validate
+
+CODE = """
+from langflow.custom import Component
+from langflow.io import Output
+from langflow.schema import Data
+
+
+class CachedComponent(Component):
+    outputs = [Output(name="data", display_name="Data", method="build_data")]
+
+    def build_data(self) -> Data:
+        return Data(data={"value": 1})
+"""
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    component_class_cache.clear()
+    yield
+    component_class_cache.clear()
+
+
+def test_eval_custom_component_code_reuses_compiled_class():
+    with patch.object(validate, "create_class", wraps=validate.create_class) as create_class:
+        first = eval_custom_component_code(CODE)
+        second = eval_custom_component_code(CODE)
+
+    assert first is second
+    assert create_class.call_count == 1
+    stats = component_class_cache.stats()
+    assert stats["hits"] >= 1
+    assert stats["size"] == 1
+
+
+def test_eval_custom_component_code_recompiles_after_invalidate():
+    first = eval_custom_component_code(CODE)
+    component_class_cache.invalidate(CODE)
+    second = eval_custom_component_code(CODE)
+
+    assert first is not second
+    assert first.__name__ == second.__name__ == "CachedComponent"
+
+
+def test_instances_of_a_cached_class_do_not_share_outputs():
+    component_class = eval_custom_component_code(CODE)
+    component = component_class()
+    component._append_tool_output()
+
+    assert [output.name for output in component.outputs] == ["data", "component_as_tool"]
+    assert [output.name for output in eval_custom_component_code(CODE)().outputs] == ["data"]
+    assert [output.name for output in component_class.outputs] == ["data"]
+
+
+def test_component_class_cache_evicts_least_recently_used():
+    cache = ComponentClassCache(max_size=2)
+    cache.set("a", int)
+    cache.set("b", str)
+    assert cache.get("a") is int
+    cache.set("c", float)
+
+    assert cache.get("b") is None
+    assert cache.get("a") is int
+    assert cache.stats()["evictions"] == 1
@@ -210,3 +210,82 @@ class TestEventManager:
         # Accessing a non-registered event callback should return the 'noop' function
         callback = event_manager.on_non_existing_event
         assert callback.__name__ == "noop"
+
+
+class TestTokenCoalescing:
+    @staticmethod
+    def _decode(item):
+        return json.loads(item[1].decode("utf-8"))
+
+    async def test_tokens_are_merged_until_flush_bytes(self):
+        queue = asyncio.Queue()
+        manager = EventManager(queue, coalesce_tokens=True, flush_interval=60, flush_bytes=6)
+        manager.register_event("on_token", "token")
+        for chunk in ["ab", "cd", "ef", "gh"]:
+            manager.on_token(data={"chunk": chunk, "id": "message-1"})
+
+        assert queue.qsize() == 1
+        event = self._decode(queue.get_nowait())
+        assert event["event"] == "token"
+        assert event["data"]["chunk"] == "abcdef"
+        assert event["data"]["id"] == "message-1"
+
+        manager.flush()
+        assert self._decode(queue.get_nowait())["data"]["chunk"] == "gh"
+
+    async def test_tokens_are_flushed_after_interval(self):
+        queue = asyncio.Queue()
+        manager = EventManager(queue, coalesce_tokens=True, flush_interval=0.01)
+        manager.register_event("on_token", "token")
+        manager.on_token(data={"chunk": "hello", "id": "message-1"})
+        assert queue.empty()
+
+        event = await asyncio.wait_for(queue.get(), timeout=1)
+        assert self._decode(event)["data"]["chunk"] == "hello"
+
+    async def test_other_events_keep_their_order(self):
+        queue = asyncio.Queue()
+        manager = EventManager(queue, coalesce_tokens=True, flush_interval=60)
+        manager.register_event("on_token", "token")
+        manager.register_event("on_end", "end")
+        manager.on_token(data={"chunk": "a", "id": "message-1"})
+        manager.on_token(data={"chunk": "b", "id": "message-1"})
+        manager.on_end(data={})
+
+        events = [self._decode(queue.get_nowait()) for _ in range(queue.qsize())]
+        assert [event["event"] for event in events] == ["token", "end"]
+        assert events[0]["data"]["chunk"] == "ab"
+
+    async def test_event_ids_are_unique_without_uuid_per_event(self):
+        queue = asyncio.Queue()
+        manager = EventManager(queue, coalesce_tokens=True)
+        manager.register_event("on_end", "end")
+        manager.on_end(data={})
+        manager.on_end(data={})
+
+        event_id_1, _, _ = queue.get_nowait()
+        event_id_2, _, _ = queue.get_nowait()
+        assert event_id_1 != event_id_2
+        assert event_id_1.startswith("end-")
+
+    async def test_full_queue_backlogs_events_until_drained(self):
+        queue = asyncio.Queue(maxsize=1)
+        manager = EventManager(queue, coalesce_tokens=True, flush_interval=60)
+        manager.register_event("on_message", "add_message")
+        manager.register_event("on_token", "token")
+        manager.on_message(data={"text": "first"})
+        manager.on_message(data={"text": "second"})
+        manager.on_token(data={"chunk": "a", "id": "message-1"})
+        manager.on_token(data={"chunk": "b", "id": "message-1"})
+        assert queue.qsize() == 1
+
+        async def consume():
+            return [self._decode(await queue.get()) for _ in range(3)]
+
+        consumer = asyncio.create_task(consume())
+        await asyncio.wait_for(manager.drain(flush=True), timeout=1)
+        events = await asyncio.wait_for(consumer, timeout=1)
+
+        assert [event["event"] for event in events] == ["add_message", "add_message", "token"]
+        assert events[1]["data"]["text"] == "second"
+        assert events[2]["data"]["chunk"] == "ab"
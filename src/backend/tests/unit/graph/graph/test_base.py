@@ -1,3 +1,4 @@
+import asyncio
 import logging
 from collections import deque
 
@@ -5,9 +6,11 @@ import pytest
 from langflow.components.inputs import ChatInput
 from langflow.components.langchain_utilities import ToolCallingAgentComponent
 from langflow.components.outputs import ChatOutput, TextOutputComponent
+from langflow.components.processing import CombineTextComponent
 from langflow.components.tools import YfinanceToolComponent
 from langflow.graph import Graph
 from langflow.graph.graph.constants import Finish
+from langflow.graph.vertex.base import Vertex
 
 
 async def test_graph_not_prepared():
@@ -131,6 +134,98 @@ def test_graph_functional_start_end():
     assert results[-1] == Finish()
 
 
+@pytest.mark.parametrize("execution_mode", ["layered", "dataflow"])
+async def test_graph_process_execution_modes(execution_mode):
+    chat_input = ChatInput(_id="chat_input")
+    chat_input.set(should_store_message=False)
+    text_output = TextOutputComponent(_id="text_output")
+    text_output.set(input_value=chat_input.message_response)
+    chat_output = ChatOutput(_id="chat_output")
+    chat_output.set(input_value=text_output.text_response, should_store_message=False)
+    graph = Graph(chat_input, chat_output)
+    graph.prepare()
+
+    await graph.process(fallback_to_env_vars=False, execution_mode=execution_mode, max_concurrency=1)
+
+    assert all(vertex.built for vertex in graph.vertices)
+    assert not graph.run_manager.vertices_being_run
+
+
+def _scan_vertex_edges(graph, vertex_id):
+    return [edge for edge in graph.edges if vertex_id in {edge.source_id, edge.target_id}]
+
+
+def _chained_graph():
+    chat_input = ChatInput(_id="chat_input")
+    text_output = TextOutputComponent(_id="text_output")
+    text_output.set(input_value=chat_input.message_response)
+    chat_output = ChatOutput(_id="chat_output")
+    chat_output.set(input_value=text_output.text_response)
+    graph = Graph(chat_input, chat_output)
+    graph.prepare()
+    return graph
+
+
+def test_graph_edge_index_stays_consistent():
+    graph = _chained_graph()
+
+    for vertex_id in graph.get_vertex_ids():
+        assert graph.get_vertex_edges(vertex_id) == _scan_vertex_edges(graph, vertex_id)
+    text_output_vertex = graph.get_vertex("text_output")
+    assert [edge.source_id for edge in text_output_vertex.incoming_edges] == ["chat_input"]
+    assert [edge.target_id for edge in text_output_vertex.outgoing_edges] == ["chat_output"]
+    assert [vertex.id for vertex in graph.get_vertices_with_target("text_output")] == ["chat_input"]
+    assert {vertex.id for vertex in graph.get_vertex_neighbors(text_output_vertex)} == {"chat_input", "chat_output"}
+
+    restored = Graph.__new__(Graph)
+    restored.__setstate__(graph.__getstate__())
+    assert restored.get_vertex_edges("text_output") == graph.get_vertex_edges("text_output")
+
+    graph.remove_vertex("text_output")
+    assert graph.get_vertex_edges("text_output") == []
+    assert graph.get_vertex_edges("chat_input") == _scan_vertex_edges(graph, "chat_input") == []
+
+    graph.update(_chained_graph())
+    assert graph.get_vertex_edges("text_output") == _scan_vertex_edges(graph, "text_output")
+    assert len(graph.get_vertex_edges("text_output")) == 2
+    assert graph.get_edge("chat_input", "text_output") is not None
+
+
+@pytest.mark.parametrize(("execution_mode", "fast_branch_first"), [("layered", False), ("dataflow", True)])
+async def test_graph_process_slow_vertex_blocks_only_its_branch(monkeypatch, execution_mode, fast_branch_first):
+    chat_input = ChatInput(_id="chat_input")
+    chat_input.set(should_store_message=False)
+    slow = TextOutputComponent(_id="slow")
+    slow.set(input_value=chat_input.message_response)
+    fast = TextOutputComponent(_id="fast")
+    fast.set(input_value=chat_input.message_response)
+    fast_successor = TextOutputComponent(_id="fast_successor")
+    fast_successor.set(input_value=fast.text_response)
+    combine = CombineTextComponent(_id="combine")
+    combine.set(text1=slow.text_response, text2=fast_successor.text_response)
+    chat_output = ChatOutput(_id="chat_output")
+    chat_output.set(input_value=combine.combine_texts, should_store_message=False)
+    graph = Graph(chat_input, chat_output)
+    graph.prepare()
+
+    built_vertex_ids = []
+    build = Vertex.build
+
+    async def recording_build(self, *args, **kwargs):
+        if self.id == "slow":
+            await asyncio.sleep(0.2)
+        result = await build(self, *args, **kwargs)
+        built_vertex_ids.append(self.id)
+        return result
+
+    monkeypatch.setattr(Vertex, "build", recording_build)
+
+    await graph.process(fallback_to_env_vars=False, execution_mode=execution_mode, max_concurrency=0)
+
+    assert (built_vertex_ids.index("fast_successor") < built_vertex_ids.index("slow")) is fast_branch_first
+    assert built_vertex_ids[-2:] == ["combine", "chat_output"]
+
+
 @pytest.mark.skip(reason="Temporarily disabled")
 def test_graph_set_with_valid_component():
     tool = YfinanceToolComponent()
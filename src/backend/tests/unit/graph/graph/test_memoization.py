@@ -0,0 +1,161 @@
+import threading
+
+import pytest
+from langflow.components.inputs import ChatInput
+from langflow.components.outputs import ChatOutput
+from langflow.components.processing import CombineTextComponent
+from langflow.components.prompts import PromptComponent
+from langflow.graph import Graph
+from langflow.graph.graph import memoization
+from langflow.graph.graph.memoization import VertexResultCache, vertex_result_cache
+from langflow.graph.vertex.base import Vertex
+from langflow.schema.schema import INPUT_FIELD_NAME
+from langflow.services.deps import get_settings_service
+from langflow.services.settings.base import Settings
+
+
+def _graph(template="Answer", suffix=":"):
+    chat_input = ChatInput(_id="ChatInput-1")
+    chat_input.set(should_store_message=False)
+    prompt = PromptComponent(_id="Prompt-1")
+    prompt.set(template=template)
+    suffixed = CombineTextComponent(_id="CombineText-suffix")
+    suffixed.set(text1=prompt.build_prompt, text2=suffix, delimiter="")
+    combine = CombineTextComponent(_id="CombineText-1")
+    combine.set(text1=suffixed.combine_texts, text2=chat_input.message_response)
+    chat_output = ChatOutput(_id="ChatOutput-1")
+    chat_output.set(input_value=combine.combine_texts, should_store_message=False)
+    graph = Graph(chat_input, chat_output)
+    graph.prepare()
+    return graph
+
+
+@pytest.fixture(autouse=True)
+def enable_memoization(monkeypatch):
+    monkeypatch.setattr(get_settings_service().settings, "vertex_memoization", True)
+
+
+@pytest.fixture
+def built_vertex_ids(monkeypatch):
+    built_vertex_ids = []
+    build = Vertex.build
+
+    async def recording_build(self, *args, **kwargs):
+        built_vertex_ids.append(self.id)
+        return await build(self, *args, **kwargs)
+
+    monkeypatch.setattr(Vertex, "build", recording_build)
+    return built_vertex_ids
+
+
+async def _run(graph, value):
+    run_outputs = await graph.arun([{INPUT_FIELD_NAME: value}])
+    return run_outputs[0].outputs[0].results["message"].text
+
+
+def test_vertex_fingerprints_cover_upstream_vertices():
+    fingerprints = _graph().vertex_fingerprints
+
+    assert set(fingerprints) == {"Prompt-1", "CombineText-suffix"}
+    assert _graph().vertex_fingerprints == fingerprints
+
+    suffix_changed = _graph(suffix="?").vertex_fingerprints
+    assert suffix_changed["Prompt-1"] == fingerprints["Prompt-1"]
+    assert suffix_changed["CombineText-suffix"] != fingerprints["CombineText-suffix"]
+
+    template_changed = _graph(template="Reply").vertex_fingerprints
+    assert template_changed["Prompt-1"] != fingerprints["Prompt-1"]
+    assert template_changed["CombineText-suffix"] != fingerprints["CombineText-suffix"]
+
+
+async def test_input_independent_results_are_reused_across_runs(built_vertex_ids):
+    assert await _run(_graph(), "first") == "Answer: first"
+    assert await _run(_graph(), "second") == "Answer: second"
+
+    assert built_vertex_ids.count("Prompt-1") == 1
+    assert built_vertex_ids.count("CombineText-suffix") == 1
+    assert built_vertex_ids.count("CombineText-1") == 2
+
+    assert await _run(_graph(suffix="?"), "third") == "Answer? third"
+    assert built_vertex_ids.count("Prompt-1") == 1
+    assert built_vertex_ids.count("CombineText-suffix") == 2
+
+
+async def test_components_can_opt_out_of_memoization(built_vertex_ids, monkeypatch):
+    monkeypatch.setattr(PromptComponent, "memoizable", False)
+
+    await _run(_graph(), "first")
+    await _run(_graph(), "second")
+
+    assert built_vertex_ids.count("Prompt-1") == 2
+    # The successors of a vertex that is not memoized can still be
+    assert built_vertex_ids.count("CombineText-suffix") == 1
+
+
+async def test_memoization_can_be_disabled(built_vertex_ids, monkeypatch):
+    monkeypatch.setattr(get_settings_service().settings, "vertex_memoization", False)
+
+    await _run(_graph(), "first")
+    await _run(_graph(), "second")
+
+    assert built_vertex_ids.count("Prompt-1") == 2
+    assert len(vertex_result_cache) == 0
+
+
+def test_memoization_is_disabled_by_default():
+    assert Settings().vertex_memoization is False
+
+
+async def test_runs_get_their_own_copy_of_memoized_results():
+    first = _graph()
+    await _run(first, "first")
+    second = _graph()
+    await _run(second, "second")
+
+    first_prompt, second_prompt = first.get_vertex("Prompt-1"), second.get_vertex("Prompt-1")
+    assert second_prompt.built_object is not first_prompt.built_object
+    assert second_prompt.built_object == first_prompt.built_object
+    assert second_prompt.results is not first_prompt.results
+
+
+def test_vertex_result_cache_skips_results_that_cannot_be_copied():
+    cache = VertexResultCache(max_size=10, ttl=0)
+
+    assert not cache.set(("user", "lock", False), {"built_object": threading.Lock()})
+    assert cache.get(("user", "lock", False)) is None
+
+
+def test_vertex_result_cache_evicts_least_recently_used_results():
+    cache = VertexResultCache(max_size=2, ttl=0)
+    cache.set(("user", "first", False), {})
+    cache.set(("user", "second", False), {})
+    cache.get(("user", "first", False))
+
+    cache.set(("user", "third", False), {})
+
+    assert cache.get(("user", "second", False)) is None
+    assert cache.get(("user", "first", False)) is not None
+
+
+def test_vertex_result_cache_expires_results(monkeypatch):
+    now = 1000.0
+    monkeypatch.setattr(memoization.time, "monotonic", lambda: now)
+    cache = VertexResultCache(max_size=10, ttl=60)
+    cache.set(("user", "fingerprint", False), {})
+
+    now += 30
+    assert cache.get(("user", "fingerprint", False)) is not None
+    now += 31
+    assert cache.get(("user", "fingerprint", False)) is None
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_vertex_result_cache_invalidate_user():
+    cache = VertexResultCache(max_size=10, ttl=0)
+    cache.set(cache.key("user", "first", fallback_to_env_vars=False), {})
+    cache.set(cache.key("other", "first", fallback_to_env_vars=False), {})
+
+    cache.invalidate_user("user")
+
+    assert len(cache) == 1
+    assert cache.get(cache.key("other", "first", fallback_to_env_vars=False)) is not None
@@ -0,0 +1,102 @@
+import gc
+
+import pytest
+from langflow.components.inputs import ChatInput
+from langflow.components.outputs import ChatOutput
+from langflow.graph import Graph
+from langflow.services.cache.disk import AsyncDiskCache
+from langflow.services.cache.service import AsyncInMemoryCache
+from langflow.services.cache.utils import CacheMiss
+from langflow.services.chat.service import ChatService
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return AsyncDiskCache(cache_dir=str(tmp_path))
+
+
+@pytest.fixture
+def chat_service(cache):
+    service = ChatService()
+    service.cache_service = cache
+    return service
+
+
+def _graph():
+    chat_input = ChatInput(_id="chat_input")
+    chat_input.set(should_store_message=False)
+    chat_output = ChatOutput(_id="chat_output")
+    chat_output.set(input_value=chat_input.message_response, should_store_message=False)
+    graph = Graph(chat_input, chat_output, flow_id="flow")
+    graph.prepare()
+    return graph
+
+
+@pytest.fixture
+def graph():
+    return _graph()
+
+
+async def test_set_graph_cache_writes_snapshot_then_deltas(chat_service, graph):
+    await chat_service.set_graph_cache("flow", graph)
+    token = graph._checkpoint_token
+
+    await graph.build_vertex("chat_input")
+    await chat_service.set_graph_cache("flow", graph)
+
+    assert graph._checkpoint_token == token
+    delta = await chat_service.get_cache(f"flow:checkpoint:{token}:0")
+    assert list(delta["result"]["vertices"]) == ["chat_input"]
+    head = await chat_service.get_cache(f"flow:checkpoint:{token}")
+    assert head["result"] == 1
+
+
+async def test_get_graph_cache_replays_deltas(chat_service, cache, graph):
+    await chat_service.set_graph_cache("flow", graph)
+    await graph.build_vertex("chat_input")
+    await graph.get_next_runnable_vertices(graph._lock, vertex=graph.get_vertex("chat_input"), cache=False)
+    await chat_service.set_graph_cache("flow", graph)
+
+    # A fresh service has no in-process checkpoint and must restore from the cache
+    other_service = ChatService()
+    other_service.cache_service = cache
+    restored = (await other_service.get_graph_cache("flow"))["result"]
+
+    assert restored is not graph
+    assert restored.get_vertex("chat_input").built
+    assert not restored.get_vertex("chat_output").built
+    assert restored.run_manager.vertices_being_run == graph.run_manager.vertices_being_run
+
+
+async def test_set_graph_cache_compacts_delta_log(chat_service, graph):
+    chat_service.max_checkpoint_deltas = 2
+    await chat_service.set_graph_cache("flow", graph)
+    token = graph._checkpoint_token
+    for _ in range(3):
+        await chat_service.set_graph_cache("flow", graph)
+
+    assert graph._checkpoint_token != token
+    assert isinstance(await chat_service.get_cache(f"flow:checkpoint:{token}:0"), CacheMiss)
+
+
+async def test_set_graph_cache_stores_graph_in_caches_that_keep_references(graph):
+    service = ChatService()
+    service.cache_service = AsyncInMemoryCache()
+    await service.set_graph_cache("flow", graph)
+    await graph.build_vertex("chat_input")
+    await service.set_graph_cache("flow", graph)
+
+    assert (await service.get_graph_cache("flow"))["result"] is graph
+    assert list(service.cache_service.cache) == ["flow"]
+    assert service._graph_checkpoints == {}
+
+
+async def test_checkpoints_are_forgotten_with_their_graph(chat_service):
+    graph = _graph()
+    await chat_service.set_graph_cache("flow", graph)
+    assert "flow" in chat_service._graph_checkpoints
+
+    del graph
+    gc.collect()
+
+    assert "flow" not in chat_service._graph_checkpoints
@@ -0,0 +1,59 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from langflow.services.database.models.message.crud import (
+    decode_message_cursor,
+    encode_message_cursor,
+    paginate_messages,
+)
+from langflow.services.database.models.message.model import MessageTable
+from sqlalchemy import text
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+
+@pytest.fixture
+async def stored_messages(async_session: AsyncSession):
+    base_time = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    messages = [
+        MessageTable(
+            text=f"Message {index}",
+            sender="User",
+            sender_name="User",
+            session_id="session",
+            # Pairs of messages share a timestamp, so that pages have to break ties by id
+            timestamp=base_time + timedelta(seconds=index // 2),
+            files=[],
+            category="message",
+        )
+        for index in range(7)
+    ]
+    async_session.add_all(messages)
+    await async_session.commit()
+    return messages
+
+
+async def test_paginate_messages_walks_every_message_once(async_session: AsyncSession, stored_messages):
+    seen = []
+    cursor = None
+    while True:
+        stmt = paginate_messages(select(MessageTable).where(MessageTable.session_id == "session"), cursor, 3)
+        page = (await async_session.exec(stmt)).all()
+        seen.extend(page)
+        if len(page) < 3:
+            break
+        cursor = encode_message_cursor(page[-1])
+
+    expected = sorted(stored_messages, key=lambda message: (message.timestamp, message.id))
+    assert [message.id for message in seen] == [message.id for message in expected]
+
+
+async def test_message_session_index_is_created(async_session: AsyncSession):
+    indexes = (await async_session.exec(text("PRAGMA index_list('message')"))).all()
+
+    assert {"ix_message_session_id_timestamp", "ix_message_flow_id_timestamp"} <= {index[1] for index in indexes}
+
+
+def test_decode_message_cursor_rejects_malformed_cursors():
+    with pytest.raises(ValueError, match="Invalid message cursor"):
+        decode_message_cursor("not-a-cursor")
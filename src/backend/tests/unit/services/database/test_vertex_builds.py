@@ -3,7 +3,11 @@ from unittest.mock import patch
 from uuid import uuid4
 
 import pytest
-from langflow.services.database.models.vertex_builds.crud import log_vertex_build
+from langflow.services.database.models.vertex_builds.crud import (
+    log_vertex_build,
+    log_vertex_builds,
+    prune_vertex_builds,
+)
 from langflow.services.database.models.vertex_builds.model import VertexBuildBase, VertexBuildTable
 from langflow.services.settings.base import Settings
 from sqlalchemy import delete, func, select
@@ -314,3 +318,38 @@ async def test_concurrent_log_vertex_build(vertex_build_data, mock_settings):
         async with AsyncSession(engine) as session:
             count = await session.scalar(select(func.count()).select_from(VertexBuildTable))
             assert count <= mock_settings.max_vertex_builds_to_keep
+
+
+@pytest.mark.asyncio
+async def test_log_vertex_builds_and_prune(async_session: AsyncSession, mock_settings, timestamp_generator):
+    """Test that batched builds are inserted as-is and pruned to the limits afterwards."""
+    flow_id = uuid4()
+    builds = [
+        VertexBuildBase(
+            id=f"vertex-{i % 2}",
+            flow_id=flow_id,
+            timestamp=timestamp_generator(i),
+            artifacts={},
+            valid=True,
+        )
+        for i in range(8)
+    ]
+    with patch("langflow.services.database.models.vertex_builds.crud.get_settings_service") as mock_settings_service:
+        mock_settings_service.return_value.settings = mock_settings
+
+        inserted = await log_vertex_builds(async_session, builds)
+        assert len(inserted) == 8
+        count = await async_session.execute(select(func.count()).select_from(VertexBuildTable))
+        assert count.scalar() == 8
+
+        await prune_vertex_builds(async_session)
+
+        remaining = (await async_session.execute(select(VertexBuildTable))).scalars().all()
+        assert len(remaining) <= mock_settings.max_vertex_builds_to_keep
+        for vertex_id in ("vertex-0", "vertex-1"):
+            vertex_builds = [build for build in remaining if build.id == vertex_id]
+            assert len(vertex_builds) <= mock_settings.max_vertex_builds_per_vertex
+        # The newest build of each vertex survives
+        newest = {b.timestamp.replace(tzinfo=None) for b in remaining}
+        assert timestamp_generator(7).replace(tzinfo=None) in newest
+        assert timestamp_generator(6).replace(tzinfo=None) in newest
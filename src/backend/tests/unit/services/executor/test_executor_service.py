@@ -0,0 +1,77 @@
+import asyncio
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+from langflow.services.executor.service import PROCESS_POOL, ExecutorService
+from langflow.services.settings.base import Settings
+
+
+@pytest.fixture
+def executor_service():
+    settings = Settings()
+    settings.component_executors = {"io": 2}
+    settings.component_executor_overrides = {"SlowComponent": "io", "SlowComponent.fast": "other"}
+    settings.component_process_pool_size = 1
+    settings_service = MagicMock()
+    settings_service.settings = settings
+    service = ExecutorService(settings_service)
+    yield service
+    asyncio.run(service.teardown())
+
+
+def square_sum(count=1000):
+    return sum(number * number for number in range(count))
+
+
+def fail_with_type_error():
+    msg = "bad operand"
+    raise TypeError(msg)
+
+
+def test_resolve_prefers_overrides(executor_service):
+    assert executor_service.resolve("SlowComponent", "fast") == "other"
+    assert executor_service.resolve("SlowComponent", "parse", default="cpu") == "io"
+    assert executor_service.resolve("OtherComponent", "parse", default="cpu") == "cpu"
+    assert executor_service.resolve("OtherComponent", "parse") is None
+
+
+async def test_run_uses_the_named_pool_and_records_timings(executor_service):
+    thread_name = await executor_service.run(lambda: threading.current_thread().name, key="Parser", executor="io")
+
+    assert thread_name.startswith("langflow-io")
+    assert executor_service.get_executor("io")._max_workers == 2
+    stats = executor_service.stats()["Parser"]
+    assert stats["calls"] == 1
+    assert stats["failures"] == 0
+    assert stats["queue_wait"] >= 0
+    assert stats["execution"] >= 0
+
+
+async def test_run_reraises_errors(executor_service):
+    def fail():
+        msg = "parse failed"
+        raise ValueError(msg)
+
+    with pytest.raises(ValueError, match="parse failed"):
+        await executor_service.run(fail, key="Parser")
+
+    assert executor_service.stats()["Parser"]["failures"] == 1
+
+
+async def test_process_pool_falls_back_to_threads_for_unpicklable_functions(executor_service):
+    assert await executor_service.run(square_sum, key="Squares", executor=PROCESS_POOL) == square_sum()
+
+    local_value = 3
+    assert await executor_service.run(lambda: local_value, key="Closure", executor=PROCESS_POOL) == local_value
+    assert "Closure" in executor_service._unpicklable
+    assert executor_service.stats()["Closure"]["calls"] == 1
+
+
+async def test_process_pool_does_not_rerun_functions_that_fail(executor_service):
+    with pytest.raises(TypeError, match="bad operand"):
+        await executor_service.run(fail_with_type_error, key="Failing", executor=PROCESS_POOL)
+
+    assert "Failing" not in executor_service._unpicklable
+    assert executor_service.stats()["Failing"]["calls"] == 1
+    assert executor_service.stats()["Failing"]["failures"] == 1
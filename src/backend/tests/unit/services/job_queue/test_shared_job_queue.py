@@ -0,0 +1,164 @@
+import asyncio
+import time
+
+import pytest
+from langflow.services.job_queue.backend import RedisJobQueueBackend
+from langflow.services.job_queue.exceptions import JobQueueNotFoundError
+from langflow.services.job_queue.service import JobQueueService
+
+
+class FakeRedis:
+    """The subset of the redis-py asyncio client used by RedisJobQueueBackend, in memory."""
+
+    def __init__(self):
+        self.hashes: dict[str, dict[str, str]] = {}
+        self.streams: dict[str, list[tuple[str, dict]]] = {}
+        self.expiry: dict[str, int] = {}
+        self._sequence = 0
+        self._changed = asyncio.Condition()
+
+    def pipeline(self, *, transaction=True):  # noqa: ARG002
+        return FakePipeline(self)
+
+    async def hset(self, key, field=None, value=None, mapping=None):
+        values = self.hashes.setdefault(key, {})
+        if mapping:
+            values.update(mapping)
+        if field is not None:
+            values[field] = value
+
+    async def hget(self, key, field):
+        return self.hashes.get(key, {}).get(field)
+
+    async def exists(self, key):
+        return int(key in self.hashes or key in self.streams)
+
+    async def expire(self, key, seconds):
+        self.expiry[key] = seconds
+
+    async def xadd(self, key, fields, *, maxlen=None, approximate=True):  # noqa: ARG002
+        self._sequence += 1
+        entry_id = f"{int(time.time() * 1000)}-{self._sequence}"
+        entries = self.streams.setdefault(key, [])
+        entries.append((entry_id.encode(), {name.encode(): value for name, value in fields.items()}))
+        if maxlen is not None:
+            del entries[:-maxlen]
+        async with self._changed:
+            self._changed.notify_all()
+        return entry_id
+
+    async def xread(self, streams, count=None, block=None):
+        ((key, cursor),) = streams.items()
+
+        def newer():
+            sequence = int(cursor.split("-")[1])
+            return [entry for entry in self.streams.get(key, []) if int(entry[0].split(b"-")[1]) > sequence][:count]
+
+        if not newer() and block is not None:
+            async with self._changed:
+                try:
+                    await asyncio.wait_for(self._changed.wait_for(lambda: bool(newer())), block / 1000)
+                except asyncio.TimeoutError:
+                    return []
+        entries = newer()
+        return [[key.encode(), entries]] if entries else []
+
+    async def aclose(self):
+        pass
+
+
+class FakePipeline:
+    def __init__(self, client):
+        self._client = client
+        self._commands = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    def __getattr__(self, name):
+        def command(*args, **kwargs):
+            self._commands.append((name, args, kwargs))
+            return self
+
+        return command
+
+    async def execute(self):
+        return [await getattr(self._client, name)(*args, **kwargs) for name, args, kwargs in self._commands]
+
+
+@pytest.fixture
+def redis_client():
+    return FakeRedis()
+
+
+async def test_backend_reads_events_with_cursors(redis_client):
+    backend = RedisJobQueueBackend(redis_client, retention=60, max_events=3)
+    await backend.create_job("job", "worker-a")
+    await backend.append("job", [("e1", b"one"), ("e2", b"two")])
+
+    events, cursor = await backend.read("job")
+    assert events == [b"one", b"two"]
+    # Reading without a cursor resumes after the last read
+    assert await backend.read("job", timeout=0.01) == ([], cursor)
+
+    await backend.append("job", [("e3", b"three")])
+    await backend.finish("job")
+    assert (await backend.read("job", cursor))[0] == [b"three", None]
+    # Older events were trimmed, an explicit cursor reads what is left
+    assert (await backend.read("job", "0-0"))[0] == [b"two", b"three", None]
+    assert await backend.get_status("job") == "done"
+    assert redis_client.expiry["langflow:job:job:events"] == 60
+
+    with pytest.raises(JobQueueNotFoundError):
+        await backend.read("missing")
+
+
+async def test_any_worker_serves_the_events_of_a_job(redis_client):
+    owner = JobQueueService(RedisJobQueueBackend(redis_client))
+    other = JobQueueService(RedisJobQueueBackend(redis_client))
+    owner.start()
+    try:
+        queue, event_manager = owner.create_queue("job")
+        await owner.register_job("job")
+
+        async def build():
+            for index in range(3):
+                event_manager.on_token(data={"chunk": str(index), "id": "message"})
+                await asyncio.sleep(0)
+            await queue.put((None, None, time.time()))
+
+        owner.start_job("job", build())
+
+        received = []
+        while None not in received:
+            events, _ = await other.read_events("job", timeout=1)
+            received.extend(events)
+        assert len(received) == 4
+        assert all(b'"token"' in event for event in received[:-1])
+        assert not other.owns_job("job")
+    finally:
+        await owner.stop()
+
+
+async def test_jobs_can_be_cancelled_from_another_worker(redis_client, monkeypatch):
+    monkeypatch.setattr("langflow.services.job_queue.service.CANCEL_CHECK_INTERVAL", 0.01)
+    owner = JobQueueService(RedisJobQueueBackend(redis_client))
+    other = JobQueueService(RedisJobQueueBackend(redis_client))
+    owner.start()
+    try:
+        owner.create_queue("job")
+        await owner.register_job("job")
+        owner.start_job("job", asyncio.sleep(60))
+        _, _, task, _ = owner.get_queue_data("job")
+
+        await other.request_cancel("job")
+        events, _ = await other.read_events("job", "0-0", timeout=2)
+
+        assert events[-1] is None
+        assert task.cancelled()
+        assert await other.backend.get_status("job") == "cancelled"
+    finally:
+        await owner.stop()
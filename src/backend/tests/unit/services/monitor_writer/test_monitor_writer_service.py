@@ -0,0 +1,83 @@
+import asyncio
+from contextlib import asynccontextmanager
+from unittest.mock import MagicMock, patch
+from uuid import uuid4
+
+import pytest
+from langflow.services.database.models.transactions.model import TransactionBase
+from langflow.services.database.models.vertex_builds.model import VertexBuildBase
+from langflow.services.monitor_writer.service import MonitorWriterService
+from langflow.services.settings.base import Settings
+
+
+@pytest.fixture
+def settings_service():
+    settings = Settings()
+    settings.monitor_write_behind = True
+    settings.monitor_write_behind_batch_size = 3
+    settings.monitor_write_behind_flush_interval = 0.05
+    settings.monitor_write_behind_max_queue_size = 5
+    settings.monitor_compaction_interval = 3600
+    settings_service = MagicMock()
+    settings_service.settings = settings
+    return settings_service
+
+
+@pytest.fixture
+def written_batches():
+    batches: list[list] = []
+
+    @asynccontextmanager
+    async def session_getter(_db_service):
+        yield MagicMock()
+
+    async def log_rows(_session, rows):
+        batches.append(list(rows))
+        return rows
+
+    with (
+        patch("langflow.services.monitor_writer.service.session_getter", session_getter),
+        patch("langflow.services.monitor_writer.service.get_db_service"),
+        patch("langflow.services.monitor_writer.service.log_vertex_builds", log_rows),
+        patch("langflow.services.monitor_writer.service.log_transactions", log_rows),
+    ):
+        yield batches
+
+
+def _vertex_build():
+    return VertexBuildBase(id="vertex", flow_id=uuid4(), valid=True)
+
+
+def _transaction():
+    return TransactionBase(vertex_id="vertex", flow_id=uuid4(), status="success")
+
+
+async def test_rows_are_written_in_batches(settings_service, written_batches):
+    service = MonitorWriterService(settings_service)
+    for _ in range(4):
+        assert service.enqueue(_vertex_build())
+    service.enqueue(_transaction())
+
+    await asyncio.wait_for(service.flush(), timeout=1)
+    await service.stop()
+
+    assert [len(batch) for batch in written_batches] == [3, 1, 1]
+    assert isinstance(written_batches[-1][0], TransactionBase)
+    stats = service.stats()
+    assert stats["written"] == 5
+    assert stats["batches"] == 3
+    assert stats["queue_depth"] == 0
+    assert stats["dropped"] == 0
+
+
+async def test_rows_are_dropped_when_queue_is_full(settings_service, written_batches):
+    service = MonitorWriterService(settings_service)
+    service.start()
+    results = [service.enqueue(_vertex_build()) for _ in range(7)]
+
+    assert results.count(False) == 2
+    assert service.stats()["dropped"] == 2
+
+    await service.stop()
+    assert not service.enqueue(_vertex_build())
+    assert sum(len(batch) for batch in written_batches) == 5
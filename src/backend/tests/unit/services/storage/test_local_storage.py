@@ -0,0 +1,81 @@
+from unittest.mock import MagicMock
+
+import pytest
+from langflow.services.storage.local import LocalStorageService
+from langflow.services.storage.utils import parse_range_header
+
+
+@pytest.fixture
+def storage_service(tmp_path):
+    settings_service = MagicMock()
+    settings_service.settings.config_dir = str(tmp_path)
+    return LocalStorageService(MagicMock(), settings_service)
+
+
+async def chunks_of(data: bytes, size: int):
+    for offset in range(0, len(data), size):
+        yield data[offset : offset + size]
+
+
+async def test_save_file_stream_writes_the_chunks(storage_service):
+    data = bytes(range(256)) * 1000
+
+    size = await storage_service.save_file_stream("flow", "data.bin", chunks_of(data, 1000))
+
+    assert size == len(data)
+    assert await storage_service.get_file("flow", "data.bin") == data
+    assert await storage_service.list_files("flow") == ["data.bin"]
+
+
+async def test_save_file_stream_leaves_no_partial_file_on_error(storage_service):
+    async def failing_chunks():
+        yield b"partial"
+        msg = "upload interrupted"
+        raise ConnectionError(msg)
+
+    with pytest.raises(ConnectionError, match="upload interrupted"):
+        await storage_service.save_file_stream("flow", "data.bin", failing_chunks())
+
+    assert [path async for path in (storage_service.data_dir / "flow").iterdir()] == []
+
+
+@pytest.mark.parametrize(
+    ("start", "end"),
+    [(0, None), (0, 0), (10, 99_999), (1000, None), (65_530, 65_540), (99_999, None)],
+)
+async def test_get_file_stream_reads_ranges(storage_service, start, end):
+    data = bytes(range(256)) * 400 + b"tail"
+    await storage_service.save_file("flow", "data.bin", data)
+
+    chunks = [chunk async for chunk in storage_service.get_file_stream("flow", "data.bin", start=start, end=end)]
+
+    assert b"".join(chunks) == data[start : None if end is None else end + 1]
+    assert all(len(chunk) <= 64 * 1024 for chunk in chunks)
+
+
+async def test_get_file_stream_raises_for_missing_files(storage_service):
+    with pytest.raises(FileNotFoundError):
+        [chunk async for chunk in storage_service.get_file_stream("flow", "missing.bin")]
+
+
+@pytest.mark.parametrize(
+    ("header", "expected"),
+    [
+        (None, None),
+        ("bytes=0-99", (0, 99)),
+        ("bytes=100-", (100, 999)),
+        ("bytes=-100", (900, 999)),
+        ("bytes=900-2000", (900, 999)),
+        ("bytes=0-1,5-6", None),
+        ("bytes=5-1", None),
+        ("items=0-1", None),
+        ("bytes=a-b", None),
+    ],
+)
+def test_parse_range_header(header, expected):
+    assert parse_range_header(header, 1000) == expected
+
+
+def test_parse_range_header_rejects_ranges_past_the_end():
+    with pytest.raises(ValueError, match="not satisfiable"):
+        parse_range_header("bytes=1000-", 1000)
@@ -1,11 +1,14 @@
+import asyncio
 from datetime import datetime
 from unittest.mock import patch
 from uuid import uuid4
 
 import pytest
+from langflow.services.auth import utils as auth_utils
 from langflow.services.database.models.variable.model import VariableUpdate
 from langflow.services.deps import get_settings_service
 from langflow.services.settings.constants import VARIABLES_TO_GET_FROM_ENVIRONMENT
+from langflow.services.variable import service as variable_service
 from langflow.services.variable.constants import CREDENTIAL_TYPE
 from langflow.services.variable.service import DatabaseVariableService
 from sqlalchemy.ext.asyncio import create_async_engine
@@ -240,3 +243,64 @@ async def test_create_variable(service, session: AsyncSession):
     assert result.type == CREDENTIAL_TYPE
     assert isinstance(result.created_at, datetime)
     assert isinstance(result.updated_at, datetime)
+
+
+async def test_prefetch_variables_decrypts_each_variable_once(service, session: AsyncSession):
+    user_id = uuid4()
+    names = ["name1", "name2", "name3"]
+    for name in names:
+        await service.create_variable(user_id, name, f"value of {name}", session=session)
+
+    with patch(
+        "langflow.services.variable.service.auth_utils.decrypt_api_key", wraps=auth_utils.decrypt_api_key
+    ) as decrypt_api_key:
+        await service.prefetch_variables(user_id, [*names, "missing"], session=session)
+        values = [await service.get_variable(user_id, name, "", session=session) for name in names]
+        await service.prefetch_variables(user_id, names, session=session)
+
+    assert values == [f"value of {name}" for name in names]
+    assert decrypt_api_key.call_count == len(names)
+    assert service.get_cached_variable(user_id, "name1", "") == "value of name1"
+    with pytest.raises(ValueError, match=r"missing variable not found\."):
+        service.get_cached_variable(user_id, "missing", "")
+
+
+async def test_cached_variables_are_invalidated_on_changes(service, session: AsyncSession):
+    user_id = uuid4()
+    await service.prefetch_variables(user_id, ["name"], session=session)
+    await service.create_variable(user_id, "name", "old_value", session=session)
+
+    assert await service.get_variable(user_id, "name", "", session=session) == "old_value"
+    await service.update_variable(user_id, "name", "new_value", session=session)
+    assert await service.get_variable(user_id, "name", "", session=session) == "new_value"
+    await service.delete_variable(user_id, "name", session=session)
+    assert service.get_cached_variable(user_id, "name", "") is None
+    with pytest.raises(ValueError, match=r"name variable not found\."):
+        await service.get_variable(user_id, "name", "", session=session)
+
+
+async def test_variable_cache_can_be_disabled(service, session: AsyncSession, monkeypatch):
+    monkeypatch.setattr(service.settings_service.settings, "variable_cache_ttl", 0)
+    user_id = uuid4()
+    await service.create_variable(user_id, "name", "value", session=session)
+
+    await service.prefetch_variables(user_id, ["name"], session=session)
+
+    assert service.get_cached_variable(user_id, "name", "") is None
+    assert await service.get_variable(user_id, "name", "", session=session) == "value"
+
+
+async def test_expired_variables_and_users_are_evicted(session: AsyncSession, monkeypatch):
+    monkeypatch.setattr(variable_service, "VARIABLE_CACHE_MAX_USERS", 2)
+    service = DatabaseVariableService(get_settings_service())
+    monkeypatch.setattr(service.settings_service.settings, "variable_cache_ttl", 0.05)
+    user_ids = [uuid4() for _ in range(3)]
+    for user_id in user_ids:
+        await service.prefetch_variables(user_id, ["name"], session=session)
+
+    assert len(service._cache) == 2
+    assert str(user_ids[0]) not in service._cache
+
+    await asyncio.sleep(0.1)
+    assert service.get_cached_variable(user_ids[1], "name", "") is None
+    assert str(user_ids[1]) not in service._cache
@@ -0,0 +1,114 @@
+import asyncio
+
+import pytest
+from langflow.api.v1.schemas import InputValueRequest
+from langflow.components.inputs import ChatInput
+from langflow.components.outputs import ChatOutput
+from langflow.components.processing import CombineTextComponent
+from langflow.components.prompts import PromptComponent
+from langflow.graph import Graph
+from langflow.graph.vertex.base import Vertex
+from langflow.processing import batch
+from langflow.processing.batch import run_graph_batch
+
+FLOW_ID = "b6f4c5a4-7b0e-4c1b-9d39-3c8f0f4f3a11"
+
+
+def _prompted_graph():
+    chat_input = ChatInput(_id="ChatInput-1")
+    chat_input.set(should_store_message=False)
+    prompt = PromptComponent(_id="Prompt-1")
+    prompt.set(template="Answer:")
+    combine = CombineTextComponent(_id="CombineText-1")
+    combine.set(text1=prompt.build_prompt, text2=chat_input.message_response)
+    chat_output = ChatOutput(_id="ChatOutput-1")
+    chat_output.set(input_value=combine.combine_texts, should_store_message=False)
+    graph = Graph(chat_input, chat_output)
+    graph.prepare()
+    return graph
+
+
+def _inputs(*values):
+    return [InputValueRequest(components=[], input_value=value, type="chat") for value in values]
+
+
+def _text(result):
+    return result.outputs[0].outputs[0].results["message"].text
+
+
+def test_get_input_independent_vertex_ids():
+    assert _prompted_graph().get_input_independent_vertex_ids() == {"Prompt-1"}
+
+
+async def test_run_graph_batch_shares_input_independent_vertices(monkeypatch):
+    built_vertex_ids = []
+    build = Vertex.build
+
+    async def recording_build(self, *args, **kwargs):
+        built_vertex_ids.append(self.id)
+        return await build(self, *args, **kwargs)
+
+    monkeypatch.setattr(Vertex, "build", recording_build)
+    values = [f"question {index}" for index in range(5)]
+
+    results = [result async for result in run_graph_batch(_prompted_graph(), _inputs(*values), flow_id=FLOW_ID)]
+
+    results.sort(key=lambda result: result.index)
+    assert [_text(result) for result in results] == [f"Answer: {value}" for value in values]
+    assert all(result.error is None for result in results)
+    assert len({result.session_id for result in results}) == len(values)
+    assert built_vertex_ids.count("Prompt-1") == 1
+    assert built_vertex_ids.count("CombineText-1") == len(values)
+
+
+async def test_run_graph_batch_reports_errors_per_input(monkeypatch):
+    run_graph_internal = batch.run_graph_internal
+
+    async def failing_run_graph_internal(*args, inputs, **kwargs):
+        if inputs[0].input_value == "fail":
+            msg = "Cannot run"
+            raise ValueError(msg)
+        return await run_graph_internal(*args, inputs=inputs, **kwargs)
+
+    monkeypatch.setattr(batch, "run_graph_internal", failing_run_graph_internal)
+
+    results = [
+        result
+        async for result in run_graph_batch(
+            _prompted_graph(), _inputs("ok", "fail"), flow_id=FLOW_ID, session_ids=["first", None]
+        )
+    ]
+
+    by_index = {result.index: result for result in results}
+    assert _text(by_index[0]) == "Answer: ok"
+    assert by_index[0].session_id == "first"
+    assert by_index[1].outputs is None
+    assert str(by_index[1].error) == "Cannot run"
+
+
+@pytest.mark.parametrize("max_concurrency", [1, 3])
+async def test_run_graph_batch_limits_concurrency(monkeypatch, max_concurrency):
+    running = 0
+    max_running = 0
+    run_graph_internal = batch.run_graph_internal
+
+    async def tracking_run_graph_internal(*args, **kwargs):
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        try:
+            await asyncio.sleep(0.01)
+            return await run_graph_internal(*args, **kwargs)
+        finally:
+            running -= 1
+
+    monkeypatch.setattr(batch, "run_graph_internal", tracking_run_graph_internal)
+    inputs = _inputs(*(str(index) for index in range(6)))
+
+    results = [
+        result
+        async for result in run_graph_batch(_prompted_graph(), inputs, flow_id=FLOW_ID, max_concurrency=max_concurrency)
+    ]
+
+    assert len(results) == len(inputs)
+    assert max_running == max_concurrency
@@ -0,0 +1,80 @@
+import asyncio
+import json
+from unittest.mock import patch
+
+from langflow.interface import component_index
+from langflow.interface.component_index import ComponentIndex, abuild_custom_components_with_index
+
+COMPONENT_CODE = """
+from langflow.custom import Component
+from langflow.io import MessageTextInput, Output
+from langflow.schema.message import Message
+
+
+class {name}(Component):
+    display_name = "{display_name}"
+    inputs = [MessageTextInput(name="input_value", display_name="Input")]
+    outputs = [Output(display_name="Message", name="message", method="build_message")]
+
+    def build_message(self) -> Message:
+        return Message(text=self.input_value)
+"""
+
+
+def _write_component(components_path, name, display_name):
+    category = components_path / "custom"
+    category.mkdir(parents=True, exist_ok=True)
+    (category / f"{name.lower()}.py").write_text(COMPONENT_CODE.format(name=name, display_name=display_name))
+
+
+async def _build(components_path, index_path):
+    built_files = []
+    build_entries = component_index.abuild_component_entries_from_files
+
+    async def record_build(path, file_list):
+        built_files.extend(file_list)
+        return await build_entries(path, file_list)
+
+    with patch.object(component_index, "abuild_component_entries_from_files", record_build):
+        all_types = await abuild_custom_components_with_index([str(components_path)], index_path)
+    return all_types, built_files
+
+
+async def test_component_index_rebuilds_only_changed_files(tmp_path):
+    components_path = tmp_path / "components"
+    index_path = tmp_path / "index.json"
+    await asyncio.to_thread(_write_component, components_path, "First", "First")
+    await asyncio.to_thread(_write_component, components_path, "Second", "Second")
+
+    all_types, built_files = await _build(components_path, index_path)
+    assert set(all_types["custom"]) == {"First", "Second"}
+    assert len(built_files) == 2
+    assert await asyncio.to_thread(index_path.exists)
+
+    warm_types, built_files = await _build(components_path, index_path)
+    assert warm_types == all_types
+    assert built_files == []
+
+    await asyncio.to_thread(_write_component, components_path, "Second", "Second changed")
+    changed_types, built_files = await _build(components_path, index_path)
+    assert [path.endswith("second.py") for path in built_files] == [True]
+    assert changed_types["custom"]["Second"]["display_name"] == "Second changed"
+    assert changed_types["custom"]["First"] == all_types["custom"]["First"]
+
+
+async def test_component_index_is_discarded_for_other_versions(tmp_path):
+    components_path = tmp_path / "components"
+    index_path = tmp_path / "index.json"
+    await asyncio.to_thread(_write_component, components_path, "First", "First")
+    await _build(components_path, index_path)
+
+    data = json.loads(await asyncio.to_thread(index_path.read_text))
+    data["version"] = "0.0.0"
+    await asyncio.to_thread(index_path.write_text, json.dumps(data))
+
+    _, built_files = await _build(components_path, index_path)
+    assert len(built_files) == 1
+
+    index = ComponentIndex(index_path)
+    await asyncio.to_thread(index.load)
+    assert list(index.files) == built_files
@@ -128,6 +128,17 @@ async def test_get_all(client: AsyncClient, logged_in_headers):
     assert "ChatOutput" in json_response["outputs"]
 
 
+async def test_get_all_not_modified(client: AsyncClient, logged_in_headers):
+    response = await client.get("api/v1/all", headers=logged_in_headers)
+    assert response.status_code == 200
+    etag = response.headers["etag"]
+
+    response = await client.get("api/v1/all", headers={**logged_in_headers, "If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.headers["etag"] == etag
+    assert not response.content
+
+
 @pytest.mark.usefixtures("active_user")
 async def test_post_validate_code(client: AsyncClient, logged_in_headers):
     # Test case with a valid import and function
@@ -454,6 +465,30 @@ async def test_successful_run_with_input_type_chat(client: AsyncClient, simple_a
     )
 
 
+async def test_batch_run(client: AsyncClient, simple_api_test, created_api_key):
+    headers = {"x-api-key": created_api_key.api_key}
+    flow_id = simple_api_test["id"]
+    payload = {
+        "inputs": [{"input_value": "value1"}, {"input_value": "value2", "session_id": "session2"}],
+        "output_type": "debug",
+    }
+    response = await client.post(f"/api/v1/run/batch/{flow_id}", headers=headers, json=payload)
+    assert response.status_code == status.HTTP_200_OK, response.text
+    results = response.json()["results"]
+    assert [result["index"] for result in results] == [0, 1]
+    assert results[1]["session_id"] == "session2"
+    for result, value in zip(results, ["value1", "value2"], strict=True):
+        assert result.get("error") is None
+        outputs = result["outputs"][0]["outputs"]
+        chat_input_outputs = [output for output in outputs if "ChatInput" in output.get("component_id")]
+        assert chat_input_outputs[0]["results"]["message"]["text"] == value
+
+    response = await client.post(f"/api/v1/run/batch/{flow_id}?stream=true", headers=headers, json=payload)
+    assert response.status_code == status.HTTP_200_OK, response.text
+    streamed = [json.loads(line) for line in response.text.splitlines()]
+    assert sorted(result["index"] for result in streamed) == [0, 1]
+
+
 @pytest.mark.benchmark
 async def test_invalid_run_with_input_type_chat(client, simple_api_test, created_api_key):
     headers = {"x-api-key": created_api_key.api_key}
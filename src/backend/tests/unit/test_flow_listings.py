@@ -0,0 +1,71 @@
+import gzip
+import json
+from uuid import uuid4
+
+from langflow.api.v1.flows import _read_flow_headers
+from langflow.processing.flow_listings import FlowListingCache
+from langflow.services.database.models.flow import Flow
+from sqlmodel import update
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+
+def test_get_returns_listing_of_current_version():
+    cache = FlowListingCache()
+    key = cache.key("user", "headers")
+
+    etag, compressed = cache.set(key, (1, None), [{"name": "Flow"}])
+
+    assert cache.get(key, (1, None)) == (etag, compressed)
+    assert json.loads(gzip.decompress(compressed)) == [{"name": "Flow"}]
+    assert cache.get(key, (2, None)) is None
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_invalidate_user_drops_only_their_listings():
+    cache = FlowListingCache()
+    cache.set(cache.key("user", "headers"), (1, None), [])
+    cache.set(cache.key("user", "flows"), (1, None), [])
+    cache.set(cache.key("other", "headers"), (1, None), [])
+
+    cache.invalidate_user("user")
+    assert len(cache) == 1
+
+    # Flows without a user are listed for everyone
+    cache.invalidate_user(None)
+    assert len(cache) == 0
+
+
+def test_set_evicts_least_recently_used_listing():
+    cache = FlowListingCache(max_size=2)
+    cache.set(cache.key("first"), (1, None), [])
+    cache.set(cache.key("second"), (1, None), [])
+    cache.get(cache.key("first"), (1, None))
+
+    cache.set(cache.key("third"), (1, None), [])
+
+    assert cache.get(cache.key("second"), (1, None)) is None
+    assert cache.get(cache.key("first"), (1, None)) is not None
+
+
+async def test_read_flow_headers_only_loads_data_of_components(async_session: AsyncSession):
+    user_id = uuid4()
+    component_data = {"nodes": [{"id": "Component"}]}
+    async_session.add_all(
+        [
+            Flow(name="Flow", data={"nodes": [{"id": "A"}, {"id": "B"}]}, is_component=False, user_id=user_id),
+            Flow(name="Component", data=component_data, is_component=True, user_id=user_id),
+            Flow(name="Legacy component", data=component_data, user_id=user_id),
+        ]
+    )
+    await async_session.commit()
+    # Flows saved before is_component existed have no value for it
+    await async_session.exec(update(Flow).where(Flow.name == "Legacy component").values(is_component=None))
+    await async_session.commit()
+
+    headers = await _read_flow_headers(async_session, [Flow.user_id == user_id])
+
+    by_name = {header.name: header for header in headers}
+    assert by_name["Flow"].data is None
+    assert by_name["Component"].data == component_data
+    assert by_name["Legacy component"].is_component is True
+    assert by_name["Legacy component"].data == component_data
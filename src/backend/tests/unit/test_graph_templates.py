@@ -0,0 +1,71 @@
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+from uuid import uuid4
+
+import orjson
+import pytest
+from langflow.graph.graph import base
+from langflow.processing.graph_templates import GraphTemplateCache
+from langflow.services.database.models.flow import Flow
+
+
+@pytest.fixture
+def flow(json_memory_chatbot_no_llm):
+    data = orjson.loads(json_memory_chatbot_no_llm)["data"]
+    return Flow(id=uuid4(), name="Memory Chatbot", data=data, updated_at=datetime.now(timezone.utc))
+
+
+def test_get_graph_reuses_template(flow):
+    cache = GraphTemplateCache()
+
+    first = cache.get_graph(flow, user_id="user")
+    second = cache.get_graph(flow, user_id="user")
+
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert first is not second
+    assert first.get_vertex_ids() == second.get_vertex_ids()
+    assert len(first.edges) == len(second.edges)
+    assert first.predecessor_map == second.predecessor_map
+    assert first._is_output_vertices == second._is_output_vertices
+    assert first.user_id == second.user_id == "user"
+    # Vertices and their components hold run state and must not be shared
+    for vertex_id in first.get_vertex_ids():
+        assert first.get_vertex(vertex_id) is not second.get_vertex(vertex_id)
+        assert first.get_vertex(vertex_id).custom_component is not second.get_vertex(vertex_id).custom_component
+
+
+def test_get_graph_does_not_detect_cycles_again(flow):
+    cache = GraphTemplateCache()
+    cache.get_graph(flow)
+
+    with patch.object(base, "find_cycle_vertices", wraps=base.find_cycle_vertices) as find_cycle_vertices:
+        cache.get_graph(flow)
+
+    assert cache.hits == 1
+    find_cycle_vertices.assert_not_called()
+
+
+def test_get_graph_applies_tweaks_without_touching_flow(flow):
+    cache = GraphTemplateCache()
+    chat_input_id = next(node["id"] for node in flow.data["nodes"] if node["id"].startswith("ChatInput"))
+
+    graph = cache.get_graph(flow, {chat_input_id: {"input_value": "tweaked"}})
+
+    assert graph.get_vertex(chat_input_id).params["input_value"] == "tweaked"
+    chat_input_node = next(node for node in flow.data["nodes"] if node["id"] == chat_input_id)
+    assert chat_input_node["data"]["node"]["template"]["input_value"]["value"] != "tweaked"
+    cache.get_graph(flow, {chat_input_id: {"input_value": "other"}})
+    assert cache.misses == 2
+
+
+def test_saved_flow_replaces_template(flow):
+    cache = GraphTemplateCache()
+    cache.get_graph(flow)
+
+    flow.updated_at += timedelta(seconds=1)
+    cache.get_graph(flow)
+
+    assert cache.misses == 2
+    assert len(cache) == 1
+    cache.invalidate_flow(flow.id)
+    assert len(cache) == 0
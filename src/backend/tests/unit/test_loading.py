@@ -1,5 +1,10 @@
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
 from langflow.graph import Graph
 from langflow.initial_setup.setup import load_starter_projects
+from langflow.interface.initialize import loading
+from langflow.interface.initialize.loading import update_params_with_load_from_db_fields
 from langflow.load import aload_flow_from_json
 
 # TODO: UPDATE BASIC EXAMPLE
@@ -25,3 +30,38 @@ async def test_load_flow_from_json_object():
     loaded = await aload_flow_from_json(project)
     assert loaded is not None
     assert isinstance(loaded, Graph)
+
+
+async def test_update_params_with_load_from_db_fields_prefetches_the_graph_variables():
+    graph = SimpleNamespace(
+        vertices=[
+            SimpleNamespace(load_from_db_fields=["api_key"], params={"api_key": "OPENAI_API_KEY"}),
+            SimpleNamespace(load_from_db_fields=["token", "url"], params={"token": "TOKEN", "url": ""}),
+        ]
+    )
+    custom_component = MagicMock()
+    custom_component._vertex = SimpleNamespace(graph=graph)
+    custom_component.prefetch_variables = AsyncMock()
+    custom_component.get_variables = AsyncMock(side_effect=lambda name, _field: f"value of {name}")
+
+    params = await update_params_with_load_from_db_fields(
+        custom_component, {"api_key": "OPENAI_API_KEY", "model": "gpt"}, ["api_key"]
+    )
+
+    assert params == {"api_key": "value of OPENAI_API_KEY", "model": "gpt"}
+    custom_component.prefetch_variables.assert_awaited_once()
+    assert set(custom_component.prefetch_variables.await_args.args[0]) == {"OPENAI_API_KEY", "TOKEN"}
+
+
+async def test_update_params_with_load_from_db_fields_skips_prefetch_without_cache(monkeypatch):
+    monkeypatch.setattr(
+        loading, "get_settings_service", lambda: SimpleNamespace(settings=SimpleNamespace(variable_cache_ttl=0))
+    )
+    custom_component = MagicMock()
+    custom_component.prefetch_variables = AsyncMock()
+    custom_component.get_variables = AsyncMock(return_value="value")
+
+    params = await update_params_with_load_from_db_fields(custom_component, {"api_key": "OPENAI_API_KEY"}, ["api_key"])
+
+    assert params == {"api_key": "value"}
+    custom_component.prefetch_variables.assert_not_awaited()
@@ -7,6 +7,7 @@ from langflow.memory import (
     aadd_messagetables,
     add_messages,
     adelete_messages,
+    aget_last_messages,
     aget_messages,
     astore_message,
     aupdate_messages,
@@ -51,11 +52,23 @@ async def created_messages(async_session):  # noqa: ARG001
 def test_get_messages():
     add_messages(
         [
-            Message(text="Test message 1", sender="User", sender_name="User", session_id="session_id2"),
-            Message(text="Test message 2", sender="User", sender_name="User", session_id="session_id2"),
+            Message(
+                text="Test message 1",
+                sender="User",
+                sender_name="User",
+                session_id="session_id2",
+                timestamp=datetime(2024, 1, 1, 0, 0, 0, tzinfo=timezone.utc),
+            ),
+            Message(
+                text="Test message 2",
+                sender="User",
+                sender_name="User",
+                session_id="session_id2",
+                timestamp=datetime(2024, 1, 1, 0, 0, 1, tzinfo=timezone.utc),
+            ),
         ]
     )
-    messages = get_messages(sender="User", session_id="session_id2", limit=2)
+    messages = get_messages(sender="User", session_id="session_id2", order="ASC", limit=2)
     assert len(messages) == 2
     assert messages[0].text == "Test message 1"
     assert messages[1].text == "Test message 2"
@@ -65,16 +78,46 @@ def test_get_messages():
 async def test_aget_messages():
     await aadd_messages(
         [
-            Message(text="Test message 1", sender="User", sender_name="User", session_id="session_id2"),
-            Message(text="Test message 2", sender="User", sender_name="User", session_id="session_id2"),
+            Message(
+                text="Test message 1",
+                sender="User",
+                sender_name="User",
+                session_id="session_id2",
+                timestamp=datetime(2024, 1, 1, 0, 0, 0, tzinfo=timezone.utc),
+            ),
+            Message(
+                text="Test message 2",
+                sender="User",
+                sender_name="User",
+                session_id="session_id2",
+                timestamp=datetime(2024, 1, 1, 0, 0, 1, tzinfo=timezone.utc),
+            ),
         ]
     )
-    messages = await aget_messages(sender="User", session_id="session_id2", limit=2)
+    messages = await aget_messages(sender="User", session_id="session_id2", order="ASC", limit=2)
     assert len(messages) == 2
     assert messages[0].text == "Test message 1"
     assert messages[1].text == "Test message 2"
 
 
+@pytest.mark.usefixtures("client")
+async def test_aget_last_messages():
+    await aadd_messages(
+        [
+            Message(
+                text=f"Test message {index}",
+                sender="User",
+                sender_name="User",
+                session_id="last_session",
+                timestamp=datetime(2024, 1, 1, 0, 0, index, tzinfo=timezone.utc),
+            )
+            for index in range(5)
+        ]
+    )
+    messages = await aget_last_messages("last_session", 2)
+    assert [message.text for message in messages] == ["Test message 3", "Test message 4"]
+
+
 @pytest.mark.usefixtures("client")
 def test_add_messages():
     message = Message(text="New Test message", sender="User", sender_name="User", session_id="new_session_id")
@@ -77,6 +77,33 @@ async def test_delete_messages_session(client: AsyncClient, created_messages, lo
     assert len(response.json()) == 0
 
 
+@pytest.mark.api_key_required
+async def test_get_messages_paginated(client: AsyncClient, created_messages, logged_in_headers):
+    params = {"session_id": "session_id2", "limit": 2}
+    response = await client.get("api/v1/monitor/messages", headers=logged_in_headers, params=params)
+    assert response.status_code == 200, response.text
+    first_page = response.json()
+    assert len(first_page) == 2
+    cursor = response.headers["X-Next-Cursor"]
+
+    response = await client.get(
+        "api/v1/monitor/messages", headers=logged_in_headers, params={**params, "cursor": cursor}
+    )
+    assert response.status_code == 200, response.text
+    second_page = response.json()
+    assert len(second_page) == 1
+    assert "X-Next-Cursor" not in response.headers
+    assert {message["id"] for message in first_page + second_page} == {str(msg.id) for msg in created_messages}
+
+
+@pytest.mark.api_key_required
+async def test_get_messages_invalid_cursor(client: AsyncClient, logged_in_headers):
+    response = await client.get(
+        "api/v1/monitor/messages", headers=logged_in_headers, params={"limit": 2, "cursor": "not-a-cursor"}
+    )
+    assert response.status_code == 400
+
+
 # Successfully update session ID for all messages with the old session ID
 @pytest.mark.usefixtures("session")
 async def test_successfully_update_session_id(client, logged_in_headers, created_messages):
@@ -1,9 +1,15 @@
 import re
 import threading
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
-from langflow.services.telemetry.opentelemetry import OpenTelemetry
+from langflow.components.inputs import ChatInput
+from langflow.components.outputs import ChatOutput
+from langflow.graph import Graph
+from langflow.graph import utils as graph_utils
+from langflow.services.telemetry.opentelemetry import OVERFLOW_LABEL_VALUE, Metric, MetricType, OpenTelemetry
 
 fixed_labels = {"flow_id": "this_flow_id", "service": "this", "user": "that"}
 
@@ -16,8 +22,9 @@ def opentelemetry_instance():
 def test_init(opentelemetry_instance):
     assert isinstance(opentelemetry_instance, OpenTelemetry)
     assert len(opentelemetry_instance._metrics) > 1
-    assert len(opentelemetry_instance._metrics) == len(opentelemetry_instance._metrics_registry) == 2
+    assert len(opentelemetry_instance._metrics) == len(opentelemetry_instance._metrics_registry)
     assert "file_uploads" in opentelemetry_instance._metrics
+    assert "vertex_build_duration" in opentelemetry_instance._metrics
 
 
 def test_gauge(opentelemetry_instance):
@@ -43,6 +50,63 @@ def test_increment_counter(opentelemetry_instance):
     opentelemetry_instance.increment_counter(metric_name="num_files_uploaded", value=5, labels=fixed_labels)
 
 
+def test_observe_histogram(opentelemetry_instance):
+    opentelemetry_instance.observe_histogram(
+        "vertex_build_duration", 0.25, {"component": "ChatInput", "status": "success"}
+    )
+
+
+def test_bound_labels():
+    metric = Metric(
+        name="bounded",
+        description="A bounded metric",
+        metric_type=MetricType.COUNTER,
+        labels={"component": True},
+        max_label_values=2,
+    )
+
+    assert metric.bound_labels({"component": "a"}) == {"component": "a"}
+    assert metric.bound_labels({"component": "b"}) == {"component": "b"}
+    assert metric.bound_labels({"component": "c"}) == {"component": OVERFLOW_LABEL_VALUE}
+    assert metric.bound_labels({"component": "a"}) == {"component": "a"}
+
+
+async def test_graph_records_vertex_builds(monkeypatch):
+    telemetry_service = MagicMock()
+    monkeypatch.setattr("langflow.graph.graph.base.get_telemetry_service", lambda: telemetry_service)
+    chat_input = ChatInput(_id="chat_input")
+    chat_output = ChatOutput(input_value="test", _id="chat_output")
+    chat_output.set(sender_name=chat_input.message_response)
+    graph = Graph(chat_input, chat_output)
+
+    [result async for result in graph.async_start()]
+
+    recorded = {call.args[0]: call.kwargs["status"] for call in telemetry_service.record_vertex_build.call_args_list}
+    assert recorded == {"ChatInput": "success", "ChatOutput": "success"}
+    assert all(call.args[1] >= 0 for call in telemetry_service.record_vertex_build.call_args_list)
+
+
+async def test_log_vertex_build_records_direct_db_writes(monkeypatch):
+    telemetry_service = MagicMock()
+    crud_log_vertex_build = AsyncMock()
+
+    @asynccontextmanager
+    async def session_getter(_db_service):
+        yield MagicMock()
+
+    monkeypatch.setattr(graph_utils, "get_telemetry_service", lambda: telemetry_service)
+    monkeypatch.setattr(graph_utils, "session_getter", session_getter)
+    monkeypatch.setattr(graph_utils, "crud_log_vertex_build", crud_log_vertex_build)
+
+    await graph_utils.log_vertex_build(
+        flow_id="4e4e0b36-8e0a-4a4e-9d3b-1a8a4d4c2f10", vertex_id="chat_input", valid=True, params=None, data={}
+    )
+
+    crud_log_vertex_build.assert_awaited_once()
+    telemetry_service.record_db_write.assert_called_once()
+    assert telemetry_service.record_db_write.call_args.args[0] == "vertex_build"
+
+
 def test_increment_counter_empty_label(opentelemetry_instance):
     with pytest.raises(ValueError, match="Labels must be provided for the metric"):
         opentelemetry_instance.increment_counter(metric_name="num_files_uploaded", value=5, labels={})
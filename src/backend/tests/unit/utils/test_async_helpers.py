@@ -0,0 +1,53 @@
+import threading
+from contextlib import aclosing
+
+import pytest
+from langflow.utils.async_helpers import iterate_in_thread
+
+
+async def test_iterate_in_thread_yields_items_from_a_worker_thread():
+    threads = set()
+
+    def numbers():
+        for number in range(200):
+            threads.add(threading.get_ident())
+            yield number
+
+    items = [item async for item in iterate_in_thread(numbers(), max_buffer=8)]
+
+    assert items == list(range(200))
+    assert threading.get_ident() not in threads
+
+
+async def test_iterate_in_thread_reraises_iterator_errors():
+    def failing():
+        yield 1
+        msg = "boom"
+        raise ValueError(msg)
+
+    async def collect(items):
+        async for item in iterate_in_thread(failing()):
+            items.append(item)
+
+    items: list[int] = []
+    with pytest.raises(ValueError, match="boom"):
+        await collect(items)
+    assert items == [1]
+
+
+async def test_iterate_in_thread_stops_reading_when_closed():
+    produced = []
+
+    def endless():
+        number = 0
+        while True:
+            produced.append(number)
+            yield number
+            number += 1
+
+    async with aclosing(iterate_in_thread(endless(), max_buffer=4)) as items:
+        async for item in items:
+            if item == 10:
+                break
+
+    assert len(produced) <= 10 + 4 + 2
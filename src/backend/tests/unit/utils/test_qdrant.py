@@ -0,0 +1,149 @@
+from types import SimpleNamespace
+
+import pytest
+from langchain_core.documents import Document
+from langchain_core.embeddings import DeterministicFakeEmbedding
+
+pytest.importorskip("qdrant_client")
+
+from langflow.utils import qdrant
+
+
+class FakeQdrantClient:
+    def __init__(self, **kwargs):
+        self.kwargs = kwargs
+        self.collections = {"docs"}
+        self.points = []
+        self.calls = []
+        self.filters = []
+        self.stored = {}
+
+    def collection_exists(self, collection_name):
+        self.calls.append(("collection_exists", collection_name))
+        return collection_name in self.collections
+
+    def scroll(
+        self, collection_name, *, scroll_filter=None, limit=10, offset=None, with_payload=True, with_vectors=False
+    ):
+        self.calls.append(("scroll", collection_name, limit, offset, with_payload, with_vectors))
+        self.filters.append(scroll_filter)
+        start = offset or 0
+        points = [SimpleNamespace(payload={"metadata": metadata}) for metadata in self.points[start : start + limit]]
+        next_offset = start + limit if start + limit < len(self.points) else None
+        return points, next_offset
+
+    def create_collection(self, collection_name, vectors_config):
+        self.calls.append(("create_collection", collection_name, vectors_config.size))
+        self.collections.add(collection_name)
+
+    def upsert(self, collection_name, points, *, wait):
+        self.calls.append(("upsert", collection_name, len(points), wait))
+        self.stored.update({point.id: point for point in points})
+
+    def close(self):
+        self.calls.append(("close",))
+
+
+@pytest.fixture
+def fake_client(monkeypatch):
+    monkeypatch.setattr(qdrant, "QdrantClient", FakeQdrantClient)
+    yield
+    qdrant.close_qdrant_clients()
+
+
+@pytest.mark.usefixtures("fake_client")
+def test_clients_are_shared_per_host_and_port():
+    client = qdrant.get_qdrant_client("qdrant", "6333")
+
+    assert qdrant.get_qdrant_client("qdrant", 6333) is client
+    assert qdrant.get_qdrant_client("other", "6333") is not client
+    assert client.kwargs["port"] == 6333
+
+
+@pytest.mark.usefixtures("fake_client")
+def test_existing_collections_are_cached():
+    client = qdrant.get_qdrant_client("qdrant", "6333")
+
+    assert qdrant.check_collection_exists(client, "docs")
+    assert qdrant.check_collection_exists(client, "docs")
+    assert not qdrant.check_collection_exists(client, "missing")
+    assert not qdrant.check_collection_exists(client, "missing")
+
+    assert client.calls.count(("collection_exists", "docs")) == 1
+    assert client.calls.count(("collection_exists", "missing")) == 2
+
+
+@pytest.mark.usefixtures("fake_client")
+def test_document_exists_reads_no_payload_or_vector():
+    client = qdrant.get_qdrant_client("qdrant", "6333")
+
+    assert not qdrant.document_exists(client, "docs", {"id": 1, "version": 2})
+    client.points = [{"id": 1, "version": 2, "page": 0}]
+    assert qdrant.document_exists(client, "docs", {"id": 1, "version": 2})
+    assert not qdrant.document_exists(client, "docs", {"title": "no id"})
+
+    assert client.calls == [("scroll", "docs", 1, None, False, False)] * 2
+    assert {condition.key for condition in client.filters[0].must} == {
+        "metadata.id",
+        "metadata.version",
+        "metadata.page",
+    }
+
+
+@pytest.mark.usefixtures("fake_client")
+def test_scroll_metadata_reads_every_page():
+    client = qdrant.get_qdrant_client("qdrant", "6333")
+    client.points = [{"id": index, "version": 1} for index in range(5)]
+
+    files = list(qdrant.scroll_metadata(client, "docs", batch_size=2))
+
+    assert [file["id"] for file in files] == list(range(5))
+    assert [call[3] for call in client.calls] == [None, 2, 4]
+
+
+@pytest.mark.usefixtures("fake_client")
+async def test_upsert_documents_is_batched_and_idempotent():
+    client = qdrant.get_qdrant_client("qdrant", "6333")
+    documents = [
+        Document(page_content=f"page {page}", metadata={"id": 7, "version": 1, "page": page}) for page in range(10)
+    ]
+
+    metrics = await qdrant.upsert_documents(
+        client, "new", DeterministicFakeEmbedding(size=8), documents, batch_size=4, max_concurrency=2
+    )
+    await qdrant.upsert_documents(client, "new", DeterministicFakeEmbedding(size=8), documents, batch_size=4)
+
+    assert metrics["documents"] == 10
+    assert metrics["batches"] == 3
+    assert [call for call in client.calls if call[0] == "create_collection"] == [("create_collection", "new", 8)]
+    assert sorted(call[2] for call in client.calls if call[0] == "upsert") == [2, 2, 4, 4, 4, 4]
+    # The second ingestion overwrote the points of the first one
+    assert len(client.stored) == 10
+    assert client.stored[qdrant.document_point_id(documents[3].metadata)].payload == {
+        "page_content": "page 3",
+        "metadata": {"id": 7, "version": 1, "page": 3},
+    }
+
+
+def test_documents_without_page_are_stored_as_their_first_page():
+    assert qdrant.document_point_id({"id": 7, "version": 1}) == qdrant.document_point_id(
+        {"id": 7, "version": 1, "page": 0}
+    )
+
+
+class MissingVectorEmbedding(DeterministicFakeEmbedding):
+    async def aembed_documents(self, texts):
+        return (await super().aembed_documents(texts))[:-1]
+
+
+@pytest.mark.usefixtures("fake_client")
+async def test_upsert_documents_fails_when_vectors_are_missing():
+    client = qdrant.get_qdrant_client("qdrant", "6333")
+    documents = [
+        Document(page_content=f"page {page}", metadata={"id": 7, "version": 1, "page": page}) for page in range(3)
+    ]
+
+    with pytest.raises(ValueError, match="zip"):
+        await qdrant.upsert_documents(client, "new", MissingVectorEmbedding(size=8), documents)
+
+    assert not client.stored